@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import multiprocessing
 import sys
 import os
 import warnings
@@ -45,5 +46,7 @@ def main() -> int:
 
 
 if __name__ == "__main__":
+    # Transcription worker processes re-enter here when frozen
+    multiprocessing.freeze_support()
     raise SystemExit(main())
 
@@ -0,0 +1,338 @@
+from __future__ import annotations
+
+import hmac
+import itertools
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import parse_qs, urlsplit
+
+
+# Machine-readable job states; the GUI shows its own Turkish labels
+QUEUED = "queued"
+DOWNLOADING = "downloading"
+PROCESSING = "processing"
+PAUSED = "paused"
+FAILED = "failed"
+DONE = "done"
+CANCELED = "canceled"
+SKIPPED = "skipped"
+TERMINAL = (DONE, CANCELED, SKIPPED)
+
+QUALITIES = ("best", "mp4", "mp3", "transcript")
+# Same names as scheduler.PRIORITIES; a bulk submit defaults to "bulk"
+PRIORITIES = ("high", "normal", "bulk")
+ACTIONS = ("cancel", "pause", "resume")
+
+# Finished jobs kept for listing; older ones are forgotten first
+MAX_FINISHED = 5000
+MAX_BODY = 16 * 1024 * 1024  # a bulk submit of ~100k URLs
+HEARTBEAT = 15.0
+
+
+def is_final(job: Dict[str, Any]) -> bool:
+    """No command applies any more (failed jobs stay open while retryable)."""
+    return job["state"] in TERMINAL or (job["state"] == FAILED and not job.get("retryable"))
+
+
+def _loopback(netloc: str) -> bool:
+    host = netloc.rsplit(":", 1)[0] if not netloc.endswith("]") else netloc
+    return host.strip("[]").lower() in ("127.0.0.1", "localhost", "::1")
+
+
+def _is_url(url: str) -> bool:
+    return url.startswith(("http://", "https://"))
+
+
+class _Feed:
+    """Pending updates of one event-stream client, latest state per job.
+
+    A slow client gets fewer, newer snapshots instead of an ever-growing
+    backlog: a job updated ten times between two reads is sent once.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._pending: Dict[str, Dict[str, Any]] = {}
+
+    def push(self, job: Dict[str, Any]) -> None:
+        with self._cond:
+            self._pending.pop(job["id"], None)  # re-insert at the end
+            self._pending[job["id"]] = job
+            self._cond.notify()
+
+    def take(self, timeout: float) -> List[Dict[str, Any]]:
+        with self._cond:
+            if not self._pending:
+                self._cond.wait(timeout)
+            out = list(self._pending.values())
+            self._pending.clear()
+            return out
+
+
+class JobBoard:
+    """Thread-safe snapshot of every download job, for the control API.
+
+    The GUI thread writes (``add`` / ``update``); HTTP threads read and
+    subscribe to changes. Snapshots are plain dicts, replaced on update,
+    so readers never see a half-written job.
+    """
+
+    def __init__(self, max_finished: int = MAX_FINISHED):
+        self.max_finished = max_finished
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+        self._finished: List[str] = []
+        self._feeds: List[_Feed] = []
+
+    def add(self, url: str, quality: str, source: str = "gui", priority: str = "normal") -> str:
+        with self._lock:
+            job_id = str(next(self._ids))
+            job = {
+                "id": job_id, "url": url, "quality": quality, "source": source, "priority": priority,
+                "state": QUEUED, "started": False, "percent": 0, "plan": "", "path": "", "error": "",
+                "retryable": False,
+                "created": time.time(), "updated": time.time(),
+            }
+            self._jobs[job_id] = job
+            feeds = list(self._feeds)
+        for f in feeds:
+            f.push(job)
+        return job_id
+
+    def update(self, job_id: Optional[str], **fields: Any) -> None:
+        if job_id is None:
+            return
+        with self._lock:
+            old = self._jobs.get(job_id)
+            if old is None:
+                return
+            job = {**old, **fields, "updated": time.time()}
+            self._jobs[job_id] = job
+            if is_final(job) and not is_final(old):
+                self._finished.append(job_id)
+                while len(self._finished) > self.max_finished:
+                    self._jobs.pop(self._finished.pop(0), None)
+            feeds = list(self._feeds)
+        for f in feeds:
+            f.push(job)
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def jobs(self, state: Optional[str] = None) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [j for j in self._jobs.values() if state is None or j["state"] == state]
+
+    def subscribe(self) -> _Feed:
+        feed = _Feed()
+        with self._lock:
+            self._feeds.append(feed)
+        return feed
+
+    def unsubscribe(self, feed: _Feed) -> None:
+        with self._lock:
+            if feed in self._feeds:
+                self._feeds.remove(feed)
+
+
+class ControlServer:
+    """Local HTTP/JSON API over a :class:`JobBoard`.
+
+    ``GET /jobs[?state=]``, ``GET /jobs/<id>``, ``POST /jobs`` with
+    ``{"urls": [...], "quality": "best", "priority": "normal"}`` (or one URL
+    per line as plain text, options in the query string), ``POST /jobs/<id>/cancel|pause|resume`` and ``GET /events``, a
+    server-sent event stream of job snapshots.
+
+    New jobs are added to the board here and handed to ``on_enqueue`` as a
+    list of ids; commands go to ``on_command(action, job_id)``. Both are
+    called on HTTP threads, so the GUI passes queued Qt signals.
+    Listens on loopback only; with a token set, every request needs
+    ``Authorization: Bearer <token>``.
+    """
+
+    def __init__(self, board: JobBoard, on_enqueue: Callable[[List[str]], None],
+                 on_command: Callable[[str, str], None], port: int,
+                 host: str = "127.0.0.1", token: str = ""):
+        self.board = board
+        self.on_enqueue = on_enqueue
+        self.on_command = on_command
+        self.token = token
+        self._httpd = ThreadingHTTPServer((host, port), _handler_for(self))
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+        self._closing = threading.Event()
+
+    @property
+    def port(self) -> int:
+        return self._httpd.server_address[1]
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="control-api", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._closing.set()
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def submit(self, urls: List[str], quality: str, priority: str = "") -> List[str]:
+        priority = priority or ("normal" if len(urls) == 1 else "bulk")
+        ids = [self.board.add(u, quality, source="api", priority=priority) for u in urls]
+        if ids:
+            self.on_enqueue(ids)
+        return ids
+
+
+def _handler_for(server: ControlServer):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *args):
+            pass
+
+        def _send(self, code: int, payload: Any) -> None:
+            body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+            self.send_response(code)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _error(self, code: int, message: str) -> None:
+            self._send(code, {"error": message})
+
+        def _allowed(self) -> bool:
+            # Loopback Host only (no DNS rebinding), and no cross-site browser
+            # requests: a web page may POST text/plain here without a preflight
+            origin = self.headers.get("Origin")
+            if not _loopback(self.headers.get("Host") or "") or (
+                    origin and not _loopback(urlsplit(origin).netloc)):
+                self._error(403, "forbidden")
+                return False
+            if server.token:
+                auth = self.headers.get("Authorization") or ""
+                if not hmac.compare_digest(auth.encode(), f"Bearer {server.token}".encode()):
+                    self._error(401, "unauthorized")
+                    return False
+            return True
+
+        def _parts(self) -> List[str]:
+            return [p for p in urlsplit(self.path).path.split("/") if p]
+
+        def do_GET(self):
+            if not self._allowed():
+                return
+            parts = self._parts()
+            if parts == ["jobs"]:
+                state = (parse_qs(urlsplit(self.path).query).get("state") or [None])[0]
+                self._send(200, {"jobs": server.board.jobs(state)})
+            elif len(parts) == 2 and parts[0] == "jobs":
+                job = server.board.get(parts[1])
+                if job is None:
+                    self._error(404, "no such job")
+                else:
+                    self._send(200, job)
+            elif parts == ["events"]:
+                self._events()
+            else:
+                self._error(404, "not found")
+
+        def do_POST(self):
+            if not self._allowed():
+                return
+            parts = self._parts()
+            try:
+                length = int(self.headers.get("Content-Length") or 0)
+            except ValueError:
+                length = -1
+            if length < 0:
+                self._error(400, "bad Content-Length")
+                return
+            if length > MAX_BODY:
+                self._error(413, "body too large")
+                return
+            raw = self.rfile.read(length) if length else b""
+            if parts == ["jobs"]:
+                self._submit(raw)
+            elif len(parts) == 3 and parts[0] == "jobs" and parts[2] in ACTIONS:
+                job = server.board.get(parts[1])
+                if job is None:
+                    self._error(404, "no such job")
+                elif is_final(job):
+                    self._error(409, f"job is {job['state']}")
+                elif parts[2] != "cancel" and not job["started"]:
+                    # Still waiting for a download slot; only cancel applies
+                    self._error(409, "job has not started")
+                else:
+                    server.on_command(parts[2], parts[1])
+                    self._send(202, {"id": parts[1], "action": parts[2]})
+            else:
+                self._error(404, "not found")
+
+        def _submit(self, raw: bytes) -> None:
+            ctype = (self.headers.get("Content-Type") or "").split(";")[0].strip().lower()
+            quality = "best"
+            priority = ""
+            try:
+                if ctype == "text/plain":
+                    urls = raw.decode("utf-8").split()
+                    query = parse_qs(urlsplit(self.path).query)
+                    quality = (query.get("quality") or ["best"])[0]
+                    priority = (query.get("priority") or [""])[0]
+                else:
+                    data = json.loads(raw.decode("utf-8") or "{}")
+                    if not isinstance(data, dict):
+                        raise ValueError("not an object")
+                    urls = data.get("urls") or ([data["url"]] if data.get("url") else [])
+                    if isinstance(urls, str):
+                        urls = [urls]  # a single URL
+                    if not isinstance(urls, list):
+                        raise ValueError("urls is not a list")
+                    quality = data.get("quality") or "best"
+                    priority = data.get("priority") or ""
+            except (ValueError, KeyError):
+                self._error(400, "expected JSON {\"urls\": [...]} or text/plain URLs")
+                return
+            if quality not in QUALITIES:
+                self._error(400, f"quality must be one of {', '.join(QUALITIES)}")
+                return
+            if priority and priority not in PRIORITIES:
+                self._error(400, f"priority must be one of {', '.join(PRIORITIES)}")
+                return
+            urls = [u.strip() for u in urls if isinstance(u, str) and u.strip()]
+            bad = [u for u in urls if not _is_url(u)]
+            if bad or not urls:
+                self._error(400, "no URLs" if not urls else f"not an http(s) URL: {bad[0]}")
+                return
+            self._send(202, {"ids": server.submit(urls, quality, priority)})
+
+        def _events(self) -> None:
+            feed = server.board.subscribe()
+            try:
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Cache-Control", "no-cache")
+                self.send_header("Connection", "close")
+                self.end_headers()
+                self.close_connection = True
+                while not server._closing.is_set():
+                    jobs = feed.take(HEARTBEAT)
+                    if jobs:
+                        chunk = "".join(
+                            f"event: job\ndata: {json.dumps(j, ensure_ascii=False)}\n\n" for j in jobs
+                        )
+                    else:
+                        chunk = ": ping\n\n"  # also detects closed clients
+                    self.wfile.write(chunk.encode("utf-8"))
+                    self.wfile.flush()
+            except OSError:
+                pass  # client went away
+            finally:
+                server.board.unsubscribe(feed)
+
+    return Handler
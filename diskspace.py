@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import os
+import shutil
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    import format_plan
+except Exception:
+    from . import format_plan
+
+
+# Kept free on every volume for thumbnails, subtitles, sidecars and the OS
+MIN_FREE = 64 * 1024 * 1024
+# Peak disk use per downloaded byte. A single progressive file is renamed in
+# place; HLS/DASH streams get an ffmpeg fixup that writes a full copy; merged
+# streams stay on disk until the merged file is complete.
+OVERHEAD_SINGLE = 1.05
+OVERHEAD_FIXUP = 2.0
+OVERHEAD_MERGE = 2.0
+# Bitrate of the mp3 written for the "mp3" quality (see downloader.build_ydl_opts)
+MP3_KBPS = 192
+# How often a held job looks at the free space again
+POLL = 1.0
+
+_FRAGMENT_PROTOCOLS = ("m3u8", "http_dash_segments", "ism", "f4m")
+
+
+class InsufficientSpace(Exception):
+    """The job does not fit on the volume even with no other job running."""
+
+    def __init__(self, need: int, free: int, path: str):
+        self.need = need
+        self.free = free
+        self.path = path
+        super().__init__(f"Yetersiz disk alanı: ~{_mb(need)} MB gerekli, {_mb(free)} MB boş ({path})")
+
+
+def _mb(n: int) -> int:
+    return max(0, int(n)) // (1024 * 1024)
+
+
+def volume(path: Path) -> Tuple[int, str]:
+    """(device id, nearest existing folder) of ``path``."""
+    p = Path(path)
+    while not p.exists() and p.parent != p:
+        p = p.parent
+    return os.stat(p).st_dev, str(p)
+
+
+def peak_bytes(plan: "format_plan.FormatPlan") -> Tuple[int, int]:
+    """(peak bytes while downloading and post-processing, bytes of the finished file)."""
+    est = int(plan.est_bytes or 0)
+    final = est
+    if plan.transcode:
+        # Source audio plus the mp3, which can be larger than a low-bitrate source
+        abr = next((f.get("abr") or f.get("tbr") for f in plan.formats if f.get("abr") or f.get("tbr")), None)
+        final = int(est * max(1.0, MP3_KBPS / abr)) if abr else est
+        return est + final, final
+    if plan.merge or len(plan.formats) > 1:
+        return int(est * OVERHEAD_MERGE), final
+    proto = str(plan.formats[0].get("protocol") or "") if plan.formats else ""
+    if proto.startswith(_FRAGMENT_PROTOCOLS):
+        return int(est * OVERHEAD_FIXUP), final
+    return int(est * OVERHEAD_SINGLE), final
+
+
+def needs(plan: "format_plan.FormatPlan", download_dir: Path,
+          work_dir: Optional[Path] = None) -> Dict[int, List[Any]]:
+    """Bytes a job needs per volume: ``{device: [folder, peak bytes, bytes kept]}``.
+
+    Everything up to the finished file happens in ``work_dir`` (the staging
+    folder, else ``download_dir``); with staging on another volume only the
+    finished file lands on the download volume. The job's peak minus what
+    it keeps comes back once it is done.
+    """
+    peak, final = peak_bytes(plan)
+    work_dev, work_path = volume(work_dir or download_dir)
+    home_dev, home_path = volume(download_dir)
+    if home_dev == work_dev:
+        return {work_dev: [work_path, peak, final]}
+    return {work_dev: [work_path, peak, 0], home_dev: [home_path, final, final]}
+
+
+class Reservation:
+    """Space promised to one admitted job.
+
+    Bytes the job has written already show up in the volume's free space,
+    so they are taken off what it still holds in the work volume.
+    """
+
+    def __init__(self, ledger: "SpaceLedger", need: Dict[int, List[Any]], work_dev: int):
+        self._ledger = ledger
+        self.need = need
+        self.work_dev = work_dev
+        self._written: Dict[str, int] = {}
+
+    def progress(self, d: Dict[str, Any]) -> None:
+        # Progress hook dict; merged formats download one file after the other
+        if d.get("status") != "downloading" or d.get("downloaded_bytes") is None:
+            return
+        name = str(d.get("tmpfilename") or d.get("filename") or "")
+        self._written[name] = int(d["downloaded_bytes"])
+
+    def outstanding(self, dev: int) -> int:
+        ent = self.need.get(dev)
+        if ent is None:
+            return 0
+        if dev != self.work_dev:
+            return ent[1]
+        return max(0, ent[1] - sum(self._written.values()))
+
+    def reclaimable(self, dev: int) -> int:
+        # Bytes on ``dev`` the job frees when it is done (temporary files)
+        ent = self.need.get(dev)
+        return max(0, ent[1] - ent[2]) if ent is not None else 0
+
+    def release(self) -> None:
+        self._ledger._release(self)
+
+
+class SpaceLedger:
+    """Disk space reserved by running jobs, checked before a job downloads.
+
+    A job that cannot fit even once the running jobs are done (their
+    temporary files deleted) is rejected with :class:`InsufficientSpace`;
+    one that only lacks space other jobs have reserved or still use is held
+    until they finish (or write what they reserved).
+    Reservations are per process; with worker processes each one keeps its
+    own, and the free-space check still applies to every job.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._held: List[Reservation] = []
+
+    def _reserved(self, dev: int) -> int:
+        return sum(r.outstanding(dev) for r in self._held)
+
+    def _shortage(self, need: Dict[int, List[Any]]) -> Optional[Tuple[int, int]]:
+        # (bytes needed, bytes available to this job) of the first volume that lacks room
+        for dev, (path, n, _kept) in need.items():
+            free = max(0, shutil.disk_usage(path).free - MIN_FREE)
+            # Free space already excludes the temporary files of running jobs
+            if n > free + sum(r.reclaimable(dev) for r in self._held):
+                raise InsufficientSpace(n, free, path)
+            avail = free - self._reserved(dev)
+            if n > avail:
+                return n, max(0, avail)
+        return None
+
+    def admit(self, need: Dict[int, List[Any]], work_dev: int,
+              cancel_check: Optional[Callable[[], bool]] = None,
+              on_wait: Optional[Callable[[int, int], None]] = None) -> Optional[Reservation]:
+        """Reserve ``need`` once it fits; None if ``cancel_check`` fired while held."""
+        waited = False
+        with self._cond:
+            while True:
+                if cancel_check is not None and cancel_check():
+                    return None
+                short = self._shortage(need)
+                if short is None:
+                    res = Reservation(self, need, work_dev)
+                    self._held.append(res)
+                    return res
+                if not waited and on_wait is not None:
+                    waited = True
+                    on_wait(*short)
+                self._cond.wait(POLL)
+
+    def _release(self, res: Reservation) -> None:
+        with self._cond:
+            if res in self._held:
+                self._held.remove(res)
+                self._cond.notify_all()
+
+
+_ledger = SpaceLedger()
+
+
+def ledger() -> SpaceLedger:
+    return _ledger
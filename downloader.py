@@ -1,18 +1,75 @@
 from __future__ import annotations
 
+import copy
+import glob
+import os
+import shutil
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Callable, Optional, Dict, Any
+from typing import Callable, Optional, Dict, Any, Iterable, Iterator
 
 from yt_dlp import YoutubeDL
+from yt_dlp.downloader import get_suitable_downloader
+from yt_dlp.networking import HEADRequest
+from yt_dlp.networking.exceptions import HTTPError
+from yt_dlp.postprocessor.movefilesafterdownload import MoveFilesAfterDownloadPP
+from yt_dlp.utils import DownloadCancelled
+
+try:
+    from library import Library, StreamingHasher
+    import format_plan
+    import sessions
+    import thumbnails
+    import segmented
+    import staging
+    import fragcache
+    import diskspace
+    import scheduler
+except Exception:
+    from .library import Library, StreamingHasher
+    from . import format_plan
+    from . import sessions
+    from . import thumbnails
+    from . import segmented
+    from . import staging
+    from . import fragcache
+    from . import diskspace
+    from . import scheduler
 
 
 ProgressHook = Callable[[Dict[str, Any]], None]
+CancelCheck = Callable[[], bool]
+PlanCallback = Callable[["format_plan.FormatPlan"], None]
+
+
+class DownloadInterrupted(DownloadCancelled):
+    """Raised from the progress hook to stop a download cooperatively.
+
+    yt-dlp only calls progress hooks between written chunks/fragments, so the
+    ``.part`` file and the ``.ytdl`` fragment index are consistent at that point
+    and a later run with ``continuedl`` picks up where this one stopped.
+    """
+    msg = "Download interrupted"
+
+
+class AlreadyHeld(Exception):
+    """The URL's extractor id matches a file already in the download folder."""
+
+    def __init__(self, path: Path):
+        super().__init__(str(path))
+        self.path = path
 
 
 def build_ydl_opts(
     download_dir: Path,
     quality: str,
     progress_hook: Optional[ProgressHook] = None,
+    format_selector: Optional[Callable[[Dict[str, Any]], Any]] = None,
+    subtitles: Optional[list[str]] = None,
+    connections: int = 1,
+    staging_dir: Optional[Path] = None,
 ) -> dict:
     fmt_best = "bestvideo+bestaudio/best"
     fmt_mp4 = "bestvideo[ext=mp4]+bestaudio[ext=m4a]/best[ext=mp4]/best"
@@ -24,24 +81,31 @@ def build_ydl_opts(
         "noprogress": True,
         # Do not ignore errors; fail fast so UI doesn't add stale items
         "ignoreerrors": False,
+        # Jittered exponential backoff per request and per fragment (see fragcache)
+        **fragcache.retry_opts(),
         "quiet": True,
         "no_warnings": True,
         # Save thumbnails alongside media for richer UI
         "writethumbnail": True,
+        # Keep partial data on disk and continue from it (HTTP Range / fragment index)
+        "continuedl": True,
+        "nopart": False,
+        # Connections per single-file HTTP format (see segmented); 1 = yt-dlp's own
+        "segmented_connections": max(1, int(connections)),
     }
 
     if quality == "mp4":
         ydl_opts["format"] = fmt_mp4
+        ydl_opts["merge_output_format"] = "mp4"
     elif quality == "mp3":
         ydl_opts["format"] = "bestaudio/best"
-    
-    # Postprocessors
+    if format_selector is not None:
+        # Cost-aware choice (see format_plan); the strings above are the fallback
+        ydl_opts["format_fallback"] = ydl_opts["format"]
+        ydl_opts["format"] = format_selector
+
+    # Postprocessors (thumbnails are converted in-process, see _StagedYoutubeDL)
     postprocessors: list[dict] = []
-    # Always try converting thumbnails to jpg for easy display
-    postprocessors.append({
-        "key": "FFmpegThumbnailsConvertor",
-        "format": "jpg",
-    })
     if quality == "mp3":
         postprocessors.append({
             "key": "FFmpegExtractAudio",
@@ -51,14 +115,731 @@ def build_ydl_opts(
     if postprocessors:
         ydl_opts["postprocessors"] = postprocessors
 
+    if subtitles:
+        # Uploaded tracks win; yt-dlp uses auto captions only for missing languages
+        ydl_opts["writesubtitles"] = True
+        ydl_opts["writeautomaticsub"] = True
+        ydl_opts["subtitleslangs"] = list(subtitles)
+        ydl_opts["subtitlesformat"] = "vtt/srt/best"
+
+    paths = staging.staging_paths(download_dir, staging_dir)
+    if paths is not None:
+        # Parts, fragments, merges and post-processing happen in the staging
+        # folder; only finished files are published to download_dir
+        ydl_opts["paths"] = paths
+        ydl_opts["outtmpl"] = "%(title)s.%(ext)s"
+        ydl_opts["buffersize"] = staging.STAGING_BUFFER
+
     if progress_hook is not None:
         ydl_opts["progress_hooks"] = [progress_hook]
 
     return ydl_opts
 
 
-def download(url: str, download_dir: Path, quality: str, progress_hook: Optional[ProgressHook] = None) -> None:
+def _cancellable_hook(progress_hook: Optional[ProgressHook], cancel_check: CancelCheck) -> ProgressHook:
+    def hook(d: Dict[str, Any]) -> None:
+        if progress_hook is not None:
+            progress_hook(d)
+        if d.get("status") == "downloading" and cancel_check():
+            raise DownloadInterrupted()
+    return hook
+
+
+def partial_files(progress: Dict[str, Any]) -> list[Path]:
+    """Leftover files a download in progress would resume from."""
+    if "partial_files" in progress:
+        # Relayed from a worker process, already worked out there
+        return [Path(p) for p in progress["partial_files"]]
+    out: list[Path] = []
+    tmp = progress.get("tmpfilename")
+    final = progress.get("filename")
+    if tmp:
+        out.append(Path(tmp))
+        out.append(Path(segmented.state_path(str(tmp))))
+    if final:
+        # Fragment index written by yt-dlp's fragment downloader
+        out.append(Path(str(final) + ".ytdl"))
+    info = progress.get("info_dict")
+    if progress.get("fragment_count") and info:
+        out.append(fragcache.cache_dir(info))
+    return out
+
+
+def discard_partial(paths: Iterable[Path]) -> None:
+    # Remove resume state (and per-fragment leftovers) for a canceled download
+    for p in paths:
+        try:
+            if p.is_dir():
+                shutil.rmtree(p, ignore_errors=True)  # cached fragments of the stream
+                continue
+            for frag in p.parent.glob(glob.escape(p.name) + "-Frag*"):
+                frag.unlink(missing_ok=True)
+            p.unlink(missing_ok=True)
+        except Exception:
+            pass
+
+
+def _downloaded_entries(info: Optional[Dict[str, Any]]) -> list[tuple[Dict[str, Any], str]]:
+    # (video info, final file path) for a single video or each playlist entry
+    if not info:
+        return []
+    if info.get("_type") == "playlist" or "entries" in info:
+        out = []
+        for e in info.get("entries") or []:
+            out.extend(_downloaded_entries(e))
+        return out
+    out = []
+    for rd in info.get("requested_downloads") or []:
+        fp = rd.get("filepath") or rd.get("filename")
+        if fp:
+            out.append((info, str(fp)))
+    return out
+
+
+class _StagedYoutubeDL(YoutubeDL):
+    """YoutubeDL that stops after the network phase.
+
+    yt-dlp funnels the format merge, fixups and every ``post_process``-stage
+    post-processor (thumbnail conversion, audio extraction) through
+    :meth:`post_process`. Recording those calls instead of running them lets
+    the download slot be released before any ffmpeg work starts.
+
+    Instances are pooled (see :mod:`sessions`); :meth:`begin_job` swaps in
+    the per-job hooks, filters and output template on every checkout.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.deferred: list[tuple] = []
+        self.published: list[tuple[str, str]] = []  # (staging path, final path)
+        # Downscaled jpg thumbnails without an ffmpeg process per download
+        self.add_post_processor(thumbnails.QtThumbnailsConvertorPP(self), when="post_process")
+
+    def begin_job(self, opts: Dict[str, Any]) -> list[tuple]:
+        self.deferred = []
+        self.published = []
+        self._num_downloads = 0
+        self._download_retcode = 0
+        tmpl = opts["outtmpl"]
+        # YoutubeDL.__init__ normalizes the template dict in place
+        self.params["outtmpl"] = dict(tmpl) if isinstance(tmpl, dict) else {"default": tmpl}
+        self._parse_outtmpl()
+        self.params["match_filter"] = opts.get("match_filter")
+        fmt = opts.get("format")
+        self.params["format"] = fmt
+        self.format_selector = fmt if callable(fmt) or fmt in (None, "-") else self.build_format_selector(fmt)
+        if callable(fmt) and opts.get("format_fallback"):
+            fmt.fallback = self.build_format_selector(opts["format_fallback"])
+        self._progress_hooks = list(opts.get("progress_hooks") or [])
+        self.params["segmented_connections"] = opts.get("segmented_connections", 1)
+        self.params["paths"] = dict(opts.get("paths") or {})
+        if opts.get("buffersize"):
+            self.params["buffersize"] = opts["buffersize"]
+        else:
+            self.params.pop("buffersize", None)
+        return self.deferred
+
+    def run_pp(self, pp, infodict):
+        # Finished files leave the staging folder with one sequential copy + rename
+        if type(pp) is MoveFilesAfterDownloadPP:
+            pp = staging.PublishFilesPP(self, pp._downloaded)
+            infodict = super().run_pp(pp, infodict)
+            self.published.extend(pp.moved)
+            return infodict
+        return super().run_pp(pp, infodict)
+
+    def dl(self, name, info, subtitle=False, test=False):
+        # Progressive HTTP formats go through the multi-connection downloader,
+        # HLS/DASH fragments through the persistent fragment cache
+        if subtitle or test or name == "-" or not info.get("url"):
+            return super().dl(name, info, subtitle, test)
+        if segmented.suitable(info, self.params):
+            fd_cls = segmented.SegmentedHttpFD
+        else:
+            fd_cls = fragcache.cached(get_suitable_downloader(info, self.params))
+            if fd_cls is None:
+                return super().dl(name, info, subtitle, test)
+        fd = fd_cls(self, self.params)
+        for ph in self._progress_hooks:
+            fd.add_progress_hook(ph)
+        new_info = self._copy_infodict(info)
+        if new_info.get("http_headers") is None:
+            new_info["http_headers"] = self._calc_headers(new_info)
+        return fd.download(name, new_info, subtitle)
+
+    def post_process(self, filename, info, files_to_move=None):
+        # Snapshot: once process_info returns, yt-dlp strips keys the format
+        # dict shares with the video (id, title, thumbnails...) from ``info``
+        self.deferred.append((filename, dict(info), files_to_move, info))
+        info["filepath"] = filename
+        return info
+
+
+class PostJob:
+    """Post-processing half of a download, produced by :func:`fetch`."""
+
+    def __init__(self, ydl: _StagedYoutubeDL, deferred: list[tuple], info: Optional[Dict[str, Any]],
+                 library: Library, hasher: StreamingHasher, held: list[Path],
+                 reservations: Optional[list] = None):
+        self.ydl = ydl
+        self.deferred = deferred
+        self.info = info
+        self.library = library
+        self.hasher = hasher
+        self.held = held
+        self.reservations = reservations if reservations is not None else []
+
+    def run(self) -> Optional[str]:
+        ok = False
+        try:
+            for filename, snapshot, files_to_move, info in self.deferred:
+                new_info = YoutubeDL.post_process(self.ydl, filename, snapshot, files_to_move)
+                # yt-dlp expects the info dict to be updated in place
+                info.clear()
+                info.update(new_info)
+            ok = True
+            for old, new in self.ydl.published:
+                self.hasher.moved(old, new)
+        finally:
+            self.deferred.clear()
+            # Session goes back to the pool only now: deferred post-processors
+            # still hold it and read its params
+            sessions.pool().release(self.ydl, reusable=ok)
+            # Peak disk use is over; the finished files count as used space now
+            _release_all(self.reservations)
+
+        final: Optional[str] = None
+        for entry, fp in _downloaded_entries(self.info):
+            if Path(fp).is_file():
+                self.library.record_download(Path(fp), entry, self.hasher.digest_for(Path(fp)))
+                final = final or fp
+        if final is None and self.held:
+            raise AlreadyHeld(self.held[0])
+        return final
+
+
+def fetch(
+    url: str,
+    download_dir: Path,
+    quality: str,
+    progress_hook: Optional[ProgressHook] = None,
+    cancel_check: Optional[CancelCheck] = None,
+    skip_held: bool = False,
+    on_plan: Optional[PlanCallback] = None,
+    connections: int = 1,
+    staging_dir: Optional[Path] = None,
+) -> PostJob:
+    """Network phase: extract and download, deferring all post-processing.
+
+    Finished files are hashed while the bytes are written (see
+    :class:`StreamingHasher`). With ``skip_held`` a URL whose extractor id
+    already maps to an existing file is rejected right after metadata
+    extraction; the returned job then raises :class:`AlreadyHeld`.
+    ``on_plan`` receives the :class:`format_plan.FormatPlan` picked for the
+    video before any media bytes are fetched. ``connections`` above 1 fetches
+    single-file HTTP formats over that many connections (see :mod:`segmented`).
+    With ``staging_dir`` all intermediate files live there and only finished
+    files are published to ``download_dir`` (see :mod:`staging`).
+
+    Once the format is chosen, and before any media bytes are fetched, the
+    job reserves its expected peak disk use (see :mod:`diskspace`). It
+    waits while other jobs hold the space it needs, reporting a
+    ``"disk_wait"`` progress status, and fails with
+    :class:`diskspace.InsufficientSpace` if it cannot fit at all.
+    """
     download_dir.mkdir(parents=True, exist_ok=True)
-    opts = build_ydl_opts(download_dir, quality, progress_hook)
+    library = Library(download_dir)
+    hasher = StreamingHasher()
+    reservations: list = []
+
+    def hook(d: Dict[str, Any]) -> None:
+        try:
+            hasher.feed(d)
+            if reservations:
+                reservations[-1].progress(d)
+        except Exception:
+            pass
+        if progress_hook is not None:
+            progress_hook(d)
+
+    hook_fn: ProgressHook = hook
+    if cancel_check is not None:
+        hook_fn = _cancellable_hook(hook, cancel_check)
+
+    # match_filter sees the video's info before format selection; keep what
+    # the selector needs (it only receives the format list)
+    seen: Dict[str, Any] = {}
+    paths = staging.staging_paths(download_dir, staging_dir)
+    work_dir = Path(paths["temp"]) if paths else download_dir
+
+    def admit(plan: format_plan.FormatPlan) -> None:
+        need = diskspace.needs(plan, download_dir, work_dir)
+        res = diskspace.ledger().admit(
+            need, diskspace.volume(work_dir)[0], cancel_check,
+            on_wait=lambda n, free: hook({"status": "disk_wait", "total_bytes": n, "free_bytes": free}),
+        )
+        if res is None:
+            raise DownloadInterrupted()
+        reservations.append(res)
+
+    select = format_plan.selector(quality, on_plan, duration=lambda: seen.get("duration"), admit=admit)
+    opts = build_ydl_opts(download_dir, quality, hook_fn, format_selector=select,
+                          connections=connections, staging_dir=staging_dir)
+
+    held: list[Path] = []
+
+    def match_filter(info: Dict[str, Any], incomplete: bool = False) -> Optional[str]:
+        if info.get("duration"):
+            seen["duration"] = info["duration"]
+        if skip_held:
+            p = library.held_file(info)
+            if p is not None:
+                held.append(p)
+                return f"already downloaded as {p.name}"
+        return None
+    opts["match_filter"] = match_filter
+
+    # Warm session per (extractor, option profile); the profile is the
+    # quality since it decides the registered post-processors
+    ie_key = sessions.extractor_key(url)
+    pool = sessions.pool()
+    ydl = pool.acquire((ie_key, quality), lambda: _StagedYoutubeDL(opts))
+    deferred = ydl.begin_job(opts)
+    try:
+        prefetched = info_cache().get_copy(url)
+        if prefetched is not None:
+            # Extraction already done while the URL was being entered
+            info = ydl.process_ie_result(prefetched, download=True)
+        else:
+            info = ydl.extract_info(url, download=True, ie_key=ie_key)
+    except DownloadInterrupted:
+        pool.release(ydl)
+        _release_all(reservations)
+        raise
+    except BaseException:
+        # Unknown state after a failure; don't hand it to the next job
+        pool.release(ydl, reusable=False)
+        _release_all(reservations)
+        raise
+    return PostJob(ydl, deferred, info, library, hasher, held, reservations)
+
+
+def _release_all(reservations: list) -> None:
+    while reservations:
+        reservations.pop().release()
+
+
+# Prefetched extraction results stay usable this long (stream URLs expire)
+PREFETCH_TTL = 600.0
+
+
+class InfoCache:
+    """TTL cache of unprocessed extraction results, keyed by URL.
+
+    Holds what ``extract_info(..., process=False)`` returns for single
+    videos; :func:`fetch` hands a copy to ``process_ie_result`` so format
+    selection and the download start without another extraction round-trip.
+    """
+
+    def __init__(self, ttl: float = PREFETCH_TTL, max_entries: int = 64):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._items: Dict[str, tuple] = {}  # url -> (expires_at, info)
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            ent = self._items.get(url)
+            if ent is None:
+                return None
+            if ent[0] < time.monotonic():
+                del self._items[url]
+                return None
+            return ent[1]
+
+    def get_copy(self, url: str) -> Optional[Dict[str, Any]]:
+        # yt-dlp mutates the info dict while processing it
+        info = self.get(url)
+        if info is None:
+            return None
+        try:
+            return copy.deepcopy(info)
+        except Exception:
+            return None
+
+    def put(self, url: str, info: Dict[str, Any]) -> None:
+        with self._lock:
+            if len(self._items) >= self.max_entries:
+                oldest = min(self._items, key=lambda k: self._items[k][0])
+                del self._items[oldest]
+            self._items[url] = (time.monotonic() + self.ttl, info)
+
+
+_info_cache = InfoCache()
+
+
+def info_cache() -> InfoCache:
+    return _info_cache
+
+
+def _probe_opts() -> Dict[str, Any]:
+    return {"quiet": True, "no_warnings": True, "noprogress": True, "ignoreerrors": False}
+
+
+def probe(url: str) -> Dict[str, Any]:
+    """Extract metadata for ``url`` without downloading, caching single videos."""
+    cached = info_cache().get(url)
+    if cached is not None:
+        return cached
+    ie_key = sessions.extractor_key(url)
+    pool = sessions.pool()
+    ydl = pool.acquire((ie_key, "probe"), lambda: YoutubeDL(_probe_opts()))
+    try:
+        info = ydl.extract_info(url, download=False, process=False, ie_key=ie_key)
+    except BaseException:
+        pool.release(ydl, reusable=False)
+        raise
+    pool.release(ydl)
+    # Playlists/redirects resolve lazily; only plain videos are replayable
+    if info and info.get("_type", "video") == "video" and (info.get("formats") or info.get("url")):
+        info_cache().put(url, info)
+    return info
+
+
+def flat_entries(url: str) -> Iterator[Dict[str, Any]]:
+    """Entries of a playlist or channel, unresolved, listed as far as the caller reads.
+
+    Listing pages are requested lazily, so a caller that stops at entries
+    it already knows never pages through the whole channel. Entries are the
+    extractor's flat results (id, url, title, sometimes a timestamp); a
+    single video yields itself.
+    """
+    ie_key = sessions.extractor_key(url)
+    pool = sessions.pool()
+    ydl = pool.acquire((ie_key, "probe"), lambda: YoutubeDL(_probe_opts()))
+    reusable = False
+    try:
+        info = ydl.extract_info(url, download=False, process=False, ie_key=ie_key)
+        for _ in range(3):
+            # Redirects, e.g. a channel page to its uploads tab
+            if not info or info.get("_type") not in ("url", "url_transparent"):
+                break
+            info = ydl.extract_info(info["url"], download=False, process=False, ie_key=info.get("ie_key"))
+        if info and info.get("_type") in ("playlist", "multi_video"):
+            for entry in info.get("entries") or []:
+                if entry:
+                    yield entry
+        elif info:
+            yield info
+        reusable = True
+    except GeneratorExit:
+        reusable = True  # the caller stopped early
+        raise
+    finally:
+        pool.release(ydl, reusable=reusable)
+
+
+def changed_since(url: str, etag: str = "", last_modified: str = "") -> Optional[Dict[str, str]]:
+    """Conditional HEAD request for ``url``; None if the server answers 304.
+
+    Otherwise returns the page's current validators (``etag``,
+    ``last_modified``; empty when the server sends none, as most dynamic
+    pages do). Any error counts as changed.
+    """
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    pool = sessions.pool()
+    ydl = pool.acquire((sessions.extractor_key(url), "probe"), lambda: YoutubeDL(_probe_opts()))
+    try:
+        resp = ydl.urlopen(HEADRequest(url, headers=headers))
+    except HTTPError as e:
+        if e.status == 304:
+            return None
+        return {"etag": "", "last_modified": ""}
+    except Exception:
+        return {"etag": "", "last_modified": ""}
+    finally:
+        pool.release(ydl)
+    try:
+        return {"etag": resp.headers.get("ETag") or "", "last_modified": resp.headers.get("Last-Modified") or ""}
+    finally:
+        resp.close()
+
+
+def _subtitle_track(info: Dict[str, Any], lang: Optional[str]) -> Optional[tuple[str, bool]]:
+    # (track key, is auto caption) for ``lang``; uploaded subtitles first.
+    # Without a language the video's own (or its only uploaded) track is used.
+    manual = info.get("subtitles") or {}
+    auto = info.get("automatic_captions") or {}
+    lang = lang or info.get("language")
+    if not lang:
+        keys = [k for k in manual if k != "live_chat"]
+        return (keys[0], False) if len(keys) == 1 else None
+    base = lang.split("-")[0].lower()
+
+    def match(tracks: Dict[str, Any], exact: list[str]) -> Optional[str]:
+        for k in exact:
+            if k in tracks:
+                return k
+        return next((k for k in tracks if k.split("-")[0].lower() == base), None)
+
+    key = match(manual, [lang])
+    if key:
+        return key, False
+    # YouTube lists every machine translation; "-orig" is the spoken language
+    key = match(auto, [f"{lang}-orig", lang])
+    return (key, True) if key else None
+
+
+def fetch_subtitles(url: str, out_base: Path, lang: Optional[str] = None) -> Optional[tuple[Path, bool]]:
+    """Fetch the platform's subtitle track for ``url`` as ``<out_base>.<lang>.<ext>``.
+
+    Returns (track file, is auto caption), or None when the video has no
+    track in ``lang`` (default: the video's language). Only the subtitle
+    file is downloaded; metadata comes from :func:`probe` and its cache.
+    """
+    info = probe(url)
+    if not info or info.get("_type", "video") != "video":
+        return None
+    track = _subtitle_track(info, lang)
+    if track is None:
+        return None
+    key, is_auto = track
+    opts = build_ydl_opts(out_base.parent, "best", subtitles=[key])
+    opts.pop("postprocessors", None)
+    opts.update({
+        "outtmpl": str(out_base) + ".%(ext)s",
+        "skip_download": True,
+        "writethumbnail": False,
+        "format": None,
+    })
     with YoutubeDL(opts) as ydl:
-        ydl.download([url])
+        res = ydl.process_ie_result(copy.deepcopy(info), download=True)
+    fp = ((res or {}).get("requested_subtitles") or {}).get(key, {}).get("filepath")
+    if not fp or not Path(fp).is_file():
+        return None
+    return Path(fp), is_auto
+
+
+def audio_source(url: str, on_plan: Optional[PlanCallback] = None) -> Dict[str, Any]:
+    """Resolve the smallest acceptable audio stream of ``url`` without downloading.
+
+    The returned info has the stream's ``url`` and ``http_headers`` merged in
+    (yt-dlp does this for a single selected format), ready for ffmpeg.
+    """
+    info = probe(url)
+    if not info or info.get("_type", "video") != "video":
+        raise RuntimeError("Sadece tek bir video için transkript alınabilir")
+    opts = _probe_opts()
+    opts["format"] = format_plan.selector("speech", on_plan, duration=lambda: info.get("duration"))
+    with YoutubeDL(opts) as ydl:
+        res = ydl.process_ie_result(copy.deepcopy(info), download=False)
+    if not res or not res.get("url"):
+        raise RuntimeError("Uygun ses akışı bulunamadı")
+    return res
+
+
+def download(
+    url: str,
+    download_dir: Path,
+    quality: str,
+    progress_hook: Optional[ProgressHook] = None,
+    cancel_check: Optional[CancelCheck] = None,
+    skip_held: bool = False,
+    on_plan: Optional[PlanCallback] = None,
+    connections: int = 1,
+    staging_dir: Optional[Path] = None,
+) -> Optional[str]:
+    """Download ``url`` and return the final file path (if known).
+
+    Runs both phases back to back in the calling thread; use
+    :class:`Pipeline` to overlap them across jobs.
+    """
+    return fetch(url, download_dir, quality, progress_hook, cancel_check, skip_held, on_plan, connections, staging_dir).run()
+
+
+def _default_postprocess_slots() -> int:
+    return max(1, (os.cpu_count() or 2) // 2)
+
+
+class Pipeline:
+    """Two-stage download pipeline with separate concurrency limits.
+
+    Jobs take a network slot for :func:`fetch` and hand their
+    :class:`PostJob` to the post-processing pool as soon as the last byte is
+    in, freeing the slot for the next queued URL while ffmpeg runs. The
+    post-processing pool uses threads: its work happens in ffmpeg
+    subprocesses, so it is bounded by CPU cores rather than the GIL.
+
+    Queued jobs get network slots by priority, at most a few per site and
+    spaced out in time (see :mod:`scheduler`); a queued job learns why it
+    waits through a ``"queued"`` progress status with a ``reason``.
+    """
+
+    def __init__(self, network_slots: int = 2, postprocess_slots: int = 0):
+        self.network_slots = max(1, int(network_slots))
+        self.postprocess_slots = int(postprocess_slots) or _default_postprocess_slots()
+        self._net = ThreadPoolExecutor(self.network_slots, thread_name_prefix="dl-net")
+        self._cpu = ThreadPoolExecutor(self.postprocess_slots, thread_name_prefix="dl-post")
+        self._lock = threading.Lock()
+        self._queue = scheduler.HostQueue()
+        self._running = 0
+        self._posting = 0  # jobs handed to the post-processing pool, not done yet
+        self._closing = False
+        self._timer: Optional[threading.Timer] = None
+
+    def set_site_limits(self, per_host: int, interval: float) -> None:
+        with self._lock:
+            self._queue.per_host = max(1, int(per_host))
+            self._queue.interval = max(0.0, float(interval))
+        self._dispatch()
+
+    def submit(
+        self,
+        url: str,
+        download_dir: Path,
+        quality: str,
+        progress_hook: Optional[ProgressHook] = None,
+        cancel_check: Optional[CancelCheck] = None,
+        skip_held: bool = False,
+        on_fetched: Optional[Callable[[], None]] = None,
+        on_plan: Optional[PlanCallback] = None,
+        connections: int = 1,
+        staging_dir: Optional[Path] = None,
+        priority: str = scheduler.NORMAL,
+    ) -> "Future[Optional[str]]":
+        result: "Future[Optional[str]]" = Future()
+        result.set_running_or_notify_cancel()
+
+        def post(job: PostJob) -> None:
+            try:
+                result.set_result(job.run())
+            except BaseException as e:
+                result.set_exception(e)
+            finally:
+                with self._lock:
+                    self._posting -= 1
+                self._close_if_drained()
+
+        def net() -> bool:
+            # True if the site throttled the job
+            if cancel_check is not None and cancel_check():
+                # Canceled while queued for a slot: don't start extracting
+                result.set_exception(DownloadInterrupted())
+                return False
+            try:
+                job = fetch(url, download_dir, quality, progress_hook, cancel_check, skip_held, on_plan, connections, staging_dir)
+            except BaseException as e:
+                result.set_exception(e)
+                return scheduler.is_throttled(e)
+            if on_fetched is not None:
+                try:
+                    on_fetched()
+                except Exception:
+                    pass
+            with self._lock:
+                self._posting += 1
+            self._cpu.submit(post, job)
+            return False
+
+        on_state = None
+        if progress_hook is not None:
+            on_state = lambda text: progress_hook({"status": "queued", "reason": text})
+        with self._lock:
+            self._queue.push((net, cancel_check), url, priority, on_state)
+        self._dispatch()
+        return result
+
+    def _dispatch(self) -> None:
+        with self._lock:
+            # Canceled while queued: fail them now instead of at their turn
+            dropped = self._queue.remove(lambda it: it[1] is not None and it[1]())
+            starts = []
+            while self._running < self.network_slots:
+                nxt = self._queue.pop()
+                if nxt is None:
+                    break
+                self._running += 1
+                starts.append(nxt)
+            notes = self._queue.notes()
+            delay = self._queue.delay() if self._running < self.network_slots else None
+            if delay is not None and self._timer is None:
+                # A slot is free but the next job's site is still pacing
+                self._timer = threading.Timer(delay, self._wake)
+                self._timer.daemon = True
+                self._timer.start()
+        for net, _cancel in dropped:
+            net()
+        for (net, _cancel), key in starts:
+            self._net.submit(self._run, net, key)
+        for on_state, text in notes:
+            try:
+                on_state(text)
+            except Exception:
+                pass
+        self._close_if_drained()
+
+    def _wake(self) -> None:
+        with self._lock:
+            self._timer = None
+        self._dispatch()
+
+    def _run(self, net: Callable[[], bool], key: str) -> None:
+        throttled = False
+        try:
+            throttled = net()
+        finally:
+            with self._lock:
+                self._running -= 1
+                self._queue.done(key, throttled)
+            self._dispatch()
+
+    def shutdown(self) -> None:
+        # Queued and running jobs still finish; the executors close after the last one
+        with self._lock:
+            self._closing = True
+        self._close_if_drained()
+
+    def _close_if_drained(self) -> None:
+        with self._lock:
+            if not self._closing or self._running or self._posting or len(self._queue):
+                return
+        self._net.shutdown(wait=False)
+        self._cpu.shutdown(wait=False)
+
+
+_pipeline: Optional[Pipeline] = None
+_pipeline_lock = threading.Lock()
+
+
+def pipeline() -> Pipeline:
+    global _pipeline
+    with _pipeline_lock:
+        if _pipeline is None:
+            _pipeline = Pipeline()
+        return _pipeline
+
+
+def configure_pipeline(network_slots: int, postprocess_slots: int = 0, pipeline_cls: Optional[type] = None,
+                       per_host: int = scheduler.PER_HOST, interval: float = scheduler.MIN_INTERVAL) -> Pipeline:
+    """Replace the shared pipeline if its limits or kind changed.
+
+    ``pipeline_cls`` is :class:`Pipeline` (the default) or another class
+    with the same constructor, ``submit`` and ``set_site_limits``, e.g.
+    ``procpool.ProcessPipeline``. Per-site limits apply without a new pipeline.
+    """
+    global _pipeline
+    cls = pipeline_cls or Pipeline
+    with _pipeline_lock:
+        cur = _pipeline
+        want_pp = int(postprocess_slots) or _default_postprocess_slots()
+        if not (cur is not None and type(cur) is cls and cur.network_slots == max(1, int(network_slots))
+                and cur.postprocess_slots == want_pp):
+            _pipeline = cls(network_slots, postprocess_slots)
+            if cur is not None:
+                cur.shutdown()
+        _pipeline.set_site_limits(per_host, interval)
+        return _pipeline
@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+
+Format = Dict[str, Any]
+
+# Relative cost weights; bytes are counted in MB
+COST_PER_MB = 1.0
+COST_PER_STREAM = 5.0
+COST_MERGE = 20.0  # ffmpeg remux of separate streams
+COST_TRANSCODE = 200.0  # full re-encode
+
+# Minimum audio bitrate (kbps) accepted for mp3 output when available
+MP3_MIN_ABR = 128
+# ... and for speech-to-text, which decodes to 16 kHz mono anyway
+SPEECH_MIN_ABR = 32
+# Protocols ffmpeg can read straight from the URL (for streamed transcription)
+_STREAMABLE = {"http", "https", "m3u8", "m3u8_native"}
+
+_MP4_VIDEO = ("avc", "h264", "hev", "hvc", "h265", "av01")
+_MP4_AUDIO = ("mp4a", "aac")
+
+
+@dataclass
+class FormatPlan:
+    formats: List[Format]
+    est_bytes: Optional[int]
+    merge: bool = False
+    transcode: bool = False
+    cost: float = 0.0
+
+    @property
+    def format_id(self) -> str:
+        return "+".join(str(f.get("format_id")) for f in self.formats)
+
+    def describe(self) -> str:
+        # Short human summary for the downloading row, e.g. "720p mp4 · tek akış · ~45 MB"
+        parts = []
+        v = next((f for f in self.formats if _has_video(f)), None)
+        a = next((f for f in self.formats if _has_audio(f) and not _has_video(f)), None)
+        if v is not None:
+            parts.append(f"{v['height']}p {v.get('ext') or ''}".strip() if v.get("height") else (v.get("ext") or "video"))
+        elif a is not None:
+            abr = a.get("abr")
+            parts.append(f"{a.get('ext') or 'ses'} {int(abr)}k" if abr else (a.get("ext") or "ses"))
+        parts.append("tek akış" if len(self.formats) == 1 else f"{len(self.formats)} akış + birleştirme")
+        if self.transcode:
+            parts.append("dönüştürme")
+        if self.est_bytes:
+            parts.append(f"~{self.est_bytes / (1024 * 1024):.0f} MB")
+        return " · ".join(parts)
+
+    def to_ydl(self) -> Format:
+        # Shape yt-dlp expects from a custom format selector
+        if len(self.formats) == 1:
+            return self.formats[0]
+        v, a = self.formats
+        return {
+            "format_id": self.format_id,
+            "ext": _merge_ext(v, a),
+            "requested_formats": self.formats,
+            "protocol": f"{v.get('protocol')}+{a.get('protocol')}",
+        }
+
+
+# Same convention as yt-dlp: an unknown codec (None) counts as present
+def _has_video(f: Format) -> bool:
+    return f.get("vcodec") != "none"
+
+
+def _has_audio(f: Format) -> bool:
+    return f.get("acodec") != "none"
+
+
+def _codec_in(codec: Optional[str], prefixes) -> bool:
+    c = (codec or "").lower()
+    return any(c.startswith(p) for p in prefixes)
+
+
+def _merge_ext(v: Format, a: Format) -> str:
+    # Mirrors yt-dlp's default: keep the container when both streams fit it
+    if v.get("ext") == "mp4" and a.get("ext") == "m4a":
+        return "mp4"
+    if v.get("ext") == "webm" and a.get("ext") == "webm":
+        return "webm"
+    return "mkv"
+
+
+def estimate_bytes(f: Format, duration: Optional[float]) -> Optional[int]:
+    size = f.get("filesize") or f.get("filesize_approx")
+    if size:
+        return int(size)
+    tbr = f.get("tbr") or ((f.get("vbr") or 0) + (f.get("abr") or 0))
+    if tbr and duration:
+        return int(tbr * 1000 / 8 * duration)
+    return None
+
+
+def _plan(formats: List[Format], duration: Optional[float], transcode: bool = False) -> FormatPlan:
+    sizes = [estimate_bytes(f, duration) for f in formats]
+    est = sum(sizes) if all(s is not None for s in sizes) else None
+    merge = len(formats) > 1
+    cost = COST_PER_STREAM * len(formats)
+    # Unknown sizes are penalized so that a known-small stream wins ties
+    cost += (est / (1024 * 1024) if est is not None else 1000.0) * COST_PER_MB
+    if merge:
+        cost += COST_MERGE
+    if transcode:
+        cost += COST_TRANSCODE
+    return FormatPlan(list(formats), est, merge=merge, transcode=transcode, cost=cost)
+
+
+def _video_candidates(formats: List[Format], duration: Optional[float], mp4_only: bool) -> List[FormatPlan]:
+    muxed = [f for f in formats if _has_video(f) and _has_audio(f)]
+    video_only = [f for f in formats if _has_video(f) and not _has_audio(f)]
+    audio_only = [f for f in formats if _has_audio(f) and not _has_video(f)]
+    if mp4_only:
+        muxed = [f for f in muxed if f.get("ext") == "mp4"]
+        video_only = [f for f in video_only if f.get("ext") == "mp4" and _codec_in(f.get("vcodec"), _MP4_VIDEO)]
+        audio_only = [f for f in audio_only if f.get("ext") == "m4a" or _codec_in(f.get("acodec"), _MP4_AUDIO)]
+    # Only the streams that can be delivered count toward the quality bar:
+    # with mp4_only a resolution offered only as VP9/webm is out of reach
+    videos = muxed + (video_only if audio_only else [])
+    if not videos:
+        return []
+    # Quality bar: the best resolution (and frame rate at it) on offer
+    bar = max((f.get("height") or 0) for f in videos)
+    fps_bar = max((f.get("fps") or 0) for f in videos if (f.get("height") or 0) >= bar)
+
+    def meets(f: Format) -> bool:
+        return (f.get("height") or 0) >= bar and (f.get("fps") or 0) >= fps_bar
+
+    muxed = [f for f in muxed if meets(f)]
+    video_only = [f for f in video_only if meets(f)]
+
+    plans = [_plan([f], duration) for f in muxed]
+    if audio_only:
+        # Best audio per container family keeps the pairing list short
+        best_audio: Dict[str, Format] = {}
+        for a in audio_only:
+            key = a.get("ext") or ""
+            cur = best_audio.get(key)
+            if cur is None or (a.get("abr") or a.get("tbr") or 0) >= (cur.get("abr") or cur.get("tbr") or 0):
+                best_audio[key] = a
+        for v in video_only:
+            for a in best_audio.values():
+                plan = _plan([v, a], duration)
+                if _merge_ext(v, a) == "mkv":
+                    plan.cost += COST_PER_STREAM  # cross-container remux
+                plans.append(plan)
+    return plans
+
+
+def _audio_candidates(formats: List[Format], duration: Optional[float], speech: bool = False) -> List[FormatPlan]:
+    if speech:
+        formats = [f for f in formats if (f.get("protocol") or "https") in _STREAMABLE]
+    audio_only = [f for f in formats if _has_audio(f) and not _has_video(f)]
+    if not audio_only:
+        # Fall back to muxed streams; the video track is discarded on extraction
+        audio_only = [f for f in formats if _has_audio(f)]
+    if not audio_only:
+        return []
+    best_abr = max((f.get("abr") or f.get("tbr") or 0) for f in audio_only)
+    bar = min(SPEECH_MIN_ABR if speech else MP3_MIN_ABR, best_abr)
+    plans = []
+    for f in audio_only:
+        if (f.get("abr") or f.get("tbr") or 0) < bar:
+            continue
+        # Speech is decoded to PCM locally; no output re-encode
+        transcode = not speech and (f.get("acodec") or "").lower() != "mp3"
+        plans.append(_plan([f], duration, transcode=transcode))
+    return plans
+
+
+def choose(formats: List[Format], quality: str, duration: Optional[float] = None) -> Optional[FormatPlan]:
+    """Cheapest plan that meets the quality bar for ``quality``.
+
+    ``best``/``mp4`` require the top available resolution and frame rate; a
+    pre-muxed stream wins over a video+audio merge when it reaches it, and
+    ``mp4`` only considers codecs that fit the container (the bar is the
+    best of those; None if there are none). ``mp3`` takes the
+    smallest audio stream with at least ``MP3_MIN_ABR`` kbps (or the best
+    available if lower), preferring streams that need no re-encode.
+    ``speech`` takes the smallest ffmpeg-readable audio stream with at least
+    ``SPEECH_MIN_ABR`` kbps.
+    """
+    if quality in ("mp3", "speech"):
+        plans = _audio_candidates(formats, duration, speech=(quality == "speech"))
+    else:
+        plans = _video_candidates(formats, duration, mp4_only=(quality == "mp4"))
+    if not plans:
+        return None
+    # Ties go to the later (higher-ranked by yt-dlp) format
+    order = {id(f): i for i, f in enumerate(formats)}
+    return min(plans, key=lambda p: (p.cost, -max(order.get(id(f), 0) for f in p.formats)))
+
+
+def selector(
+    quality: str,
+    on_plan: Optional[Callable[[FormatPlan], None]] = None,
+    duration: Optional[Callable[[], Optional[float]]] = None,
+    admit: Optional[Callable[[FormatPlan], None]] = None,
+):
+    """yt-dlp ``format`` callable wrapping :func:`choose`.
+
+    yt-dlp passes only the format list, so the media duration (used to
+    estimate sizes from bitrates) comes from the ``duration`` callback.
+    ``admit`` runs before the plan is handed to yt-dlp; unlike ``on_plan``
+    it may block or raise to hold or reject the download. When no plan
+    scores, the returned callable's ``fallback`` attribute (a yt-dlp
+    selector, e.g. built from the quality's fixed format string) picks
+    instead; without one the last (best-ranked) format goes through.
+    """
+
+    def select(ctx: Dict[str, Any]) -> Iterator[Format]:
+        formats = ctx.get("formats") or []
+        plan = choose(formats, quality, duration() if duration is not None else None)
+        if plan is None:
+            if select.fallback is not None:
+                yield from select.fallback(ctx)
+            elif formats:
+                yield formats[-1]
+            return
+        if on_plan is not None:
+            try:
+                on_plan(plan)
+            except Exception:
+                pass
+        if admit is not None:
+            admit(plan)
+        yield plan.to_ydl()
+
+    select.fallback = None
+    return select
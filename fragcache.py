@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import random
+import shutil
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+
+from yt_dlp.downloader.fragment import FragmentFD
+
+try:
+    from settings import SETTINGS_FILE
+except Exception:
+    from .settings import SETTINGS_FILE
+
+
+# Fetched HLS/DASH fragments, one folder per stream, next to settings.json
+CACHE_DIR = SETTINGS_FILE.parent / "fragment_cache"
+# Streams not touched for this long are dropped (abandoned downloads)
+CACHE_TTL = 3 * 24 * 3600
+
+RETRIES = 10
+FILE_ACCESS_RETRIES = 3
+BACKOFF_BASE = 1.0
+BACKOFF_CAP = 30.0
+
+
+def backoff(n: int) -> float:
+    """Seconds to wait before retry ``n`` (0-based): exponential with equal jitter.
+
+    Half of the exponential step is fixed and half random, so connections
+    that failed together (one flaky CDN node) do not retry in lockstep.
+    """
+    step = min(BACKOFF_CAP, BACKOFF_BASE * (2 ** n))
+    return step / 2 + random.uniform(0, step / 2)
+
+
+def retry_opts() -> Dict[str, Any]:
+    return {
+        "retries": RETRIES,
+        "fragment_retries": RETRIES,
+        "file_access_retries": FILE_ACCESS_RETRIES,
+        "retry_sleep_functions": {"http": backoff, "fragment": backoff, "file_access": backoff},
+        # A fragment that still fails stops the job (and stays missing from the
+        # cache) instead of leaving a silent gap in the file
+        "skip_unavailable_fragments": False,
+    }
+
+
+def stream_key(info: Dict[str, Any]) -> str:
+    # Signed stream URLs change on every extraction; the video and format id
+    # do not. Without them, the URL minus its query string.
+    vid, fmt = info.get("id"), info.get("format_id")
+    if vid and fmt:
+        return f"{info.get('extractor_key') or info.get('extractor') or ''} {vid} {fmt}"
+    parts = urlsplit(info.get("manifest_url") or info.get("url") or "")
+    return f"{parts.netloc}{parts.path}"
+
+
+def cache_dir(info: Dict[str, Any]) -> Path:
+    return CACHE_DIR / hashlib.sha1(stream_key(info).encode("utf-8")).hexdigest()[:20]
+
+
+_pruned = False
+_prune_lock = threading.Lock()
+
+
+def prune(max_age: float = CACHE_TTL) -> None:
+    global _pruned
+    with _prune_lock:
+        if _pruned:
+            return
+        _pruned = True
+    cutoff = time.time() - max_age
+    try:
+        entries = list(os.scandir(CACHE_DIR))
+    except OSError:
+        return
+    for e in entries:
+        try:
+            if e.is_dir() and e.stat().st_mtime < cutoff:
+                shutil.rmtree(e.path, ignore_errors=True)
+        except OSError:
+            pass
+
+
+def _link_or_copy(src: str, dst: str) -> None:
+    # Same volume: a hard link costs nothing; the fragment reader deletes only its name
+    tmp = dst + ".tmp"
+    try:
+        os.link(src, tmp)
+    except OSError:
+        shutil.copyfile(src, tmp)
+    os.replace(tmp, dst)
+
+
+class CachedFragmentsMixin:
+    """Keeps every fetched fragment of a stream until the stream is complete.
+
+    yt-dlp's own resume data (``.part`` + ``.ytdl``) only covers the
+    contiguous prefix and is lost with the ``.part`` file. With this cache a
+    retried or resumed job, even one that starts from scratch, fetches only
+    the fragments that are not in ``cache_dir(info)`` yet.
+    """
+
+    def _download_fragment(self, ctx, frag_url, info_dict, headers=None, request_data=None):
+        folder = cache_dir(info_dict)
+        cached = folder / f"{ctx['fragment_index']}.frag"
+        fragment_filename = "%s-Frag%d" % (ctx["tmpfilename"], ctx["fragment_index"])
+        if cached.is_file():
+            _link_or_copy(str(cached), fragment_filename)
+            ctx["fragment_filename_sanitized"] = fragment_filename
+            # Count it like a downloaded fragment so progress stays right
+            size = os.path.getsize(fragment_filename)
+            ctx["dl"]._hook_progress({
+                "status": "finished", "downloaded_bytes": size, "total_bytes": size,
+                "filename": fragment_filename, "ctx_id": ctx.get("ctx_id"),
+            }, {})
+            return True
+        if not super()._download_fragment(ctx, frag_url, info_dict, headers, request_data):
+            return False
+        try:
+            folder.mkdir(parents=True, exist_ok=True)
+            _link_or_copy(ctx["fragment_filename_sanitized"], str(cached))
+        except OSError:
+            pass  # caching is best effort
+        return True
+
+    def _finish_frag_download(self, ctx, info_dict):
+        result = super()._finish_frag_download(ctx, info_dict)
+        shutil.rmtree(cache_dir(info_dict), ignore_errors=True)
+        return result
+
+
+_cached_classes: Dict[type, type] = {}
+
+
+def cached(fd_cls: type) -> Optional[type]:
+    """Fragment-caching subclass of a yt-dlp fragment downloader, else None."""
+    if not isinstance(fd_cls, type) or not issubclass(fd_cls, FragmentFD):
+        return None
+    if fd_cls not in _cached_classes:
+        prune()
+        _cached_classes[fd_cls] = type("Cached" + fd_cls.__name__, (CachedFragmentsMixin, fd_cls), {})
+    return _cached_classes[fd_cls]
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from PySide6.QtCore import Qt, QDirIterator
+from PySide6.QtGui import QIcon, QPixmap
+
+# Compiled resource bundle (generated by: pyside6-rcc assets/icons/icons.qrc -o icons_rc.py).
+# Importing it registers ":/icons/..." in memory; no filesystem access afterwards.
+try:
+    import icons_rc  # noqa: F401
+    _HAS_RESOURCES = True
+except Exception:
+    try:
+        from . import icons_rc  # noqa: F401
+        _HAS_RESOURCES = True
+    except Exception:
+        _HAS_RESOURCES = False
+
+
+# Pixel sizes used by the UI (tabs/kind icons, row actions, toolbar buttons)
+ICON_SIZES: Tuple[int, ...] = (24, 28, 32)
+
+_RESOURCE_ROOT = ":/icons"
+_EXTS = (".png", ".ico")
+
+
+def _disk_icon_dir() -> Optional[Path]:
+    # Same candidate roots the window used to probe per call, resolved once:
+    #  - <frozen_root>/assets/icons (PyInstaller)
+    #  - <repo_root>/assets/icons
+    #  - <package_dir>/assets/icons
+    pkg_dir = Path(__file__).resolve().parent
+    repo_root = pkg_dir.parent
+    frozen_root = Path(getattr(sys, "_MEIPASS", repo_root))
+    for root in (frozen_root, repo_root, pkg_dir):
+        d = root / "assets" / "icons"
+        if d.is_dir():
+            return d
+    return None
+
+
+def _add_source(found: Dict[str, str], filename: str, src: str) -> None:
+    name, ext = os.path.splitext(filename)
+    ext = ext.lower()
+    if ext not in _EXTS:
+        return
+    # .png wins over .ico for the same name
+    if ext == ".png" or name not in found:
+        found[name] = src
+
+
+class IconRegistry:
+    """Process-wide icon cache.
+
+    All icons are loaded once (from the compiled resource bundle, or from a
+    single directory listing as a fallback) and pre-rendered at ``ICON_SIZES``.
+    Lookups afterwards are plain dict hits returning implicitly shared Qt objects.
+    """
+
+    def __init__(self):
+        self._sources: Dict[str, str] = {}
+        self._icons: Dict[str, QIcon] = {}
+        self._pixmaps: Dict[Tuple[str, int], QPixmap] = {}
+        self._empty = QIcon()
+        self._discover()
+        for name in list(self._sources):
+            self._load(name)
+
+    def _discover(self) -> None:
+        # name -> source path
+        found: Dict[str, str] = {}
+        if _HAS_RESOURCES:
+            it = QDirIterator(_RESOURCE_ROOT)
+            while it.hasNext():
+                p = it.next()
+                _add_source(found, p.rsplit("/", 1)[-1], p)
+        if not found:
+            d = _disk_icon_dir()
+            if d is not None:
+                try:
+                    entries = os.listdir(d)
+                except Exception:
+                    entries = []
+                for fn in entries:
+                    _add_source(found, fn, str(d / fn))
+        self._sources = found
+
+    def _load(self, name: str) -> None:
+        src = self._sources.get(name)
+        if not src:
+            return
+        base = QPixmap(src)
+        if base.isNull():
+            return
+        icon = QIcon()
+        icon.addPixmap(base)
+        for size in ICON_SIZES:
+            pm = base if base.width() == size and base.height() == size else base.scaled(
+                size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation
+            )
+            icon.addPixmap(pm)
+            self._pixmaps[(name, size)] = pm
+        self._icons[name] = icon
+
+    def icon(self, name: str) -> QIcon:
+        # Unknown names return an empty icon so UI stays functional
+        return self._icons.get(name, self._empty)
+
+    def pixmap(self, name: str, size: int) -> QPixmap:
+        pm = self._pixmaps.get((name, size))
+        if pm is not None:
+            return pm
+        icon = self._icons.get(name)
+        if icon is None:
+            return QPixmap()
+        pm = icon.pixmap(size, size)
+        self._pixmaps[(name, size)] = pm
+        return pm
+
+
+_registry: Optional[IconRegistry] = None
+
+
+def registry() -> IconRegistry:
+    # Created lazily: QPixmap needs a QGuiApplication instance
+    global _registry
+    if _registry is None:
+        _registry = IconRegistry()
+    return _registry
+
+
+def icon(name: str) -> QIcon:
+    return registry().icon(name)
+
+
+def pixmap(name: str, size: int) -> QPixmap:
+    return registry().pixmap(name, size)
@@ -0,0 +1,1466 @@
+# Resource object code (Python 3)
+# Created by: object code
+# Created by: The Resource Compiler for Qt version 6.12.0
+# WARNING! All changes made in this file will be lost!
+
+from PySide6 import QtCore
+
+qt_resource_data = b"\
+\x00\x00\x02V\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
+\x00\x00\x00\x04sBIT\x08\x08\x08\x08|\x08d\x88\
+\x00\x00\x00\x09pHYs\x00\x00\x00\xec\x00\x00\x00\xec\
+\x01y(q\xbd\x00\x00\x00\x19tEXtSof\
+tware\x00www.inksca\
+pe.org\x9b\xee<\x1a\x00\x00\x01\xd3ID\
+ATX\x85\xed\x96;k\x14Q\x14\xc7\x7f\xe7\xce+\
+\xb33\x0a\x09Bj\xc1\xc6o!\xa2\xa0i\xb4\xd0O\
+\xa0\x88\xddjp\xd7\xd8\x19$\xd9\x14\xbe\xd0^\xb1\xb3\
+\x10?\x81b\xe1+\x95\xfa\x01\xb4\xb0\x10\x92\xb9\x83\x11\
+\xdf\xae\xee\xbd6\xc9\xb2\xc4dw\xe6\xee\x04\x9b9\xdd\
+\xccy\xfc\xfe\xdc\xcb9\xe7\x0a\xc0\xf4\x83\x95'\xc0\x01\
+\x1c\xcc\xbe\xdb\xe3\x92\x86\x9d\xe8\xad\xe9f4\xa5\xd6\xbf\
+\x9d\xe0\xe3\x98\xfc\xf4&\x01\xd4\xa8\xc0\x9d\xb6Z\x80\x0f\
+\xc0\xf7\xe8-\x7fd\x9f[\x85_nd\x91n_\x80\
+YIN\x8aU\x8f\x81\xa9\xb2uz\x1f\xbe\x95\x87+\
+\xb1*Vg`\xfd\x0at;|c\x8d9\x04|,\
+_\xcd\x09~Jw\xd2{}\x01\x00\xfaR\xf8\xda\x88\
+9,\xb0\xb6cp\x11\xabvy\xa7u'\xbd\xdb\xd7\
+3\xe8\xcf\xdb\xe1+03X>W\x0f\x07\x95\xf8M\
+}%\xb93\xf8\xfb\x9f.X\xbd\x18.\xe3\xd9#\xc0\
+\x97J\xe1i\xd4\xd4\x8b\x8d\xdb\x9b][\xb6a\xd6\x0a\
+^b+\x12! \x0d\xef\xbc^\x98\xb8\xb5\x95{\xdb\
+9\x90\xcd\x05/\x10{\x14\xf8:\x16<\x09f\xf3N\
+zs\xbb\x90\xa1\x83(k\x07\xcf\xadu\x14! \xb1\
+w!_l\xdc\x18\x166r\x12\xea\xb9\xe0\x99\x15;\
+\x03\x14ox\x01I\x83V\xbe\x94^\x1b\x15Zh\x14\
+\xebv\xf0T\x94=\x0e\xfc(\x04\x8f\xfd\xcb\xf9B\xe3\
+j\x91\xda\x85w\xc1j+x\x04\xf6\x18b\xcdP~\
+\xec\xcf\xe7K\xc9|\xd1\xbaR4p\xc36?^\x06\
+\x1f$6\xea}\xd2\xe7\xa2\xc92\xf5\xfe\xfb6\xac\x05\
+\xd4\x02j\x01\xb5\x80J\x05\x882\xa5\xb7fu\x02\xe2\
+\xdf\xef\xc3\xb0{\xb0l\x9a?6\xd83\x86\xb4{=\
+;\x9b\xb6\x5c\xd2\xc7;\x01\xe1~\xb0\xdb\xecw\x85\x83\
+\xdb\x09,\x03{\xad\x95\xd9\xec\xc4\xf4CW\xf0\x86\xfd\
+\x05\xb6%\x85[\xac\x93=\x00\x00\x00\x00\x00IEN\
+D\xaeB`\x82\
+\x00\x00\x026\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
+\x00\x00\x00\x09pHYs\x00\x00\x00\xec\x00\x00\x00\xec\
+\x01y(q\xbd\x00\x00\x00\x19tEXtSof\
+tware\x00www.inksca\
+pe.org\x9b\xee<\x1a\x00\x00\x01\xc3ID\
+ATX\x85\xc5\x97;N\xc3@\x10\x86\xbfq\xec\x80\
+\xc4SP\x90\x82\x82\x06\x09\x09J\x8eAC\xc3!\x90\
+8\x04\xe2\x00\x1c\x04\x89\x86\x8a\x0bPA\x0dH\x94 \
+!\xf1\x08\x01\x82H\xfc\x18\x0a\x1c\x04\xc9\xaeY\x9b\xb5\
+\xf8%7;\xb3\xfb\x7f\x99\x9d\xf5:\xe0(\xa5\xb9\x92\
+\x10\xb5\x13\x22\xfd\xe5i+\xcd\x15\xd7u\x03\xd7\xc4\x14\
+V\x81Y\x87\xd4\xd9<\xd7/@]\x12\xd7D\x85&\
+0\xe1\x98\xde\x15\xe8W\x02Ph\xc0\xf8\x22\xd0p\x85\
+sT\x0a\xef\xd7\x02\xa9\x15\xa0O\xb4\x1e G\xa0-\
+\xcf\xe6\x03\xbb\xdb\x0c\xddh\x12\x9f\x0dF~\xf4@\x80\
+\xec\xd6g\x0e\xa0\xadO\x8f\xef\x9e\xdf\xf9\xd0\x85\xfa\xcc\
+\xbf<~\xfc\xc0\x7f?\x05\xff.\xe31T\xc6\x96c\
+\xb2i\x9fF\x11AG\xe8]9\x01$\x84\x87 \x9b\
+>\x01\x80\x83\x90xkx\xd0\xd2\x03\xd2\xf6l\x0e\xf0\
+`\x1a4\x02(\xf2h[E\xe1\x1cx1\x84\x9e\x15\
+.\xec\xf3\xcck\x1a\x01\x022[\x05\xeeB\xe25`\
+g4$\xdby\xccb\x94\xb9\x03\x14l\xc1\x9b@\x06\
+b\xaa\xc0k\xfe\x9a\xed\x9a&*r\xef\x0cP\xb4\x05\
+\xd5\x95\x95\xe9\x01\xeb\x16TV\xa9\x1e\xa8\xa3\x02!\x0d\
+\xf7\x0aD\x045\x1c\xc3\x9e;\x00\xf4|W@\x81\xa7\
+\x12\x00t\x18\xfap\xf8\xa3:\x02\x893\xc0\xe7Q\xa3\
+\xe3\x11\xc0X~+@.\x9f}P\x09\xc0c\x1f\xd8\
+OU\x01\x80\xcf\x0bI\xabT@\xbdU@=\xf6\xc0\
+\xbc\xc2\x94\x90-\x0d\x07\x04]R\x98\x01\xe6F\xa7\xd9\
+\xab\x19\xda\x02\x8a<\x0a:<<\x99\x12\xdd\x00\x93\xa3\
+\xf9\xec\xa7D{\x18\xfe\xbc\x04U\xb6\xa0\xe0J\x9e\xc2\
+\xfc%%ylD\x8a\x94\x07(\x9aTVJf\xbc\
+\x8a\x0b\x01\x1a\xc4\xc7\x0a\x97\x1e\xfcOC\x92\x13[\xf0\
+\x037\x84\x97\xd7\x90J3e\x00\x00\x00\x00IEN\
+D\xaeB`\x82\
+\x00\x00\x03\x06\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
+\x00\x00\x00\x09pHYs\x00\x00\x00\xec\x00\x00\x00\xec\
+\x01y(q\xbd\x00\x00\x00\x19tEXtSof\
+tware\x00www.inksca\
+pe.org\x9b\xee<\x1a\x00\x00\x02\x93ID\
+ATX\x85\xc5\x97\xb1O\x13a\x18\x87\x9f\xf7Zh\
+\xe2\xa0@\x1b\x05b\x84\xcdN\xe5.\xc4\x18aRb\
+\xe2\xa4\x01#\x7f\x82\x0e:\x9a\xa8\x8b\x81\xb8\xe8f\x1c\
+\x8c\x89\xff\x81\x89\xe8\xa8\x127I\x10\xc5\xf6\xda\x90\xe0\
+d\x8a!\x80\xb1`H0\x16\xdb\xefuh\xaf\xb4J\
+\xa1\xb5\xed\xf1L\x97\xf7\xfb\xee\xfb=w\xf7\xe5\xde;\
+8`\xa4\x9e\xc9\x0aV&\x16;%\x22\xc3@\xaf\xc0\
+\xd1b\xfd\x1b\xb0\xac0\x13v\xdd\x8f\x02\xa6\xa9\x02\x1b\
+\xb6\xddoTo\x03\xa3\x14C\xf7`M\xe1E\xc0\xb2\
+\xeew\xc6\xe3\xe9\x86\x046\xa3\xd1p.\x14\x9aP\xb8\
+\x0a\xb4\xd7\x22[\xc66\xf0$\x98\xcbM\x1eYXX\
+\xaf[ \xe38g0\xe6\x19p\xbc\xce\xe0JT\x97\
+\x14\xc6#\xc9\xe4\xfb\x9a\x052\xb1\xd8\x05D\x9e\x03\x87\
+\x1a\x0a\xdf\xe1'0\x16v\xdd\xd7\xfb\x0adl{\x08\
+\xd5\xe9&\x86{l)\x9c\x8b\xb8\xee\x5cU\x81\xcdh\
+4\xfc;\x14J\xd0\xe8m\xaf\x86\xeaR@\xd5\xeeH\
+\xa56\xbc\x92U>\x9e\x0b\x85&[\x16\x0e r\x22\
+/r\xb7\xa2\xe4\x1dl\xd8v\x7f^uQ \xd42\
+\x81\x02\xdb\x01\xd5hG2\xf9\x05 \xe8U\x8d\xea\x9d\
+=\xc3G\xce\xc3\x80][\x84\x9b\x80\xb7\xd3\xd5F\xdb\
+sp\x13\xb8^\x12P\xb0\xd6\xe1\xd2\x9e\x8b\x0e\xd8p\
+q\xef)\x15T\x17@DF\x15n\x08\xa8\x05\xb0\xee\
+8\xa7\x81c\xb5\xaf\xde0=\xdf\x1dg\x10\xbcMh\
+\xcc\x90\x8f\xe1\x00X\xf9\xfc\xf0\x8e\x00\xf4\xf8-\xa0\x22\
+=%\x01\x85n\xbf\x05\xacr\x81\x82\x83\xbf\xa81Z\
+\x12\x10\x91U\xdf\x05DVJ\x02\xa8\xfa. \xc5L\
+O`\xc6o\x01\xa3\xfa\xae$\xd0\x95L\xce\x01k>\
+\xe6\xafDR\xa9OP|\x13\x0a\x98\x0c\xbc\x04\xaeU\
+=\xc5M\xd4\xbe\xfc>s\x05\xa6\xa4\xb8\xf1w\x9a\x91\
+\xe3\xf4\xe5\x8d\xf9\xecC3\xfa%\xc1\xe0\xc9\xae\xf9\xf9\
+%(k\xc7\x9d\xf1x\xda\x82\xa7-\x0e\x07x\xec\x85\
+W\x08\x00\x04\xb3\xd9\x09\xe0k\x0b\xc3\xd3\x96\xc8\xbd\xf2\
+B\x85\xc0\xe1\xc5\xc5\x0c\xaa\xe3\x14\xbe\xe1\x9a\xcd\x96\x8a\
+\x5c\xe9L$~T\x15\x00\x08'\x93\xb3\xa8^n\xb2\
+\xc4\x160\x16I$>\xfc=\xf0\x8f@Q\xe2\x15\xaa\
+#4\xe7q\xa4U\xe4l\xd8u\xdf\xec6\xb8\xab@\
+Qb6\x98\xcb\xd9\xc0#\x85l\xbd\xa9\x0aYT\x1f\
+Z\x22\xf6nW\xeeQ\xdb\xaf\x99\xe3\xf4\xe5Uo\x89\
+\xea(\xfbw\xceUU\x9d\xb2\xda\xda\x1e\x94\xef\xf6\x86\
+\x04<\x14\xac\x8cm\x0f\x0a\x0ccL\xaf\x88t\x03h\
+\xe1\xbd\xbel\x02\x81\x99H<>/\x07\xd0]\xff\x9b\
+?\xa5\x9d\xf1Q\xc0\xb5\xe3\xae\x00\x00\x00\x00IEN\
+D\xaeB`\x82\
+\x00\x00\x05\xc6\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
+\x00\x00\x00\x04sBIT\x08\x08\x08\x08|\x08d\x88\
+\x00\x00\x00\x09pHYs\x00\x00\x00\xec\x00\x00\x00\xec\
+\x01y(q\xbd\x00\x00\x00\x19tEXtSof\
+tware\x00www.inksca\
+pe.org\x9b\xee<\x1a\x00\x00\x05CID\
+ATX\x85\xbd\x96K\x8c\x5c\xc5\x15\x86\xbfS\xb7\xfa\
+\xf6k\xde\xc6=#&X2\x90\xf0\x12\xc4\x96\xc7F\
+l\x90F\x13)b\x91\xac\xb2\xc82\x82E\xd6H\x88\
+\x0d\xbbd\x81X\xf0\xda ,dv,\x90@a\x83\
+@\x8a\x1c9\x11R\x14<\x96\x8d\xc8\xc2Rl\xe2\xd8\
+\x8e\xc9\x0c\x99\xf7\xb8\xe7v\xf7\xad:,\xaa\xee\x1d\xc6\
+\xee\x1e\x981p\xa4j\xdd\xae\xae\xae\xf3\x9fs\xfe\xf3\
+\x9f+|\xc3N\xce\xcfW\x16\xc7\xf3\xe7V|\xf7\xe9\
+L\xddO\x9c\xf75\x10\xee\xcc\x94\xc4\x98\xacn\x92k\
+cI\xe3Tk\x89W~?3\xd3+~-o\x7f\
+\xf1\xca\xd9\xa37\xba\xed\xd3\x0bY{\x5c\xef\xd0\xe5 \
+\x13`\xb2\xda\x5c\x9eJks/\x1c>q\xa1\x04\xf0\
+\x87+g\x8f^\xd9\xdc\xf8t=\xef\xd8\x1f\xc8\xf7\x0e\
+\x1bM\xd2\xfc\xde\xa1\xe1\xe3/\x1c>qAN\xce\xcf\
+W\xce76\x17\x16;[\xe3?\x86\xf3\xc2Zic\
+\xf9\xe8Vs\xca\xfe\xbb\xd9}n\xa1\xbd\xf5\x83\xa5}\
+\x90-d\xed\x89/\x86\xd2g\xedr\xde}\xda\xf9\x1f\
+\xd9{\xb4\xd5n\xef\x19\xbb\xd5s\xf7\xe8\xf7\x04\xc0\x88\
+p\x7f}\x98\x99\xe1\x09~\x966i\xd9*k\xdd.\
+\xcf_\xf9\x9c\xa4r{7m\xf5\xf2C\xb6\xe7H\xfd\
+>\x01LV\xeb\x9c\x18>\xc0\xa3\x8d\x11\xa6\xd3\x1aC\
+\xc6\xe2\xf2\x1c\xd5PPu\x9e\x83\x95\x94\xc5\xcbK\xb4\
+\xee?\x80\x98\x9d \xba^\xab\xd6\xab\xca^\x01\xfc\xee\
+\xee{\x99\x1bk!\xde\xa3\xaa\xe5\xf2\xce\xf5=\x9fw\
+<_}\x99q`\xb2\x8e\x98\xed}\xaf*\xd69\xd8\
++\x80_NL\xe2rWF\xfa\xad&\xe0\xba\xb0\xb2\
+\xd8a\xf4\xae\xb4\xcc\x84s`\xbc*\xaa\xeci\xb1\xc7\
+\x96\x11\x150\x90;e}\xb9\x87w\xe1\x1e\xaf\x8aU\
+\xbf\xf7\x0c\xf4u\x22\x82\x88\xd0\xe9tX]]\xa5\xd3\
+\xe90==]f |\x08y\x0e\x9b\xab]\x1a#\
+)j\xc0\xba;\x00 \x22\xac\xad\xad\xb1\xb8\xb8\xc8\xd5\
+\xeb\xd7\xb9\xb4\xbc\xca\xf5\xad\x0e_ze+\xb1\x9c\xfa\
+\xcd\xaf\xb1I\x02\x22a!\x08\x8asB{3\xa7>\
+\x9a`\xfd>\x01\x18cx\xf3\xfd\x0f8\xbfz\x93\x1b\
+jX\xb2)\xda\xa8\x93\x8c\x8eE\x7f\x06\x1fG\x8d\x8a\
+\x80\x0a\x22\x1a\x9e\x11\x9c\x83\xf6\xa6\xc3z\xaf\xecG\x07\
+\xba\xbd\x1eo\xaf8d\xa4\x15\x1c\x1a\xc1Dr\x89\x9a\
+\x10p\x91)\x0d\x91C\x00B\x04\xe4r\xc5z\xdd_\
+\x06<\xc0\xf0H\xf4\x10\xea\x8f\x04\xe7j\xe2^yZ\
+\xcb\x12\x14\xce\xc3\xff\x88%\xd8\xcf \x88\x01a$\xb4\
+\x95\x00\x18\xee\x19i\xf2\xd4\xa1)\x0e\x0f7\xa9$\xa6\
+\x04\xa8l\xf3\xa0p\xee\x91\xbdg@n\xfb\x16\x92;\
+Yo\xf0\xc6\x93G9XI\xf0\xf1B\xef=\xc6\x18\
+T\x05\x89\xe9W\x05\x0c\xa8\x06P\xd6;\xbe\x13\x07\x1a\
+\xd6\xf2\xf0\xe80\xb3\xadV\xe9 \xb4\x1e\x8cV\xaa\xbc\
+\xfb\x8b\xe3\x98\xa8\x88\xb7\xa3\x8e\x91\xc7J\x04@\x80\x07\
+\xebTw\xcd@\xab^\xe3\xc5G\x1f\xe2P\xb3\x81w\
+;\xd5Oc\xcd_z\xe2\x11\xcc\x00U\x14\x11T%\
+\x90\xc6\x80\x22H<\xeaE\xb1\xba\x8b\x14\x1f\x1en\xf2\
+\xd6\x89#\xe0=\xda\xe7\x90x\x03\x06\x1e\x18\x1d\x1a\x18\
+\xc0\x7f\x17\xbfB\x93\xf0\xa2UF\x1e\x92\x81z0.\
+r\xa0\xdfz\xf9\xc8#\xc8\x80\xc8\x9c\xf7\xa8\x84\x1e\xdf\
+\xbc\xd9\xee\x1by\x96e\xbc\xf4\xe7\xbfB\xb5\x16j~\
+\x8b\xa4{\x04\xa3> \xb9u\xd5\xc50^M\x07F\
+v\xee_\x97)H\xf8\xda\xe9O\xd8\xd8\xd8\xc0\x18\x83\
+1\x06\xe7\x1c\x17/^\xe4\x8f\x1f|\xc4?G&C\
+\x09\x8a\x19R\x02\x08{A\x8a\xfb\x059\xe05ID\
+X[_\xe7\xf5\x7f|\x0ecS\x80\xf0\x17\x9a\xac}\
+t\x86\x07SP\xaf,ts>\xcb\x0d+\x13\xd3`\
+w\xbe\xe7\x86\xee\x0d\xce\xbd\x0a\xd6#\xea\xfd-\xdd\x05\
+l\x00\x7f?\x7f\x81\xc7\x7f\xfeX\x10\x19\xc09\xc7\xa5\
+\xcb_\xf0\xfa\xdf\xceru\xa8E\xa1\xed^\x0c\xf3\x8d\
+\x83\x9c#6e\xd5 \xc96\xf3!j\x8fF\xe7\x04\
+2zP9\xf6\xde\xc7Y\xd6\xd5j\xbfh\xc7\xb26\
+O\xf9M\xee\x1b\x1b\xa2\x93\xe7\x5c\x5c\xde\xe0\x93\xf5\x1e\
+7FZHb\x11Q\xc4\xc4\x1e7A\x0d\xb7\x07\xdf\
+\xf6s!~Bh[\x8d\xc0\xeb\xa9\xcdl\x22rU\
+\xbd\xfe\xb4\x1f\x80\x95\xb4\xc1;\xaeJ\xf6\x9f5T\x15\
+\xa9\x8d\xc3h\x12\x1d\xdd\xae\xed(A\x86#\xdb\x0b\xb1\
+\xd4\x22\x05Q\x03@\x03\x08\xe1\x9a\xb1\x89=\xe5w\xe9\
+\x04\x95\x84\xf4\xaeq\xa41\x84\x9a$:\x0a\x17\x14j\
+\xa6H /\xa1\xae;\x98\xae\xdb{^\x05\xaf\x8a\xf7\
+\x82\x07*\xc6\x9f\x92c\xf3\xf3\x95\xde\xa5\xa5\xffe\x99\
+\x9f\xe8\xcb\xba\xc2<\xf4:\xbd\xd0\x22q\xf8H\x9c\xf3\
+\xdfL;\xb0S\xf2\xa5|\x08\xb9\xd0P\x86z\xd5,\
+\x8dM\xa5S\xe6\xdc\xccLo\xa8\x9a\xcfY+\xb9/\
+\x11\xf7Y\x02I\xd5\xa2\xc6\x04\xaa\xc5\x01\xa3\xe1N|\
+,J\xb1\xbcF\xa2\xc5~/\x22W \xb1\xe4i\xb5\
+;wfv6/\xd9\x7f\xfcO\x1f\x1e\xb9\xd96\xa7\
+;\x19\xbbg\x02\xf0\xbd\xbc\x0c\xb1$U1\x10\x07\x10\
+Nc\xe4\xd5\x9aYj&\xdd\xb9O\x7f\xfb\xab\xcf(\
+o\x89v\xec\xe4|\xa5;\xf6\xffg\xf3\x5c\x9f\xf1N\
+\x0e\xa9\xd7\xda`\x10\x9e\xed9\xbf{\xda\xc5$Yb\
+\xf4Z-\xd5\xb7F\x0e\xd6^=3;\x9b\x17\xf7|\
+\x0d\x97M\xda\xd1\xf0r\x8f\xa6\x00\x00\x00\x00IEN\
+D\xaeB`\x82\
+\x00\x00\x03G\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
+\x00\x00\x00\x09pHYs\x00\x00\x00\xec\x00\x00\x00\xec\
+\x01y(q\xbd\x00\x00\x00\x19tEXtSof\
+tware\x00www.inksca\
+pe.org\x9b\xee<\x1a\x00\x00\x02\xd4ID\
+ATX\x85\xed\x97MHTQ\x14\xc7\xff\xe7\xf9\x9a\
+\x9e_\xa9\x90\x112 E\x14$-\x86\x81>\x18\xbd\
+#\xc1,\x841lP\x10t\x95\xd4\xa6U\xb40\x17\
+m\x02\xc1,i7\xd0*\x88\xd2lQ\x89\x06!%\
+\xf3\xde\x83\x8c\x86V5\x09\x09R6\xe4\x22P\x9f<\
+\x9d\x0f\xa79-r \xf4\xcd4\xbe\xf1\xa3\x85\xff\xdd\
+;\xe7\x9e\xfb\xff]x\xf7\xdc{\x09\x80$\x84\xe8\x04\
+p\x12\x16\x22\xa2\x11UU'\xadr\xffR}}\xfd\
+qI\x92.eI\x7f\xd64\xed\x91\xdc\xd0\xd0p\x15\
+@\x1b\x80\xc7D\xc4\x16\x00\x0bv\xcc\x01\x80\x99M\x22\
+\x9a\xb1\x88\x133_\x16B\x94\x93\xd7\xeb}\xc0\xcc\xa3\
+\x9a\xa6=\xb3kdGB\x88\x00\x115K\x00`\xb5\
+\xf2\xedV\xc6S\xdai\xe3\xf5\x92\xd7\x07\xea\xea\xea\x1c\
+N\xa7\xf3\x86\xa2(\x0dV\x05\xcc\xbc`\x18\xc6\x1dU\
+U\xc3\xdb\x02\xe0t:\xbb].Wwkkk\x89\
+U\x81a\x18\x18\x18\x18\xf0566\x9e\x0a\x85B\xd1\
+\x82\x01\x98y\x99\x88\xccL@Q\x14\x11\x08\x04J\xdc\
+nw\xd6\xa2\xb9\xb9\xb9\xd2\xc1\xc1\xc1\xdb\x00:\x0a\xf0\
+6\x99\xd9\x04\x00\xfa;\xda\xd2\xd2\xf2:\x1c\x0es.\
+%\x12\x09\xf6\xfb\xfdK\x1e\x8f\xe7D\x01\x00\x00@\x12\
+\x80M\xef\x00\x87\xc3\x81\xae\xae\xae\x92\xaa\xaa\xaa\xbb\x05\
+\x02\xf0\x86\x7f _\xf9\xfd\xfe\xa2\xf1\xf1q\xe1\xf3\xf9\
+bYgg&EQ^\x8c\x8d\x8d\xb5g\x1bc\x1b\
+@\x96e\x04\x83\xc1\x03\xb9\xc6\x98\xa6\x89\xb6\xb66_\
+\xceyr%\xe7\xe7\xe7\xf1t\xf8!\xcc%{\xdd8\
+\x95\xfa\x85\xd5\xd5D\xd9\x85\xa6\xb3C\x89T\xd1Tb\
+u_\x7f(\x14\x8a\xe7\x0d\xd0\xd7\xdb\x83\xdar\x0d\xee\
+Z\xc3\x16\x00\x00\x9c\xe9\x80\x03@\xfb\xab\xf7\xd5\xf1O\
+3\xe5\xc5\x00z\xf2\x06\xf8\xfa\xed;n^\x9fE\xa9\
+\x92\xb2\x0d\x90QYqJ\xf92[zz}<\x8f\
+V\xbc5\xc7\x04\x91\xb5\xdb\xae\x9f\x05{\x00{\x00\xff\
+'\x00\xf3\xce\xdd\xd0d!\xc4=\x00\xa3\x9a\xa6M\x00\
+@,\x16{7<<\xecY^^V\xe2\xf1\xc2\x1b\
+P6\x09!\xce\x03h\x96\x89\xa8\x12@E&\x11\x8d\
+Fo\xa5\xd3\xe9\xa5\xe9\xe9i\xd7J,q\x11\xa0\xfd\
+[a\xc8\x0c0#\x9d\xf9&\xa2\x0a\x00\x95\x1bZq\
+$\x12IF\x22\x91~\x00hn:\xf7\xe6\xc9D\x8d\
+p\x1d3l\x9f\x9a\x19=\xd7\x0f\xaf\xc4\x93\x92\xbe>\
+\x9es\xe2ESn\x1f\xd1\x0f\xf5\xbe\x9c<x\xa4P\
+\x80d\xb2\xe8m\xf4\xc7b\xdf\xa6\x00t]\xff\x09\xe0\
+J\xa1\xe6\xb9\xb4\xeb\xdbP\x06\xfe\x5c\x9dv\xdax\xed\
+}\xc8r:\x9d\xfe\x00\xe0\x9a\x10\xa2\xda\xea\x89\xc6\xcc\
+\xba\xa6iSvL<\x1eO\x8d,\xcb\xfe,\xe6\x9d\
+\x92$\x0d\xc9\xba\xae\x07\xbd^\xaf\xc1\xccuV\x0d\x88\
+\x88>\xda1_\xab-c\xe6\xa3Y\xd2\xf7UU\x1d\
+\xfc\x0d\x9e\xf2.\xc3yM\xff\x1a\x00\x00\x00\x00IE\
+ND\xaeB`\x82\
+\x00\x00\x03\xa3\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00 \x00\x00\x00 \x08\x03\x00\x00\x00D\xa4\x8a\xc6\
+\x00\x00\x00\x03sBIT\x08\x08\x08\xdb\xe1O\xe0\x00\
+\x00\x00\x09pHYs\x00\x00\x00\xe0\x00\x00\x00\xe0\x01\
+\xa2_\xfe\xca\x00\x00\x00\x19tEXtSoft\
+ware\x00www.inkscap\
+e.org\x9b\xee<\x1a\x00\x00\x01nPLT\
+E\xff\xff\xff$\xb6m@\xbf\x809\xc6q'\xb1v\
+\x0f\xa5i5\xbf\x803\xb8z+\xb3w(\xb7x\x1e\
+\xb2w3\xbb}(\xb3y1\xb9z\x1d\xact\x1c\xac\
+s2\xb9|3\xba{2\xba|/\xb8{\x1f\xadu\
+\x18\xa9s\x1e\xadu\x1d\xadt2\xba|\x1b\xact2\
+\xba|2\xba|.\xb7z3\xba|\x19\xaas\x13\xa6\
+q2\xbb|\x11\xa5p2\xba|2\xba|\x13\xa6q\
+\x13\xa6q\x11\xa4p\x10\xa4p\x11\xa4p\x0d\xa2o\x0e\
+\xa3o\x0f\xa4o\x0a\xa0n\x12\xa5q\x13\xa6q\x15\xa7\
+r\x17\xa9s\x1a\xabt%\xaa~+\xb0\x800\xb9{\
+1\xb9|2\xb0\x862\xba|3\xb0\x864\xb0\x874\
+\xbb~5\xb1\x885\xbb~6\xb1\x886\xbb\x7f7\xb2\
+\x898\xb2\x898\xbc\x809\xb2\x8a<\xbe\x83=\xbe\x83\
+>\xbe\x84A\xbf\x85A\xbf\x86C\xc0\x87E\xc0\x88L\
+\xc3\x8cR\xc5\x91S\xc5\x91T\xc5\x92U\xc6\x92U\xc6\
+\x93V\xbe\x9bV\xc6\x93W\xc6\x94Y\xbf\x9ch\xc8\xa3\
+m\xce\xa2|\xd3\xab~\xd3\xac\x80\xd4\xae\x81\xd5\xae\x82\
+\xcf\xb5\x8f\xd9\xb8\x93\xda\xba\xa7\xe2\xc7\xb9\xe7\xd3\xcf\xef\
+\xe0\xd0\xef\xe1\xd2\xf0\xe2\xd4\xf0\xe3\xe2\xf6\xed\xe4\xf5\xef\
+\xe4\xf6\xee\xe6\xf7\xef\xea\xf7\xf2\xeb\xf7\xf3\xec\xf8\xf4\xec\
+\xf9\xf3\xed\xf8\xf4\xed\xf9\xf3\xed\xf9\xf4\xee\xf8\xf5\xee\xf9\
+\xf4\xef\xfa\xf5\xf0\xfa\xf5\xf1\xfa\xf6\xf6\xfc\xf9\xf6\xfc\xfa\
+\xf8\xfc\xfb\xfc\xfe\xfd\xfd\xfe\xfd\xfd\xfe\xfe\xff\xff\xff\x8d\
+\x82\xb1\x95\x00\x00\x00,tRNS\x00\x07\x08\x09\x0d\
+\x11\x18\x19\x1e +-9Irx\x84\x97\x98\x9d\xae\
+\xbe\xbe\xc1\xc1\xc4\xc8\xda\xdd\xe3\xe4\xef\xf2\xf3\xf3\xf5\xf6\
+\xf8\xfa\xfd\xfd\xfe\xfe\xfe\xa1\x98\xe6\xd8\x00\x00\x01oI\
+DAT8\xcbu\x93\xf7[\xc20\x10\x86\x03*\xa0\
+Xm\xeb\xaaE\x14\xc1\x85\xc6\x8d\xc6\x8d\x03\xf7\xde{\
+O\xdc[\xf2\xdf\xdb4iHi\xf9~\xe8\x93\xde\xfb\
+\xa5\xcd]\xee\x00\xe0\xf2H\xaa\x16\x8aFC\x9a*y\
+\x80S~%\x82\xb8\x22\x8a?\x07{\xe5\x18\xb2)&\
+{E\xee\xd3\x91C\xba/\xcb\x83a\xe4\xa2p\x90\xef\
+w\xe5\x86\x83}\xc3\xab\xa3<\xd2\xe99d76a\
+>e3\xbf\x98\x13/\x9f\x7f\x9d\x8e\x91\x5cH\xb6\x8a\
+\x93\xaf<b\x8c\xcfF\x8c\x95b\xd4/\xe2\xe0\xab\xcf\
+\x98h\x87T\xcc\x03$\x07_{19>\xea5^\
+$\xa0\xb2C\xed.2\xbe\xce\xf8k\x1f\xec\x19@*\
+\xd0\xcc\xe8\xd2-\xfe=\xa0\xfc\x8d\xf1i\x08awB\
+\x03!\x12\x9d\xbf3B\x99}c\xb5\xf9N\xf9\xd3$\
+$\xea\xac\x03Qb86\x83\x99=\xb4e\xf1$\xa4\
+j\xa5\x86C\x1a\xfe;\xf9\xa0\x8b\xf48\xe30N\x7f\
+1u\x81E\xa5G-\x0e\x9b\xd8!gD\xc7\xc30\
+\xe7\xb0\xdeJ3u\xc9\xf9\xbd\xc0a\x0d/T\xea\xca\
+\xe2C\x02\x87e\xd9R\xcf^\x9b\xfcgP\xe4\xf1\x22\
+\xe1\xb2\xe6>I\xaa\x1b\x22\x87\xb5\xb6\xeb^\xb8\xc1\xdf\
+\xdb6\xde\x11\xb07L\xa2\x1f\xdaU\x99\xdbr\x89.\
+\x1bo,p4\xad\xcd\xd1R\xe2\xd2\xf6\x82\xa3\xb9\xd4\
+up\xb8\xa3\xa18\xcf\xe8QG{Ua\xde\xe15\
+\x1cm\xd5\x01\x97\xf9\xe6\xe3_Q.\x8c\xff?\x97\x9d\
+\xc5\xbb\x10\x02\xdac\x00\x00\x00\x00IEND\xaeB\
+`\x82\
+\x00\x00\x03#\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
+\x00\x00\x00\x04sBIT\x08\x08\x08\x08|\x08d\x88\
+\x00\x00\x00\x09pHYs\x00\x00\x00\xec\x00\x00\x00\xec\
+\x01y(q\xbd\x00\x00\x00\x19tEXtSof\
+tware\x00www.inksca\
+pe.org\x9b\xee<\x1a\x00\x00\x02\xa0ID\
+ATX\x85\xd5\x97\xcdKTQ\x18\xc6\x7f\xe7\xde\xeb\
+\xa4\x8e\xca\x88\x99\x09Y\xa1}Z.\xd2\x22\x08!&\
+\x17BaD\x04\xb5m\xe3\xa6M-\xf2?h\x13Q\
+\x8b\x02IB\x22\xa2\xa4\x10\x17B\x19\xd2\xa6/\xa3\xd2\
+\x81\xd22\x8d(\x02\x0dbt\x9cJg\x9c;\xf7m\
+1\xd5t\x1b?\xee\x9d\x19\x11\x9f\xcd\xbd\xf7\x9c\xe7<\
+\xef\x8fs\xce\xfdRroo\x119\xb1K\xa0\x8e\x02\
+>R\x15\x03\x86Q\xdc%\xdfsA\xed\xeb\x9b\x99\xc3\
+\x93\xb6\x94\xf4\xeen\x079\xe9\xd0?\x80\x11\xd9\xaf\xfc\
+C?\xb2\x05\xa0\xa1\xe4\x88\x0b\x7f-f\xee\xf9l\x15\
+\x07P\xd2['.\xc7|G8\x86\xa6Y\x00\x04\xa5\
+\xd6uUK}\xa6\xc0\xeaVM\xfd\xd3\xe9\x00\xd8\xf5\
+1\xcdq9\xccRh4i\x19\x15\xcfD1<L\
+\x9b\xb7\x96\x0f\x00 J\x89akP\x1a\xac9\x08F\
+\x91\xf3\x8c\xb2\xcd\x8e\xbdj6\x8c'p\x19,3\xd1\
+ `\x07\xf0n\x85\xaa\x16\xc7\x81\x003\xc1\xaf\xae\xfc\
+\xda\xfaw\x18\x9fz\x92\xd7\xf6\xdeU\xae\xc2\xd2\x92\xe1\
+\xb1\x97\x5c\xfa\x8a\x0b\xcb`\xe3\x16\x93?Kah\xf0\
+\xb3\xd5U@\xc1\x97AW~\xdd\x1a\x87\xf2\x7f\x01\xbc\
+\x85\xf6}`\x8e\xb8\x0a4\xa6\xdf\xb8\xf2\x03\x90\x97<\
+]\xf6%X\xd9\x00\xd7\xbb\x85Sw6d\x04`,\
+n\x99_\x8f\x07\x84\xf1ozF\x00+o\x09f\x22\
+\xf3\xbf<\xa7f\x0c,\x97\x91\xae\xdc\x1d\x0f\x84\xe6s\
+B`8\x15\xe2v\xffjN\xb4W\xd0\xd2\xb5n\xe9\
+\x00*\xd6\x82\x19\x87\x8b7\x85\xc0\xfb$D\xc7@\x09\
+7\x9e\x17!\x02\xd5\xe5\x11W\x00J\xc6\x9a]}\x90\
+<|\x09\xd7\xba,\x0c\x0d, 81\x85\x02D\x84\
+\xc6\x1d\x11\xce\xf8\xc7]\x01\xb8\xbe\x0b\x1a\xf6\x80\xa6)\
+\xda:\x05\x11@\x04\x01\x1a\xb6E]\x17O\x0b\x00\xc0\
+_\xa7\x00h\xebLL^Cu\x94\xb3\x07\xc6\xd2\x89\
+r\x06\x10\x0aC`D\xa8\xdf\xa5\xc8\xd1\x93\x10\xa5>\
+\x18z\x16\xe6xm\xf0\xaf7jj\xb4>)\xe3p\
+\xcd$\x95%\x8b\xef\x07G\x9b\xb0\xa7O\xb8\xda)\x0c\
+~\xb0o\x97\x9dU\xcaV\x1c\xa0{\xc8G\xcf`.\
+W\x1e\x95:\x89v6\x03\xb3\xb1\xc4\xf1\xfeSx\xf5\
+\xd6\x0e\x11\x08\xd8\x1f\xc5\xa1i\x1d\x10\xac\xb8\xca\x1e\x80\
+\xaf0q|=\x9az\xc3\x84B\xffOb\xc2S\xec\
+\x8dg\x0f\xe0P\xbdbS\x85\x22n\xa5\xf6\x8d\xbe\x98\
+Ji\xcb\xf3X4n\x0f;\x06\x98\x04\x8a\x172\xe9\
+:TW\xce\xddW\x13\x9dpTh\x9e`\xd1Pt\
+\xa5\x9f\x90\xa1\xf2\xbd#\x06\x86y\x9a\x98.\xbf\x7f\xcf\
+\x17\x9c\x89\xacI\xd7\x85|\xef\x08E\xc5\xfe_\x17\xd4\
+\xd0\xdcx\xe2\xa8\xe9\x00\x00\x00\x00IEND\xaeB\
+`\x82\
+\x00\x00\x03.\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
+\x00\x00\x00\x04sBIT\x08\x08\x08\x08|\x08d\x88\
+\x00\x00\x00\x09pHYs\x00\x00\x00\xb2\x00\x00\x00\xb2\
+\x01k\x94h\xe0\x00\x00\x00\x19tEXtSof\
+tware\x00www.inksca\
+pe.org\x9b\xee<\x1a\x00\x00\x02\xabID\
+ATX\x85\xed\x97=h\x13a\x18\xc7\x7f\xef%\xb9\
+\xa4M\xce\xb45\xd6\xb6\xa8\xd5b\xa5%\x8dt(N\
+\x22\x82\x9d\xdc\x1cDDp\xeb*\x8a8\x0avp\x11\
+\x04Wqst\x13\xc4\xa5\x08\xf5\x03\x07[\xb0\x10c\
+\xb5\x0a-\xb6\xd6\xa6I\x13\xb5I\x9a&\xb9{\x1dR\
+1\xc9]\xdbKs\xd9\xfc\xc3q\xdc=\xef=\xff\xdf\
+{\xcf\xf3\xde\x87\xa0FR\xa2\x10\x8d\x5c\x97\x821\xe0\
+\x04\xa0\xd4\x8e\xa9\x1a\xff\xd3\xfb\xef e ~\x14\xd6\
+\xc4\xc8\x87n1Bq\xa7\xeb\xfe\xca\x94\xdc\x88F\xc6\
+\xa5\xe0>0\xb0\x9b\xb9\x09\x06\x89\x5c\xd4\xf7\xcb\xa9H\
+B\xc6P\xeb\x06\x90\xb1\xb0*\x04\xb7\xea1\xb5\x04Y\
+*\x05\xe5\xab\xc8\xaa\x1d\x88\x9a\x19\xba\xfb\x01\xaf\xe5\xc8\
+&A\xd4\x00\x94<N\x98\xd7\x03QW\x8dw\x93\xb0\
+\xc8&\x97JA\xf9:\x12\x97\xd3XN\xceQ\x00\x02\
+\x8aeF\xb9Xj3\xde\x0d%\xac \x9c\x05p\x0b\
+\x18PA\x08s\xec\xbb\x1e4\xa6\x86\xe2\xa6K\x1c\x05\
+\x008\xe2\x81v\x17\xa4t\xd0M\xd1v\xf9f\xf8\xbc\
+8=\xf3\xbcy\x00\x00\x9aR\xde\xac\xa4\x16\xb5\xcaC\
+gK\xb0\x07\xfd\x07p\xac\x07\xf2+\x1eR\x13A\xd2\
+S>r\xcb\xd0{%K\xe7\x85t\xf3\x00\x8cu7\
+\x1b\xd1 \xf3\x0f\xdb\xc8|\x83\xcd|i+R\xde'\
+&\xfd\xcd\x03H=\xea#\xfd\xe4\x10\x18\x82\xb5\xdcB\
+9\x91\xcb\x85\xbf[\xa0x =_\xda9A\xa3\x00\
+\xb9\xe9v0\x04\xda\xb98\xbd\xbaAht\x1d\xff\xe0\
+\x06\x00\xcb\x8fC\xa4\xe7\xed\xa7m\xa8\x07B\xd7\xbe\x22\
+J\xaeFR8\xbb\x0a\xb2\x9fZ\xc8-\xd4\xf7Bu\
+d\x15\xac\xcf\xb4\xf2q\xbcc\xab\x11e\xf3\x00\x8a+\
+>\x8a\xcb-\x18\xb9\xea\xdb>{\xb7\xa3b\x15\xd4'\
+{\x00\x12\x92\x0f\xfa\xf9\xf5\xac\xc7\x142\xf2\x82\xcd\x8c\
+\xd9\x5c(\xf6\xee\x84\xad\x1e\xc8\xbe\x0dY\x9a\x03(>\
+\x89\xcbmnD\x7f\x9f\xad\x8fb{\x00\x85\xb9\x80\xf9\
+\xa4\x00\xdc\xe5Y\x1e\xbd\xb8\x89\xa8\xf8\x06h\x09\xb89\
+<\x96\xb0\x05`\xab\x04\x9ecY\xd39\xb57\x87\xe2\
+\xd3\x91y7=W\x93h'[INhx\xbbt\
+\xba.\xc5QT{%\xb0\x05\x108\x93${v\x95\
+\xccd'\x00\xae}E\x0e\xdc\x98\xab\x1a\xa3\x0d\xe7\xd0\
+\x86s\xb6L\xeb\x06@\x91\x1c\xbc=K\xdb\xe5E\xf4\
+\x94\x8ao\xf07\x8a\xb6\xb7\xae\xdf\x1b\xc0\x96\xbc\xc73\
+\x8e\x98V\xaa\xf6\xc7\xc4^\xeb6\x22\xe1\xc9\xef\x00P\
+\xfa\x02l6\xcf]B\xeb\xc6\x8bm\x01D8V\x90\
+\x82{M\xb3W\x8d\x97\x22\x1c\xab\xaa\xa3\xe99\xa0\x84\
+\xa3w\x84\xe4&\xf0\x99z\x1f\xec\xdbI\x91\x05\xe1\xd1\
+\x9f\xbaN\xbd\x1f\xad\x0d\xfd\x01\xffc\xe7\x7fa\xcd\x04\
+.\x00\x00\x00\x00IEND\xaeB`\x82\
+\x00\x00\x04*\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00 \x00\x00\x00\x22\x08\x06\x00\x00\x00>\xb2\xdb\xff\
+\x00\x00\x00\x09pHYs\x00\x00\x17\x9f\x00\x00\x17\x9f\
+\x01K\x9c3R\x00\x00\x00\x19tEXtSof\
+tware\x00www.inksca\
+pe.org\x9b\xee<\x1a\x00\x00\x03\xb7ID\
+ATX\x85\xed\x96Mh\x5cU\x14\xc7\x7f\xe7\xbd\x99\
+T\xac\x9f\x0b+I\x06Qb5\xa5`\x8b\xbapi\
+\x16.,\x86\xaaH\xb0L&\xd1\x99\xccL\x8b\xa5\x0a\
+bE\x17\xf5i7\xc5\x8aF\xd4\xa4\xc9s\x92v\x92\
+\xd0v\x22H\x1b\x11\xd1E\xa3;\xa1\x85\x82\x1b\xd1\xd6\
+\x1a\x9b\x8fEi,\xd1\xa6i2\xef\x1e\x17\xf3F\xda\
+83y\x93h\x10\xf4\xbf:\x1c\xce=\xff\xdf\xbb\xef\
+\xbe\xf3.\xfc\xaf\xff\xba\xa4\xda\x05\xae;\x18\x01\x22\xc6\
+\xe2\x16[\xbd\x0b\x96\xe5\x8d\xc7\xe3\xf1\x0b\xff(\xc0\x81\
+\xfe\xa1\xf5\x96g^\x00\xd9\x0azw\x89\x92\xd3 \x9f\
+\xce\x87\xbd\x8fv\xb6\xb7_\xfc\xdb\x00\xb2\xd9\xec\xda\xb9\
+y\xd9\x07\xa4\x81p\x80~\x97\x14}+\x95\x88u\x8a\
+\x88\xae\x08\xc0u\x07#\x8a\x1eCx\x10\x00\xe5\x0a\xc2\
+1Q\x8e\x83\x9c\xf3BrQ\x8cw'*\x1b\x05\x9e\
+\x06\x1e+\xf6\x13d\xd8x\x97\x9fK\xa7\xd3\xb3\xcb\x02\
+\xe8\xea\x1a\xba=Tc\xbe\x05\xd6\x17\xbc\xf5h\xd8\x0a\
+\xbf\x12\x8fo;_\x1ex\xe8!\x15\xf3!\xf0\x88\x9f\
+\xfa|r\xfcl\xb3\xe38\xa6\x12\x80\xb58\xa1\xaa\x12\
+Z\xa3\x87\xaf1\x7f5\xdd\xd1\xf6l%s\x80d2\
+zjn\xf6\xd7GQ\x86\xfc\xd4\x96\xda\xfa\x86\xbd\x95\
+\xd6@\x89\x1dp\xdd\xc1gTt\xb8\x00\xc3\xfet2\
+\xb6{\xa9&\xd7*\x97\xcb\xd9\x97f\xae\x8e\x00\x8f\x03\
+\x0b\xc6\xb66n\x7f>\xfac\xb9\xfa\xebv@UE\
+-S\xa0\x16\xfd~j\x22\xf2z5\xe6\x00---\
+\x9e-\xa1\x0e`\x16\x08\x8bg\xf6T\xaa\xbf\x0e \x93\
+\xc9nF\xa5\xb1@\xc3\x9b\x8e\xd3\x94\xaf\x16\x00 \x91\
+\xd86)\xa2\xdd\x00\x02O\xf5\xf7\xf7\xdf\x10\x08\xc0`\
+7\xfb\xe1\xaczW\x8e/\xc7\xbc(\x0f\x8e\xf8\xe1\xda\
+\x05\x13n\x0a\x04\x80h#\x80\xc0\xc9 \x9fP%\xa5\
+\xe3\xb1S\xc0e\x00U\xd3\x18\x0c\xc0P\x07\xa0\xc2\xc4\
+J\xcc\x01\xfcA4\x09 H]0\x80\xe2b\xd5@\
+S,\x80\x8a}\xec`\x00\xc2TaUy\xe2*U\
+\xebs\x94\xfdY-\xda\x01\xfd\xc1\x0f\x1e\xaetr\x83\
+\xa8\xb7wh3p3\x00\xc6\xfa.\x18\x80\xb1>\xf3\
+\xa3\x9b\xf2y{\xcbJ\x00\xb0\xb4\xc5\x8f\x16\xe6n\xe4\
+\x9b@\x00\xc9d\xf4$p\x16@E\xdep\x1c\xa7\xe4\
+\x19YJ\xdd\xdd\xd9u\xa0;\x01\x10>\xd9\xd5\xda:\
+\x13\x08@DT\x91\xe2\xe4z\xa0\xb6\xbe\xa1\xe2\x14+\
+%\xc7q,\xbb\x86\x0c\x85\xed\xf7\xf0\xac\xb7+\xd5\xff\
+\xe5\x09\xa7\xc6\xcf\x1cA\xf9\xba\x00\xc4\x9e\x1ew`G\
+p\xf3\x13\xa1\xbaHC\x17*O\xf8\xa9\xf7R\xa9\xe8\
+\xe9\xaa\x00\x1c\xc71^^[\x801@D\xe8\xeau\
+\x07>\xee\xeb\xeb\xbb\xa3R#\xd7\xcdn\xa8\x8b\x9c\xff\
+\x92\xc2\xe5\xc5\x97\xfc\xb6\x14t\xd9\x0bIO\xcf\xc1\x06\
+\xb1\xed\x11`\x83\x9f\x9a\x01=j`\xc4V\xce@h\
+\xda\x84\xcc:+\xcf&\x15}\x12\xd8\x0a\x84\xfc\xda\xab\
+\xc0\x1a\x00Uy-\x9dl\xddW5@\x01\x22w\xab\
+\xd8\xf3\x9d\xa0m\x94\x19Z\x8b4\x0f\xbaW\xd4:\xa8\
+\x96\xf9\xaa\xf8c\x13aw2\x11\xdb_5@Q\x07\
+2\x03\x9b,\xd5] \xcd@\xa9W1\x06\x0c{a\
+\xd3\xb9\xa3\xbd}\x02 \x939\x5c\xe7i\xfe\x04p\x9f\
+\xef\xf4r*\x11{wY\x00E\xe5r9{\xfa\xf7\
+\xf9\xfbmO\xeb\x8d\xe8m\x8a5]c\xc9\xb9x<\
+\xfaS\xa9\xfa\xeeC\x87\xea\xed\x05k\x14\xb8\xd7O\xbd\
+\x94\xea\x88\xbd\xbfl\x80\xe5\xc8u\x07#*:\x0a4\
+\x00\x8a\xc8\x8b\xa9D\xeb\x07\xab\x06\x00\xd0\xd3\x93\xbdK\
+l\x19\x05\xee\x01T\x94\xed\xc9d\xac\x17\x82\x1d\xac\x15\
++\x9dn\xfb\xc5\xc2j\x02\xf9\x19\x10\x15\xfe<\x90\xab\
+\x02\x00\xd0\xd1\x11\x1d\xf3\xec\x85&\x81/Tyg\xb5\
+|\xff\xfd\xfa\x03_\x1bW\xceJ\xcbz\xc2\x00\x00\x00\
+\x00IEND\xaeB`\x82\
+\x00\x00\x02\xd8\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
+\x00\x00\x00\x04sBIT\x08\x08\x08\x08|\x08d\x88\
+\x00\x00\x00\x09pHYs\x00\x00\x00\xec\x00\x00\x00\xec\
+\x01y(q\xbd\x00\x00\x00\x19tEXtSof\
+tware\x00www.inksca\
+pe.org\x9b\xee<\x1a\x00\x00\x02UID\
+ATX\x85\xc5\x97\xbdkSQ\x18\x87\x9f\xf7\xde\xda\
+F\xfa\x81\x95\x80\xff@Q\xb1\x0e:\x0a-\xa44\xc4\
+\xb6[\x91\x04)\xb89U\xe2V\xe9T\xe2\x18\x05\xa5\
+\x1dtp\x17\x9aN\x85H*\xad6\xe8\xe0\xc7\xe4`\
+\x11\x1a7\xa1t1\x84\xd8\x9a\x0f\xb8y\x1d\x9a\x8f\x9b\
+[\xda^\xd3\xe6\xe6\xb7\x9d\x0fx\x1e\xcey\xcf9\xf7\
+B\x87#n'\xeaf\xc0G\xc9\x0c\xa0:\x05r\x03\
+\xe52\x82\x1f$\x0fZB\xd8\x06\xdd\xa2B\x8a\xbd\xc2\
+\x86D>\x15\xceD@\x93#\x83\x18=Q\x84(\xe0\
+w\xe9\xbb\x8f\xe8k\x0c\xf3\xa9\x84\xd63-\x0b\xe8Z\
+0BE\x97\x10.\xb9\x04;SF\x89\xb3w\xf1\xb1\
+DV,\xd7\x02\x9a\x08\x9b\xf4g\x17\x81\x07-\x82\x9d\
+yK\xd1\xba+\xd3\xe9\xdc\x89\x02\x9a\x08\x9b\xf4e\x97\
+\x11\xee\x9c\x11\xbc\x96-\x8a\xd6\x88S\xc284\xad\xff\
+\xf7\xf36\xc0\x01\x86\xf1u-k\x22l\x1e)\xa0k\
+\xc1\x08H\xb4\x0d\xf0\x1a!\xc4@v\xc1\xdeS\xdf\x82\
+j\xb5\xff8E\xc1\xb9M\x09\xb1\xae\xcbD\xfa'\xd8\
+W\xc0\xec~\xe8\x01\x1c\xa0\x075\xe7j\x0d\x81\xea%\
+S4\x7fq\xcc9\x97\xc9wM\x05\xab\xa9q\xfd\x9f\
+qG\xf6\xf1Y~\x19K\x17\x0fV\xa0`\x8c\x1d\x07\
+oCz)\x9bA\xa8m\x810\xe9!\xfc \x96\xdc\
+n\x08 7=\x17\x10\x1d\xb6\x090\xe4\xb9\x00\x5c\xb5\
+\x0b\x0cv@\xa0\xcf.P\xe9\x80\x80\xd1\x10P\xf2\x1d\
+\x10\xc85\x04\x84\xed\x0e\x08dl\x02\xfa\xdds\xbc\xc8\
+\xb7\x86@\x85\x94\xe7\x02*\xc9\x86\xc0^a\x03\xd8\xf7\
+\x10\xbf\xcb\x9f\x0b\x1f\xc1\xfe\x1a\xa6\xc6_\x01\xf7=\xc1\
+\xab\xce\xcb\xd4\xfb84\xbd\x86\xc6\x13\xa0\xec\x01~\x07\
+z^\xd6\x1au\x01\x09\xadgP\xe2m\xc7\x8b\xcc\xca\
+T\xaa~\xec\x9b?\xc9\xbe\x8e\xc6P\x92m\xc4?\x93\
+\x89\x8dU{G\x93\x80\xc4b\x15J\xd6=`\xeb\xcc\
+\xd1\xc22_F\xe7\x9c\xdd\x87>Je:\x9d\xa3\x5c\
+\xbc\x05\xac:\xc7N\x91%>\x8f\xceH,v\xe8\xca\
+?\xf2\xc7D\x13a\x93\x81\xec\x02\xca<\xd0\xdd\x22x\
+\x07\x91Y\xe7\xb2\xbb\x12\xa8\x8b\xac\x05\x86\xc0x\x84\xca\
+\x0c\xd0\xeb\x12\xbc\x0b\xb2\x88\x9e{a/\xb8\x96\x04\xea\
+\x22\x9b\x01\x1f\xa5\xaeqT'\x81k\xc0\x15\x90\xf3\xd5\
+\xd1\xbf@\xa6z\xbd\xbe!?\xf8A\x22+^\x1c\xe9\
+\xd3\xe7\x1f\xee\xf7\xb7\xc4\xd2Z\xc2j\x00\x00\x00\x00I\
+END\xaeB`\x82\
+\x00\x00\x04\x87\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
+\x00\x00\x00\x09pHYs\x00\x00\x00\xec\x00\x00\x00\xec\
+\x01y(q\xbd\x00\x00\x00\x19tEXtSof\
+tware\x00www.inksca\
+pe.org\x9b\xee<\x1a\x00\x00\x04\x14ID\
+ATX\x85\xb5\x97Kl\x1bE\x18\xc7\x7f\xb3vl\
+\xc7y\xb8\xce\xb3!q\x9e\xa5\xa1\xa5j\xab \x914\
+\x80\x9a4j\x0e\x80\x10\xaa\x10m\x85\xe8\x05\x90PE\
+\x15Q\x08p@(\x07\x0eH\xad\xd4V\x91\x90(7\
+$Z8\xf4\x0e\x91\x08%\x10\xb5\x95\xa0U\x11 \xa5\
+\x8f\xa4X\x11\xcd\xcbN\xd6M\xe2\xc7\xaew88A\
+\xb1\xbd\xf6\xaeC\xfb?\xed\xec\xcc|\xdf\xcf\xdf\xcc\xec\
+\x7f,\xb0P\xcd\x80\xacM\x08\xf6\x159\xe8q)\xf4\
+J\xc9\xdf\x918o,\x0f\x8by\xb3\xf1\xfe\x0f\xa5O\
+\xae\xb2W\x81\xf9\xf0\xb0\xf8\xcb*\xbeHk\x0dI\xc5\
+\x1ff\xa7\x80n\xb7\x8b~i\xf0\xac\x14\xf8\x1a\xfc\xc4\
+\xdbj(\x0bT\xa2\xdc\x9aA\xfbu\x8a\xdf\xefG\xd8\
+\xc7y\xa1\xf9N\xc86!\xe8\xf6\xb8\xe8\x13\xd0\x93L\
+\xb2\xb5\xc6Gt!\x82KKr tN\x5c\xcb\x07\
+\xe0\x04\xa88!\x1b\xdc\x1e\xbe\xd0Uz\xbd^\xf4\x96\
+*\x94\xd6\x1aJ\x1a+\xa0\xb2\x14\x84\xc0\xb3>\xa1\xb9\
+\x92\xa2\xf02O\x00w\x92'\xe5\x96\x22\x07\x8e\xe6*\
+\x8c\x96j\xca\x9a*\xa1\xd6\x07\x8a\xc0=6\x81\xf1\xd3\
+\x04\xaf\x01\xd6\x00\x1e\x0f\x17\xbaZ\xe9\xee\xda\x86\xc3\xeb\
+\xb2(\x99\x80#\x9d\x94\xcc\xaa\x94x\xddP^l>\
+\xae\xa9\x0a\xc5q\x9b\xbe\xfc\xd1\xd6\x00\xa4\xa4yWC\
+\xee\xe4q\x1d\xc6o\xa1\xadh\xc4\xad\x02\xaeK\xd7\x11\
+\xf1\x04\xed\x8f\x7f,/f\xf6%4\x1e,%\xf8L\
+=#&\x9dk\xbf\xea\xb7\xe9E\x025\xe5\xe6\xc1\xc6\
+&\x88{\x9c\x88\xa3\xbb)\xb5\x0b\x00\xf0z'\x00G\
+2\xdf\xdf\x9e\xc3\xb8p\x8d\xa7U\xd8\xeb\x04\x88j\x8c\
+L\xcd\xd3\xdf\xd1\x84\xd7,P$\x8av\xac\x87\xd2C\
+\x1d\x85\xa4\xcf\xad\xfb*\xcaWW\x08\xc0\xda\x12 \x19\
+\x9fZ@\xb7\x1b`.\x02\xabZaI\x15\x01\x8d\x15\
+\xd9\xef\x9d\x00\x8b~\xfepF(\x8a&\xa0\xd8b\x13\
+\x1a\x12^=\x0f\x91h\xe1\x00_\xbf\x09\xed[M\x00\
+\x18\x12\x86\xeb\x03y3\x18\xa6+s\x80Y\xa0\xcb\xef\
+\x17\x96<o\xbc\xf5\x87\xb8\xc6H0D\x81\x85\xfd\xff\
+r\xae?hI\xc6\xee\xce1p\xf0I|\xf9&\x18\
+\x12zN\xc3r\xcc^\x823\x87a\xffv\x1b\x00\x1e\
+\x17WgT\x8a\x93\x068\x94\xdc\x13\x14\x01\x97\xde\x86\
+\x95\x84ur\x01\x04L6\x9e)\xc0\xeci\xb1R7\
+(\xa7gTZ\xeb\xfd\xf9'U\x97A\xb5u~[\
+r\xa6\xb5\x0cF\xef\x85i\xa9\xf7g\x98\xd4\xc6!\x12\
+\xde\xfd\x16\x226\x97\xe0\xbfD\x0a|\xf2bvE\xd2\
+\x00bIF'g9\xfcL\x1be\xb9\x02)\x02^\
+\xd8\x0dQ\x1bK\xb0QB\xa4\x8c-\x0b,\xad%\x19\
+\x0f\x86qX\x05\xeb\xdfYX\xf2|J\x03X<'\
+\x82\xb5'elq\x15\xaf\xdf\xf4\xa3\x9c\xd2\xa5\xeb\xf6\
+O\x01\xc0SM\xb0\xab\xde\x06\x00\x80\xd3\xc1\xd5`\x88\
+\xe7s\x01\x18\x12n\x04\xed\x9d\x82uU\x97\x15\x00\x10\
+\xd5\x19\xb9\xb7@\xef\x9e\x00\xa6N\xaf\x08\xf8\xf4e\xfb\
+\xc9\xad\x94\x05\x90L\xf2\xcb\xe4<\x1a\x98\x03\x00\xcc\xa8\
+\x10\xb3m]))\x02\x02\xfe\xd4f\xcc\x0b\xa0Vp\
+\xd3\xa5\xe2\x8e\xe9\xe0\xc9\xeaM-\xc1\xd1/A-\xd0\
+\x8c\x1cJ\xca\x8c\xb6\xd7Z\x000$t\xd7\xa0\xfcs\
+:D\xc7\xb6\xda\xac^\x14\x01?>\x0a3\xda\xa8\x84\
+\xc6\xf7\xc10\xc9\x87\x97&\xb7L\x8a\x0c:\xfc|g\
+\x8e\xe3\x07vd\x1b\x93!a\xff)X\xb1\xb8\x1d\x9e\
+z\x05\xfavl\x12@\xc2\x95\x7f\x96(6d\xaa\xe4\
+\x1b\xa5\x08\xf8n\x004\x8b\xfa\xf8rna\x1b\x00K\
+g\xc5R\xdd\xa0\x9c\x99\x8d\xd0Xgb\xce%n{\
+\xc17\x0d\x00 %\x97\x83!\x8ee\x02\x18\x12\x06\xbe\
+\x81e\x1b\x17\xf4\xee6x\xeb\xb9M\x02\xc44~\x98\
+\x9c\xe3Pgk\xfaU\x5c\x11\xf0\xd2\x1eX\xb5\xf1%\
+l\xb5\xe1\xd99\x01\x14\x83\xd1\xbb\xf3(\xa1eH\xe8\
+\xe9\xa7\xe5\xe0\xa32\xa3\x8d\x0a\x0f\x8b\xe9\xea\xf7\xe4G\
+\x9f\x8f2d\x18x\xae\x071:\x9a\xcc\x8fm\xa1\xba\
+\x11\x04\x87B\x042\xff\x1d\xe7P\xd5;\xf2\xb1-\xe5\
+\x5c\x8c\xeb\xb4?\x0c\x00\x87\xc2\xd2\x83\x18\xc7Cg\xc5\
+\xe8\xbf\x0ciR\x11\x0et\xcf\xb0\x00\x00\x00\x00IE\
+ND\xaeB`\x82\
+\x00\x00\x05\xb5\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
+\x00\x00\x00\x04sBIT\x08\x08\x08\x08|\x08d\x88\
+\x00\x00\x00\x09pHYs\x00\x00\x00\xec\x00\x00\x00\xec\
+\x01y(q\xbd\x00\x00\x00\x19tEXtSof\
+tware\x00www.inksca\
+pe.org\x9b\xee<\x1a\x00\x00\x052ID\
+ATX\x85\xa5\x97KlTe\x14\xc7\x7f\xe7\x9b\xdb\
+y\x94\x99\x16\xa6\x0f\x05\x83\x96\x98\x18\x22\xe2\x83\x85\xbb\
+\xaa\x85\xf8L\x8a\x0bSBP\x8cM\x17D^B4\
+e\xa1\x8b\xb2\x11\xac\xc6W\xa1\xe8\xc2\x07h\x8dI#\
+\x89%\xe0#\xa9U1\xc6\x95F\xa3\xc1(!\x88\x05\
+\xec\xb4\xd3\x873m\xe7\xce\xdc\xb9\xc7Ei\xbd\x9d\xce\
+\xbd%zv\xf7\xfb\xff\xe7\xfc\xff\xdf\xf9\x1e\xe7\x1b\xe1\
+*\xa2\xfd\x85\x8f\x13\xd3\xe1\xe8F\xd0\x16WX-!\
+\xb3\xfe\xd0\xae\xfb.y9\x9b\xdb\xdfZ!\x96\xf5\x85\
+\xc2\xaf*\xda;](\xf6\xf5u\xb6e\x16\xcb-A\
+\xe0\xf6\xc3\x03q)\xd8;\x04\xda\x81\xa4\x07\xfa\xc1\xad\
+\x88\xdc\xd5\xbd\xa3)\x0b\xd0\xdc\xf1f\xe5\x92|t\x00\
+\xb8\xd3\x938\xa3\xd0\x1d\x0d\xbb\x07\xdf\xedh\x1d\xf7\xd3\
+\xb0\x82\x0c\x98\xbc\xfd\x0d\xc2me\xa0;\xc4\xc9}\xb0\
+\xe3\xa5\x93\xbb\xd2cC\xae\xe6\xcda\xaf8\x80B\x02\
+\xd8\x97+\x98\x07\x80\xdb\xff\x93\x01\x84\xa2/\xa4\xd2\x8c\
+\x15jFC\xc1e\x04'\x084\x81?U\x1d\x09\xce\
+\xbdx\xa8\x12\x98#\xd8\x80\xc8\xff6 \x90\xfeO\x06\
+vv}\xb6\x0ah,\x9b\xd4\x18b\x95Q\xaa\x97\xc6\
+IT\xc5\x89UF1\xc6w!\x1a[\x9e;\xb6*\
+\xc0\xe0\xcc1\x9b\x8aD\xbeF\xc8\xa32\x22\xaai\x15\
+\xee\x06\xae\xf7\x92\xa3\xb10uuI\xe2\xd51\x8c\xcc\
+xO\xfd5S$\xd7u\x99\xccL2<<\x8a\x9d\
+\xb3Ku. |\xa5P#J\xadBx\xdaq\xee\
+\xea\xebl\xcbX\x00\xd3\x91\xc8.\xe0v\x14@\xd1\x92\
+\xc9\x08B\xfd\xf2$\xb5u\xd5\xf8\x9d\x5cc\x0c\x89\xea\
+\x04\x89\xea8\xe9\xe11\x86S#\xa8\xce\xc1\xd7\xa3l\
+\x95\xb9|P\x19\xb2v\x01\xcf\xcb\xf6\xc3\x03qS\xb0\
+\xcf\x035\xe5K$\xacl\xb8\x86D\xd5\x92\xb2\xc2\xb3\
+\x15(\x8dL&\xcb\xc5\x0b\x97\xbc&J#]\x0c\xc7\
+\x1a,\xe3\xd8\x1b\xfd\xc4\x01\xea\x97'\xcb\x89\xa7\x05\xfd\
+\xc8U9\x07L\x01k\x81G\xf0\x5cV\x89D\x9c\xba\
+\xfaZRC\xbe\xfb\xb8&\x94\xcfm\xb4PZ\xfc\x18\
+\xd1h\xf8J\xd9\xbd\xa1GM1\xf4\xd4\xb6{o\x9c\
+\xf0\x8ev\xbc3\xd0.\xe1\xc8\xeb\x88l\x9d\x1dK\xd6\
+&\x99\x18\xcf`\xdb\x0b\xf6\xc4L&\xdc\x16\x0bX\xe3\
+g\xa0\xae>\xc9\xfc5\xd7\xa3O\xae\xbf\xe9\x89r\xdc\
+\x8e\xd6\xa6q\xe0\xf1\xfd=\xdf2kB\x04j\xeb\x93\
+\x5c\xfc\xf3r\xd9\xfc\x82\xac1b\xdc\xf5(?.\x00\
+\x8d!^\x1d\xf3\x0e\xa5M1\xf4\x94\x9f\xd99\x8by\
+{706\xfb\x1dO\xc4\x11)\xb3q\x85\x1fCN\
+h\xbd\xe9\xda\xfd\xd0`e\xdenD8\xe9\xc5c\xd1\
+\xf0\xdcQ\xbb\x12\xc7K\xcb^.:Z\x9b\xc6\x11\x8e\
+\xcf~\x1b#Dc\x91R\xf5\x93S\x05\xa7\xb1\xa7\xf3\
+\xb1A\x03\xd0\xb9\xef\xe1\x8cS,l\xf3R\xac\x8aP\
+\xc9\xd4\xe4\xa7\xc5\xc4\xe7\xd2\xc3<\xaee\xcdo9E\
+\xd1m\xb3\xad:\xf8*\x9e\x97\xd5\xbdz\xae\xea<\xae\
+\xe2\x7f\x16\x0d\xc03/~\xb6$\x14\xb2\x8ex\x81B\
+\xa1\xa4\x11\xaa\xac\xbdZ}\x173\x8f\xeb\x94\xe42\xaa\
+G\xb6>sl\x09\x80\xec\xec\xfa|\x05E\xf7\x04\xb0\
+\xceK\x12cX}s\x83\xf7\x8e\x1f\xcd\x89u\xe3\xde\
+\xa6U\xbe\x8f\x0b\x80\x03=\xa7\x97\xe5\xa5\xe2\x1c\xe8R\
+\x00\xd7U~;s\x16]p#\xe9\xf78\xc5fC\
+\xd1\xed/\x15\x07P\xd7%\x93\x99\xf4\x0e%c\xae\xd3\
+\x15$\xae\xaabc\x1d\x9a\x15\x87\x99\x1bq\xa18\x80\
+\xac\xc3\xb2\xfa\x0d\xc8\x19\xbf\x84#\xa9\xf1y\xeb\xa7\xc2\
+co\xf4\xff\xfe^\xf7\xe9?\x96\x95r\x0f\xf4\x9c^\
+\xb6\xff\x83\xef\xde\x17a\xcb\xbf\x86 \x9d\x1a\x0d\xf2|\
+Fv\xbe\xf6\xe9\x16\x94\x1e?\xc6\xb5\xcbk\xa8\xa9[\
+Z:<\xa6p\x5c\xd5=\x9bN\x8dN)\xdc\x8a\xca\
+#\xde\x99\x03\xa4GF}{\xc5L\xc8\xa3\x96kE\
+\xfaL\xc1N\xe3\xd3\x0f\x86.\x8fR\x11\xb1\xa8\xaa\x8a\
+{\x87\x97\x09\xb4\x89\x18O\xb3\x99_\xe6\xcc\xdfY\x86\
+\xfd\xfb\x00@\xba\x18\x8e\xf6\x99\xee\x1dMY\x81\x97\xfd\
+X\x8a2x>\xc5\xc8\xf0x\xe0q\x9a\xe3+\x8c\x0c\
+\x8f2x\xe1rP'\x04\xe5\xe5\xde\x8eMY\x0b \
+f\xdb]S\x91H\x0bP\x14\x18vE\xd3\xa2\xd2\xc8\
+\x95\x07\x89\xa2\x0c]N3>\x96\xa1\xae~)\x89\xaa\
+\xf8\x82\x17P\xd1u\xc9f&I\xa7F\xcb5\x9f\x0b\
+\xa2rZ\x0d5\xa0u\xaa\x84\xa6\x8b3\x1b\xda\xf7\x1d\
+\xb5\xe7\x95O\x1a\x1c\xe4K\x84\x1bJ1#B$\x16\
+&\x5cQA\xea\xaf!\x0a\x8eC\xde\xb6q\xdd\xb2S\
+\xfe\x03\xd7\xbd\xe7\xc3\x83\xad\xe7\xcb\x81\xbe\xb7\xdb\xab{\
+\x1f</\xf0u9\xccUez\xcafb\x22K&\
+\x93%7\x9d\xf3\x13G\x90\xaf\xfc\xc4\x03\x0d\x00\xa8P\
+\x1b\x84_M\xb8\xa2\x819\x02\x0d\x08\xff\xdf\x80hp\
+\x8e\xe0\x0a\x04\xe2rJ\x8c\xbb\x12\xc7\xb9N\x85S\xfe\
+4B\xbe\xd8b\x06\xa2\x05\xb9\x1ba\x0f0T\x02\xfd\
+\x92\xcf\x99-]\xbb\x1f\x1a\xfc\xb0\xb3\xed\xd2t\xc1\xd9\
+\x8c,x\xd4\xa4\x81\xfdE'\xb7!Hc\x91\xbfu\
+3\xb1\xfd\xf0@<\x94\xcf5\xab\x98\x16\xd0[\xdc\xa2\
+l\xe8~\xfa\xfe?\xbd\x9c\xcd\xcf\xbe\xbd\x12\x0d\xf5\x03\
+?\x8bh\xafSQy\xa2\xb7cSv\xb1\xdc\xff\x00\
+\xa8\xb6\x100\xef=\xd3\x0d\x00\x00\x00\x00IEND\
+\xaeB`\x82\
+\x00\x00\x03\xcb\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
+\x00\x00\x00\x09pHYs\x00\x00\x00\xec\x00\x00\x00\xec\
+\x01y(q\xbd\x00\x00\x00\x19tEXtSof\
+tware\x00www.inksca\
+pe.org\x9b\xee<\x1a\x00\x00\x03XID\
+ATX\x85\xc5\x97Oh\x1cu\x14\xc7?\xef7\xf3\
+\x9b-\xdb6\xeen\xd2\xb5\x92\xe2\xc9J\xa4Ph=\
+\xa8 x\xb0Q\x0f\xc5?\x97\x82zI\xed\xc9\x8a\x07\
+=(\x94B\x0fB\x05\x05\x05Q(9\x98\x96\xf6$\
+x\xb0h\x11\x0fE\x0f\x1e\x04cP\x08)\xed\xb1\xda\
+\x9a\xa2\xe9&t\xb6\xdd\x9d?\xcf\xc3\xec\x9f\x99d\xd3\
+\xecN\xd3\xf5\xc1\x8f\x99\xf9\x0d\xef\xbd\xef\xbc\xf7}\xdf\
+\x99\x81\xff\xd9$s\xf5\xfd|\x8508l\x94} \
+\xde\xe6\xa6\xd2f\x0c\xbf!f\x86\x83{o\xae\x01`\
+\xbf\xfe\xfdIc\xccy\x85\x1d\x9b\x9bx\x15\x0c\xb8\x81\
+\x98\x17\x83\x97\xf7\xfc\xd2\x010\xf2\xd5|%\x12.\x81\
+\xde\xd7\xe4)\xbb\xe16\xe3\x89\xe5\xd7\xf7\xdet\x01L\
+h\x0e\x8b\xe8\x8e\xd5\x1d\xb9\x8fV\x15c\xa6\x80O]\
+\x007\x94\xfd\xc8\xd0\x92\xb7\xedq\x00\x17\xc0FR\x1c\
+vv`k\x07\x80\x17\x184G\x01\x1e\xab\x14\x00X\
+Xj\x0c\xec+\x9a\x1c\x93\x16\xc4\x02:8\x80\x0f\x9e\
+\x1a\x03\xe0\xd5o\xae\x0d\xee,i\x00\x81\x90\x87\x80\x9e\
+\x98$Hh\x06\x07\xd0z\xe2\x84\x03\xb9\x02t\xcbh\
+\xc3<\x04\x96.\x00/\x104\xc7\x14\xb4=\xf2<\x80\
+h\xaa\x02n\xec\xe4\xe2\x80\xb4\x98\x9b\xab\x82Y\x0e\x80\
+\xe4\xe0\xc0\xbd\xb4@\xb3\x1cp\xfavt\x1d\x08\xa36\
+\x80V\x1f[\x15H\xdf\xeb\xd7\x0c\x80\x0d\x0c6\x94\x0d\
+\xd7[\x07F8s\xb4\xca\xa8\xe7`CA4\xa9\x82\
+\x0d\x85Q\xcf\xe1\xcc\xd1*o>;\xd2W,\x1b\x98\
+\x14\x80H\xb0\x91\xd9p\xcd.\x04\xec,;\x1c?T\
+\xa2\xa0\xa6\x03\xa0\xa0\x86\xe3\x87J\xec,;\xcc]\x0a\
+\xfa\x8ae\xa3\xf4\x14\xc4\x06\xd5\x8dY\xb8p9\xe0\xec\
+\x05\x9f\xa9\x83[ycr[\x87\x03G&\xb7\xb1\xef\
+\x11\x8f\x99oo\xb1p9\xc0\xf6\xc1'\x91\x14\x80A\
+\x84\xe8\xbb\x8bw\xd8=ny\xe5\x99\x22\x8df\x82\xe0\
+\xd1\x87-?\xcf5\xb9p\xb1\x81\xd5\xc1&\xc2@B\
+\x227\x945k\xac\xe80}\xa2\xcc\xc4\xb8\xed\xec9\
+\x810}\xce\xe7\xcf\xbf#\xb6\x14\x84-\x05\xe1\xea\xf5\
+\x88\xe9s>N\xd0\xf5\x9d\xd8e\x99>Qf\xac\xe8\
+\xf4\x8c\xdd&n\x8b\x84\x82\x0d\xcd\x9a\xf5\xe0v\x87J\
+\xc90>\xeaf\xf6\xe3\xba\xf0\xc9\x17>\xb7|\xc5\xaf\
++\x9f\x9d\xf2\x89\xeb\xd9\x18\xbb*.\x95\x92\xa1\xba\xdd\
+\xe9\x19\xdb\x06\x19\x0e\x08\xda\xe3u\x18\xd6\x93\xbd\xa2k\
+\xd6\x88\xcd\xf2\x22|\xf4\xb1\x8f\x02K\xd7\xc1\x92\xbd_\
+\xb4\xc9u\xe4KO\xa1\x12I+a\xd0\xbboK\x7f\
+)++\xca\x0b\x93\x1e\x8bWc\x96kY\xa2F\xf5\
+\xe4\xf8P9\xab#\x0f\x94\x84\xe7\x0fx,\xd7\x94\xa5\
+k\x8a\x8d{\xf1+M\xc2P\xd6U\xc2\xb3\xa7\x1a\x1c\
+y\xbb\xc0{\xc7\x06\xfbf\xb9]W\xbe\xfc\xbc\x81\xd3\
+4\xf4\x92\xb9\xac\x12\x06f\xdd!\xb82\x17s\xf2\xdd\
+;\xec\xde\xe3P\x1a\xedoRj\xff*W\xe6#V\
+j\x8a\xbb^`\xcdp\xc0\xb9\xab\x0e\xdc\xfe\x07\xfe\xf8\
+)\xee+y\xd7\xe4\xaez\xb0J\x07\xb4>\xc4/\xe2\
+\xc4T\xfd.\x80\xd0\x9d\x15\xf4\xb5\xe1\xe6\xe7\xd7\x0e\x80\
+\xa2\xba3a\x14\xbd\x0fT\x87\x92]X\x8c\x0a\xce\xe9\
+\xe4\xb4e'\x9f\xd3'$\x8e\xcf\x0f\x01\xc4\xa2\x1a\xf3\
+\xd2\xb1\x1f\xa4\xfbk\xd6\xb6\x0f\x9f\xd6\xb2u\x98Ra\
+\xbf\x08\x85\xcd\xcc\xaaJ\x03\x98u\xe1\xf4;?Jm\
+3c\xdf\x93\xfd\x07\xb9eW\xa9\xbd\xf1\x10\xc7\x00\x00\
+\x00\x00IEND\xaeB`\x82\
+\x00\x00\x03\xa6\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
+\x00\x00\x00\x04sBIT\x08\x08\x08\x08|\x08d\x88\
+\x00\x00\x00\x09pHYs\x00\x00\x00\xec\x00\x00\x00\xec\
+\x01y(q\xbd\x00\x00\x00\x19tEXtSof\
+tware\x00www.inksca\
+pe.org\x9b\xee<\x1a\x00\x00\x03#ID\
+ATX\x85\xbd\x97=L\x13a\x1c\xc6\x7fw\x9cm\
+\x91^\x93\xa2`U\x22\x0c\x8dQ)\x03&Nl&\
+\x0c\xba\xc9\xa6\x09\x13\x13,$8\xb0\x91\x10\xc3H\xe2\
+W\x94\xc1\x89\xf81\x13'%u0D\x13\x12Q\x01\
+\x81\x22D\x04\x81\x08i\x01\xe9\xa1\xd7\xde\xdd\xeb\xd0\x02\
+\xa5\xb4\xf48>\x9e\xe5.\xf7>}\x9e\xe7\xfd\xff\xdf\
+\xbe\xef\x9dD\x16\xc4\xd5P\x03\xaa\xb7\x03\x9fz\x89\xe2\
+b7JQ6e\x7f0LX]\xd3\xf8\xf1\xf3-\
+\xdfg:$\x18\xcd\x1c\x96\xb6\x8c\x83A\x1f\x15\xe5\x1f\
+8[^\x8d$\xed\x16:\x0c\x0c~\xb6\x98\x9ay\x0a\
+\xb4I\x90\xd8\x0a \x82A\x1f\xc1\x8a\x19J\xfd\xfe\xa3\
+qN\xc30\xa1\xef\x0d\xe8\xfa;\xe0\x86\x04\x09\x19\x80\
+\xf3e\x1f\x8f\xdc\x1c@)\x82@\x19\xc0u\xa0\x1b@\
+\x16WC\x0d\x9c;s\xe5\xc8\xcd7Q\xec\xd9\xbck\
+\x16P-\xa3z;\x8e\xac\xe7\xb9\x10\xd76\xef\x8a\x80\
+&\x19\x9f\xef\xd2\xb1\x99\x1b\x06,E3\x9f\xd4\xcbx\
+\xdc\xaec\x0b\xf0i\x18\x12\x89\xcc'\x95\x0a'\x14\xfb\
+\xf5W} \x04\xc4\xd7\xed\x9b\x1a&DW`,\x02\
+\x8bK;\x86,dU\xb1%\x22\x04,G\xa1\xfb\x09\
+\xf8|\xd0\xd5\x05\xdd\xdd\xa0\xeb\xf6\x83\xe4@\x12\x17\x92\
+\xb8sK\xe4e\x98&D\xa6a|*e&2\xa8\
+\x93\x93\xd0\xd2\x02\xe1\xb0\xe3\x00QN#\xe7\x1d\x9d\x9d\
+\x87\xd7\xfd\xf0\xe5[\xee\x99^\xbc\x08\xfd\xfd\xd0\xdb\x0b\
+ee\x0e\xec%V\xf1\xe7\x0902\x01\x03\x83\xb0\xf1\
+\xb7\x80\x86\x04\x8d\x8d\x10\x89@k+\xc8\xf9\xe7\x93\x8d\
+\x18\xa5\xe8\xb8\xb3\x02\x08\x912\x1e\x19\xb7-\x04\x80\xdf\
+\x0f\xf7\xef\xc3\xfb\xf7PSS\x90\xae\xe1\xe57\x01\x80\
+\xac\x00_\xc7R\xa5w\x8a\xba:\x18\x1a\x82\x07\x0f@\
+Us\x10$b\x9cb\x96JD\xfa\x1c\xdc^\x84\xb3\
+\xf3\xa9\xd9\xef\x05\x91\x7f\xbd\xeeB$\x02\xa1\x10\x96a\
+\x91\xc4E\x1c/\xab\xf8\xd1q\xef\xa0\xa5\xfe\x86\xa6\x09\
+C#\xf6\xc5m \x89\x8bi.c\xb1w\xe8T\x0b\
+&\xa6\x0b/8\x9b\x10\x86I\xec\xe1\x0b\xa6\xaf\xdd\xc6\
+2\x0aWLA\x08\x98\x98:\x14\xf3\x8d\x81!\x16\x9b\
+\xef\xa1\x8f\xda\xd7SX\x8e\x1exG\xb3V\xd6X\xea\
+\xec!\xf6\xe8%X\xd6\xbe~\xab\xf0k\xd1\xb9\xb3\x10\
+\x98\xcf_1u\xb7\x07sy\xc5\x91D\xaa\x02N\x90\
+\xde\x8a\x97\xc2\xe3\x98\x94:\xd3\x00d\xe2\x1b\xf6\xd9s\
+s\xa0i\xd0\xde\x0e\xa1\x10\x84\xc3h\x9486\x07P\
+H&\xed\xb3kkS\xd7\xe8v\xd5\x92\x1c\xecuB\
+\xc1\xb2\xd6\x81\x5c\xdb\xd6nD\x1d\xb6+\x0fd,!\
+\x03s\x07\x11q\x91(L\xca\x03\x05#!\x03\xfd\x07\
+\x09p\x12\xad0)\x0f\x5c\xe8c2\xf0\x0c0\x9d\x8a\
+\xf8\x899\x0e\xe0&\xd9)\xa7\xbf\xd5z\x9c\x8ax\xf8\
+\xe7(\x84J|8\xc0B\xdf\xe6q\xdc\x068~\xb7\
+\x0a\xb0H\xc9>ZQ\xccF\xcc\x83V\x07\xe9\xc3(\
+\xfd\xa1x\x13x\x8c\x83vH\x08.0c\xab\x12*\
+\xf1a\x95?U\xe5,\xc7\xd3\xde;!\xa0\x1ah\x02\
+\xea\x81*\xc0\xbb\x9f0:\x1eV\xf0\xa3\xe1%\x81\x0b\
+\x09!\x14\x8c\x84\x0b}\xccM\xb23\xc0B_&\xff\
+?\xc1\xb1\x1aG\xdbo\xae\xb6\x00\x00\x00\x00IEN\
+D\xaeB`\x82\
+\x00\x00\x02b\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
+\x00\x00\x00\x04sBIT\x08\x08\x08\x08|\x08d\x88\
+\x00\x00\x00\x09pHYs\x00\x00\x00\xec\x00\x00\x00\xec\
+\x01y(q\xbd\x00\x00\x00\x19tEXtSof\
+tware\x00www.inksca\
+pe.org\x9b\xee<\x1a\x00\x00\x01\xdfID\
+ATX\x85\xed\x96\xbfk\x13q\x18\x87\x9f\xf7{w\
+!I+6\x81\xa2\x16\xa5\x19\x04'\x07A]D\xe9\
+$*8u\x11Ap\xef\xa0\xa3\x7f\x8a\xeeU\xc4A\
+t\xb1\x8a\x83\xbf\x86\x0a\x1dt/(I\xb4\x0a\xd5\xa4\
+\xb1\xa6\x97\xfb\xf5}\x1d\xaa\x18\xd0\xd2\xf4r\xcd-}\
+\x96\xbb\xe5\xe5\xf3\xf0r\xef\xfb\x1e\xec\x913\xf2\xe7e\
+\xe6\xc5\xc7\xe2\x98[\x99\x1aE\xa8]\xdf\xffy\xe1\x92\
+\x04\x00r\xf8A\xb3t\xfc\xd0\xf8m\x03W\x01w\x14\
+\x02@\x84p\xd7\x14\xfd9\xd7\xf1\x92;\xa2z\x0d\x91\
+\xed\xcb\xb2\xc3C\xb9\x9e\xf8\xa5\x8e\xb1\xaa\x97G\x99\xdc\
+\x8f\xc0\x15cU'\xf2\x12\x00\x0e\x98\x1c\xc3\x01\xd8\xb1\
+\xc0t\xd9\xa1Vv2\x13\xd8\xd1W?\xe6\x08\xb7\x8e\
+\xed\xe3`\x19\x16\xbf\x85\xdco\x0646\x92\xd1\x09\x14\
+]Adsy\x9c\x9b,pv\xb2\xc0R+b\xbe\
+\xde\xe3C7\x9d\xc8Ps/\xc0\xe9\xaa\xc7\xa9\xaa\x97\
+Z$\x93\xc5\xd3/\xf2f5d\xbe\xd1c\xc5\xb7\x03\
+\xd5f:\x05\x02\x9c\xac\x16\xb8qt|\xe0\x9at\x1d\
+P\xfa\xae\xc8&\x1b\x09t\x22\x88\x13X\xfc\x1e\xee\xae\
+@`\xc15\x7f\x83\x7fD\x10%\xf0\xb6\x15\xf2h\xa5\
+G'\x1a\xac\xfd\xa9\x05\xd6B\xf0\x13\x88,\xc46]\
+p*\x01\xd5\xdfO\xc0\x8f\x87\x0bN%\xd0\x0e-\xaf\
+W\x03,\xb0\xf05\x18*8\x95\x80\x02\xf7\x9a\xfe\xd0\
+\xa1\xfd\xe4\x7f\x8c\x04\x22\xcd/?0\x02\xef\xda\xbd\xa8\
+\x9b\x93\xc0\x92\x8b\xea\xdc\xa7\x9f\xdd\xe7\xebQ\xd8*\xb9\
+nE\xfeY1\xd9\xa3\xd0\x15t\xb9R.\xdf\x14\x80\
+#\x8f\x1bS\x1a\xc7\xb3*Z\x13\xc8\xee\xd8o\x81E\
+\x96=5\x0f\xeb\xb3\xb5/\xbb\x9d\xb5-\xffm\xf7\xc5\
+W\xed\x13\xc6\xf0\x8c\xec~\xd3c5\x9c\x7fr\xa6\xf2\
+~ \x01T\xe5\xc2\xcb\xb5i\xc7\x95L\xc64\x89\xd5\
+>\x9d\x99\xa8#\x92\xe3\xc0\xed\xb1\x05\xbf\x00/!\xbc\
+W8b\xb3X\x00\x00\x00\x00IEND\xaeB`\
+\x82\
+\x00\x00\x02\xe0\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
+\x00\x00\x00\x09pHYs\x00\x00\x00\xec\x00\x00\x00\xec\
+\x01y(q\xbd\x00\x00\x00\x19tEXtSof\
+tware\x00www.inksca\
+pe.org\x9b\xee<\x1a\x00\x00\x02mID\
+ATX\x85\xed\x97\xcfK\x94A\x1c\xc6?3\xef\xbb\
+k\x9b\x8bQIa\x89\x14\x1dR\x14\x09\x93(\x82J\
+\xecV\x08J\xed\xa1KG):\x85D\xd01\xd0\x0a\
+\xf1\x10A\xf8\x1f\x84\x85\x88\x82]\xa4\x0d\x0a\x8d\xac@\
+D\xf0\x92\xa0fK\x98\xa2\xb9\xdb\xaa\xef\x8f\xe9\xb0(\
+\xee\x8a\xfb\xbe\xa3\xebv\xf19\xbd\xef\xcc3\xf3|\x98\
+\x97\xef;3\x82\x0c5\x8c\xbe\xa9vp\x9a\x05\xa2\x1e\
+(\x03B\x99\x1eM%\x81)\x94\x18pQ\x9d\xfd\xd5\
+\x91\xd1\x8d\x9db\xed\xe1\xec\x97\xce@\xc9\xbe\x83\x1d(\
+\xee\x02r\x87\xa1[\xc9\x05\xf1\x22\xb62\xdf\xf2\xb5\xb6\
+\xd9Z\x07\xb8\xd9\xd5e$+\xe8\x01\xae\xefRp\xba\
+\x14\xbd\xa1q\x9a^G\x22\x8e\x04X.\xe7Q\xde\xc2\
+\x01\x04\x0d\xcb\x15<\x04\x10\x8d#\xddG,iO\x00\
+\x85y\x03H).\x82\xf6IiI\xab\xe9?\x84\x03\
+\x84\x95e4\x9aB\xc9\xf3J(\xad\x91\xed\xa7\xea9\
+\x1e\x0c\xa7\xb5\xcd\xac,\xd12\xf1N\x0fAq\xc1\x04\
+uTo\x14\x14\x19A\xc2F0\xbd\xcd,\xd0\x9d\x06\
+\xa1D\x89T\x92\x80\xf6\xc8\x1cII\x02\xbbU\xef\xbe\
+\xb5\x07\xb0\x07`\xfa1\x05\xa5Ay\xe80R\xa4\xf6\
+\xae\x02il\xf2\x14H\x833\xe1TE\xbbJ1\x9e\
+\x9cc\xd5ur\x03p\xb1\xa8\x94\xfb\xa5\xe7\xb2z\x0e\
+\x99!\x1e\x9f\xb8\xb4\xfe\xde\xf1\xe33\xd1\x85I\xcf\xb9\
+}}\x82\x0f\x8b\xd3\x0c\xfd\x99\xf1c\x05`x)\xc6\
+\xc7\xc5i_^_\x00\xb6ry6\xfd\xc9\x17\xc4\xf0\
+R\x8c\xb6\xa9A,\xe5\xe6\x0e\xc0/\x84n\xb8\x16\x80\
+\x17\xc4v\xc2\xb5\x01\xb6\x82\xd8n\xf8\xb6\x002!v\
+\x12\x0e>\xcbp+\x88\xb6\xa9!\x00\x14z\xe7\x09m\
+\x80B#@I\xc6\x01\xc4K\xb1\xd58\x09\xc7\xf2\x06\
+\x10.\x96\x12\xd9M\x97\x0f\x94q\xe7X\x8d\x16\xc0\xcb\
+\x9f\xdf\xe8\x9f\xff\x9e\xd5#\x5c,\x13\xc4/<\x960\
+\xe9\xda\xc4\x9dU-\x80\xa4k{z\x94P1\x13\x18\
+\x02ng3F\x17&}\xfdVu%\x84\x1c\x94\xb6\
+\xad\xba\x81D\xceg\xf7V\x9c\x80\xd5#\xdf\xd6Df\
+\x11\xe2I\xfe\xf3Ek\xdf\xe9[\xbf%@m\xe5X\
++\x8a\xde<\xa6\xf7\xd4V\x8d=\x85\x0d\x97\xd3+\xd1\
+\xa8\x19.\x9em\x07\xee\x01\x9b7\xfc\xdc\xc8QJ<\
+O\xcc\x15?x_Wg\xa7\x01\xac\xe9\xda\xc8\xab*\
+a\xc8f\x14WI]\xcf\xf7\xef0\xf4/0)P\
+\x03H\xa3\xb3\xaf\xf2\xc6\xd8\xc6\xce\x7f\xf5K\xfd\x8d$\
+\xf7\xdcR\x00\x00\x00\x00IEND\xaeB`\x82\
+\x00\x00\x03g\
+(\
+\xb5/\xfd`\xbe\x0f\xed\x1a\x00\x96\xe2\x837\xb0r\x1d\
+b\x9bXZ\xb1\xd4u\x99\xeb{\xed\xc8\x9a\x01k>\
+k\xf1\x03\xf0\xbf\xc8[g*.\xac\x19\xb3\x16s\xfd\
+\xbf\x22\x8f\xbe\xe2\xe7]\xe5R\xf7Q\x17U\xeb\x95\x22\
+\x9b`\x9d\x14s\x00r\x00v\x00\xdc\xfa~\x9b{\xbf\
+\x12\x91\xfd1M\xba\xc34\xb7\xfc\x0b\xeb\xfbTI\xde\
+\x8f_\xb8?cR\xf7\x19f\xcd\xff\x86\xc4\xee8%\
+]n\xb5\x13b\xff\xce\xb2{\xb5\xb3\xb4\xb93V~\
+\xcf\xc7\xb7&\xfe\x18\xe4\xc4\x9f\xe5g\xa3\xc9\x97\xa3\x1e\
+\xe0\xa2T\x99}Y\x8a\x0cS\x08q\x10\x91\x8e\xef\x9c\
+\x1ei|\x95\xd1\xf1i\x8e2\xbe(\xc5x\xeew4\
+>p\xce\x138'jqn4\x02p\x1e\xdd\xfb\xef\
+\xfb\xdf\x0c\xcd\xfb$4\xdfG\x9c~\x1cz4\xdb\xe9\
+\x81\xff\x0e\x0b\xfe\x93\x1a@\xa8\xd1\xfc\x7f\xda\xf0\xbb<\
+\xb5\xcf\x94\xf9\xebL\x19@\x1e3\xd9\xc4\xf3\xd3\xf5\xfd\
+[\xfa~'t^\x82\xaa\xbfG*\xf8\xcd\x17mo\
+\xbah\xf9\x93g\xfbSU6O\xec\xf3RT\xf6?\
+\xe3\xed\xa7\xac\xcc]\x85%0P{?q\xe8'\x0a\
+\xaa?\xbb\x17\xfey\xbe\xffE\xe5{\x0b\x8a \x0f\xef\
+\x90D\xd7\x1d\x92\xe6\xd2\xbeC \xd5q5l\xf7#\
+\x8c\xec\xbaD\xd1\x95\xaf\xe9y\x7fB\x8a\xd7'\x86\xd8\
+\xf2\xbc\x7f\x11\xcd\xeb\x16Q<+\xdew\x03\xe8{\x86\
+\x0f\x96k\x91\xd1mw_\x91 \xf9\xf3\xfc\xc0?-\
+\xa3\x1f\x09\xdd\xeb\xc8g\x96\xbb\xd9}_\xf9\x94\x1f-\
+\xce\xfb\xe0\xf0\x7f\x8e\x93\xf6\x93:rO\xe6\xc8\xfc\xa1\
+\xa8\xdb\xefz\xbb~\x9fK\xac\xfe(*\xfd 7|\
+=\x04\xa7\xcf\x0e\xff\xffC\xce\xaf\x00\x9c\xff\x08p>\
+6\xe4\xfc\xfa\xbc\xc8\xc1\xd4j8\xb5:\x0d\xa0\xa6Y\
+\x05P\xab6\x1c\xacz\xc0\xc3\xac\x9cB\xe8e\x95\x85\
+?\xd0\xd7\xf8\x86}\xadB\xc8\x95\xc6\x8b\x06Wj\xf2\
+\x13l\xb1\xf1\x11lY\x0f\x0a\xa6VNC|\x83\xac\
+6\x1b\x22\x96\x9b\xd5#T\xbd]!P\xbd}W\x88\
+\x82\xe3\x1d\x5cw\xbf\xf0\x14\xd7\x19\x9c\xe2\xf8\x19\x96\xfb\
+\x0dLr\xbd\xa1I\x8eW\xf7\xba\x01\x80\xb4\xa8\x91-\
+qJdP\x92B:`\xd2\x09\xd1\x03\xe2`\x1d\x01\
+\x8f0\x01\x11\x18!B\x02B\x94\x90\x08\x8a\xa0\x10\xc1\
+(\x12%\x05\xe9\x06/\x02\x842\x90\x17\xc4\xc6\xa5@\
+\x90\xae(\x07\xca5:\xbd\xe9\xc4Kc.\x1fl\x12\
+3\xb5\x83\x8c\x18\x87?\x89n\x19\xf3!\x80h/\x13\
+\xdc\xd2\xe6C\x00\xd1&3\xdct\x81B!y\x83A\
+\xba\xd8\xa1{\xfe\xd8\xa0\xf2'\xa8\xbbp\xfe\x1fDl\
++\x8c{\x9b|\x08 Z\x832\xc8o\x8eXu\x8d\
+y\xe4 p\xf8\x9e\xeea\xe6U\x96{1\xd0]\xf6\
+\x06\x0c_w\xe3\x1e\x22\x14\xce!\xff\x84\xe8\xd6\xe0S\
+\xe1\xbc~\x1d\xeb\xf7\xb0z'?\xdd\x1d\xec\x85\xc6f\
+\xbe\x05\x05|\xf7%\x0cra\x1d\xf6\xdf\x8f\xfd\xe6V\
+\x08\xe0\xae\xbc{\xc4\x87\x7f\x88}p\x9d\x0f\xf7+C\
+\xf2\x0b\xf7Kp\xb7\x08\x0b\x9b\xc3\x92\xc7\xdd'\xe5\x81\
+\xf7\xaf\x0d\xc2_7\xf7\xee\x0d \xe9\xf2\xeb7\xd8F\
+$\xba)\xfcA\xf0\x0f\x1e\xf9Q\xbf\xff\x07\x81\xc1\xea\
+\x8d;Y\xdd\xc0n;\xf1A\x8c\xaa\x1c\x9es\x0f\xf6\
+\x12\xb9\xe0\xddb\xf4\xfa'\xcf\x8dT\xe2w\xce\x13g\
+\xc4T<\x83\x89h\xa8+\xb6w\xafY\xa4\x1e\xcb\x1f\
+$//\xb1t\xc5\x89%,\xf9|\x5c\xfb\x7f\xdf\xd2\
+\xc3K\xed\x02\x88&\
+\x00\x00\x03\x8d\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
+\x00\x00\x00\x04sBIT\x08\x08\x08\x08|\x08d\x88\
+\x00\x00\x00\x09pHYs\x00\x00\x00\xec\x00\x00\x00\xec\
+\x01y(q\xbd\x00\x00\x00\x19tEXtSof\
+tware\x00www.inksca\
+pe.org\x9b\xee<\x1a\x00\x00\x03\x0aID\
+ATX\x85\xb5\x96\xcb\x8a\x13A\x14\x86\xbf\xd3\xd5\x9d\
+L\x87\x19\x1d/\x887p+\xba\x13QAp\xe5[\
+\x88\x0b7.\xdd\xccBd\x1cp\xe3kx\xd9\x0a\xb3\
+p\xe1\xc6\x07p)\x0e\xa2 \x08:\xccb\x18\x8dW\
+\x92I\xba\x93\xae\xe3\xa2\xd3\x99Nw\x99N\xc7\xb1\xa0\
+IQ]\xa9\xef\xcf9\xff9\x15\xa10V\xd7{g\
+|I\x9e\x01\x17\x01\xaf\xf8\xbej4\xb0Q\x98\xf4\x93\
+n\x7fpa\xed\xe6\xa9\x0fU\xfbK\x80\x80d\x0d\xb8\
+4\x0f\x1c@\x90\xe6\x89\x93GZG\x0f/\xbe{\xf0\
+h\xfb\x5cm\x01x\x9c\x9e\x07\x9c\x0d\xd5\xf4syy\
+\xd1\x1c:\x12\xbe\xbd\xfbd\xf3|=\x01\xff\x08\xb7\xa3\
+y\x9c(\xe1R\xcb[^\x5c\xdaXy\xb4\xf9\xd7H\
+\xec\x9b\x00U\xb0\x0ah\x0a\x8f\x86\x96h\xa8\x04\xad\xd0\
+\x84\xe1\xd2\xc6\xca\xe3\xf6\xd9\xff& \x83g\x11\xc8\xe0\
+\xd1\xd0\x12\x0d,\xa6\xd9\xf0\x83\x05\x7fc\xf5Y\xfbT\
+\xf1\xbb\xfe\xbe\xc2\x15\xfa\x16\xbe\xfd\xec\x91 \xc4C\xcb\
+\xc0\x82\x08x\x9e4:=\xd6\x81+\xfb&\xa0\x08\xcf\
+\xe6\xdb\xbf\x12\xda;\xdfA<\xc4\xf3\xf1L\xfa\x89o\
+Jg\xcc-\xc0\x0dW\xac\x82\xdf\x0c8|\xfc(\xdd\
+N\x1fU\x01\xcf \x9e \x22\xc3}\x110\x0d\x9e=\
+\xc67\xb4\x16[D\xb1\x05\x01\x10\xf0$\xfag\x01\xb3\
+\xc0U\xc1Z@\x84F\xc3\x90$\x8a\x15\x01eP<\
+\xafV\x15\xd4\x81\xe7\xf7\xa9\x08\xa8\x928\xce\x9c)\x02\
+\x0b\x01\x04F\xc7u>\x86Q6\xa0\xb5\xe9z?\x86\
+N4)2\xeb\x92\xb5\x05\xdc\xb8<$\x0cf\xd9\xb9\
+7vcx\xf8\xc2LD\xc8%\xa02\x05\xaa\x10\x18\
+\xa9G\x07\x1a\xbe\x94\xe0\xd6\x96\xf7M\x8d@\x16\xde\x97\
+\xef=\x0e,\x8cR0Z\xcf\xc2?~ M\xcfh\
+\xfd{\xb7\x00W\xeay o\xb8\xcfm!0\xd3s\
+\x9e_G\x95\xddXJ\x86eV\x0f\x14\xdd~\xebj\
+}\x0ftcx\xf0\xdc+E\xa18J\x1e(\x96\x90\
+\x9d\xd7\x03F\xca\xa59\x8b\x07\x92b\xa9\xa9\xf2\xe2\xad\
+p0\x94\xa99\x07\x9d\xf0F\xbb\xe3\xee\x0b\x95\x02\xb0\
+\xe9\xa1\xf9\xfa\xfd\xdc\x16|3=\xe7Vs9\x07z\
+q\x19\xaeZ\x0eAI@\x11n\x15n_K\xea{\
+ \x82{\xeb^.\x9d\x8a#\x03\x0e\x0f8\xda\xeb\xbc\
+}`\x02>k\x1fp\xf5\xf6\xe7oR\x0fL\xcb\xb9\
+\xb2\x97ckS\x0f\xe4\xe1\x99w*\x05d)\xc8\x1b\
+\xe8\xd3\xd7\xd4\x03\xae\x9c\xff\xe8\xc2\xd0\xba\x0d\x97\x87[\
+\x05\x87\x05\x1c\x02\x1c\x87\xdd\xb9\x9e\xd0(\xff\x99\x01\xe0\
+\xe9+\xe1\xcd\x96T\xc2\xb3\xcb\xab8\xfe\xe2\x81\xc9\xc3\
+\xa6]\x18\xa3\x9b\xb6\x1a\xee\xa2\xbb\x22\xe0\xba\xcf\xd7_\
+{4}\xdd\xcb\x7f\xce\x0b\x1fwdn\xb8S\x80\xab\
+\x13nl1Y\xe7\xc5\x0e7'\xdc) \x8e\xb59\
+n4LV\x05Ex\xce\xdd\x19|\xbc\x07\x07\x5ci\
+V\x0a\xd8\xedt\xfb\xc3A\xe2,\xaf|\x1b\x9e\x9ck\
+y\xbf\xe3\x97\xab1\xbd\xea\x08t;\xab\xd1\xef\xce\x85\
+$\x8a\x8e\x8d{~\xfe<u\xcf\x9d\xefGC\x00\x0d\
+\x82/\x12\x86\xf7\x8b\xbc?\x1b\x16Rs)\xe6\xa8\x16\
+\x00\x00\x00\x00IEND\xaeB`\x82\
+\x00\x00\x03{\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
+\x00\x00\x00\x04sBIT\x08\x08\x08\x08|\x08d\x88\
+\x00\x00\x00\x09pHYs\x00\x00\x00\xb1\x00\x00\x00\xb1\
+\x01\xc6-I\x8d\x00\x00\x00\x19tEXtSof\
+tware\x00www.inksca\
+pe.org\x9b\xee<\x1a\x00\x00\x02\xf8ID\
+ATX\x85\xbd\x97KHTQ\x18\xc7\x7f\xdf\xb9W\
+\x9bI\x1b[\x18\x14\xf4\x0e\x051\xb24\x0d*\x02]\
+Dd\xabV\xad\x22\x88\x22\x0a\x8d\xda\xd4J\xa2\x82\xa8\
+E\xdak\x88h\xd1\xa6\x07\x04\xadz\x10\x91E\x91\x8a\
+-\xd4\xc2EX\xf6\xd2\x0cjQ:>2\xe7|-\
+\xc6\x19'+\xe6zg\xec\xbf\xba\xdc\xf3\x9d\xf3\xfb\x9f\
+\xc39\xdf\xf9\x8e\xe0Q5-\x84\xc8\xa6\x1aL\x15\xaa\
+%\xc0b`\xf6x\xf37\xe0\x1dH\xbb\x88m\x0c\x0c\
+q\xe7\xd4z\x06\xbc\x8c+\xa9\x02\xf6\xb5Sh\xa2\xe6\
+\x10\xe86`\xa6G\xbfC\xa2r\x1d\xc7\x9e<\xbb\x8a\
+._\x06\x0e4\x11\x1c\x0b\x98c\xa8\xee\x07\x5c\x8f\xe0\
+\xc9\xfa\x09\xd20\xd0o\xeb\xaeT2\xe2\xd9@m\x1b\
+\x05j\xe5\x16\xb0\xdc'x\xb2Z\x1c\xd5\xad\x0d\xab\xe9\
+Ki\xa0\xe69\xab0r\x1f\x98\x93!xLJ\x8f\
+\x11\xad>S\xc6\x8b\x7f\x1a\x18\x9f\xf9\xb3\x8c\xc3\x93L\
+D\xad\x96\x87+\xf8\x1c\xffe\xe2\x1f;\x1e\x11P+\
+7\xa7\x0d\x0e \xccw\x1c\xb9}\xa0\x89\xe0\x1f\x06f\
+\xe5\x99\xe3@\xc9\xb4\xc1'T6\x160\x87'<\x11\
+?j\xd2\x89\xff\xdd>UE\xa2Q-\x08W\xf0\xd9\
+\x00\xc4\xce\xb97xMA#\x87\x8a\xdaX\x94\xb3&\
+\x1d\x03\xb9\x8ek\xea\x00\xa4\xa6\x85\x10Y\xd2\x87\xc7$\
+s\xb6\xd4\x02\xa0X\x9a\xbf^\xe6V\xcfAF\xed\x90\
+\x1f\x13\x83\xc1a\x9dgb\xe9\xd5s\x86KH0\xac\
+\xcd\xdf\xcd\xe1\xa2\x0e\x96\xe5n\xf0c g(\xc8f\
+\x03\xa6\xcaO\xef\xb8\xf2g,\xa3\xb6\xb0\x91m\x0b/\
+\x92m\xa6:\x0fSe\xc6/\x96\xb4\xe4w5\x04]\
+a\x80%\xe9\x1a\x88\xcb\xc7j,5@(S\x06`\
+b5\xf6\x15<\xf0\x12\x9egR\xc7\xf8\x95z\x8a2\
+@\x7ff\xb1\x96\xa6\xaf\x97\xb8\xd0\xb5\xd1K\xf8w\x17\
+x\x0b\xe4g\x02\xfe\xe5\xc7k\xae\xbd\xdf\xc9\x9b\xc8S\
+\xaf]\xba]\x90v\xd0\xf2t\xc0\xfe\x93\x92t\xb8\x22\
+\xb6QUv\xf9\x85\xfb\x98uB\xaa\xf6\xa1;6\x83\
+\xdb\xce\x08\x83@\xce\x94:g \x15\xdb \xf7L\xb8\
+\x98\x88\xa8\xdc\xf0\xda\xabk\xe01\xbd\xc3\x1d\x9c~\xb5\
+\x8e\x1b\x1f\xf6\xf8\x85\x03r-\x5cLD Q\x09u\
+\x02Y>G\x9b\xaaF]\xabE\xf5\xe5t\x1b\x80X\
+\xe9,\x0d\xff\x09\x8e\x88\x9c\xae/\xa7\x1b\x92*\xa2\x81\
+~[\x07\xb4\xfc\x07~\xb3\xce\xb2G\x12f\x92[\xf6\
+\xb62\xd7q\xa4\x15X0M\xf0O\xae\xa3\x15\xf5+\
+\xe9\x8d\xff\xf8-\x15\xc7J$\xdd\x82\xd23\x0d\xf0\x8f\
+\xaa\xba)\x19\xfe\x87\x01\x803e\xbc\xc0h\xa9\xc2\x93\
+\x0c\xc2\x9b\xa3Q\xad8\xbf\x9a\x97\x93\x1b\xfez\x19\x9d\
++\xe5\x8b\x84t#\x22G\x81\xc14\xc0\xa3*r\x82\
+\x90V&\xbf\x05\x92\x95\xf2q\xba\xb7\x95\xb9\x8ek\xea\
+P\xdd\x8e\xf7d5\xa8\xc8\xd5,kO\xc6w\xfb\xbf\
+\x94\xd2@\xc2H'\xb9f\x84j\xc1T*\xbaRb\
+\x85L\xe2y\xae\xf0\xd6\xa8\xb4!\xf6\xd1X\x80\xbb\xe1\
+b\x22^\xc6\xfd\x057+\x18\xa1\xdb\x91\xb1\xd3\x00\x00\
+\x00\x00IEND\xaeB`\x82\
+\x00\x00\x05x\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
+\x00\x00\x00\x09pHYs\x00\x00\x00\xec\x00\x00\x00\xec\
+\x01y(q\xbd\x00\x00\x00\x19tEXtSof\
+tware\x00www.inksca\
+pe.org\x9b\xee<\x1a\x00\x00\x05\x05ID\
+ATX\x85\xb5\x96[hTW\x14@\xd7>\xf7\xce\
+\xc4$c\xd4\xd6W\xc1\x82\x16\xed\x83\xda\xc4\xb7F\x8b\
+\xf8(\xd2j\xe9\x874\xb4 \x88PJ\xbfj\x8cV\
+m,\x08R\x11\xadZ\x84\xf6\xbb\xf4\xa3/\xb0\xf5\xa7\
+\xb6\xa5Eb\x04\xe3#A\xabB\xb4\x0f\xb1\x8a\xcf\x22\
+\x1am&\x93\xc9\xdc{\xcf\xee\xc7<2\x93\xb93I\
+\x83=?3\xe72\xb3\xd7\xba\xfb\x9c\xb3\xcf\x16\x868\
+t\xcd\xfc\x1a\xa2\xa9U\x16\x96\x09R\x872YUF\
+\xa3\x00<P\xd5\xab \xe7@Z\x9cH\xc5\x0f\xf2Y\
+[\xf7P\xe2\xca\xa0\xe0\xb7\xeb\x9e\xc6:[Uy\x13\
+\xa5*\xfd\x10T\x85\x0c<3\xef\xff\x8e\x92\xc0\xf2\xb5\
+o\x82=#\xbe:\xf7\xe7\xb0\x04\xb4\xa9\xbe\x92\xee\xe4\
+\x87\xa84\xaa\xe2\x16\xc2\xca\xc2\xf3\xe7\x1e*\x07\xdc\xca\
+\xd8v\xf9\xbc59d\x01}g\xc64\x02s\x08e\
+\xbaf\x82\x0e\x03\x0e*\x99\xb9\x9c\x8a\xf8v\xb5\x1c:\
+s{P\x01}k\xceL\xc4\xfe\x8c2\xee\xd1\xc0\xd3\
+sQnX\xb5\xab*\xbe;{\xa1\xa4@\xe6\xcd\xdb\
+\x1e5<\xfb?UnxF\xe6\xc6\x0ev\xdc\xc92\
+M\x0e\xben\xc9\x08\xac9\xf8?\xc2A\x99\x14\xf19\
+\xac\x0d\xf5\x95E\x02\xb8\x0fwb\xa9+\x82\x8b\x83\xcc\
+Y\x8e,o\x801\x13\x06\x85\xf3\xd8\x04\xcc\x8a\xd71\
+\xf3\x96\x81\x98|x&\xae\xceN\xa6R\xefg\xb1\x02\
+\xb9\xa3\xd6Y\xb4\xdb\xc5A6~\x82L\x9f\x9f~\x96\
+\x88c?mF/\x9c\x0c\x87\xd7\xd6\xe3n\xd8\x05U\
+1\x00z\xcf\x9e\x82]\x8d8j\x07d\xc2\xc4}O\
+\xa7\xc5~\xec\xb8\x93VL\x9f\xf3\xa2\xa3&3\x97\xf4\
+\xc3\x01\xaab\x98\xa6\xfdH\xed\xc2bx]=\xee\xe6\
+}98@\xe5\xac\x05\xdcxv\x11~\x90\x0f\x17P\
+\x8d\xb9.\xdb\x01\x8c\xae\x99_\x93)2\x05p\x14\x18\
+=\x96\xa2\x11\x89b\x9a\xf6!u\x0b\x0b\xe1\xef\xed\x83\
+H\xb4\xe8\xe7\xb6f\x0c\xbf\xddO\xe2\xd9,<'\xb3\
+V_[4\xd2\x10M\xad*U\xe1\xf4\xcc1H\xc4\
+C%\x9c\x8d\xfb\x90\xda\x85e\xe1~\xbc\x9b\xae\xe3G\
+Ix\x96+])\xac\xd5\xbcLP\xddkS+\x9d\
+\xed3\x9fh\x14dV\xe8nO\xf4\xc0\xb5\xdf\x91y\
+/\x81\xe3\x14Fw\x1c\xcc\x82\xe5\x98\x85+\xc2\xdf<\
+\xd5\xc7\xc5\xe6\x0d\xf4\xfeq\x09\xd7\x18\xacB\xaf\xaf\xd4\
+D\x0d\x92\xe1\x08\xdc7\x99\x8b\xa5\xe4Q\xd3\x0b'\xb1\
+\xfb7\x82\x97\x0a\xcdD(\xdc\xf3\xb8\xb8\xad\x89\x87\xa7\
+\xdbp\x8d\xc1\x11\xc1\x11\xe8\x0b\x94[q\x0fks\xcb\
+Pk\xb0L\x19\xec\x9c\xdb\x0b\xa7\x08JI\x84\xc1\x9b\
+\x1by\xd0v\xac\x00\x9e\xfd\xf4\x02\xb8\x9b\xf4\xb0\xe9\xd8\
+O\x19Ej\x86Rd\xf4\xfc)\x82\xbd\x9b\xcaJ\x0c\
+\x06w\x10\x1c\x03\xbeBW\xd2Ga\x94\x19V\x85+\
+1\x040\x22e\xe1\x8e\x08n&d\xc2S1\xc0?\
+C\x81\xf3\xc2\x02\xdc-\xfbC\xd7<'\x10\x89\xf0\xdc\
+\xae\x03<\xfe\xe2\x92\xb2\xf0\xf4s!P\xe2FU\xff\
+z\x14\xf0|\x89\xa9;?fLV\xa2\x04\xdc\xa8\xc1\
+\x85\xab&\xddF\x95\x81\xd7\xd6\x97\x84\xdbT\x1f6\xd5\
+\x17*1y\xc7^j\xe6-*\x09w\x04\xc4p\xde\
+\x80\xb4\x94\xbbX\xdc\x0d\xbbJ\xc2;\xb7\xac\xe7\xd2\xd6\
+\xf5\xe1\x12\xd1\x0a&\xed\xd8K\xc5\xf8\x89\xa1pG\x84\
+\xa88\xbf\x18'\xd9{\x18\xa5'l\xc3\xc9\x9c\xc5\x05\
+\xb5} \xfc\xe1\xe9\xe3t\xb7\x9f\xe0rsc\xa8\x84\
+\xa9\xaa&6\xb7>\x14n\x90Do\xaa\xf2\xb0\x91\x83\
+\x9dq,\xdf\x0c\x84\x03\xd0u\xaf,<\xbb\xdb\xe3\xed\
+'\xb8\xbam\x03\x1a\x22\xa1\x0f\xba\x8a\xe0\xae\x82A\xbe\
+\x1c\xdf\xda\x1a7\x00\xbe\x09\xf6d\x1a\xc8\x82e\xb0\xed\
+\xad\xe9+53\xfcx7\x9d[\xde-\x80g\x83&\
+:Np\xfd\x83&lO\xff\xdd\xd1w\xf64^{\
+[\x11\x5cDRQ\xecn\xc8k\xc9\xbc7\xe6|\xa4\
+\xca\xe6\xfeLd\xa0\x18n>\xb3\x88\xa0f\x0c]\xc7\
+\x8f\xe2\xdf\xfd\xbb\xec9\xaf\x18;\x9e\xea\xd9\xf3!\xde\
+\x9d\x86\x07\x0c\x84#Vv\xc7ZN7\x17\x08\xe8\xba\
+%#\xbcD\xcfQT\x17\x0ch\xa3\x08,\x5c\xba\xd7\
+G\xc2\x0b\x86Td\xc2\xd6<\x0bG9\x19\x8b\xde_\
+*?]\xee+\x10\x00\xd0\x86\xb9\x13=\xab\xed\x08O\
+\x16\xb6Q\x10X\xe5\xca\x03\x9f\x84o\x87\x0d\x17\xd5[\
+F\xddyU-'o\xe66j\xbe\x80\x1c\xec\xb8\xa3\
+\xd8WU\xb91\xb0\xa14\x18\xa6\xd4D\x18\x191\xc3\
+\x84s\x1dq_\xce\x87\x17e\xa0?\x133\xc7\xf5\xf9\
+\xce\xb7\x02\x8b\xfb\xdb\xa8l&\xe0v\x8fG*\xd0\xff\
+\x94v\x09tu\xac\xb5\xbf\x1d/+\x00\xa0\xafL\xad\
+HFGm\x13\xcc&\x94\xea\xfc=am\xfaJ\xf5\
+\x95\xc1\xe0)Q\xdd_\x1d\xed\xda\x91]\xf3!\x0bd\
+G|\xe5\xdc\x89\xae\xcbvU\xd6\xa2T\xe72\xa1\xf0\
+0\xe9c3\x02\x03\x8b\x8cA\xbf\x88\xc2\x9e\x11G:\
+\xae\x94\x8b?\xa8@.#\x0d\xcf\xc7z{\xabV\x89\
+\xcaRUf\xa0:Eat\x22\xa5\x12@\xb7\x0b\xd7\
+D\xf8\xb5B\xcc\x91\x84W\xf5\xfd\xf8\xd6\xd6\x90f\xb2\
+x\xfc\x0byxC3\xc2\xf2\xfey\x00\x00\x00\x00I\
+END\xaeB`\x82\
+\x00\x00\x03'\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
+\x00\x00\x00\x09pHYs\x00\x00\x00\xec\x00\x00\x00\xec\
+\x01y(q\xbd\x00\x00\x00\x19tEXtSof\
+tware\x00www.inksca\
+pe.org\x9b\xee<\x1a\x00\x00\x02\xb4ID\
+ATX\x85\xed\x96\xcfKTQ\x14\xc7?\xf7\xcd\xf3\
+\xb7\xce\xe8h\x08\xb5\xa8H#\xb5P\x10\x8a\xb4\xc4\x9d\
+A\xbb\x16-\x84\xa4\xa0m\x8b\xe8\x1f\x98u\xad\xa2\x8d\
+n\xc2\x027\xba\x88\x16J\xf4\x03E,)\x8b\x12\x1c\
+\xca\xa4Ed2\xe5\xa8\x13\x8e\x8d\x8e\xf3\xeei1\xa3\
+\xce\xe8\xe0\xbc\x99q\xdc\xe4\x17\xce\xe2]\xee;\xdf/\
+\xe7\x9c\xfb\xbd\x17\x0e\xf0\xbfC%[<ui\xfc\x98\
+V<P\xa8v\xa04K\x8e \xa8aCEn}\
+\x1ej\xfd\x9eR@CC\x7f~\xa8\xb2\xfc\xa3@}\
+\x96\xc4\xdb1U\xbc\x10h\xf6z\xaf\x86\xe3\x17\xcd\xed\
+\xbb\x96\xdde\x17\x8d|U\xef(\xc8\xdbSv\xb1\xf4\
+\xe9\x90\xe1l\x03^\xc6\xaf'T\xe0\xcc\x9d\xf9f%\
+\xd63\x1cf\xd5\x9e\xb2o\xaa\xd0+J9\xaeL\xde\
+\xab|\xbeS\x80G\x8c\x93\xfe\x85i\x0559!\xdf\
+\xc2\x12\xc5rt\xfa\xee\xa1e\x88kA\xcd\xfcb]\
+\x89Sj\x0a\x8b\x14\x86\x91\x1bf\xada\xf5\xafT\x04\
+\xff8\xda\x80A\x88U\xa0\xdd#\xa6\xa3\xd4?a\x98\
+4\xe5\x86:\x11\x91\x08^\x09V5\x8dxT\xc4\x04\
+0\x5c\xfe\xeb\x08MZ\xef\x07=\x18\x06\x0d\xca5\xdf\
+\x05<4\x01\xc4R-\x82\xec\x0f\xfb\x96\x8c\xd6M\x01\
+Z\xdb7\x9bj\xa7A\xcb\x89|f~[L\xfd\x5c\
+\xcfFA\x19\xc4\x86P\x04\xec\x14\xa0\xdai\xd0s\xad\
+\x1cWQtJG\xbf\x86\xe9\x1eYa.`\xa5O\
+\x1f;\x7f\xd1\x0aX\xf6\x044\x1e1)+\x04-\xd1\
+a\xb9Pkr\xf6\xb8\x93\xfe\x895\xfa\xc6C\x84\xc2\
+i\xb41^\x80X\xb6\xf8QJ\xa1u\xe2N\xd3\x80\
+\xces\x05t4\xe4\xd1;\xb6\xca\xe0\xe4\x1a\xdaF\xb2\
+\x0d\x032\x00,\x1d=\xa3\xa9C\xd0\xa2\x93FE\x09\
+\xdc\xee(\xe4~g\x09\xa5\x05*e.K\xc7\x09\xd0\
+bW@L\xc4.Qw\xd8\xc1\xe5\xc6\xbc\xd4yd\
+{\x0b$\xe9\xcd\x9c\x00\xb1\x04m\xc3,\xb4\x05\xda\xda\
+=\x9f\xda1\x846\xa0E\xd0\xb2{\x83\xbd\xb3\x9a\xa7\
+\xef\xd7\x91\x14:7\xb2D+\xa0\xed\x0da\xb4|\xc9\
+3/\x04\x85\xdeQ\x8b\xa1O\x91\xb4\x86\xd0\x04\xb0l\
+\xfa@8\xc2\x8e\x0a\x84#\xc2\xc0[M\xdfX\x84P\
+:\xbe\x94\x89\x0f|\xf8\xa6\x09\xac\x08\xae\xe2\xe8\xf7\xe8\
+\x17M\xf7\x0b\x8b\xb9\xa5\x0cl<\x13\x1f\xf0\x05\x84\x9b\
+=a\xce\xd7:\x98\xf9\xa5\xf1\xfe\xc8\xfc\xfeHh\x81\
+\xd6\x04\xed\xfe\xe8[\x82'\xef2\xb0\xdem\x10a\xeb\
+A\x22\xa2\xde\x88\xc8\x8d\xac\xb3\xa6#\x00\xf5\x1abF\
+T\xedv\xf7j\x8b\xe1\xe8\xf9\xdd\x97x5\xeds?\
+\x82\xb87a\xbbG\xccY\xdfb\x17H+\xb1\xab2\
+\x07XVJ\x8d\xcd\xf8\xdd\x8f\x19P\xd9\xf7\xf1\x00{\
+\x81\x7fM]\xb6w\x5c?\x12\x96\x00\x00\x00\x00IE\
+ND\xaeB`\x82\
+\x00\x00\x01\xf2\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
+\x00\x00\x00\x09pHYs\x00\x00\x13\xaf\x00\x00\x13\xaf\
+\x01c\xe6\x8e\xc3\x00\x00\x00\x19tEXtSof\
+tware\x00www.inksca\
+pe.org\x9b\xee<\x1a\x00\x00\x01\x7fID\
+ATX\x85\xed\x97\xcd+\x04a\x1c\xc7?\xcf\xb3;\
+\xd8\xbc\x1c\x90v\xb9p\x94\x9b\x03\x8aU\x8en\x0a\xe5\
+\xed\x22\x8ar\xf3\x07\xb8\xf8\x13\x1cd]\xdc\x97\x83\xe2\
+\xe6 %Q\xcaKRn\x0e6I-\x91\xc5\xcc\xce\
+\xe3\xa0\x91=\x98\x19cg\xc7a\xbe\xa7\xa7_\xbf\xe7\
+\xf7\xf94\xcf<M\x03\x01G85tO\xac&Q\
+j\x1c%j\xff\xc8\xd2\x15\xe6\xe1[\x15\xcb\xc7\xa9\x19\
+\xdd*Fm\xe1\xe3\xa9~L\xb5\x05HP\x7f\xe4\x83\
+@\x8cU<\xd3\x0b\x0cY5i\xbf\x819\xa7\x1e\x0f\
+\x19LN\xac$\x5c\x09(E\xbc\xc8\xf0\xcf\xb9\xa6l\
+t%P\x8a\x04.P\xf0\x12\x0e_\xa8\xda(,(\
+\xe8\x14\xa0eV\xd6[\x8d\xfbl\xe9\x04\xa2\xb0\x09\xf4\
+XwSj\x11_\xe1\xf0\xed\x08F.U3\xd0\xe3\
+;\xf1'\x01\x09u\xa5\x86\x17\x08\x04\x95P \x14\x08\
+\x05B\x81P\xe0\x9f\x0bH\x9f\xfcd\xdep%P\x1e\
+\xaf\xf7\x03\xff\x9c\x7f{\xb9r%P\x93lGk(\
+\xeaW\xfa\x05!\xa6\x0f\xd2\xf39\xab`\xfb_\x10\xa9\
+\x8c\x91\x98\x1a\xe0\xfd.\x8b\x99{\xfd5\xed\xfd:\xb3\
+\xf8\xb8\x7f\xb2\x07 \x14z\xa4\x5c;\xdd]\x9b|\xf8\
+\xdec+\x00\x80\x94\x94\xc5\xbd=\x85XK\xd3\xf9\xf6\
+\x5c\xc7\x8e\xedxk\xa1\x9b\xdcx\xa2\xd8\xc4t1\xf3\
+K \xdd&n\x81\x8d\x22\xf2\x8fn\xef9rj*\
+8\x82\xea\x1c\xa3O1f\x05t)\xd0<a\x15y\
+\x04g\x06,\xed\xf6\x09\xc3yC\xc0\xf9\x00\xb1\x0b_\
+,\x8f\x12su\x00\x00\x00\x00IEND\xaeB`\
+\x82\
+"
+
+qt_resource_name = b"\
+\x00\x05\
+\x00o\xa6S\
+\x00i\
+\x00c\x00o\x00n\x00s\
+\x00\x0a\
+\x0a\xc8\xf7'\
+\x00f\
+\x00i\x00l\x00t\x00e\x00r\x00.\x00p\x00n\x00g\
+\x00\x0a\
+\x0c\xad\x0f\x07\
+\x00d\
+\x00e\x00l\x00e\x00t\x00e\x00.\x00p\x00n\x00g\
+\x00\x08\
+\x0bcX\x07\
+\x00s\
+\x00t\x00o\x00p\x00.\x00p\x00n\x00g\
+\x00\x09\
+\x09\xf6\xbe\xc7\
+\x00m\
+\x00u\x00s\x00i\x00c\x00.\x00p\x00n\x00g\
+\x00\x0a\
+\x0a\xc8\xfb\x07\
+\x00f\
+\x00o\x00l\x00d\x00e\x00r\x00.\x00p\x00n\x00g\
+\x00\x10\
+\x0eFx\x07\
+\x00d\
+\x00o\x00w\x00n\x00l\x00o\x00a\x00d\x00_\x00m\x00p\x003\x00.\x00p\x00n\x00g\
+\x00\x09\
+\x0b\x9e\x84\x87\
+\x00c\
+\x00h\x00e\x00c\x00k\x00.\x00p\x00n\x00g\
+\x00\x0d\
+\x01j\xf0G\
+\x00d\
+\x00o\x00w\x00n\x00l\x00o\x00a\x00d\x00s\x00.\x00p\x00n\x00g\
+\x00\x09\
+\x0b\x02\x86'\
+\x00a\
+\x00u\x00d\x00i\x00o\x00.\x00p\x00n\x00g\
+\x00\x0a\
+\x08\x94`G\
+\x00s\
+\x00e\x00a\x00r\x00c\x00h\x00.\x00p\x00n\x00g\
+\x00\x09\
+\x0c\x98\xbaG\
+\x00p\
+\x00a\x00u\x00s\x00e\x00.\x00p\x00n\x00g\
+\x00\x0e\
+\x01||\x87\
+\x00t\
+\x00r\x00a\x00n\x00s\x00c\x00r\x00i\x00p\x00t\x00.\x00p\x00n\x00g\
+\x00\x0c\
+\x0b\xdf!G\
+\x00s\
+\x00e\x00t\x00t\x00i\x00n\x00g\x00s\x00.\x00p\x00n\x00g\
+\x00\x08\
+\x05\xe2Y'\
+\x00l\
+\x00o\x00g\x00o\x00.\x00p\x00n\x00g\
+\x00\x10\
+\x0eGx\x07\
+\x00d\
+\x00o\x00w\x00n\x00l\x00o\x00a\x00d\x00_\x00m\x00p\x004\x00.\x00p\x00n\x00g\
+\x00\x09\
+\x0a\xc2\xae\xa7\
+\x00v\
+\x00i\x00d\x00e\x00o\x00.\x00p\x00n\x00g\
+\x00\x11\
+\x0b\xa5\xa5\x07\
+\x00d\
+\x00o\x00w\x00n\x00l\x00o\x00a\x00d\x00_\x00b\x00e\x00s\x00t\x00.\x00p\x00n\x00g\
+\
+\x00\x08\
+\x05\xe2A\xff\
+\x00l\
+\x00o\x00g\x00o\x00.\x00i\x00c\x00o\
+\x00\x0d\
+\x06\xf2;\xa7\
+\x00f\
+\x00i\x00l\x00e\x00_\x00t\x00e\x00x\x00t\x00.\x00p\x00n\x00g\
+\x00\x08\
+\x02\x8cY\xa7\
+\x00p\
+\x00l\x00a\x00y\x00.\x00p\x00n\x00g\
+\x00\x09\
+\x06\x98\x83'\
+\x00c\
+\x00l\x00o\x00s\x00e\x00.\x00p\x00n\x00g\
+\x00\x08\
+\x068Z\xa7\
+\x00h\
+\x00o\x00m\x00e\x00.\x00p\x00n\x00g\
+\x00\x09\
+\x0a\xa8\xbaG\
+\x00p\
+\x00a\x00s\x00t\x00e\x00.\x00p\x00n\x00g\
+"
+
+qt_resource_struct = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x17\x00\x00\x00\x02\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\xca\x00\x00\x00\x00\x00\x01\x00\x00\x14Z\
+\x00\x00\x01\x9a\x86\xde%\xe8\
+\x00\x00\x014\x00\x00\x00\x00\x00\x01\x00\x00!\xbd\
+\x00\x00\x01\x9a\x86\xde%\xe8\
+\x00\x00\x02&\x00\x00\x00\x00\x00\x01\x00\x00?\xc0\
+\x00\x00\x01\x9a\x86\xde%\xe8\
+\x00\x00\x01\xf0\x00\x04\x00\x00\x00\x01\x00\x008\xc4\
+\x00\x00\x01\x9a\x86\xde%\xe8\
+\x00\x00\x01t\x00\x00\x00\x00\x00\x01\x00\x00,\x01\
+\x00\x00\x01\x9a\x86\xde%\xe8\
+\x00\x00\x02T\x00\x00\x00\x00\x00\x01\x00\x00H\xbb\
+\x00\x00\x01\x9a\x86\xde%\xe8\
+\x00\x00\x02<\x00\x00\x00\x00\x00\x01\x00\x00C?\
+\x00\x00\x01\x9a\x86\xde%\xe8\
+\x00\x00\x02\x06\x00\x00\x00\x00\x00\x01\x00\x00</\
+\x00\x00\x01\x9a\x86\xde%\xe8\
+\x00\x00\x01\x02\x00\x00\x00\x00\x00\x01\x00\x00\x1a\xb3\
+\x00\x00\x01\x9a\x86\xde%\xe8\
+\x00\x00\x00Z\x00\x00\x00\x00\x00\x01\x00\x00\x07\x9e\
+\x00\x00\x01\x9a\x86\xde%\xe8\
+\x00\x00\x02j\x00\x00\x00\x00\x00\x01\x00\x00K\xe6\
+\x00\x00\x01\x9a\x86\xde%\xe8\
+\x00\x00\x01\xb0\x00\x00\x00\x00\x00\x01\x00\x003z\
+\x00\x00\x01\x9a\x86\xde%\xe8\
+\x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\x9a\x86\xde%\xe8\
+\x00\x00\x00r\x00\x00\x00\x00\x00\x01\x00\x00\x0dh\
+\x00\x00\x01\x9a\x86\xde%\xe8\
+\x00\x00\x00\xea\x00\x00\x00\x00\x00\x01\x00\x00\x17\x81\
+\x00\x00\x01\x9a\x86\xde%\xe8\
+\x00\x00\x00D\x00\x00\x00\x00\x00\x01\x00\x00\x04\x94\
+\x00\x00\x01\x9a\x86\xde%\xe8\
+\x00\x00\x00\xb2\x00\x00\x00\x00\x00\x01\x00\x00\x10\xb3\
+\x00\x00\x01\x9a\x86\xde%\xe8\
+\x00\x00\x01\xc8\x00\x00\x00\x00\x00\x01\x00\x005\xe0\
+\x00\x00\x01\x9a\x86\xde%\xe8\
+\x00\x00\x01V\x00\x00\x00\x00\x00\x01\x00\x00&H\
+\x00\x00\x01\x9a\x86\xde%\xe8\
+\x00\x00\x01\x1c\x00\x00\x00\x00\x00\x01\x00\x00\x1e\xe1\
+\x00\x00\x01\x9a\x86\xde%\xe8\
+\x00\x00\x00*\x00\x00\x00\x00\x00\x01\x00\x00\x02Z\
+\x00\x00\x01\x9a\x86\xde%\xe8\
+\x00\x00\x00\x8c\x00\x00\x00\x00\x00\x01\x00\x00\x07\x9e\
+\x00\x00\x01\x9a\x86\xde%\xe8\
+\x00\x00\x01\x8a\x00\x00\x00\x00\x00\x01\x00\x00/\xd0\
+\x00\x00\x01\x9a\x86\xde%\xe8\
+"
+
+def qInitResources():
+    QtCore.qRegisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()
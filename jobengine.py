@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Coroutine, Dict, Optional, Set
+
+
+# Executors for blocking calls, by kind, with their thread counts. yt-dlp
+# downloads and ffmpeg post-processing are bounded by the download
+# pipeline's own pools; jobs only await its futures.
+NETWORK = "network"  # extraction/probing outside the pipeline
+WHISPER = "whisper"  # transcriptions; each one drives its own process pool
+DEFAULT_LIMITS = {NETWORK: 4, WHISPER: 1}
+SHUTDOWN_TIMEOUT = 3.0
+
+
+class JobEngine:
+    """One asyncio loop, on its own thread, running every background job.
+
+    A job is a coroutine, so hundreds of queued downloads cost suspended
+    coroutines instead of one waiting OS thread each. Blocking calls run in
+    small bounded executors (:meth:`blocking`) and downloads await the
+    shared pipeline's futures (:meth:`settle`). Jobs report to the GUI
+    through their own Qt signals, which are queued across threads.
+
+    Cancelling a job (the future from :meth:`start`, or :meth:`shutdown`)
+    cancels its task; the task first asks the blocking work to stop and
+    waits until it has, so nothing outlives its job.
+    """
+
+    def __init__(self, limits: Optional[Dict[str, int]] = None):
+        self._loop = asyncio.new_event_loop()
+        self._executors = {
+            kind: ThreadPoolExecutor(max(1, n), thread_name_prefix=f"job-{kind}")
+            for kind, n in {**DEFAULT_LIMITS, **(limits or {})}.items()
+        }
+        self._tasks: Set[asyncio.Task] = set()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="job-engine", daemon=True)
+        self._thread.start()
+
+    def start(self, coro: Coroutine[Any, Any, Any]) -> Future:
+        """Schedule ``coro`` as a job (from any thread); ``cancel()`` on the result cancels it."""
+        return asyncio.run_coroutine_threadsafe(self._track(coro), self._loop)
+
+    async def _track(self, coro: Coroutine[Any, Any, Any]) -> Any:
+        task = asyncio.current_task()
+        self._tasks.add(task)
+        try:
+            return await coro
+        finally:
+            self._tasks.discard(task)
+
+    async def blocking(self, kind: str, fn: Callable[..., Any], *args: Any,
+                       on_cancel: Optional[Callable[[], None]] = None) -> Any:
+        """Run ``fn(*args)`` in the ``kind`` executor and await it."""
+        return await self.settle(self._executors[kind].submit(fn, *args), on_cancel)
+
+    @staticmethod
+    async def settle(fut: Future, on_cancel: Optional[Callable[[], None]] = None) -> Any:
+        """Await a concurrent future with structured cancellation.
+
+        If the job is cancelled, a future that has not started is dropped;
+        a running one gets ``on_cancel()`` (its cooperative stop flag) and
+        is waited for before the cancellation goes on.
+        """
+        wrapped = asyncio.wrap_future(fut)
+        try:
+            return await asyncio.shield(wrapped)
+        except asyncio.CancelledError:
+            if not fut.cancel():
+                if on_cancel is not None:
+                    on_cancel()
+                try:
+                    await wrapped
+                except BaseException:
+                    pass
+            raise
+
+    def shutdown(self, timeout: float = SHUTDOWN_TIMEOUT) -> None:
+        """Cancel every job, wait up to ``timeout`` for them to unwind, stop the loop."""
+        async def cancel_all() -> None:
+            tasks = list(self._tasks)
+            for t in tasks:
+                t.cancel()
+            if tasks:
+                await asyncio.wait(tasks, timeout=timeout)
+
+        if self._loop.is_running():
+            try:
+                asyncio.run_coroutine_threadsafe(cancel_all(), self._loop).result(timeout + 1)
+            except Exception:
+                pass
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(1.0)
+        for ex in self._executors.values():
+            ex.shutdown(wait=False, cancel_futures=True)
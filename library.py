@@ -0,0 +1,353 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+
+# Per-folder index of hashes and extractor ids (hidden, next to the media)
+LIBRARY_FILE = ".library.json"
+MEDIA_EXTS = {".mp4", ".mkv", ".webm", ".mov", ".avi", ".flv", ".m4v", ".mp3", ".m4a", ".opus"}
+
+SAMPLE_SIZE = 64 * 1024
+_CHUNK = 8 * 1024 * 1024
+
+_lock = threading.Lock()
+
+try:
+    import fcntl
+
+    def _lock_file(f) -> None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+
+    def _unlock_file(f) -> None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+except ImportError:  # Windows
+    import msvcrt
+
+    def _lock_file(f) -> None:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+
+    def _unlock_file(f) -> None:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def _hasher():
+    return hashlib.blake2b(digest_size=20)
+
+
+def archive_id(info: Dict[str, Any]) -> Optional[str]:
+    # Same shape as yt-dlp's download archive entries: "<extractor> <id>"
+    key = info.get("extractor_key") or info.get("ie_key") or info.get("extractor")
+    vid = info.get("id")
+    if not key or not vid:
+        return None
+    return f"{str(key).lower()} {vid}"
+
+
+def sampled_hash(path: Path) -> str:
+    """Cheap pre-filter: size plus head/middle/tail samples."""
+    size = path.stat().st_size
+    h = _hasher()
+    h.update(str(size).encode())
+    if size == 0:
+        return h.hexdigest()
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if size <= 3 * SAMPLE_SIZE:
+            h.update(mm)
+        else:
+            mid = size // 2 - SAMPLE_SIZE // 2
+            h.update(mm[:SAMPLE_SIZE])
+            h.update(mm[mid:mid + SAMPLE_SIZE])
+            h.update(mm[size - SAMPLE_SIZE:])
+    return h.hexdigest()
+
+
+def full_hash(path: Path) -> str:
+    h = _hasher()
+    if path.stat().st_size == 0:
+        return h.hexdigest()
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        view = memoryview(mm)
+        try:
+            for off in range(0, len(view), _CHUNK):
+                h.update(view[off:off + _CHUNK])
+        finally:
+            view.release()
+    return h.hexdigest()
+
+
+class StreamingHasher:
+    """Hashes downloads while yt-dlp writes them, fed from progress hooks.
+
+    Each call reads only the bytes appended since the previous call (still hot
+    in the page cache), so the final digest is ready when the file is.
+    """
+
+    def __init__(self):
+        self._state: Dict[str, tuple] = {}  # tmp path -> (hasher, offset)
+        self.digests: Dict[str, tuple] = {}  # final path -> (digest, size, mtime)
+
+    def _catch_up(self, tmp: str, src: str, limit: Optional[int] = None) -> None:
+        h, off = self._state.get(tmp, (None, 0))
+        try:
+            size = os.path.getsize(src)
+        except OSError:
+            return
+        if limit is not None:
+            # Preallocated file written out of order: only the finished prefix
+            size = min(size, limit)
+        if h is None or size < off:
+            # First sight, or the file was restarted from scratch
+            h, off = _hasher(), 0
+        if size > off:
+            with open(src, "rb") as f:
+                f.seek(off)
+                while off < size:
+                    b = f.read(min(_CHUNK, size - off))
+                    if not b:
+                        break
+                    h.update(b)
+                    off += len(b)
+        self._state[tmp] = (h, off)
+
+    def feed(self, d: Dict[str, Any]) -> None:
+        status = d.get("status")
+        tmp = d.get("tmpfilename") or d.get("filename")
+        if not tmp:
+            return
+        if status == "downloading":
+            self._catch_up(tmp, tmp, d.get("contiguous_bytes"))
+        elif status == "finished":
+            final = d.get("filename") or tmp
+            self._catch_up(tmp, final)
+            h, _ = self._state.pop(tmp, (None, 0))
+            if h is not None:
+                try:
+                    st = os.stat(final)
+                except OSError:
+                    return
+                self.digests[str(final)] = (h.hexdigest(), st.st_size, st.st_mtime)
+
+    def moved(self, old: str, new: str) -> None:
+        # Follow a finished file to its final place if it kept size and mtime
+        ent = self.digests.pop(str(old), None)
+        if ent is None:
+            return
+        try:
+            st = os.stat(new)
+        except OSError:
+            return
+        if (st.st_size, st.st_mtime) == ent[1:]:
+            self.digests[str(new)] = ent
+
+    def digest_for(self, path: Path) -> Optional[str]:
+        # Only valid if nothing (e.g. an ffmpeg fixup) rewrote the file afterwards
+        ent = self.digests.get(str(path))
+        if ent is None:
+            return None
+        try:
+            st = Path(path).stat()
+        except OSError:
+            return None
+        return ent[0] if (st.st_size, st.st_mtime) == ent[1:] else None
+
+
+class Library:
+    """Hash/id index for one download folder, persisted in ``LIBRARY_FILE``."""
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.index_file = self.root / LIBRARY_FILE
+
+    def _load(self) -> Dict[str, Any]:
+        try:
+            data = json.loads(self.index_file.read_text(encoding="utf-8"))
+            if isinstance(data, dict):
+                data.setdefault("files", {})
+                data.setdefault("ids", {})
+                data.setdefault("urls", {})
+                return data
+        except Exception:
+            pass
+        return {"files": {}, "ids": {}, "urls": {}}
+
+    @contextmanager
+    def _writing(self):
+        # Read-modify-write of the index; download worker processes write it
+        # too, so the thread lock is paired with a lock file
+        with _lock:
+            try:
+                f = open(self.root / (LIBRARY_FILE + ".lock"), "a+b")
+            except OSError:
+                yield
+                return
+            with f:
+                try:
+                    _lock_file(f)
+                except OSError:
+                    pass
+                try:
+                    yield
+                finally:
+                    try:
+                        _unlock_file(f)
+                    except OSError:
+                        pass
+
+    def _save(self, data: Dict[str, Any]) -> None:
+        try:
+            tmp = self.index_file.with_name(self.index_file.name + ".tmp")
+            tmp.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp, self.index_file)
+        except Exception:
+            pass
+
+    def media_files(self) -> List[Path]:
+        try:
+            entries = list(os.scandir(self.root))
+        except OSError:
+            return []
+        return [
+            Path(e.path) for e in entries
+            if e.is_file() and os.path.splitext(e.name)[1].lower() in MEDIA_EXTS
+        ]
+
+    # -- extractor ids --------------------------------------------------
+
+    def record_download(self, path: Path, info: Dict[str, Any], digest: Optional[str] = None) -> None:
+        path = Path(path)
+        with self._writing():
+            data = self._load()
+            aid = archive_id(info)
+            if aid:
+                data["ids"][aid] = path.name
+            url = info.get("webpage_url") or info.get("original_url")
+            if url:
+                data["urls"][path.name] = url
+            if digest:
+                try:
+                    st = path.stat()
+                    data["files"][path.name] = {
+                        "size": st.st_size, "mtime": st.st_mtime, "hash": digest,
+                    }
+                except OSError:
+                    pass
+            self._save(data)
+
+    def held_file(self, info: Dict[str, Any]) -> Optional[Path]:
+        aid = archive_id(info)
+        if not aid:
+            return None
+        with _lock:
+            name = self._load()["ids"].get(aid)
+        if not name:
+            return None
+        p = self.root / name
+        return p if p.is_file() else None
+
+    def source_url(self, path: Path) -> Optional[str]:
+        with _lock:
+            return self._load()["urls"].get(Path(path).name)
+
+    # -- content duplicates ---------------------------------------------
+
+    def duplicate_groups(self, paths: Optional[Iterable[Path]] = None) -> List[List[Path]]:
+        """Groups of files with identical content, oldest file first.
+
+        Size buckets first, then sampled hashes, and full hashes only for
+        files that still collide. Hashes are cached by (size, mtime).
+        Files that are already hardlinked together count once.
+        """
+        if paths is None:
+            paths = self.media_files()
+        with _lock:
+            data = self._load()
+        cache = data["files"]
+
+        by_size: Dict[int, List[Path]] = {}
+        seen_inodes = set()
+        stats: Dict[Path, os.stat_result] = {}
+        for p in paths:
+            try:
+                st = p.stat()
+            except OSError:
+                continue
+            ino = (st.st_dev, st.st_ino)
+            if ino in seen_inodes:
+                continue
+            seen_inodes.add(ino)
+            stats[p] = st
+            by_size.setdefault(st.st_size, []).append(p)
+
+        def cached(p: Path, key: str, fn) -> str:
+            st = stats[p]
+            ent = cache.get(p.name)
+            if not ent or ent.get("size") != st.st_size or ent.get("mtime") != st.st_mtime:
+                ent = {"size": st.st_size, "mtime": st.st_mtime}
+                cache[p.name] = ent
+            if not ent.get(key):
+                ent[key] = fn(p)
+            return ent[key]
+
+        groups: List[List[Path]] = []
+        for same_size in by_size.values():
+            if len(same_size) < 2:
+                continue
+            by_sample: Dict[str, List[Path]] = {}
+            for p in same_size:
+                try:
+                    by_sample.setdefault(cached(p, "sample", sampled_hash), []).append(p)
+                except OSError:
+                    continue
+            for cands in by_sample.values():
+                if len(cands) < 2:
+                    continue
+                by_full: Dict[str, List[Path]] = {}
+                for p in cands:
+                    try:
+                        by_full.setdefault(cached(p, "hash", full_hash), []).append(p)
+                    except OSError:
+                        continue
+                for grp in by_full.values():
+                    if len(grp) > 1:
+                        groups.append(sorted(grp, key=lambda x: stats[x].st_mtime))
+
+        with self._writing():
+            fresh = self._load()
+            fresh["files"].update(cache)
+            self._save(fresh)
+        return groups
+
+    def link_group(self, group: List[Path]) -> int:
+        """Replace every copy in ``group`` with a hardlink to the first file.
+
+        Returns the number of bytes freed.
+        """
+        if len(group) < 2:
+            return 0
+        keep = group[0]
+        keep_st = keep.stat()
+        freed = 0
+        for p in group[1:]:
+            try:
+                st = p.stat()
+                if (st.st_dev, st.st_ino) == (keep_st.st_dev, keep_st.st_ino):
+                    continue
+                if st.st_dev != keep_st.st_dev:
+                    continue  # hardlinks cannot cross filesystems
+                tmp = p.with_name(p.name + ".linktmp")
+                tmp.unlink(missing_ok=True)
+                os.link(keep, tmp)
+                os.replace(tmp, p)
+                freed += st.st_size
+            except OSError:
+                continue
+        return freed
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+import asyncio
+import threading
+import time
+from collections import Counter, deque
 from pathlib import Path
 from typing import Optional
+from urllib.parse import urlsplit
 
-from PySide6.QtCore import Qt, QThread, Signal, QObject, QUrl, QSize, QEvent, QTimer
+from PySide6.QtCore import Qt, QThread, Signal, QObject, QUrl, QSize, QEvent, QTimer, QPoint
 from PySide6.QtWidgets import QSizePolicy
-from PySide6.QtGui import QDesktopServices, QIcon, QPixmap
+from PySide6.QtGui import QDesktopServices, QIcon, QKeySequence, QPixmap, QShortcut
 from PySide6.QtWidgets import (
     QMainWindow,
     QWidget,
@@ -23,41 +28,103 @@ from PySide6.QtWidgets import (
     QFrame,
     QTextEdit,
     QComboBox,
+    QCheckBox,
+    QSpinBox,
+    QDoubleSpinBox,
 )
 
 try:
     # Prefer absolute imports so PyInstaller bundles modules reliably
     from settings import load_settings, save_settings, AppSettings
     import downloader
+    import icons
+    import format_plan
+    from library import Library
+    import transcribe
+    import whisper_bench
+    import subtitles
+    import thumbnails
+    import sidecars
+    import control
+    import procpool
+    import jobengine
+    import scheduler
+    import stallwatch
+    import subscriptions
 except Exception:
     # Fallback for package-style imports
     from .settings import load_settings, save_settings, AppSettings
     from . import downloader
+    from . import icons
+    from . import format_plan
+    from .library import Library
+    from . import transcribe
+    from . import whisper_bench
+    from . import subtitles
+    from . import thumbnails
+    from . import sidecars
+    from . import control
+    from . import procpool
+    from . import jobengine
+    from . import scheduler
+    from . import stallwatch
+    from . import subscriptions
 
 
 class DownloadWorker(QObject):
     progressed = Signal(int)  # emit percent (0-100) only for lighter UI updates
     finished = Signal(str)  # emits final file path
     failed = Signal(str)
-
-    def __init__(self, url: str, download_dir: Path, quality: str):
+    canceled = Signal()  # pause or stop; partial data is left on disk
+    fetched = Signal()  # network phase done, post-processing queued
+    planned = Signal(str)  # chosen format plan, human readable
+    skipped = Signal(str)  # already held; emits existing file path
+    waiting = Signal(str)  # why the job has not started yet (scheduler, disk space)
+
+    def __init__(self, url: str, download_dir: Path, quality: str, skip_held: bool = False,
+                 connections: int = 1, staging_dir: Optional[Path] = None,
+                 priority: str = scheduler.NORMAL):
         super().__init__()
         self.url = url
         self.download_dir = download_dir
         self.quality = quality
-        # no cancel/pause feature
+        self.skip_held = skip_held
+        self.connections = connections
+        self.staging_dir = staging_dir
+        self.priority = priority
+        # Set from the GUI thread; checked by the progress hook in the worker thread
+        self._cancel = threading.Event()
+        self.partial_files: list[Path] = []
+
+    def request_cancel(self):
+        self._cancel.set()
 
     def _hook(self, d: dict):
         # Throttle and minimize progress emissions for better performance
         try:
             status = d.get("status")
             if status == "downloading":
-                p = d.get("_percent_str", "0.0%")
-                percent = int(float(p.strip().replace("%", "")))
+                # Remember resume state so 'stop' can discard it
+                for pf in downloader.partial_files(d):
+                    if pf not in self.partial_files:
+                        self.partial_files.append(pf)
+                # _percent_str is not refreshed with noprogress; derive from byte counts
+                total = d.get("total_bytes") or d.get("total_bytes_estimate")
+                done = d.get("downloaded_bytes")
+                if total and done is not None:
+                    percent = int(100 * done / total)
+                else:
+                    p = d.get("_percent_str", "0.0%")
+                    percent = int(float(p.strip().replace("%", "")))
                 # Emit only on integer percent change to reduce signal traffic
                 if not hasattr(self, "_last_percent") or percent != getattr(self, "_last_percent"):
                     self._last_percent = percent
                     self.progressed.emit(percent)
+            elif status == "queued":
+                self.waiting.emit(d.get("reason") or "Sırada")
+            elif status == "disk_wait":
+                need = d.get("total_bytes") or 0
+                self.waiting.emit(f"Disk alanı bekleniyor (~{need / (1024 * 1024):.0f} MB)")
             elif status in ("finished", "postprocessor"):  # capture final path
                 self.progressed.emit(100)
                 fp = None
@@ -83,15 +150,223 @@ class DownloadWorker(QObject):
             # In case parsing fails, skip emission
             pass
 
+    async def run(self, engine: "jobengine.JobEngine"):
+        # A job on the engine loop: waiting for a slot costs no thread
+        try:
+            future = downloader.pipeline().submit(
+                self.url, self.download_dir, self.quality, self._hook,
+                cancel_check=self._cancel.is_set,
+                skip_held=self.skip_held,
+                connections=self.connections,
+                staging_dir=self.staging_dir,
+                priority=self.priority,
+                on_fetched=self.fetched.emit,
+                on_plan=lambda plan: self.planned.emit(plan.describe()),
+            )
+            final = await engine.settle(future, self.request_cancel)
+            # Prefer the path yt-dlp reports after post-processing
+            self.finished.emit(final or getattr(self, "_result_file", ""))
+        except downloader.AlreadyHeld as e:
+            self.skipped.emit(str(e.path))
+        except downloader.DownloadInterrupted:
+            self.canceled.emit()
+        except asyncio.CancelledError:
+            self.canceled.emit()
+            raise
+        except Exception as e:
+            if self._cancel.is_set():
+                self.canceled.emit()
+            else:
+                self.failed.emit(str(e))
+
+
+class SyncWorker(QObject):
+    """Lists one subscription's new entries (see :func:`subscriptions.sync`)."""
+    synced = Signal(object)  # SyncResult
+
+    def __init__(self, sub: "subscriptions.Subscription"):
+        super().__init__()
+        self.sub = sub
+
+    async def run(self, engine: "jobengine.JobEngine"):
+        # Flat listings share the engine's small network executor, so a
+        # sync of many channels runs a few at a time
+        res = await engine.blocking(jobengine.NETWORK, subscriptions.sync, self.sub)
+        self.synced.emit(res)
+
+
+class PrefetchWorker(QObject):
+    """Extracts metadata for a URL in the background (no download)."""
+    done = Signal(str, dict)  # url, info summary
+    failed = Signal(str, str)  # url, message
+
+    def __init__(self, url: str):
+        super().__init__()
+        self.url = url
+
+    def run(self):
+        try:
+            info = downloader.probe(self.url) or {}
+            self.done.emit(self.url, {
+                "title": info.get("title") or "",
+                "duration": info.get("duration"),
+            })
+        except Exception as e:
+            self.failed.emit(self.url, str(e))
+
+
+class RemoteTranscribeWorker(QObject):
+    """Transcribes a URL from its audio stream only; no media file is kept.
+
+    Platform subtitles are used when the video has them. Otherwise the
+    smallest acceptable audio stream is decoded by ffmpeg and transcribed
+    chunk by chunk while it is still downloading. Signals mirror
+    :class:`DownloadWorker` so the job lives in a normal downloading row.
+    """
+    progressed = Signal(int)  # percent of the audio received
+    finished = Signal(str)  # .transcript.txt path
+    failed = Signal(str)
+    canceled = Signal()
+    fetched = Signal()  # stream fully received; last chunks still transcribing
+    planned = Signal(str)
+
+    def __init__(
+        self, url: str, download_dir: Path, lang: Optional[str] = None, model_size: str = "small",
+        device: str = "cpu", compute_type: str = "int8", workers: int = 0,
+    ):
+        super().__init__()
+        self.url = url
+        self.download_dir = download_dir
+        self.lang = lang
+        self.model_size = model_size
+        self.device = device
+        self.compute_type = compute_type
+        self.workers = workers
+        self._cancel = threading.Event()
+        self.partial_files: list[Path] = []  # nothing resumable
+        self.source = "stream"  # or "subtitles" / "auto_captions"
+
+    def request_cancel(self):
+        self._cancel.set()
+
+    def _subtitle_segments(self, base: Path):
+        try:
+            got = downloader.fetch_subtitles(self.url, base, self.lang)
+        except Exception:
+            return None
+        if got is None:
+            return None
+        track, is_auto = got
+        try:
+            segments = subtitles.parse(track.read_text(encoding="utf-8", errors="ignore"), rollup=is_auto) or None
+        finally:
+            track.unlink(missing_ok=True)
+        if segments is not None:
+            self.source = "auto_captions" if is_auto else "subtitles"
+        return segments
+
+    async def run(self, engine: "jobengine.JobEngine"):
+        try:
+            await engine.blocking(jobengine.WHISPER, self._transcribe, on_cancel=self.request_cancel)
+        except asyncio.CancelledError:
+            self.canceled.emit()
+            raise
+
+    def _transcribe(self):
+        try:
+            from yt_dlp.utils import sanitize_filename
+
+            info = downloader.probe(self.url) or {}
+            self.download_dir.mkdir(parents=True, exist_ok=True)
+            base = self.download_dir / sanitize_filename(info.get("title") or info.get("id") or "transcript")
+
+            segments = self._subtitle_segments(base)
+            if segments is not None:
+                self.planned.emit("platform altyazısı")
+            else:
+                import importlib.util
+                if importlib.util.find_spec('faster_whisper') is None:
+                    raise RuntimeError("Altyazı yok ve Whisper (faster-whisper) yüklü değil")
+                src = downloader.audio_source(self.url, on_plan=lambda plan: self.planned.emit(plan.describe()))
+                last = [-1]
+
+                def progress(frac: float):
+                    pct = int(frac * 100)
+                    if pct != last[0]:
+                        last[0] = pct
+                        self.progressed.emit(pct)
+
+                segments = transcribe.transcribe_stream(
+                    src["url"], src.get("http_headers"), src.get("duration"),
+                    self.lang or src.get("language"), self.model_size,
+                    device=self.device, compute_type=self.compute_type, workers=self.workers,
+                    on_progress=progress, cancel_check=self._cancel.is_set,
+                    on_received=self.fetched.emit,
+                )
+            self.finished.emit(str(subtitles.write_transcript(base, segments)))
+        except transcribe.TranscriptionCancelled:
+            self.canceled.emit()
+        except Exception as e:
+            self.failed.emit(str(e))
+
+
+class DedupeWorker(QObject):
+    """Finds (or hardlinks) identical media files in the download folder."""
+    found = Signal(list)  # list[list[str]] duplicate groups, oldest first
+    linked = Signal(int)  # bytes freed
+    failed = Signal(str)
+
+    def __init__(self, root: Path, groups: Optional[list] = None):
+        super().__init__()
+        self.root = root
+        self.groups = groups
+
     def run(self):
         try:
-            downloader.download(self.url, self.download_dir, self.quality, self._hook)
-            # Emit only if hook determined a final path
-            self.finished.emit(getattr(self, "_result_file", ""))
+            lib = Library(self.root)
+            if self.groups is None:
+                groups = lib.duplicate_groups()
+                self.found.emit([[str(p) for p in g] for g in groups])
+            else:
+                freed = sum(lib.link_group([Path(p) for p in g]) for g in self.groups)
+                self.linked.emit(freed)
         except Exception as e:
             self.failed.emit(str(e))
 
 
+class BenchWorker(QObject):
+    """Runs the Whisper benchmark in the background."""
+    progressed = Signal(str)  # one configuration finished
+    finished = Signal(list)  # list[BenchResult]
+    failed = Signal(str)
+
+    def __init__(self, download_dir: Path):
+        super().__init__()
+        self.download_dir = download_dir
+        self._cancel = threading.Event()
+
+    def request_cancel(self):
+        self._cancel.set()
+
+    def run(self):
+        try:
+            wav = whisper_bench.ensure_fixture(self.download_dir)
+            results = whisper_bench.run_benchmark(
+                wav,
+                on_result=lambda r: self.progressed.emit(r.describe()),
+                cancel_check=self._cancel.is_set,
+            )
+            self.finished.emit(results)
+        except Exception as e:
+            self.failed.emit(str(e))
+
+
+class ControlBridge(QObject):
+    """Carries control API calls from HTTP threads to the GUI thread."""
+    enqueued = Signal(list)  # job ids already on the board
+    command = Signal(str, str)  # action, job id
+
+
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -101,11 +376,44 @@ class MainWindow(QMainWindow):
         self.setMinimumSize(900, 560)
 
         self.settings: AppSettings = load_settings()
-        self._active_thread: Optional[QThread] = None
-        self._stt_threads = {}
+        # Running download jobs: worker -> its downloading row widget
+        self._download_rows: dict = {}
+        # Download and transcription jobs run as coroutines on one engine loop
+        self._engine = jobengine.JobEngine()
+        self._stt_jobs: dict = {}  # whisper worker -> its engine job
+        # Every job (GUI or API) for the control API: id -> row while it has one
+        self._jobs = control.JobBoard()
+        self._job_rows: dict = {}
+        # API jobs waiting for a row; rows are created as slots free up
+        self._api_backlog = {p: deque() for p in scheduler.PRIORITIES}
+        self._host_sites: dict = {}  # host name -> scheduler site key
+        self._api: Optional[control.ControlServer] = None
+        self._api_bridge = ControlBridge(self)
+        self._api_bridge.enqueued.connect(self._on_api_enqueued)
+        self._api_bridge.command.connect(self._on_api_command)
+
+        # Diagnostics: stall log and an on-demand profiler (Ctrl+Shift+P)
+        self._stall_watch = stallwatch.StallWatchdog(parent=self)
+        self._apply_stall_threshold()
+        self._profiler = stallwatch.SamplingProfiler()
+        QShortcut(QKeySequence("Ctrl+Shift+P"), self, activated=self._toggle_profiler)
+
+        # Channel/playlist subscriptions, synced on a timer
+        self._subs = subscriptions.SubscriptionStore()
+        self._sync_jobs: dict = {}  # SyncWorker -> its engine job
+        self._sub_entries: dict = {}  # board job id -> (subscription URL, entry id)
+        self._sync_new = 0
+        self._sync_timer = QTimer(self)
+        self._sync_timer.setInterval(10 * 60 * 1000)
+        self._sync_timer.timeout.connect(self._sync_due)
+        self._sync_timer.start()
+        QTimer.singleShot(5000, self._sync_due)
+        # Entries queued last session but not downloaded yet
+        QTimer.singleShot(0, self._resume_subscription_entries)
 
         self._init_menu()
         self._init_ui()
+        self._restart_api()
 
     def _init_menu(self):
         # Hide app menu bar entirely per request
@@ -118,6 +426,15 @@ class MainWindow(QMainWindow):
         # Main tab
         self.url_edit = QLineEdit()
         self.url_edit.setPlaceholderText("URL yapıştırın (YouTube, Instagram, TikTok)")
+        # Start metadata extraction shortly after typing stops
+        self._prefetch_timer = QTimer(self)
+        self._prefetch_timer.setSingleShot(True)
+        self._prefetch_timer.setInterval(600)
+        self._prefetch_timer.timeout.connect(self._prefetch_current_url)
+        self._prefetch_thread: Optional[QThread] = None
+        self._prefetch_pending: Optional[str] = None
+        self._prefetched: dict = {}  # url -> summary (title, duration)
+        self.url_edit.textEdited.connect(lambda _: self._prefetch_timer.start())
 
         self.paste_btn = QPushButton()
         self.paste_btn.clicked.connect(self._paste_from_clipboard)
@@ -145,6 +462,11 @@ class MainWindow(QMainWindow):
         self.download_mp3_btn.clicked.connect(lambda: self._start_download("mp3"))
         self._as_icon_button(self.download_mp3_btn)
 
+        self.transcribe_url_btn = QPushButton()
+        self.transcribe_url_btn.setToolTip("Transkript (sadece ses akışı, video indirilmez)")
+        self.transcribe_url_btn.clicked.connect(lambda: self._start_download("transcript"))
+        self._as_icon_button(self.transcribe_url_btn)
+
         self.open_folder_btn = QPushButton()
         self.open_folder_btn.clicked.connect(self._open_downloads)
         self.open_folder_btn.setToolTip("İndirilenler")
@@ -204,6 +526,28 @@ class MainWindow(QMainWindow):
         self.downloads_list.setSpacing(5)
         self.downloads_list.setAlternatingRowColors(True)
 
+        # Thumbnails: decoded off-thread, only for rows in/near the viewport,
+        # kept in a byte-bounded LRU (rows far off-screen drop their pixmap)
+        self._sidecars = sidecars.SidecarIndex()
+        self._thumb_cache = thumbnails.PixmapCache(int(self.settings.thumb_cache_mb) * 1024 * 1024)
+        self._thumb_loader = thumbnails.ThumbnailLoader(self._thumb_for, parent=self)
+        self._thumb_loader.loaded.connect(self._on_thumb_loaded)
+        self._thumb_rows: dict = {}  # media path -> row widget, for rows in the band
+        self._thumb_shown: dict = {}  # media path -> row widget holding a pixmap
+        self._thumb_missing: set = set()  # media paths without any thumbnail
+        self._thumb_timer = QTimer(self)
+        self._thumb_timer.setSingleShot(True)
+        self._thumb_timer.setInterval(30)
+        self._thumb_timer.timeout.connect(self._load_visible_thumbs)
+        # Hover previews: keyframe strips built once per video, scrubbed by mouse x
+        self._preview_loader = thumbnails.ThumbnailLoader(thumbnails.ensure_sprite, workers=1, box=None, parent=self)
+        self._preview_loader.loaded.connect(self._on_preview_loaded)
+        self._preview_row = None  # row widget whose thumbnail is hovered
+        self._preview_missing: set = set()  # media paths a strip could not be built for
+        sb = self.downloads_list.verticalScrollBar()
+        sb.valueChanged.connect(self._schedule_thumbs)
+        sb.rangeChanged.connect(self._schedule_thumbs)
+
         main_page = QWidget()
         mv = QVBoxLayout(main_page)
 
@@ -215,6 +559,7 @@ class MainWindow(QMainWindow):
         row1.addWidget(self.download_best_btn)
         row1.addWidget(self.download_mp4_btn)
         row1.addWidget(self.download_mp3_btn)
+        row1.addWidget(self.transcribe_url_btn)
         row1.addWidget(self.open_folder_btn)
 
         mv.addLayout(row1)
@@ -266,6 +611,179 @@ class MainWindow(QMainWindow):
 
         form.addRow("Varsayılan İndirme Klasörü", dir_row)
 
+        # Optional staging folder on a local fast disk; finished files are published
+        self.staging_dir_edit = QLineEdit(self.settings.staging_dir)
+        self.staging_dir_edit.setReadOnly(True)
+        self.staging_dir_edit.setPlaceholderText("Kapalı (doğrudan indirme klasörüne yazılır)")
+        self.staging_dir_edit.setToolTip("Parçalar, birleştirme ve dönüştürme bu klasörde yapılır; "
+                                         "yalnızca bitmiş dosyalar indirme klasörüne taşınır")
+        self.staging_dir_btn = QPushButton()
+        self.staging_dir_btn.clicked.connect(self._pick_staging_dir)
+        self.staging_dir_btn.setToolTip("Hazırlık Klasörü Seç")
+        self._as_icon_button(self.staging_dir_btn)
+        self.staging_clear_btn = QPushButton()
+        self.staging_clear_btn.clicked.connect(self._clear_staging_dir)
+        self.staging_clear_btn.setToolTip("Kapat")
+        self._as_icon_button(self.staging_clear_btn)
+        staging_row = QHBoxLayout()
+        staging_row.addWidget(self.staging_dir_edit, 1)
+        staging_row.addWidget(self.staging_dir_btn)
+        staging_row.addWidget(self.staging_clear_btn)
+        form.addRow("Hazırlık Klasörü (hızlı disk)", staging_row)
+
+        # Pipeline limits: network downloads vs. ffmpeg post-processing
+        self.max_downloads_spin = QSpinBox()
+        self.max_downloads_spin.setRange(1, 16)
+        self.max_downloads_spin.setValue(int(self.settings.max_downloads))
+        self.max_downloads_spin.valueChanged.connect(self._on_limits_changed)
+        form.addRow("Eşzamanlı İndirme", self.max_downloads_spin)
+        self.connections_spin = QSpinBox()
+        self.connections_spin.setRange(1, 16)
+        self.connections_spin.setToolTip("Tek parça (progressive) dosyalar için paralel bağlantı sayısı")
+        self.connections_spin.setValue(int(self.settings.download_connections))
+        self.connections_spin.valueChanged.connect(self._on_limits_changed)
+        form.addRow("İndirme Başına Bağlantı", self.connections_spin)
+        self.process_workers_check = QCheckBox("İndirmeleri ayrı işlemlerde çalıştır")
+        self.process_workers_check.setToolTip("Her eşzamanlı indirme kendi işleminde çalışır: arayüz takılmaz, "
+                                              "çöken bir indirme uygulamayı kapatmaz")
+        self.process_workers_check.setChecked(bool(self.settings.process_workers))
+        self.process_workers_check.toggled.connect(self._on_limits_changed)
+        form.addRow("", self.process_workers_check)
+        self.per_host_spin = QSpinBox()
+        self.per_host_spin.setRange(1, 16)
+        self.per_host_spin.setToolTip("Aynı siteden aynı anda indirilen en fazla iş (hız sınırı / 429 hatalarına karşı)")
+        self.per_host_spin.setValue(int(self.settings.per_host_downloads))
+        self.per_host_spin.valueChanged.connect(self._on_limits_changed)
+        form.addRow("Site Başına İndirme", self.per_host_spin)
+        self.host_interval_spin = QDoubleSpinBox()
+        self.host_interval_spin.setRange(0.0, 60.0)
+        self.host_interval_spin.setSingleStep(0.5)
+        self.host_interval_spin.setSuffix(" sn")
+        self.host_interval_spin.setToolTip("Aynı sitede iki indirmenin başlaması arasındaki en kısa süre")
+        self.host_interval_spin.setValue(float(self.settings.host_interval))
+        self.host_interval_spin.valueChanged.connect(self._on_limits_changed)
+        form.addRow("Site Başına Başlatma Aralığı", self.host_interval_spin)
+        self.max_postprocess_spin = QSpinBox()
+        self.max_postprocess_spin.setRange(0, 64)
+        self.max_postprocess_spin.setSpecialValueText("Otomatik")
+        self.max_postprocess_spin.setValue(int(self.settings.max_postprocess))
+        self.max_postprocess_spin.valueChanged.connect(self._on_limits_changed)
+        form.addRow("Eşzamanlı İşleme (FFmpeg)", self.max_postprocess_spin)
+        self.stt_workers_spin = QSpinBox()
+        self.stt_workers_spin.setRange(0, 64)
+        self.stt_workers_spin.setSpecialValueText("Otomatik")
+        self.stt_workers_spin.setValue(int(self.settings.stt_workers))
+        self.stt_workers_spin.valueChanged.connect(self._on_limits_changed)
+        form.addRow("Transkript İşlemleri", self.stt_workers_spin)
+        self.thumb_cache_spin = QSpinBox()
+        self.thumb_cache_spin.setRange(4, 1024)
+        self.thumb_cache_spin.setSuffix(" MB")
+        self.thumb_cache_spin.setValue(int(self.settings.thumb_cache_mb))
+        self.thumb_cache_spin.valueChanged.connect(self._on_thumb_budget_changed)
+        form.addRow("Küçük Resim Önbelleği", self.thumb_cache_spin)
+        self.api_port_spin = QSpinBox()
+        self.api_port_spin.setRange(0, 65535)
+        self.api_port_spin.setSpecialValueText("Kapalı")
+        self.api_port_spin.setKeyboardTracking(False)
+        self.api_port_spin.setToolTip("Diğer servislerin iş ekleyip izlemesi için yerel HTTP/JSON API (yalnızca 127.0.0.1)")
+        self.api_port_spin.setValue(int(self.settings.api_port))
+        self.api_port_spin.valueChanged.connect(self._on_api_port_changed)
+        form.addRow("Denetim API Portu", self.api_port_spin)
+        self.stall_spin = QSpinBox()
+        self.stall_spin.setRange(0, 10000)
+        self.stall_spin.setSingleStep(50)
+        self.stall_spin.setSuffix(" ms")
+        self.stall_spin.setSpecialValueText("Kapalı")
+        self.stall_spin.setToolTip(f"Arayüz bu süreden uzun takılırsa engelleyen kod {stallwatch.STALL_LOG.name} dosyasına yazılır")
+        self.stall_spin.setValue(int(self.settings.stall_threshold_ms))
+        self.stall_spin.valueChanged.connect(self._on_stall_threshold_changed)
+        self.profile_btn = QPushButton("Profil Kaydını Başlat")
+        self.profile_btn.setToolTip("Örnekleyici profil (Ctrl+Shift+P); çıktı flamegraph için katlanmış yığın biçiminde")
+        self.profile_btn.clicked.connect(self._toggle_profiler)
+        diag_row = QHBoxLayout()
+        diag_row.addWidget(self.stall_spin)
+        diag_row.addWidget(self.profile_btn)
+        form.addRow("Takılma Eşiği / Profil", diag_row)
+
+        # Subscriptions: new entries of channels/playlists are queued on each sync
+        self.subs_combo = QComboBox()
+        self.subs_combo.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        self.sub_add_btn = QPushButton("URL'ye Abone Ol")
+        self.sub_add_btn.setToolTip("İndirme sekmesindeki kanal/oynatma listesi URL'sine abone olur")
+        self.sub_add_btn.clicked.connect(self._add_subscription)
+        self.sub_remove_btn = QPushButton("Kaldır")
+        self.sub_remove_btn.clicked.connect(self._remove_subscription)
+        self.sub_sync_btn = QPushButton("Şimdi Eşitle")
+        self.sub_sync_btn.clicked.connect(lambda: self._sync_subscriptions(self._subs.all()))
+        subs_row = QHBoxLayout()
+        subs_row.addWidget(self.subs_combo, 1)
+        subs_row.addWidget(self.sub_add_btn)
+        subs_row.addWidget(self.sub_remove_btn)
+        subs_row.addWidget(self.sub_sync_btn)
+        form.addRow("Abonelikler", subs_row)
+        self.sync_interval_spin = QSpinBox()
+        self.sync_interval_spin.setRange(0, 24 * 7)
+        self.sync_interval_spin.setSuffix(" sa")
+        self.sync_interval_spin.setSpecialValueText("Yalnızca elle")
+        self.sync_interval_spin.setValue(int(self.settings.sync_interval_hours))
+        self.sync_interval_spin.valueChanged.connect(self._on_sync_interval_changed)
+        form.addRow("Abonelik Eşitleme Aralığı", self.sync_interval_spin)
+        self._refresh_subscriptions()
+
+        # Whisper model: picked from benchmark results by accuracy tier + latency target
+        self.stt_tier_combo = QComboBox()
+        self.stt_tier_combo.addItems(list(whisper_bench.TIERS))
+        self.stt_tier_combo.setCurrentText(self.settings.stt_tier)
+        self.stt_tier_combo.currentTextChanged.connect(self._on_stt_profile_changed)
+        self.stt_rtf_spin = QDoubleSpinBox()
+        self.stt_rtf_spin.setRange(0.05, 5.0)
+        self.stt_rtf_spin.setSingleStep(0.05)
+        self.stt_rtf_spin.setValue(float(self.settings.stt_max_rtf))
+        self.stt_rtf_spin.setToolTip("İşlem süresi / ses süresi (1.0 = gerçek zamanlı)")
+        self.stt_rtf_spin.valueChanged.connect(self._on_stt_profile_changed)
+        self.bench_btn = QPushButton("Benchmark")
+        self.bench_btn.clicked.connect(self._toggle_benchmark)
+        stt_row = QHBoxLayout()
+        stt_row.addWidget(self.stt_tier_combo)
+        stt_row.addWidget(QLabel("Hedef RTF"))
+        stt_row.addWidget(self.stt_rtf_spin)
+        stt_row.addWidget(self.bench_btn)
+        stt_row.addStretch(1)
+        form.addRow("Transkript Doğruluğu", stt_row)
+        self.stt_model_lbl = QLabel()
+        form.addRow("", self.stt_model_lbl)
+        self.transcript_lang_edit = QLineEdit(self.settings.transcript_lang)
+        self.transcript_lang_edit.setPlaceholderText("Videonun dili (ör. tr, en)")
+        self.transcript_lang_edit.setMaximumWidth(200)
+        self.transcript_lang_edit.editingFinished.connect(self._on_transcript_lang_changed)
+        form.addRow("Transkript Dili", self.transcript_lang_edit)
+        self._bench_thread: Optional[QThread] = None
+        self._bench_worker: Optional[BenchWorker] = None
+        self._update_stt_model_label()
+
+        # Library duplicates: skip already-held ids, find/link identical files
+        self.skip_held_check = QCheckBox("Zaten indirilmiş videoları atla")
+        self.skip_held_check.setChecked(bool(self.settings.skip_held))
+        self.skip_held_check.toggled.connect(self._on_skip_held_toggled)
+        form.addRow("", self.skip_held_check)
+
+        self.dedupe_scan_btn = QPushButton("Kopyaları tara")
+        self.dedupe_scan_btn.clicked.connect(self._start_dedupe_scan)
+        self.dedupe_link_btn = QPushButton("Sabit bağlantıyla birleştir")
+        self.dedupe_link_btn.setEnabled(False)
+        self.dedupe_link_btn.clicked.connect(self._start_dedupe_link)
+        dedupe_row = QHBoxLayout()
+        dedupe_row.addWidget(self.dedupe_scan_btn)
+        dedupe_row.addWidget(self.dedupe_link_btn)
+        dedupe_row.addStretch(1)
+        form.addRow("Kopya Dosyalar", dedupe_row)
+        self.dedupe_view = QTextEdit()
+        self.dedupe_view.setReadOnly(True)
+        self.dedupe_view.setVisible(False)
+        form.addRow("", self.dedupe_view)
+        self._dedupe_groups: list = []
+        self._dedupe_thread: Optional[QThread] = None
+
         self.tabs.addTab(main_page, "")
         self.tabs.addTab(settings_page, "")
         # Tooltips to indicate tab purpose when text is hidden
@@ -288,102 +806,122 @@ class MainWindow(QMainWindow):
         finished = Signal(str)  # path to txt
         failed = Signal(str)
 
-        def __init__(self, video_path: Path, lang: Optional[str] = None, model_size: str = "small"):
+        def __init__(
+            self, video_path: Path, lang: Optional[str] = None, model_size: str = "small",
+            device: str = "cpu", compute_type: str = "int8", workers: int = 0,
+            url: str = "",
+        ):
             super().__init__()
             self.video_path = video_path
             self.lang = lang
             self.model_size = model_size
-
-        def run(self):
+            self.device = device
+            self.compute_type = compute_type
+            self.workers = workers
+            self.url = url
+            self.source = "whisper"  # or "subtitles" / "auto_captions"
+
+        def _platform_segments(self):
+            # Uploaded or auto-generated captions; None when the video has none
+            if not self.url:
+                return None
             try:
-                import shutil, subprocess, tempfile
-                from faster_whisper import WhisperModel
+                got = downloader.fetch_subtitles(self.url, self.video_path.with_suffix(""), self.lang)
+            except Exception:
+                return None
+            if got is None:
+                return None
+            track, is_auto = got
+            try:
+                segments = subtitles.parse(track.read_text(encoding="utf-8", errors="ignore"), rollup=is_auto)
+            finally:
+                track.unlink(missing_ok=True)
+            if not segments:
+                return None
+            self.source = "auto_captions" if is_auto else "subtitles"
+            return segments
 
-                if shutil.which('ffmpeg') is None:
-                    raise RuntimeError("FFmpeg bulunamadı (PATH'te olmalı)")
-
-                # Extract mono 16k wav to temp
-                with tempfile.TemporaryDirectory() as td:
-                    wav_path = Path(td) / "audio.wav"
-                    cmd = [
-                        'ffmpeg', '-y', '-i', str(self.video_path),
-                        '-vn', '-ac', '1', '-ar', '16000', '-f', 'wav', str(wav_path)
-                    ]
-                    subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-
-                    model = WhisperModel(self.model_size, device="cpu", compute_type="int8")
-                    segments, info = model.transcribe(str(wav_path), language=self.lang, vad_filter=True)
-
-                    texts = []
-                    for seg in segments:
-                        texts.append(seg.text.strip())
-                    text = "\n".join([t for t in texts if t])
-
-                out_txt = self.video_path.with_suffix("").with_suffix("")  # ensure only last suffix removed once
-                # Correct stem: Path('a.mp4').with_suffix('') -> 'a'
-                out_txt = self.video_path.with_suffix("")
-                out_txt = out_txt.with_name(out_txt.name + ".transcript.txt")
-                try:
-                    Path(out_txt).write_text(text, encoding='utf-8')
-                except Exception:
-                    Path(out_txt).write_text(text)
+        async def run(self, engine: "jobengine.JobEngine"):
+            await engine.blocking(jobengine.WHISPER, self._transcribe)
+
+        def _transcribe(self):
+            try:
+                segments = self._platform_segments()
+                if segments is None:
+                    import importlib.util
+                    if importlib.util.find_spec('faster_whisper') is None:
+                        raise RuntimeError("Altyazı yok ve Whisper (faster-whisper) yüklü değil")
+                    # Long inputs are split at silences and transcribed across processes
+                    segments = transcribe.transcribe_file(
+                        self.video_path, self.lang, self.model_size,
+                        device=self.device, compute_type=self.compute_type, workers=self.workers,
+                    )
+                out_txt = subtitles.write_sidecars(self.video_path, segments)
                 self.finished.emit(str(out_txt))
             except Exception as e:
                 self.failed.emit(str(e))
 
-    def _start_whisper_transcribe(self, video_path: Path):
+    def _start_whisper_transcribe(self, video_path: Path, url: str = ""):
         # Start background STT worker
-        try:
-            # quick import check to give early feedback
-            import importlib
-            if importlib.util.find_spec('faster_whisper') is None:
-                self._status("Whisper (faster-whisper) yüklü değil. requirements.txt ile kurun.")
-                return
-        except Exception:
-            pass
+        if not url:
+            try:
+                # quick import check to give early feedback
+                import importlib
+                if importlib.util.find_spec('faster_whisper') is None:
+                    self._status("Whisper (faster-whisper) yüklü değil. requirements.txt ile kurun.")
+                    return
+            except Exception:
+                pass
 
-        worker = MainWindow._STTWorker(video_path)
-        thread = QThread(self)
-        worker.moveToThread(thread)
-        thread.started.connect(worker.run)
+        model, device, compute_type = self._stt_config()
+        worker = MainWindow._STTWorker(
+            video_path, lang=(self.settings.transcript_lang.strip() or None),
+            model_size=model, device=device, compute_type=compute_type,
+            workers=int(self.settings.stt_workers), url=url,
+        )
         worker.finished.connect(self._on_whisper_finished)
         worker.failed.connect(self._on_whisper_failed)
-        self._stt_threads[worker] = thread
-        thread.start()
-        self._status("Otomatik transkript başlatıldı (Whisper)...")
+        self._stt_jobs[worker] = self._engine.start(worker.run(self._engine))
+        if url:
+            self._status("Transkript başlatıldı (önce platform altyazıları denenecek)...")
+        else:
+            self._status("Otomatik transkript başlatıldı (Whisper)...")
 
     def _on_whisper_finished(self, txt_path: str):
-        # Ensure cleanup from the GUI thread
+        worker = self.sender()
+        if self._stt_jobs.pop(worker, None) is not None:
+            worker.deleteLater()
+        self._show_transcript(Path(txt_path), self._transcript_source(worker, "Whisper"))
         try:
-            worker = self.sender()
-            thread = self._stt_threads.pop(worker, None)
-            if thread is not None:
-                thread.quit(); thread.wait()
+            video_path = getattr(worker, 'video_path', None)
+            self._set_row_busy(self._find_row_widget_by_path(video_path) if video_path else None, False)
         except Exception:
             pass
+
+    def _transcript_source(self, worker: QObject, default: str) -> str:
+        return {
+            "subtitles": "altyazıdan", "auto_captions": "otomatik altyazıdan",
+        }.get(getattr(worker, "source", ""), default)
+
+    def _show_transcript(self, txt_path: Path, source: str):
         # Load and show
         try:
-            txt = Path(txt_path).read_text(encoding='utf-8', errors='ignore')
+            txt = txt_path.read_text(encoding='utf-8', errors='ignore')
         except Exception:
             txt = ""
         self.transcript_view.setPlainText(txt)
         self.transcript_panel.setVisible(True)
-        self._status(f"Whisper transkript hazır: {Path(txt_path).name}")
-        self._add_asset_item(Path(txt_path))
-        try:
-            video_path = getattr(worker, 'video_path', None)
-            self._set_row_busy(self._find_row_widget_by_path(video_path) if video_path else None, False)
-        except Exception:
-            pass
+        self._status(f"Transkript hazır ({source}): {txt_path.name}")
+        base = txt_path.with_name(txt_path.name[: -len(".transcript.txt")])
+        for p in subtitles.sidecar_paths(base):
+            if p.is_file():
+                self._sidecars.add(p)
+        self._add_asset_item(txt_path)
 
     def _on_whisper_failed(self, message: str):
-        try:
-            worker = self.sender()
-            thread = self._stt_threads.pop(worker, None)
-            if thread is not None:
-                thread.quit(); thread.wait()
-        except Exception:
-            pass
+        worker = self.sender()
+        if self._stt_jobs.pop(worker, None) is not None:
+            worker.deleteLater()
         self._status(f"Whisper hata: {message}")
         try:
             video_path = getattr(worker, 'video_path', None)
@@ -403,6 +941,24 @@ class MainWindow(QMainWindow):
             self.settings_dir_edit.setText(new_dir)
             self.settings_dir_edit.setToolTip(new_dir)
 
+    def _pick_staging_dir(self):
+        start = self.settings.staging_dir or str(Path.home())
+        new_dir = QFileDialog.getExistingDirectory(self, "Hazırlık Klasörü Seç", start)
+        if not new_dir:
+            return
+        if Path(new_dir).resolve() == Path(self.settings.download_dir).resolve():
+            self._status("Hazırlık klasörü indirme klasöründen farklı olmalı")
+            return
+        self._set_staging_dir(new_dir)
+
+    def _clear_staging_dir(self):
+        self._set_staging_dir("")
+
+    def _set_staging_dir(self, path: str):
+        self.settings.staging_dir = path
+        save_settings(self.settings)
+        self.staging_dir_edit.setText(path)
+
     def _open_downloads(self):
         path = Path(self.settings.download_dir)
         try:
@@ -411,33 +967,242 @@ class MainWindow(QMainWindow):
             pass
         QDesktopServices.openUrl(QUrl.fromLocalFile(str(path)))
 
+    def _on_limits_changed(self, _value: int = 0):
+        self.settings.max_downloads = int(self.max_downloads_spin.value())
+        self.settings.download_connections = int(self.connections_spin.value())
+        self.settings.process_workers = bool(self.process_workers_check.isChecked())
+        self.settings.per_host_downloads = int(self.per_host_spin.value())
+        self.settings.host_interval = float(self.host_interval_spin.value())
+        self.settings.max_postprocess = int(self.max_postprocess_spin.value())
+        self.settings.stt_workers = int(self.stt_workers_spin.value())
+        save_settings(self.settings)
+
+    # ------------------------
+    # Whisper model selection / benchmark
+    # ------------------------
+    def _stt_config(self):
+        return whisper_bench.choose_config(self.settings.stt_tier, float(self.settings.stt_max_rtf))
+
+    def _update_stt_model_label(self):
+        model, device, compute_type = self._stt_config()
+        measured = whisper_bench.load_results()
+        src = "benchmark" if measured else "varsayılan, benchmark yok"
+        self.stt_model_lbl.setText(f"Seçilen model: {model} ({device}/{compute_type}, {src})")
+
+    def _on_stt_profile_changed(self, _value=None):
+        self.settings.stt_tier = self.stt_tier_combo.currentText()
+        self.settings.stt_max_rtf = float(self.stt_rtf_spin.value())
+        save_settings(self.settings)
+        self._update_stt_model_label()
+
+    def _on_transcript_lang_changed(self):
+        self.settings.transcript_lang = self.transcript_lang_edit.text().strip()
+        save_settings(self.settings)
+
+    def _toggle_benchmark(self):
+        if self._bench_worker is not None:
+            # Stops after the configuration being measured
+            self._bench_worker.request_cancel()
+            self.bench_btn.setEnabled(False)
+            return
+        worker = BenchWorker(Path(self.settings.download_dir))
+        thread = QThread(self)
+        worker.moveToThread(thread)
+        thread.started.connect(worker.run)
+        worker.progressed.connect(lambda text: self._status(f"Benchmark: {text}"))
+        worker.finished.connect(self._on_bench_finished)
+        worker.failed.connect(self._on_bench_failed)
+        self._bench_thread = thread
+        self._bench_worker = worker
+        self.bench_btn.setText("Durdur")
+        thread.start()
+        self._status("Whisper benchmark başlatıldı...")
+
+    def _end_benchmark(self):
+        t = self._bench_thread
+        if t is not None:
+            t.quit(); t.wait()
+        self._bench_thread = None
+        self._bench_worker = None
+        self.bench_btn.setText("Benchmark")
+        self.bench_btn.setEnabled(True)
+
+    def _on_bench_finished(self, results: list):
+        canceled = self._bench_worker is not None and self._bench_worker._cancel.is_set()
+        self._end_benchmark()
+        self._update_stt_model_label()
+        if canceled:
+            self._status("Benchmark iptal edildi; önceki sonuçlar korundu.")
+            return
+        ok = sum(1 for r in results if not r.error)
+        self._status(f"Benchmark tamamlandı: {ok}/{len(results)} yapılandırma ölçüldü.")
+
+    def _on_bench_failed(self, message: str):
+        self._end_benchmark()
+        self._status(f"Benchmark hatası: {message}")
+
+    def _on_skip_held_toggled(self, checked: bool):
+        self.settings.skip_held = bool(checked)
+        save_settings(self.settings)
+
+    # ------------------------
+    # Duplicate files (background worker)
+    # ------------------------
+    def _run_dedupe_worker(self, worker: DedupeWorker):
+        if self._dedupe_thread is not None:
+            return
+        self.dedupe_scan_btn.setEnabled(False)
+        self.dedupe_link_btn.setEnabled(False)
+        thread = QThread(self)
+        worker.moveToThread(thread)
+        thread.started.connect(worker.run)
+        worker.found.connect(self._on_dedupe_found)
+        worker.linked.connect(self._on_dedupe_linked)
+        worker.failed.connect(self._on_dedupe_failed)
+        self._dedupe_thread = thread
+        self._dedupe_worker = worker
+        thread.start()
+
+    def _end_dedupe_worker(self):
+        t = self._dedupe_thread
+        if t is not None:
+            t.quit(); t.wait()
+        self._dedupe_thread = None
+        self._dedupe_worker = None
+        self.dedupe_scan_btn.setEnabled(True)
+
+    def _start_dedupe_scan(self):
+        self._status("Kopya dosyalar taranıyor...")
+        self._run_dedupe_worker(DedupeWorker(Path(self.settings.download_dir)))
+
+    def _start_dedupe_link(self):
+        if not self._dedupe_groups:
+            return
+        self._run_dedupe_worker(DedupeWorker(Path(self.settings.download_dir), self._dedupe_groups))
+
+    def _on_dedupe_found(self, groups: list):
+        self._end_dedupe_worker()
+        self._dedupe_groups = groups
+        if not groups:
+            self.dedupe_view.setVisible(False)
+            self._status("Kopya dosya bulunamadı.")
+            return
+        lines = []
+        wasted = 0
+        for g in groups:
+            try:
+                wasted += Path(g[0]).stat().st_size * (len(g) - 1)
+            except Exception:
+                pass
+            lines.append("\n".join(Path(p).name for p in g))
+        self.dedupe_view.setPlainText("\n\n".join(lines))
+        self.dedupe_view.setVisible(True)
+        self.dedupe_link_btn.setEnabled(True)
+        self._status(f"{len(groups)} kopya grubu bulundu ({wasted / (1024 * 1024):.1f} MB)")
+
+    def _on_dedupe_linked(self, freed: int):
+        self._end_dedupe_worker()
+        self._dedupe_groups = []
+        self.dedupe_view.setVisible(False)
+        self._status(f"Kopyalar birleştirildi, {freed / (1024 * 1024):.1f} MB boşaltıldı.")
+
+    def _on_dedupe_failed(self, message: str):
+        self._end_dedupe_worker()
+        self._status(f"Kopya tarama hatası: {message}")
+
     def _paste_from_clipboard(self):
         from PySide6.QtWidgets import QApplication
         cb = QApplication.clipboard()
         text = cb.text().strip()
         if text:
             self.url_edit.setText(text)
+            # Pasted URLs are complete; no need to wait for the debounce
+            self._prefetch_timer.stop()
+            self._prefetch_current_url()
+
+    # ------------------------
+    # Speculative metadata prefetch
+    # ------------------------
+    def _is_valid_url(self, url: str) -> bool:
+        return url.startswith("http://") or url.startswith("https://")
+
+    def _prefetch_current_url(self):
+        url = self.url_edit.text().strip()
+        if not self._is_valid_url(url) or downloader.info_cache().get(url) is not None:
+            return
+        if self._prefetch_thread is not None:
+            # One extraction at a time; only the latest URL matters
+            self._prefetch_pending = url
+            return
+        worker = PrefetchWorker(url)
+        thread = QThread(self)
+        worker.moveToThread(thread)
+        thread.started.connect(worker.run)
+        worker.done.connect(self._on_prefetch_done)
+        worker.failed.connect(self._on_prefetch_failed)
+        self._prefetch_thread = thread
+        self._prefetch_worker = worker
+        thread.start()
+
+    def _end_prefetch(self):
+        t = self._prefetch_thread
+        if t is not None:
+            t.quit(); t.wait()
+        self._prefetch_thread = None
+        self._prefetch_worker = None
+        pending, self._prefetch_pending = self._prefetch_pending, None
+        if pending and pending == self.url_edit.text().strip():
+            self._prefetch_current_url()
+
+    def _on_prefetch_done(self, url: str, summary: dict):
+        self._prefetched[url] = summary
+        self._end_prefetch()
+        title = summary.get("title") or ""
+        if title and url == self.url_edit.text().strip():
+            dur = self._format_duration(summary.get("duration"))
+            self._status(f"Hazır: {title}" + (f" ({dur})" if dur else ""))
+        # Rows queued before extraction finished get the details now
+        for rw in list(self._download_rows.values()):
+            if rw._url == url:
+                self._apply_prefetched(rw)
+
+    def _on_prefetch_failed(self, url: str, message: str):
+        # Silent: the download itself will report real errors
+        self._end_prefetch()
+
+    def _format_duration(self, seconds) -> str:
+        try:
+            total = int(seconds)
+        except Exception:
+            return ""
+        h, rem = divmod(total, 3600)
+        m, sec = divmod(rem, 60)
+        return f"{h}:{m:02d}:{sec:02d}" if h else f"{m}:{sec:02d}"
+
+    def _apply_prefetched(self, row_widget: QWidget):
+        # Title, duration and estimated size before the first byte arrives
+        summary = self._prefetched.get(row_widget._url)
+        if not summary:
+            return
+        title = summary.get("title")
+        if title:
+            row_widget._name_lbl.setText(title)
+        parts = []
+        dur = self._format_duration(summary.get("duration"))
+        if dur:
+            parts.append(dur)
+        info = downloader.info_cache().get(row_widget._url) or {}
+        plan = format_plan.choose(info.get("formats") or [], row_widget._quality, summary.get("duration"))
+        if plan is not None:
+            parts.append(plan.describe())
+        if parts and not row_widget._plan_lbl.text():
+            row_widget._plan_lbl.setText(" · ".join(parts))
+            row_widget._plan_lbl.setVisible(True)
 
     def _icon(self, name: str) -> QIcon:
-        # Looks up icons from multiple candidate locations and extensions:
-        #  - <frozen_root>/assets/icons/<name>.{png,ico} (PyInstaller)
-        #  - <repo_root>/assets/icons/<name>.{png,ico}
-        #  - <package_dir>/assets/icons/<name>.{png,ico}
-        # If not found, returns an empty icon so UI stays functional.
-        import sys as _sys
-        pkg_dir = Path(__file__).resolve().parent
-        repo_root = pkg_dir.parent
-        frozen_root = Path(getattr(_sys, "_MEIPASS", repo_root))
-        exts = ("png", "ico")
-        candidates = []
-        for ext in exts:
-            candidates.append(frozen_root / "assets" / "icons" / f"{name}.{ext}")
-            candidates.append(repo_root / "assets" / "icons" / f"{name}.{ext}")
-            candidates.append(pkg_dir / "assets" / "icons" / f"{name}.{ext}")
-        for p in candidates:
-            if p.exists():
-                return QIcon(str(p))
-        return QIcon()
+        # Served from the shared registry (compiled resource bundle, loaded once).
+        # Unknown names return an empty icon so UI stays functional.
+        return icons.icon(name)
 
     def _apply_icons(self):
         # Buttons
@@ -445,8 +1210,11 @@ class MainWindow(QMainWindow):
         self.download_best_btn.setIcon(self._icon("download_best"))
         self.download_mp4_btn.setIcon(self._icon("download_mp4"))
         self.download_mp3_btn.setIcon(self._icon("download_mp3"))
+        self.transcribe_url_btn.setIcon(self._icon("file_text"))
         self.open_folder_btn.setIcon(self._icon("downloads"))
         self.settings_dir_btn.setIcon(self._icon("folder"))
+        self.staging_dir_btn.setIcon(self._icon("folder"))
+        self.staging_clear_btn.setIcon(self._icon("close"))
 
         # Tabs
         self.tabs.setTabIcon(0, self._icon("home"))
@@ -470,6 +1238,7 @@ class MainWindow(QMainWindow):
         self.download_best_btn.setIconSize(icon_size)
         self.download_mp4_btn.setIconSize(icon_size)
         self.download_mp3_btn.setIconSize(icon_size)
+        self.transcribe_url_btn.setIconSize(icon_size)
         self.open_folder_btn.setIconSize(icon_size)
         self.settings_dir_btn.setIconSize(icon_size)
         self.tabs.setIconSize(QSize(24, 24))
@@ -521,6 +1290,7 @@ class MainWindow(QMainWindow):
             self.download_best_btn,
             self.download_mp4_btn,
             self.download_mp3_btn,
+            self.transcribe_url_btn,
             self.open_folder_btn,
             self.settings_dir_btn,
         ]
@@ -538,71 +1308,434 @@ class MainWindow(QMainWindow):
                 lay.setContentsMargins(12, 12, 12, 12)
                 lay.setSpacing(10)
 
-    def _set_download_buttons_enabled(self, enabled: bool):
-        self.download_best_btn.setEnabled(enabled)
-        self.download_mp4_btn.setEnabled(enabled)
-        self.download_mp3_btn.setEnabled(enabled)
-
     def _start_download(self, quality: str = "best"):
         url = self.url_edit.text().strip()
-        if not url or not (url.startswith("http://") or url.startswith("https://")):
+        if not url or not self._is_valid_url(url):
             self._status("Geçerli bir URL girin (http/https)")
             return
 
-        self._set_download_buttons_enabled(False)
-        self.progress.setValue(0)
-        self.progress.setVisible(True)
-        target_dir = Path(self.settings.download_dir)
+        # A URL entered by hand goes ahead of queued bulk jobs
+        item, row = self._create_downloading_row(url, quality, priority=scheduler.HIGH)
+        self._apply_prefetched(row)
+        self._launch_download(row)
 
-        worker = DownloadWorker(url, target_dir, quality)
-        thread = QThread(self)
-        worker.moveToThread(thread)
-        thread.started.connect(worker.run)
+    def _launch_download(self, row_widget: QWidget):
+        # Each job waits for a network slot in the shared pipeline; rows show
+        # 'queued' until their first progress report
+        self._apply_pipeline_limits()
+        target_dir = Path(self.settings.download_dir)
+        if row_widget._quality == "transcript":
+            # Streamed audio cannot be resumed; only cancel applies
+            model, device, compute_type = self._stt_config()
+            worker = RemoteTranscribeWorker(
+                row_widget._url, target_dir, lang=(self.settings.transcript_lang.strip() or None),
+                model_size=model, device=device, compute_type=compute_type,
+                workers=int(self.settings.stt_workers),
+            )
+            row_widget._btn_pause.setVisible(False)
+        else:
+            worker = DownloadWorker(
+                row_widget._url, target_dir, row_widget._quality,
+                skip_held=bool(self.settings.skip_held),
+                connections=int(self.settings.download_connections),
+                staging_dir=(Path(self.settings.staging_dir) if self.settings.staging_dir else None),
+                priority=row_widget._priority,
+            )
+            worker.skipped.connect(self._on_download_skipped)
+            worker.waiting.connect(self._on_waiting)
         worker.progressed.connect(self._on_progress)
         # Connect directly to MainWindow slots (queued across threads)
+        worker.fetched.connect(self._on_fetched)
+        worker.planned.connect(self._on_planned)
         worker.finished.connect(self._on_finished)
+        worker.canceled.connect(self._on_download_canceled)
         worker.failed.connect(self._on_failed)
 
-        self._active_thread = thread
-        self._active_worker = worker
-        thread.start()
+        row_widget._worker = worker
+        row_widget._percent = 0
+        row_widget._fetched = False
+        row_widget._progress_only_bar.setRange(0, 100)
+        row_widget._progress_only_bar.setValue(0)
+        self._set_row_state(row_widget, "Sırada")
+        self._jobs.update(row_widget._job_id, state=control.QUEUED, started=True, percent=0, error="", retryable=False)
+        self._download_rows[worker] = row_widget
+        row_widget._job = self._engine.start(worker.run(self._engine))
+        self._update_global_progress()
+
+    def _apply_pipeline_limits(self):
+        downloader.configure_pipeline(
+            self.settings.max_downloads, self.settings.max_postprocess,
+            procpool.ProcessPipeline if self.settings.process_workers else downloader.Pipeline,
+            per_host=int(self.settings.per_host_downloads), interval=float(self.settings.host_interval),
+        )
+
+    def _row_for_sender(self) -> Optional[QWidget]:
+        return self._download_rows.get(self.sender())
+
+    def _update_global_progress(self):
+        # Mean progress of jobs still in their network phase
+        active = [rw for rw in self._download_rows.values() if not rw._fetched]
+        if not active:
+            self.progress.setVisible(False)
+            return
+        self.progress.setValue(int(sum(rw._percent for rw in active) / len(active)))
+        self.progress.setVisible(True)
 
     def _on_progress(self, percent: int):
-        self.progress.setValue(max(0, min(100, int(percent))))
-        if not self.progress.isVisible():
-            self.progress.setVisible(True)
-        # row progress for active download removed
+        rw = self._row_for_sender()
+        if rw is None:
+            return
+        value = max(0, min(100, int(percent)))
+        if not rw._fetched:
+            self._set_row_state(rw, "İndiriliyor")
+            self._jobs.update(rw._job_id, state=control.DOWNLOADING, percent=value)
+        rw._percent = value
+        rw._progress_only_bar.setValue(value)
+        self._update_global_progress()
+
+    def _on_planned(self, text: str):
+        rw = self._row_for_sender()
+        if rw is not None and text:
+            # Keep the prefetched duration in front of the final plan
+            dur = self._format_duration((self._prefetched.get(rw._url) or {}).get("duration"))
+            rw._plan_lbl.setText(f"{dur} · {text}" if dur else text)
+            rw._plan_lbl.setVisible(True)
+            self._jobs.update(rw._job_id, plan=text)
+
+    def _on_waiting(self, text: str):
+        # Still queued for the API; the row says why it does not start
+        rw = self._row_for_sender()
+        if rw is not None:
+            self._set_row_state(rw, text)
+
+    def _on_fetched(self):
+        # Network phase done; the slot is already serving the next URL
+        rw = self._row_for_sender()
+        if rw is None:
+            return
+        rw._fetched = True
+        rw._progress_only_bar.setRange(0, 0)  # busy indicator while ffmpeg runs
+        rw._btn_pause.setEnabled(False)
+        self._set_row_state(rw, "İşleniyor")
+        self._jobs.update(rw._job_id, state=control.PROCESSING, percent=100)
+        self._update_global_progress()
+        # Its site has room for another job in the network phase
+        QTimer.singleShot(0, self._drain_api_backlog)
+
+    def _end_download_job(self) -> Optional[QWidget]:
+        # Forget the sender's job; its worker object goes once this slot returns
+        worker = self.sender()
+        rw = self._download_rows.pop(worker, None)
+        if rw is None:
+            return None
+        worker.deleteLater()
+        rw._job = None
+        rw._worker = None
+        self._update_global_progress()
+        # A slot freed up: give the next API job its row
+        QTimer.singleShot(0, self._drain_api_backlog)
+        return rw
 
     def _on_finished(self, final_path: str):
+        source = self._transcript_source(self.sender(), "ses akışından")
+        rw = self._end_download_job()
+        if rw is None:
+            return
+        self._jobs.update(rw._job_id, state=control.DONE, percent=100, path=final_path or "")
+        self._settle_subscription_entry(rw._job_id)
+        if rw._quality == "transcript":
+            self._remove_row(rw)
+            if final_path:
+                self._show_transcript(Path(final_path), source)
+            return
         self._status("İndirme tamamlandı.")
-        self._set_download_buttons_enabled(True)
-        self.progress.setVisible(False)
-        # Clean up thread safely from the GUI thread
-        t = getattr(self, "_active_thread", None)
-        w = getattr(self, "_active_worker", None)
-        if t is not None:
-            t.quit()
-            t.wait()
-        self._active_thread = None
-        # Add to downloads list
+        # Swap the downloading row for the finished item
         try:
-            if final_path:
-                p = Path(final_path)
-                if p.exists() and p.is_file():
-                    url = getattr(w, "url", "") if w is not None else ""
-                    self._add_download_item(url, str(p))
+            p = Path(final_path) if final_path else None
+            if p is not None and p.exists() and p.is_file():
+                self._replace_downloading_with_final(rw, p)
+            else:
+                self._remove_row(rw)
         except Exception:
             pass
 
     def _on_failed(self, message: str):
+        worker = self.sender()
+        partial = list(getattr(worker, "partial_files", []) or [])
+        rw = self._end_download_job()
         self._status(f"Hata: {message}")
-        self._set_download_buttons_enabled(True)
-        self.progress.setVisible(False)
-        t = getattr(self, "_active_thread", None)
-        if t is not None:
-            t.quit()
-            t.wait()
-        self._active_thread = None
+        if rw is None:
+            return
+        retryable = bool(partial) and not rw._fetched and not getattr(rw, "_stop_requested", False)
+        self._jobs.update(rw._job_id, state=control.FAILED, error=message, retryable=retryable)
+        if not retryable:
+            self._settle_subscription_entry(rw._job_id, ok=getattr(rw, "_stop_requested", False))
+        if retryable:
+            # Keep the row: parts and cached fragments stay, a retry fetches only what is missing
+            rw._paused = True
+            rw._pause_requested = False
+            for pf in partial:
+                if pf not in rw._partial_files:
+                    rw._partial_files.append(pf)
+            try:
+                rw._btn_pause.setIcon(self._icon("play"))
+                rw._btn_pause.setToolTip("Yeniden dene")
+            except Exception:
+                pass
+            self._set_row_state(rw, "Hata")
+            return
+        if getattr(rw, "_stop_requested", False):
+            downloader.discard_partial(partial)
+        self._remove_row(rw)
+
+    def _on_download_skipped(self, held_path: str):
+        # Same extractor id already in the folder; nothing was transferred
+        rw = self._end_download_job()
+        self._status(f"Zaten indirilmiş: {Path(held_path).name}")
+        if rw is not None:
+            self._jobs.update(rw._job_id, state=control.SKIPPED, path=held_path)
+            self._settle_subscription_entry(rw._job_id)
+            self._remove_row(rw)
+
+    # ------------------------
+    # Control API
+    # ------------------------
+    def _restart_api(self):
+        if self._api is not None:
+            self._api.stop()
+            self._api = None
+        port = int(self.settings.api_port)
+        if not port:
+            return
+        try:
+            self._api = control.ControlServer(
+                self._jobs, self._api_bridge.enqueued.emit, self._api_bridge.command.emit,
+                port, token=self.settings.api_token,
+            )
+        except OSError as e:
+            self._status(f"Denetim API başlatılamadı: {e}")
+            return
+        self._api.start()
+        self._status(f"Denetim API: http://127.0.0.1:{self._api.port}")
+
+    def _on_api_port_changed(self, value: int):
+        self.settings.api_port = int(value)
+        save_settings(self.settings)
+        self._restart_api()
+
+    # ------------------------
+    # Subscriptions
+    # ------------------------
+    def _refresh_subscriptions(self):
+        self.subs_combo.clear()
+        for sub in self._subs.all():
+            self.subs_combo.addItem(sub.url, sub.url)
+            tip = f"{len(sub.seen)} bilinen video"
+            if sub.pending:
+                tip += f" · {len(sub.pending)} indirilecek"
+            if sub.last_sync:
+                tip += " · son eşitleme " + time.strftime("%d.%m.%Y %H:%M", time.localtime(sub.last_sync))
+            if sub.error:
+                tip += f" · hata: {sub.error}"
+            self.subs_combo.setItemData(self.subs_combo.count() - 1, tip, Qt.ToolTipRole)
+        self.sub_remove_btn.setEnabled(self.subs_combo.count() > 0)
+        self.sub_sync_btn.setEnabled(self.subs_combo.count() > 0)
+
+    def _add_subscription(self):
+        url = self.url_edit.text().strip()
+        if not url or not self._is_valid_url(url):
+            self._status("Abone olmak için indirme sekmesine bir kanal veya oynatma listesi URL'si girin")
+            return
+        if not self._subs.add(url):
+            self._status("Bu URL'ye zaten abonesiniz")
+            return
+        self._refresh_subscriptions()
+        # The first sync queues what the channel already has, at bulk priority
+        self._sync_subscriptions([s for s in self._subs.all() if s.url == url])
+
+    def _remove_subscription(self):
+        url = self.subs_combo.currentData()
+        if url:
+            self._subs.remove(url)
+            self._refresh_subscriptions()
+
+    def _on_sync_interval_changed(self, value: int):
+        self.settings.sync_interval_hours = int(value)
+        save_settings(self.settings)
+
+    def _sync_due(self):
+        hours = int(self.settings.sync_interval_hours)
+        if hours > 0:
+            self._sync_subscriptions(self._subs.due(hours * 3600))
+
+    def _sync_subscriptions(self, subs: list):
+        busy = {w.sub.url for w in self._sync_jobs}
+        for sub in subs:
+            if sub.url in busy:
+                continue
+            worker = SyncWorker(sub)
+            worker.synced.connect(self._on_synced)
+            self._sync_jobs[worker] = self._engine.start(worker.run(self._engine))
+        if self._sync_jobs:
+            self._status(f"Abonelikler eşitleniyor ({len(self._sync_jobs)})...", 0)
+
+    def _on_synced(self, res: "subscriptions.SyncResult"):
+        worker = self.sender()
+        if self._sync_jobs.pop(worker, None) is not None:
+            worker.deleteLater()
+        self._subs.apply(res)
+        sub = next((s for s in self._subs.all() if s.url == res.url), None)
+        if res.new and not res.error and sub is not None:
+            # Oldest first; a first sync is a backfill and yields to other jobs
+            priority = scheduler.BULK if res.first else scheduler.NORMAL
+            new = [(sub, url, eid) for url, eid in reversed(res.new) if eid in sub.pending]
+            self._sync_new += len(new)
+            self._queue_subscription_entries(new, priority)
+        if not self._sync_jobs:
+            self._status(f"Abonelikler eşitlendi: {self._sync_new} yeni video sıraya alındı")
+            self._sync_new = 0
+            self._refresh_subscriptions()
+
+    def _queue_subscription_entries(self, entries: list, priority: str):
+        ids = []
+        for sub, url, eid in entries:
+            job_id = self._jobs.add(url, sub.quality, source="sync", priority=priority)
+            self._sub_entries[job_id] = (sub.url, eid)
+            ids.append(job_id)
+        self._queue_board_jobs(ids)
+
+    def _resume_subscription_entries(self):
+        entries = self._subs.pending()
+        if entries:
+            self._queue_subscription_entries(entries, scheduler.BULK)
+            self._status(f"Abonelikler: önceki oturumdan {len(entries)} video sıraya alındı")
+
+    def _settle_subscription_entry(self, job_id: Optional[str], ok: bool = True):
+        # Seen only once downloaded, held already or canceled; failures are retried
+        # at the next start, up to subscriptions.MAX_ATTEMPTS
+        entry = self._sub_entries.pop(job_id, None)
+        if entry is None:
+            return
+        if ok:
+            self._subs.finish(*entry)
+        else:
+            self._subs.fail(*entry)
+
+    # ------------------------
+    # Diagnostics
+    # ------------------------
+    def _apply_stall_threshold(self):
+        ms = int(self.settings.stall_threshold_ms)
+        self._stall_watch.stop()
+        if ms > 0:
+            self._stall_watch.threshold = ms / 1000
+            self._stall_watch.start()
+
+    def _on_stall_threshold_changed(self, value: int):
+        self.settings.stall_threshold_ms = int(value)
+        save_settings(self.settings)
+        self._apply_stall_threshold()
+
+    def _toggle_profiler(self):
+        if not self._profiler.running:
+            self._profiler.start()
+            self.profile_btn.setText("Profil Kaydını Durdur")
+            self._status("Profil kaydı başladı (durdurmak için Ctrl+Shift+P)", 0)
+            return
+        path = self._profiler.stop()
+        self.profile_btn.setText("Profil Kaydını Başlat")
+        self._status(f"Profil kaydedildi: {path}" if path else "Profil kaydı boş", 10000)
+
+    def _on_api_enqueued(self, job_ids: list):
+        self._queue_board_jobs(job_ids)
+        self._status(f"API: {len(job_ids)} iş sıraya eklendi")
+
+    def _queue_board_jobs(self, job_ids: list):
+        # Board jobs (API, subscriptions) get rows as slots free up
+        for job_id in job_ids:
+            job = self._jobs.get(job_id)
+            if job is not None:
+                self._api_backlog.get(job["priority"], self._api_backlog[scheduler.NORMAL]).append(job_id)
+        self._drain_api_backlog()
+
+    def _site_key(self, url: str) -> str:
+        # scheduler.site() per host name: finding the extractor for every
+        # backlog URL would stall the GUI on large submits
+        host = (urlsplit(url).hostname or "").lower()
+        key = self._host_sites.get(host)
+        if key is None:
+            key = self._host_sites[host] = scheduler.site(url)[0]
+        return key
+
+    def _next_api_job(self, full: set) -> Optional[dict]:
+        # Most urgent first job per priority whose site is below its limit;
+        # waiting raises urgency the same way as in the download queue
+        # (scheduler.urgency)
+        now = time.time()
+        best = None
+        for prio, ids in self._api_backlog.items():
+            while ids:
+                job = self._jobs.get(ids[0])
+                if job is not None and job["state"] == control.QUEUED:
+                    break
+                ids.popleft()  # canceled while waiting
+            for pos, job_id in enumerate(ids):
+                job = self._jobs.get(job_id)
+                if job is None or job["state"] != control.QUEUED or self._site_key(job["url"]) in full:
+                    continue
+                u = scheduler.urgency(prio, now - job["created"])
+                if best is None or u < best[0]:
+                    best = (u, ids, pos)
+                break
+        if best is None:
+            return None
+        _u, ids, pos = best
+        job_id = ids[pos]
+        del ids[pos]
+        return self._jobs.get(job_id)
+
+    def _drain_api_backlog(self):
+        # Rows only for jobs that can start soon: at most per_host rows per
+        # site still in the network phase, so one site's bulk submit does not
+        # take the rows other sites' jobs could run in; the rest waits here
+        # and on the board
+        limit = 2 * max(1, int(self.settings.max_downloads))
+        per_host = max(1, int(self.settings.per_host_downloads))
+        active = Counter(self._site_key(rw._url) for rw in self._download_rows.values() if not rw._fetched)
+        full = {key for key, n in active.items() if n >= per_host}
+        while len(self._download_rows) < limit:
+            job = self._next_api_job(full)
+            if job is None:
+                break
+            _item, row = self._create_downloading_row(job["url"], job["quality"], job_id=job["id"],
+                                                      priority=job["priority"])
+            self._apply_prefetched(row)
+            self._launch_download(row)
+            key = self._site_key(job["url"])
+            active[key] += 1
+            if active[key] >= per_host:
+                full.add(key)
+
+    def _on_api_command(self, action: str, job_id: str):
+        rw = self._job_rows.get(job_id)
+        if rw is None:
+            # Not started yet: only cancel applies
+            job = self._jobs.get(job_id)
+            if action == "cancel" and job is not None and job["state"] == control.QUEUED:
+                self._jobs.update(job_id, state=control.CANCELED)
+                self._settle_subscription_entry(job_id)
+            return
+        paused = getattr(rw, "_paused", False)
+        if action == "cancel":
+            rw._request_stop()
+        elif (action == "pause" and not paused and rw._quality != "transcript") or (action == "resume" and paused):
+            rw._toggle_pause()
+
+    def _remove_row(self, row_widget: QWidget):
+        self._job_rows.pop(getattr(row_widget, "_job_id", None), None)
+        idx = self.downloads_list.row(row_widget._item)
+        if idx >= 0:
+            self.downloads_list.takeItem(idx)
 
     def _append_log(self, text: str):
         # Route messages to the status bar (no dialogs)
@@ -633,10 +1766,12 @@ class MainWindow(QMainWindow):
         base = Path(self.settings.download_dir)
         if not base.exists():
             return
-        # Sort by modified time desc to show newest first
-        items = sorted(base.glob("*"), key=lambda x: x.stat().st_mtime, reverse=True)
-        for p in items:
-            if not p.is_file() or self._is_temp_file(p):
+        # One listing feeds both the list and the sidecar index; newest first
+        entries = self._sidecars.scan(base)
+        entries.sort(key=lambda e: e.stat().st_mtime, reverse=True)
+        for e in entries:
+            p = Path(e.path)
+            if self._is_temp_file(p):
                 continue
             if self._is_video_file(p):
                 # URL bilinmiyor; sadece açma/silme ve MP3/Transkript eylemleri (URL gerekirse uyarır)
@@ -645,13 +1780,12 @@ class MainWindow(QMainWindow):
                 self._add_asset_item(p)
 
     def _thumb_for(self, media_path: Path) -> Optional[Path]:
-        # Look for sidecar thumbnail files next to media
+        # Sidecar thumbnail next to the media, from the index
+        tp = self._sidecars.thumbnail(media_path)
+        if tp is not None:
+            return tp
         stem = media_path.with_suffix("").name
         parent = media_path.parent
-        for ext in (".jpg", ".jpeg", ".png", ".webp"):
-            for cand in parent.glob(f"{stem}*{ext}"):
-                if cand.is_file():
-                    return cand
         # If not found and it's a video, try extracting a frame via ffmpeg
         if self._is_video_file(media_path):
             try:
@@ -661,30 +1795,203 @@ class MainWindow(QMainWindow):
                 # Create a deterministic thumbnail path
                 out = parent / f"{stem}.thumb.jpg"
                 # Use a small offset to avoid black frames; suppress output
+                box = thumbnails.STORE_SIZE
                 cmd = [
                     'ffmpeg', '-y', '-ss', '3', '-i', str(media_path),
-                    '-frames:v', '1', '-q:v', '2', str(out)
+                    '-frames:v', '1',
+                    '-vf', f'scale={box.width()}:{box.height()}:force_original_aspect_ratio=decrease',
+                    '-q:v', '4', str(out)
                 ]
                 subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
                 if out.exists():
+                    self._sidecars.add(out)
                     return out
             except Exception:
                 return None
         return None
 
-    def _type_icon_for(self, p: Path):
+    # ------------------------
+    # Thumbnails (viewport-driven)
+    # ------------------------
+    THUMB_MARGIN_ROWS = 6  # rows above/below the viewport that get thumbnails too
+
+    def _schedule_thumbs(self, *_):
+        self._thumb_timer.start()
+
+    def _load_visible_thumbs(self):
+        lst = self.downloads_list
+        count = lst.count()
+        if count == 0:
+            return
+        vp = lst.viewport().rect()
+        first = self._row_near(vp.top(), vp.bottom(), 4)
+        last = self._row_near(vp.bottom(), vp.top(), -4)
+        if first < 0:
+            first = 0
+        if last < 0:
+            last = first
+        lo = max(0, first - self.THUMB_MARGIN_ROWS)
+        hi = min(count - 1, last + self.THUMB_MARGIN_ROWS)
+
+        band: dict = {}
+        for i in range(lo, hi + 1):
+            it = lst.item(i)
+            if it is None or it.isHidden():
+                continue
+            w = lst.itemWidget(it)
+            key = getattr(w, "_thumb_key", None)
+            if key:
+                band[key] = w
+        self._thumb_rows = band
+        self._thumb_loader.set_wanted(band.keys())
+
+        # Rows that left the band give their pixmap back to the cache
+        for key, w in list(self._thumb_shown.items()):
+            if band.get(key) is not w:
+                try:
+                    w._thumb_lbl.clear()
+                except RuntimeError:
+                    pass  # row already deleted
+                del self._thumb_shown[key]
+
+        for key, w in band.items():
+            if key in self._thumb_shown or key in self._thumb_missing:
+                continue
+            pm = self._thumb_cache.get(key)
+            if pm is not None:
+                self._show_thumb(key, w, pm)
+            else:
+                self._thumb_loader.request(key)
+
+    def _row_near(self, y: int, stop: int, step: int) -> int:
+        # indexAt() misses when y falls into the spacing between rows
+        x = self.downloads_list.viewport().width() // 2
+        for yy in range(y, stop + step, step):
+            row = self.downloads_list.indexAt(QPoint(x, yy)).row()
+            if row >= 0:
+                return row
+        return -1
+
+    def _show_thumb(self, key: str, w: QWidget, pm: QPixmap):
+        # Stored at up to 2x the label size; draw it at logical size
+        box = thumbnails.DISPLAY_SIZE
+        pm.setDevicePixelRatio(max(1.0, pm.width() / box.width(), pm.height() / box.height()))
+        if w is self._preview_row and self._thumb_cache.get("sprite:" + key) is not None:
+            self._thumb_shown[key] = w  # restored when the pointer leaves
+            return
+        try:
+            w._thumb_lbl.setPixmap(pm)
+        except RuntimeError:
+            return
+        self._thumb_shown[key] = w
+
+    def _on_thumb_loaded(self, key: str, img):
+        if img.isNull():
+            self._thumb_missing.add(key)
+            return
+        pm = QPixmap.fromImage(img)
+        self._thumb_cache.put(key, pm)
+        w = self._thumb_rows.get(key)
+        if w is not None and key not in self._thumb_shown:
+            self._show_thumb(key, w, pm)
+
+    def _attach_preview_scrub(self, row_widget: QWidget) -> None:
+        class _ScrubFilter(QObject):
+            def __init__(self, owner, target):
+                super().__init__(target)
+                self._owner = owner
+                self._target = target
+            def eventFilter(self, obj, ev):
+                t = ev.type()
+                if t == QEvent.Enter:
+                    self._owner._preview_enter(self._target)
+                elif t == QEvent.MouseMove:
+                    self._owner._preview_move(self._target, ev.position().x() / max(1, obj.width()))
+                elif t == QEvent.Leave:
+                    self._owner._preview_leave(self._target)
+                return False
+        lbl = row_widget._thumb_lbl
+        lbl.setMouseTracking(True)
+        f = _ScrubFilter(self, row_widget)
+        lbl.installEventFilter(f)
+        # Keep reference to avoid garbage collection
+        setattr(row_widget, "_scrub_filter", f)
+
+    def _preview_enter(self, w: QWidget):
+        key = w._thumb_key
+        self._preview_row = w
+        w._preview_frac = 0.0
+        if self._thumb_cache.get("sprite:" + key) is None and key not in self._preview_missing:
+            self._preview_loader.set_wanted((key,))
+            self._preview_loader.request(key)
+
+    def _preview_move(self, w: QWidget, frac: float):
+        w._preview_frac = frac
+        sprite = self._thumb_cache.get("sprite:" + w._thumb_key)
+        if sprite is not None:
+            w._thumb_lbl.setPixmap(thumbnails.sprite_frame(sprite, frac))
+
+    def _preview_leave(self, w: QWidget):
+        key = w._thumb_key
+        if self._preview_row is w:
+            self._preview_row = None
+            self._preview_loader.set_wanted(())
+        if self._thumb_cache.get("sprite:" + key) is None:
+            return  # the thumbnail was never replaced
+        pm = self._thumb_cache.get(key) if self._thumb_shown.get(key) is w else None
+        if pm is not None:
+            w._thumb_lbl.setPixmap(pm)
+        else:
+            w._thumb_lbl.clear()
+            self._thumb_shown.pop(key, None)
+            self._schedule_thumbs()
+
+    def _on_preview_loaded(self, key: str, img):
+        if img.isNull():
+            self._preview_missing.add(key)
+            return
+        # Strips built ahead of time stay on disk until their row is hovered
+        w = self._preview_row
+        if w is not None and w._thumb_key == key:
+            self._thumb_cache.put("sprite:" + key, QPixmap.fromImage(img))
+            self._preview_move(w, w._preview_frac)
+
+    def closeEvent(self, event):
+        # Stop jobs cooperatively; parts stay on disk for the next start
+        self._stall_watch.stop()
+        if self._profiler.running:
+            self._profiler.stop()
+        self._engine.shutdown()
+        if self._api is not None:
+            self._api.stop()
+            self._api = None
+        self._thumb_loader.shutdown()
+        self._preview_loader.shutdown()
+        super().closeEvent(event)
+
+    def _on_thumb_budget_changed(self, value: int):
+        self.settings.thumb_cache_mb = int(value)
+        save_settings(self.settings)
+        self._thumb_cache.set_budget(int(value) * 1024 * 1024)
+
+    def _type_icon_name(self, p: Path):
         try:
             ext = p.suffix.lower()
         except Exception:
             ext = ""
         # Determine kind
         if self._is_video_file(p):
-            return self._icon("video"), "Video"
+            return "video", "Video"
         if ext == ".mp3":
-            return self._icon("music"), "Müzik"
+            return "music", "Müzik"
         if p.name.lower().endswith(".transcript.txt") or ext in {".srt", ".vtt", ".txt"}:
-            return self._icon("file_text"), "Metin"
-        return QIcon(), ""
+            return "file_text", "Metin"
+        return "", ""
+
+    def _type_icon_for(self, p: Path):
+        name, tip = self._type_icon_name(p)
+        return (self._icon(name) if name else QIcon()), tip
+
     def _add_download_item(self, url: str, file_path: str):
         if not file_path:
             return
@@ -708,20 +2015,18 @@ class MainWindow(QMainWindow):
         h = QHBoxLayout(w)
         h.setContentsMargins(12, 6, 12, 6)
         h.setSpacing(12)
-        # Thumbnail if available
+        # Thumbnail: filled in by _load_visible_thumbs when the row is near the viewport
         thumb = QLabel()
         # Larger thumbnail for better visibility
-        thumb.setFixedSize(160, 90)
-        thumb.setScaledContents(True)
-        tp = self._thumb_for(path)
-        if tp:
-            try:
-                pm = QPixmap(str(tp))
-                if not pm.isNull():
-                    thumb.setPixmap(pm)
-            except Exception:
-                pass
+        thumb.setFixedSize(thumbnails.DISPLAY_SIZE)
+        thumb.setAlignment(Qt.AlignCenter)
         h.addWidget(thumb)
+        w._thumb_lbl = thumb
+        w._thumb_key = str(path)
+        self._thumb_missing.discard(w._thumb_key)  # a new row may come with a new thumbnail
+        if self._is_video_file(path):
+            self._attach_preview_scrub(w)
+        self._schedule_thumbs()
 
         name_lbl = QLabel(path.name)
         name_lbl.setMinimumWidth(120)
@@ -822,10 +2127,20 @@ class MainWindow(QMainWindow):
     # Item actions
     # ------------------------
     def _action_transcript(self, media_path: Path):
-        # Always use Whisper STT. Works for both video and audio files.
+        # Platform subtitles when the source URL is known, otherwise Whisper STT
         row = self._find_row_widget_by_path(media_path)
         self._set_row_busy(row, True)
-        self._start_whisper_transcribe(media_path)
+        self._start_whisper_transcribe(media_path, self._source_url_for(media_path))
+
+    def _source_url_for(self, media_path: Path) -> str:
+        for i in range(self.downloads_list.count()):
+            data = self.downloads_list.item(i).data(Qt.UserRole) or {}
+            if data.get("url") and Path(str(data.get("path", ""))) == media_path:
+                return str(data["url"])
+        try:
+            return Library(media_path.parent).source_url(media_path) or ""
+        except Exception:
+            return ""
 
     def _action_audio_mp3(self, video_path: Path):
         # Convert to MP3 using ffmpeg
@@ -843,6 +2158,7 @@ class MainWindow(QMainWindow):
             ]
             subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             self._status(f"MP3 oluşturuldu: {mp3_path.name}")
+            self._sidecars.add(mp3_path)
             # Add MP3 as its own list item for double-click opening
             self._add_asset_item(mp3_path)
         except subprocess.CalledProcessError:
@@ -857,18 +2173,15 @@ class MainWindow(QMainWindow):
 
     def _action_delete_group(self, video_path: Path):
         # Delete video and related files (inline, no dialogs)
-        related = []
-        stem = video_path.stem
-        parent = video_path.parent
-        # Collect typical sidecars: audio, transcripts, subtitles, thumbnails
-        side_exts = ('.mp3', '.transcript.txt', '.srt', '.vtt', '.jpg', '.jpeg', '.png', '.webp', '.thumb.jpg')
-        for ext in side_exts:
-            related += list(parent.glob(f"{stem}*{ext}"))
-        files_to_delete = [video_path] + [p for p in related if p.exists()]
+        # Sidecars (audio, transcripts, subtitles, thumbnails) come from the index
+        files_to_delete = [video_path] + self._sidecars.sidecars(video_path)
         errs = []
+        deleted = set()
         for p in files_to_delete:
             try:
                 p.unlink(missing_ok=True)
+                deleted.add(p)
+                self._sidecars.discard(p)
             except Exception as e:
                 errs.append(f"{p.name}: {e}")
         if errs:
@@ -879,7 +2192,7 @@ class MainWindow(QMainWindow):
             it = self.downloads_list.item(i)
             data = it.data(Qt.UserRole) or {}
             p = Path(str(data.get("path", "")))
-            if not p.exists() and (p.stem == stem or p == video_path):
+            if p in deleted:
                 self.downloads_list.takeItem(i)
             else:
                 i += 1
@@ -891,6 +2204,7 @@ class MainWindow(QMainWindow):
         except Exception as e:
             self._status(f"Silinemedi: {e}")
             return
+        self._sidecars.discard(path)
         # Remove list entry
         for i in range(self.downloads_list.count()):
             it = self.downloads_list.item(i)
@@ -921,9 +2235,9 @@ class MainWindow(QMainWindow):
         kind_icon_lbl = QLabel()
         kind_icon_lbl.setFixedSize(24, 24)
         kind_icon_lbl.setScaledContents(True)
-        kind_icon, kind_tip = self._type_icon_for(path)
-        if kind_icon and not kind_icon.isNull():
-            kind_icon_lbl.setPixmap(kind_icon.pixmap(24, 24))
+        kind_icon_name, kind_tip = self._type_icon_name(path)
+        if kind_icon_name:
+            kind_icon_lbl.setPixmap(icons.pixmap(kind_icon_name, 24))
         if kind_tip:
             kind_icon_lbl.setToolTip(kind_tip)
         h.addWidget(kind_icon_lbl)
@@ -1060,12 +2374,17 @@ class MainWindow(QMainWindow):
             kind = data.get("kind", "")
             match_text = (text in name) if text else True
             match_kind = True if filt in (None, "ALL") else (kind == filt)
+            if not match_kind and filt == "Metin" and kind == "Video":
+                # Videos with a transcript show up under text as well
+                match_kind = self._sidecars.has_transcript(Path(path))
             it.setHidden(not (match_text and match_kind))
+        self._schedule_thumbs()
 
     # ------------------------
     # Downloading row helpers
     # ------------------------
-    def _create_downloading_row(self, url: str, quality: str):
+    def _create_downloading_row(self, url: str, quality: str, job_id: Optional[str] = None,
+                                priority: str = scheduler.NORMAL):
         item = QListWidgetItem()
         item.setData(Qt.UserRole, {"url": url, "path": "", "kind": "Video", "state": "Downloading"})
         w = QWidget()
@@ -1078,7 +2397,20 @@ class MainWindow(QMainWindow):
         name_lbl.setToolTip(url)
         name_lbl.setMinimumWidth(120)
         name_lbl.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
-        h.addWidget(name_lbl, 1)
+        # Chosen format plan under the URL (e.g. "720p mp4 · tek akış · ~45 MB")
+        plan_lbl = QLabel()
+        plan_lbl.setEnabled(False)  # muted text
+        plan_lbl.setVisible(False)
+        text_col = QVBoxLayout()
+        text_col.setContentsMargins(0, 0, 0, 0)
+        text_col.setSpacing(2)
+        text_col.addWidget(name_lbl)
+        text_col.addWidget(plan_lbl)
+        h.addLayout(text_col, 1)
+
+        state_lbl = QLabel()
+        state_lbl.setEnabled(False)  # muted text
+        h.addWidget(state_lbl)
 
         pb = QProgressBar()
         pb.setRange(0, 100)
@@ -1107,28 +2439,38 @@ class MainWindow(QMainWindow):
         def on_pause():
             # toggle pause/resume
             if getattr(w, "_paused", False):
-                # resume
+                # resume: start new worker continuing from the partial data
                 btn_pause.setIcon(self._icon("pause"))
                 btn_pause.setToolTip("Durdur")
                 w._paused = False
-                # start new worker resuming the same URL
                 self._resume_from_row(w)
-            else:
+            elif w._worker is not None and not w._fetched:
                 # request cancel, will mark paused
                 w._pause_requested = True
-                if getattr(self, "_active_worker", None) is not None:
-                    self._active_worker.request_cancel()
+                w._worker.request_cancel()
 
         def on_stop():
             w._stop_requested = True
-            if getattr(self, "_active_worker", None) is not None:
-                self._active_worker.request_cancel()
+            if w._worker is not None:
+                if not w._fetched:
+                    w._worker.request_cancel()
+            elif getattr(w, "_paused", False):
+                # Nothing running for this row; drop it and its resume state now
+                downloader.discard_partial(getattr(w, "_partial_files", []))
+                self._jobs.update(w._job_id, state=control.CANCELED)
+                self._remove_row(w)
+                self._status("İndirme iptal edildi")
 
         btn_pause.clicked.connect(on_pause)
         btn_stop.clicked.connect(on_stop)
+        w._toggle_pause = on_pause
+        w._request_stop = on_stop
 
         # attach row attrs
         w._progress_only_bar = pb
+        w._state_lbl = state_lbl
+        w._plan_lbl = plan_lbl
+        w._name_lbl = name_lbl
         w._btn_pause = btn_pause
         w._btn_stop = btn_stop
         w._url = url
@@ -1136,87 +2478,85 @@ class MainWindow(QMainWindow):
         w._paused = False
         w._pause_requested = False
         w._stop_requested = False
+        w._partial_files = []
+        w._item = item
+        w._worker = None
+        w._job = None
+        w._percent = 0
+        w._fetched = False
+        w._priority = priority
+        w._job_id = job_id or self._jobs.add(url, quality, priority=priority)
+        self._job_rows[w._job_id] = w
 
         item.setSizeHint(QSize(w.sizeHint().width(), 100))
         self.downloads_list.insertItem(0, item)
         self.downloads_list.setItemWidget(item, w)
         return item, w
 
-    def _resume_from_row(self, row_widget: QWidget):
-        # Start a new worker resuming the same URL
-        url = getattr(row_widget, "_url", None)
-        quality = getattr(row_widget, "_quality", "best")
-        if not url:
-            return
-        self._set_download_buttons_enabled(False)
-        self.progress.setVisible(True)
-        worker = DownloadWorker(url, Path(self.settings.download_dir), quality)
-        thread = QThread(self)
-        worker.moveToThread(thread)
-        thread.started.connect(worker.run)
-        worker.progressed.connect(self._on_progress)
-        worker.finished.connect(self._on_finished)
-        worker.canceled.connect(self._on_download_canceled)
-        worker.failed.connect(self._on_failed)
-        self._active_thread = thread
-        self._active_worker = worker
-        self._current_row_widget = row_widget
-        self._current_row_item = self.downloads_list.itemAt(0, 0) if False else getattr(self, "_current_row_item", None)
-        thread.start()
-
-    def _replace_downloading_with_final(self, url: str, final_path: Path):
+    def _set_row_state(self, row_widget: QWidget, text: str):
+        lbl = getattr(row_widget, "_state_lbl", None)
+        if lbl is not None:
+            lbl.setText(text)
+
+    def _resume_from_row(self, row_widget: QWidget) -> bool:
+        # Start a new worker for the same URL; yt-dlp continues the .part file
+        # (HTTP Range) or the fragment index instead of starting over
+        if not getattr(row_widget, "_url", None) or row_widget._worker is not None:
+            return False
+        self._launch_download(row_widget)
+        self._status("İndirme devam ediyor...")
+        return True
+
+    def _replace_downloading_with_final(self, row_widget: QWidget, final_path: Path):
         # Replace temp row with a real downloaded item at the same position
-        temp_item = getattr(self, "_current_row_item", None)
-        if temp_item is not None:
-            row = self.downloads_list.row(temp_item)
-            if row >= 0:
-                self.downloads_list.takeItem(row)
-                item = QListWidgetItem()
-                item.setData(Qt.UserRole, {"url": url, "path": str(final_path), "kind": "Video"})
-                w = self._create_download_item_widget(final_path)
-                item.setSizeHint(w.sizeHint())
-                self.downloads_list.insertItem(row, item)
-                self.downloads_list.setItemWidget(item, w)
-                return
+        url = row_widget._url
+        self._job_rows.pop(getattr(row_widget, "_job_id", None), None)
+        self._sidecars.refresh(final_path)  # thumbnail/subtitles written by yt-dlp
+        row = self.downloads_list.row(row_widget._item)
+        if row >= 0:
+            self.downloads_list.takeItem(row)
+            item = QListWidgetItem()
+            item.setData(Qt.UserRole, {"url": url, "path": str(final_path), "kind": "Video"})
+            w = self._create_download_item_widget(final_path)
+            item.setSizeHint(QSize(w.sizeHint().width(), 110))
+            self.downloads_list.insertItem(row, item)
+            self.downloads_list.setItemWidget(item, w)
+            if self._is_video_file(final_path):
+                # Build the hover strip now so the first hover needs no ffmpeg run
+                self._preview_loader.request(str(final_path), always=True)
+            return
         # fallback add to end
         self._add_download_item(url, str(final_path))
 
     def _on_download_canceled(self):
         # Called when worker canceled (pause or stop)
-        try:
-            t = getattr(self, "_active_thread", None)
-            if t is not None:
-                t.quit(); t.wait()
-        except Exception:
-            pass
-        self._active_thread = None
-        self._active_worker = None
-        self._set_download_buttons_enabled(True)
-        self.progress.setVisible(False)
-        rw = getattr(self, "_current_row_widget", None)
+        worker = self.sender()
+        partial = list(getattr(worker, "partial_files", []) or [])
+        rw = self._end_download_job()
         if rw is None:
             return
         # determine intent
         if getattr(rw, "_stop_requested", False):
-            # remove row
-            try:
-                it = getattr(self, "_current_row_item", None)
-                if it is not None:
-                    idx = self.downloads_list.row(it)
-                    if idx >= 0:
-                        self.downloads_list.takeItem(idx)
-            except Exception:
-                pass
+            # remove row and the data it could have resumed from
+            downloader.discard_partial(partial)
+            self._jobs.update(rw._job_id, state=control.CANCELED)
+            self._settle_subscription_entry(rw._job_id)
+            self._remove_row(rw)
             self._status("İndirme iptal edildi")
         else:
-            # mark paused, swap button to 'play'
+            # mark paused, swap button to 'play'; keep .part/.ytdl for resume
             rw._paused = True
             rw._pause_requested = False
+            for pf in partial:
+                if pf not in rw._partial_files:
+                    rw._partial_files.append(pf)
             try:
                 rw._btn_pause.setIcon(self._icon("play"))
                 rw._btn_pause.setToolTip("Devam")
             except Exception:
                 pass
+            self._set_row_state(rw, "Durduruldu")
+            self._jobs.update(rw._job_id, state=control.PAUSED)
             self._status("İndirme durduruldu (devam edilebilir)")
 
     def _attach_hover_behavior(self, row_widget: QWidget) -> None:
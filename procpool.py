@@ -0,0 +1,427 @@
+from __future__ import annotations
+
+import itertools
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    import downloader
+    import scheduler
+except Exception:
+    from . import downloader
+    from . import scheduler
+
+
+# How often the parent looks at the cancel flags of its jobs
+CANCEL_POLL = 0.1
+
+
+class JobFailed(Exception):
+    """A download failed inside its worker process (message from there)."""
+
+
+class WorkerCrashed(Exception):
+    """The worker process running a job exited before reporting a result."""
+
+
+# ---------------------------------------------------------------------------
+# Worker process side
+#
+# Parent -> worker: ("job", id, kwargs), ("cancel", id, None), ("stop", None, None)
+# Worker -> parent: (id, kind, payload) with kind one of progress, plan,
+# fetched, done, held, interrupted, error. Progress is
+# (status, downloaded, total, filename, new partial paths) and is sent only
+# when the whole percent or the partial files change.
+# ---------------------------------------------------------------------------
+
+def _serve(conn, postprocess_slots: int) -> None:
+    """Worker process main loop: runs the jobs it is sent, several at a time.
+
+    Each job's network phase runs in its own thread; finished downloads go
+    to a local post-processing pool, like :class:`downloader.Pipeline`.
+    Warm yt-dlp sessions (see :mod:`sessions`) live as long as the process.
+    """
+    send_lock = threading.Lock()
+
+    def send(job_id: int, kind: str, payload: Any) -> None:
+        with send_lock:
+            try:
+                conn.send((job_id, kind, payload))
+            except (OSError, ValueError):
+                pass  # parent is gone
+
+    post = ThreadPoolExecutor(max(1, postprocess_slots), thread_name_prefix="dl-post")
+    cancels: Dict[int, threading.Event] = {}
+    threads: List[threading.Thread] = []
+    while True:
+        try:
+            op, job_id, payload = conn.recv()
+        except (EOFError, OSError):
+            # Parent died: stop downloading, keep what is on disk for a resume
+            for ev in cancels.values():
+                ev.set()
+            break
+        if op == "job":
+            threads = [t for t in threads if t.is_alive()]
+            cancels[job_id] = threading.Event()
+            t = threading.Thread(target=_run_job, args=(job_id, payload, cancels[job_id], send, post),
+                                 name=f"dl-job-{job_id}", daemon=True)
+            t.start()
+            threads.append(t)
+        elif op == "cancel" and job_id in cancels:
+            cancels[job_id].set()
+        elif op == "stop":
+            break
+    for t in threads:
+        t.join()
+    post.shutdown(wait=True)
+
+
+def _failure(e: BaseException) -> tuple:
+    if isinstance(e, downloader.AlreadyHeld):
+        return "held", str(e.path)
+    if isinstance(e, downloader.DownloadInterrupted):
+        return "interrupted", None
+    return "error", str(e) or type(e).__name__
+
+
+def _run_job(job_id: int, args: Dict[str, Any], cancel: threading.Event,
+             send: Callable[[int, str, Any], None], post: ThreadPoolExecutor) -> None:
+    known: set = set()
+    last = [None]
+
+    def hook(d: Dict[str, Any]) -> None:
+        status = d.get("status")
+        new = []
+        if status == "downloading":
+            new = [str(p) for p in downloader.partial_files(d) if str(p) not in known]
+            known.update(new)
+        total = d.get("total_bytes") or d.get("total_bytes_estimate")
+        done = d.get("downloaded_bytes")
+        percent = int(100 * done / total) if total and done is not None else None
+        if status == "downloading" and not new and percent == last[0]:
+            return
+        last[0] = percent
+        send(job_id, "progress", (status, done, total, d.get("filename"), new))
+
+    url = args.pop("url")
+    prefetched = args.pop("prefetched", None)
+    if prefetched is not None:
+        downloader.info_cache().put(url, prefetched)
+    try:
+        job = downloader.fetch(
+            url, progress_hook=hook, cancel_check=cancel.is_set,
+            on_plan=lambda plan: send(job_id, "plan", plan.describe()), **args,
+        )
+    except BaseException as e:
+        send(job_id, *_failure(e))
+        return
+    send(job_id, "fetched", None)
+
+    def finish() -> None:
+        try:
+            send(job_id, "done", job.run())
+        except BaseException as e:
+            send(job_id, *_failure(e))
+
+    post.submit(finish)
+
+
+# ---------------------------------------------------------------------------
+# GUI process side
+# ---------------------------------------------------------------------------
+
+class _Plan:
+    """Stands in for the FormatPlan picked in the worker: only its summary travels."""
+
+    def __init__(self, text: str):
+        self.text = text
+
+    def describe(self) -> str:
+        return self.text
+
+
+class _Job:
+    __slots__ = ("id", "args", "result", "progress_hook", "cancel_check", "on_fetched",
+                 "on_plan", "partials", "cancel_sent", "fetched", "site")
+
+    def __init__(self, job_id: int, args: Dict[str, Any], progress_hook, cancel_check, on_fetched, on_plan):
+        self.id = job_id
+        self.args = args
+        self.result: "Future[Optional[str]]" = Future()
+        self.result.set_running_or_notify_cancel()
+        self.progress_hook = progress_hook
+        self.cancel_check = cancel_check
+        self.on_fetched = on_fetched
+        self.on_plan = on_plan
+        self.partials: List[Path] = []
+        self.cancel_sent = False
+        self.fetched = False
+        self.site: Optional[str] = None  # scheduler key while in the network phase
+
+
+class _Worker:
+    def __init__(self, postprocess_slots: int):
+        ctx = multiprocessing.get_context("spawn")
+        self.conn, child = ctx.Pipe()
+        # Daemon: closing the app ends downloads the same way as with threads;
+        # parts and fragment caches stay for a resume
+        self.proc = ctx.Process(target=_serve, args=(child, postprocess_slots), name="dl-worker", daemon=True)
+        self.proc.start()
+        child.close()
+        self.jobs: Dict[int, _Job] = {}
+        self.net_job: Optional[int] = None  # job in its network phase
+        self.stopping = False
+        self._send_lock = threading.Lock()
+
+    def send(self, op: str, job_id: Optional[int], payload: Any) -> None:
+        with self._send_lock:
+            self.conn.send((op, job_id, payload))
+
+
+class ProcessPipeline:
+    """:class:`downloader.Pipeline` with each job running in a worker process.
+
+    yt-dlp's extraction, hooks and fragment bookkeeping then use other
+    cores instead of sharing the GUI process's GIL, and an extractor that
+    crashes the interpreter only fails the jobs of its own process (which
+    is replaced). There is one process per network slot. A process takes
+    its next URL once the current one reaches post-processing, which
+    continues in that process. Progress comes back over a pipe as small
+    tuples, at most one per whole percent.
+    """
+
+    def __init__(self, network_slots: int = 2, postprocess_slots: int = 0):
+        self.network_slots = max(1, int(network_slots))
+        self.postprocess_slots = int(postprocess_slots) or downloader._default_postprocess_slots()
+        self._per_worker_post = -(-self.postprocess_slots // self.network_slots)
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._pending = scheduler.HostQueue()
+        self._timer: Optional[threading.Timer] = None
+        self._workers: List[_Worker] = []
+        self._closing = False
+        self._poller: Optional[threading.Thread] = None
+
+    def submit(
+        self,
+        url: str,
+        download_dir: Path,
+        quality: str,
+        progress_hook: Optional[downloader.ProgressHook] = None,
+        cancel_check: Optional[downloader.CancelCheck] = None,
+        skip_held: bool = False,
+        on_fetched: Optional[Callable[[], None]] = None,
+        on_plan: Optional[downloader.PlanCallback] = None,
+        connections: int = 1,
+        staging_dir: Optional[Path] = None,
+        priority: str = scheduler.NORMAL,
+    ) -> "Future[Optional[str]]":
+        args = {
+            "url": url, "download_dir": download_dir, "quality": quality, "skip_held": skip_held,
+            "connections": connections, "staging_dir": staging_dir,
+            # Extraction done here while the URL was typed; saves the worker a round-trip
+            "prefetched": downloader.info_cache().get_copy(url),
+        }
+        with self._lock:
+            job = _Job(next(self._ids), args, progress_hook, cancel_check, on_fetched, on_plan)
+            on_state = None
+            if progress_hook is not None:
+                on_state = lambda text: progress_hook({"status": "queued", "reason": text})
+            self._pending.push(job, url, priority, on_state)
+            if self._poller is None:
+                self._poller = threading.Thread(target=self._poll_cancels, name="dl-cancel", daemon=True)
+                self._poller.start()
+        self._dispatch()
+        return job.result
+
+    def set_site_limits(self, per_host: int, interval: float) -> None:
+        with self._lock:
+            self._pending.per_host = max(1, int(per_host))
+            self._pending.interval = max(0.0, float(interval))
+        self._dispatch()
+
+    def shutdown(self) -> None:
+        # Queued and running jobs still finish; idle workers exit afterwards
+        with self._lock:
+            self._closing = True
+        self._dispatch()
+
+    # -- scheduling -------------------------------------------------------
+
+    def _dispatch(self) -> None:
+        starts = []
+        stops = []
+        with self._lock:
+            while len(self._pending):
+                w = next((w for w in self._workers if w.net_job is None and not w.stopping), None)
+                if w is None and len(self._workers) >= self.network_slots:
+                    break
+                nxt = self._pending.pop()
+                if nxt is None:
+                    break
+                job, job.site = nxt
+                if w is None:
+                    w = self._spawn()
+                w.jobs[job.id] = job
+                w.net_job = job.id
+                starts.append((w, job))
+            notes = self._pending.notes()
+            idle = any(w.net_job is None and not w.stopping for w in self._workers) or len(self._workers) < self.network_slots
+            delay = self._pending.delay() if idle else None
+            if delay is not None and self._timer is None:
+                # A slot is free but the next job's site is still pacing
+                self._timer = threading.Timer(delay, self._wake)
+                self._timer.daemon = True
+                self._timer.start()
+            if self._closing and not len(self._pending):
+                for w in self._workers:
+                    if not w.jobs and not w.stopping:
+                        w.stopping = True
+                        stops.append(w)
+        for w, job in starts:
+            self._start(w, job)
+        for w in stops:
+            try:
+                w.send("stop", None, None)
+            except OSError:
+                pass
+        for on_state, text in notes:
+            try:
+                on_state(text)
+            except Exception:
+                pass
+
+    def _wake(self) -> None:
+        with self._lock:
+            self._timer = None
+        self._dispatch()
+
+    def _left_network(self, job: _Job, throttled: bool = False) -> None:
+        # Call with the lock held; frees the job's place in its site's limit
+        if job.site is not None:
+            self._pending.done(job.site, throttled)
+            job.site = None
+
+    def _spawn(self) -> _Worker:
+        w = _Worker(self._per_worker_post)
+        self._workers.append(w)
+        threading.Thread(target=self._read, args=(w,), name="dl-worker-reader", daemon=True).start()
+        return w
+
+    def _start(self, w: _Worker, job: _Job) -> None:
+        try:
+            w.send("job", job.id, job.args)
+        except OSError:
+            pass  # worker died; its reader fails the job
+        except Exception:
+            # Unpicklable prefetched info (extractor objects): extract again there
+            job.args["prefetched"] = None
+            try:
+                w.send("job", job.id, job.args)
+            except OSError:
+                pass
+
+    def _poll_cancels(self) -> None:
+        while True:
+            time.sleep(CANCEL_POLL)
+            canceled: List[_Job] = []
+            sends = []
+            with self._lock:
+                if not len(self._pending) and not any(w.jobs for w in self._workers):
+                    self._poller = None  # the next submit starts a new one
+                    return
+                canceled = self._pending.remove(lambda job: job.cancel_check is not None and job.cancel_check())
+                for w in self._workers:
+                    for job in w.jobs.values():
+                        if not job.fetched and not job.cancel_sent and job.cancel_check is not None and job.cancel_check():
+                            job.cancel_sent = True
+                            sends.append((w, job.id))
+            for job in canceled:
+                job.result.set_exception(downloader.DownloadInterrupted())
+            for w, job_id in sends:
+                try:
+                    w.send("cancel", job_id, None)
+                except OSError:
+                    pass
+
+    # -- messages from a worker -------------------------------------------
+
+    def _read(self, w: _Worker) -> None:
+        while True:
+            try:
+                job_id, kind, payload = w.conn.recv()
+            except (EOFError, OSError):
+                break
+            with self._lock:
+                job = w.jobs.get(job_id)
+            if job is None:
+                continue
+            try:
+                self._handle(w, job, kind, payload)
+            except Exception:
+                pass  # a failing callback must not stop the relay
+        self._worker_exited(w)
+
+    def _handle(self, w: _Worker, job: _Job, kind: str, payload: Any) -> None:
+        if kind == "progress":
+            status, done, total, filename, new = payload
+            job.partials.extend(Path(p) for p in new)
+            if job.progress_hook is not None:
+                job.progress_hook({
+                    "status": status, "downloaded_bytes": done, "total_bytes": total,
+                    "filename": filename, "partial_files": list(job.partials),
+                })
+        elif kind == "plan":
+            if job.on_plan is not None:
+                job.on_plan(_Plan(payload))
+        elif kind == "fetched":
+            job.fetched = True
+            self._network_done(w, job)
+            if job.on_fetched is not None:
+                job.on_fetched()
+        else:
+            self._finish(w, job, throttled=(kind == "error" and scheduler.is_throttled(payload)))
+            if kind == "done":
+                job.result.set_result(payload)
+            elif kind == "held":
+                job.result.set_exception(downloader.AlreadyHeld(Path(payload)))
+            elif kind == "interrupted":
+                job.result.set_exception(downloader.DownloadInterrupted())
+            else:
+                job.result.set_exception(JobFailed(payload))
+
+    def _network_done(self, w: _Worker, job: _Job) -> None:
+        with self._lock:
+            if w.net_job == job.id:
+                w.net_job = None
+            self._left_network(job)
+        self._dispatch()
+
+    def _finish(self, w: _Worker, job: _Job, throttled: bool = False) -> None:
+        with self._lock:
+            w.jobs.pop(job.id, None)
+            if w.net_job == job.id:
+                w.net_job = None
+            self._left_network(job, throttled)
+        self._dispatch()
+
+    def _worker_exited(self, w: _Worker) -> None:
+        w.proc.join(5)
+        code = w.proc.exitcode
+        with self._lock:
+            if w in self._workers:
+                self._workers.remove(w)
+            orphans = list(w.jobs.values())
+            w.jobs.clear()
+            for job in orphans:
+                self._left_network(job)
+        w.conn.close()
+        for job in orphans:
+            job.result.set_exception(WorkerCrashed(f"download worker process exited unexpectedly (exit code {code})"))
+        # Queued jobs get a fresh process
+        self._dispatch()
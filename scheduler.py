@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import itertools
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+try:
+    import sessions
+except Exception:
+    from . import sessions
+
+
+# Job priorities, most urgent first
+HIGH = "high"  # a URL entered by hand
+NORMAL = "normal"
+BULK = "bulk"  # bulk submits and backfills
+PRIORITIES = (HIGH, NORMAL, BULK)
+_RANK = {p: i for i, p in enumerate(PRIORITIES)}
+
+# Jobs in their network phase at once per site
+PER_HOST = 2
+# Seconds between two job starts on one site
+MIN_INTERVAL = 1.0
+# A throttled job (HTTP 429) doubles its site's interval, up to this
+MAX_INTERVAL = 60.0
+# Seconds of waiting worth one priority level, so bulk jobs still get their turn
+AGING = 60.0
+
+StateCallback = Callable[[str], None]
+
+
+def site(url: str) -> Tuple[str, str]:
+    """(scheduling key, display name) of the site serving ``url``.
+
+    The key is the extractor, so one site's hosts (youtu.be, youtube.com)
+    share a cap; direct links to unknown sites are keyed by host name.
+    """
+    host = (urlsplit(url).hostname or "").lower()
+    ie = sessions.extractor_key(url)
+    label = host[4:] if host.startswith("www.") else host
+    return (ie if ie != "Generic" else host), (label or ie)
+
+
+def urgency(priority: str, waited: float, aging: float = AGING) -> float:
+    """Priority rank minus one level per ``aging`` seconds waited (lower runs first)."""
+    return _RANK.get(priority, _RANK[NORMAL]) - waited / aging
+
+
+def is_throttled(error: Any) -> bool:
+    text = str(error)
+    return "429" in text or "Too Many Requests" in text
+
+
+class _Entry:
+    __slots__ = ("item", "key", "label", "priority", "queued", "seq", "on_state", "note")
+
+    def __init__(self, item: Any, key: str, label: str, priority: str, seq: int,
+                 on_state: Optional[StateCallback]):
+        self.item = item
+        self.key = key
+        self.label = label
+        self.priority = priority
+        self.queued = time.monotonic()
+        self.seq = seq
+        self.on_state = on_state
+        self.note = ""
+
+
+class HostQueue:
+    """Queued network-phase jobs, started by priority within per-site limits.
+
+    :meth:`pop` returns the most urgent job whose site is below
+    ``per_host`` running jobs and past its pacing interval. Urgency is the
+    priority rank minus one level per ``aging`` seconds waited (:func:`urgency`).
+
+    Not thread-safe: a pipeline calls it under its own lock and runs the
+    callbacks from :meth:`notes` after releasing it.
+    """
+
+    def __init__(self, per_host: int = PER_HOST, interval: float = MIN_INTERVAL, aging: float = AGING):
+        self.per_host = max(1, int(per_host))
+        self.interval = max(0.0, float(interval))
+        self.aging = aging
+        self._entries: List[_Entry] = []
+        self._seq = itertools.count()
+        self._running: Dict[str, int] = {}
+        self._next_start: Dict[str, float] = {}
+        self._backoff: Dict[str, float] = {}  # site -> interval after throttling
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def push(self, item: Any, url: str, priority: str = NORMAL,
+             on_state: Optional[StateCallback] = None) -> None:
+        key, label = site(url)
+        self._entries.append(_Entry(item, key, label, priority, next(self._seq), on_state))
+
+    def _urgency(self, e: _Entry, now: float) -> Tuple[float, int]:
+        return urgency(e.priority, now - e.queued, self.aging), e.seq
+
+    def _full(self, key: str) -> bool:
+        return self._running.get(key, 0) >= self.per_host
+
+    def pop(self) -> Optional[Tuple[Any, str]]:
+        """(item, site key) of the next job to start, None if none may start now."""
+        now = time.monotonic()
+        ready = [e for e in self._entries if not self._full(e.key) and self._next_start.get(e.key, 0.0) <= now]
+        if not ready:
+            return None
+        e = min(ready, key=lambda e: self._urgency(e, now))
+        self._entries.remove(e)
+        self._running[e.key] = self._running.get(e.key, 0) + 1
+        self._next_start[e.key] = now + self._backoff.get(e.key, self.interval)
+        return e.item, e.key
+
+    def done(self, key: str, throttled: bool = False) -> None:
+        """A job popped for ``key`` left its network phase."""
+        n = self._running.get(key, 0) - 1
+        if n > 0:
+            self._running[key] = n
+        else:
+            self._running.pop(key, None)
+        if throttled:
+            step = min(MAX_INTERVAL, 2 * max(self._backoff.get(key, self.interval), 1.0))
+            self._backoff[key] = step
+            self._next_start[key] = max(self._next_start.get(key, 0.0), time.monotonic() + step)
+        else:
+            self._backoff.pop(key, None)
+
+    def remove(self, pred: Callable[[Any], bool]) -> List[Any]:
+        """Drop and return the queued items matching ``pred``."""
+        gone = [e for e in self._entries if pred(e.item)]
+        for e in gone:
+            self._entries.remove(e)
+        return [e.item for e in gone]
+
+    def delay(self) -> Optional[float]:
+        """Seconds until a job held back only by pacing may start."""
+        now = time.monotonic()
+        waits = [self._next_start.get(e.key, 0.0) - now for e in self._entries if not self._full(e.key)]
+        waits = [w for w in waits if w > 0]
+        return min(waits) if waits else None
+
+    def notes(self) -> List[Tuple[StateCallback, str]]:
+        """(callback, text) for each queued job whose reason for waiting changed."""
+        now = time.monotonic()
+        out = []
+        for pos, e in enumerate(sorted(self._entries, key=lambda e: self._urgency(e, now)), 1):
+            if self._full(e.key):
+                note = f"Sırada · {e.label} sınırı ({self._running[e.key]}/{self.per_host})"
+            elif self._next_start.get(e.key, 0.0) > now:
+                note = f"Sırada · {e.label} için aralık bekleniyor"
+            else:
+                note = f"Sırada ({pos}.)"
+            if note != e.note and e.on_state is not None:
+                e.note = note
+                out.append((e.on_state, note))
+        return out
@@ -0,0 +1,334 @@
+from __future__ import annotations
+
+import json
+import os
+import re
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from yt_dlp.downloader.common import FileDownloader
+from yt_dlp.downloader.http import HttpFD
+from yt_dlp.networking import Request
+from yt_dlp.utils import DownloadError, determine_protocol
+from yt_dlp.utils.networking import HTTPHeaderDict
+
+
+# Ranges are never split below this; smaller files use yt-dlp's HttpFD
+MIN_SEGMENT = 1024 * 1024
+READ_SIZE = 256 * 1024
+STATE_SUFFIX = ".segs"
+# Attempts per range request when the job sets no "retries"
+RANGE_RETRIES = 3
+PROGRESS_INTERVAL = 0.25
+STATE_INTERVAL = 1.0
+
+_CONTENT_RANGE_RE = re.compile(r"bytes\s+(\d+)-(\d+)/(\d+)")
+
+
+def suitable(info: Dict[str, Any], params: Dict[str, Any]) -> bool:
+    """Whether ``info`` is a single-file HTTP format worth splitting."""
+    if int(params.get("segmented_connections") or 1) < 2:
+        return False
+    if params.get("external_downloader") or info.get("is_live") or info.get("request_data"):
+        return False
+    return determine_protocol(info) in ("http", "https")
+
+
+def state_path(tmpfilename: str) -> str:
+    return tmpfilename + STATE_SUFFIX
+
+
+class _Range:
+    __slots__ = ("pos", "end")
+
+    def __init__(self, pos: int, end: int):
+        self.pos = pos  # next byte to write
+        self.end = end  # exclusive; lowered when the tail is handed to another connection
+
+    @property
+    def left(self) -> int:
+        return self.end - self.pos
+
+
+class SegmentedHttpFD(FileDownloader):
+    """Downloads one progressive HTTP file over several connections.
+
+    The file is preallocated and each connection writes its byte range in
+    place. A connection that runs out of work takes the second half of the
+    range with the most bytes left, so one throttled connection does not
+    hold up the end of the download. Progress per range is kept in
+    ``<tmpfile>.segs`` so an interrupted download resumes where each range
+    stopped. Requests go through ``ydl.urlopen`` (cookies, proxy,
+    impersonation); servers without range support fall back to HttpFD.
+    """
+
+    FD_NAME = "segmented"
+
+    def real_download(self, filename, info_dict):
+        url = info_dict["url"]
+        headers = HTTPHeaderDict({"Accept-Encoding": "identity"}, info_dict.get("http_headers"))
+        conns = max(2, int(self.params.get("segmented_connections") or 2))
+        chunk = int(
+            self.params.get("http_chunk_size")
+            or (info_dict.get("downloader_options") or {}).get("http_chunk_size")
+            or 0
+        )
+        total = self._probe_size(url, headers)
+        if not total or total < 2 * MIN_SEGMENT:
+            return self._fallback(filename, info_dict)
+
+        tmp = self.temp_name(filename)
+        self.report_destination(filename)
+        resume = self.params.get("continuedl", True)
+        ranges = self._load_state(tmp, total) if resume else None
+        fresh = ranges is None
+        if fresh:
+            # A .part without state was written front to back (HttpFD): its
+            # bytes are one finished range at the start of the file
+            have = _leading_bytes(tmp, total) if resume else 0
+            if have:
+                self.report_resuming_byte(have)
+            _preallocate(tmp, total, keep=have)
+            step = -(-(total - have) // conns)
+            ranges = [_Range(s, min(total, s + step)) for s in range(have, total, step)]
+
+        job = _Job(self, url, headers, tmp, ranges, chunk)
+        if fresh:
+            # From now on the file is full-size, so only the state tells what is written
+            job.save_state(total)
+        start = time.time()
+        base = sum(r.left for r in ranges)
+        job.resumed = resumed = total - base
+        last_state = start
+        job.start(conns)
+        try:
+            while not job.wait(PROGRESS_INTERVAL):
+                now = time.time()
+                done = job.downloaded()
+                got = done - resumed
+                self._hook_progress({
+                    "status": "downloading",
+                    "downloaded_bytes": done,
+                    "total_bytes": total,
+                    # Bytes from offset 0 that are all written (hashing reads only these)
+                    "contiguous_bytes": job.contiguous(total),
+                    "tmpfilename": tmp,
+                    "filename": filename,
+                    "speed": self.calc_speed(start, now, got),
+                    "eta": self.calc_eta(start, now, base, got),
+                    "elapsed": now - start,
+                }, info_dict)
+                if now - last_state >= STATE_INTERVAL:
+                    job.save_state(total)
+                    last_state = now
+        except BaseException:
+            # Cancel from the progress hook, or anything else: keep what was fetched
+            job.stop()
+            job.save_state(total)
+            raise
+        if job.error is not None:
+            job.save_state(total)
+            raise DownloadError(f"Segmented download failed: {job.error}")
+
+        try:
+            os.remove(state_path(tmp))
+        except OSError:
+            pass
+        self.try_rename(tmp, filename)
+        self._hook_progress({
+            "status": "finished",
+            "downloaded_bytes": total,
+            "total_bytes": total,
+            "filename": filename,
+            "tmpfilename": tmp,
+            "elapsed": time.time() - start,
+        }, info_dict)
+        return True
+
+    def _fallback(self, filename, info_dict):
+        fd = HttpFD(self.ydl, self.params)
+        for ph in self._progress_hooks:
+            fd.add_progress_hook(ph)
+        return fd.real_download(filename, info_dict)
+
+    def _probe_size(self, url: str, headers: HTTPHeaderDict) -> Optional[int]:
+        # A one-byte range request: 206 + Content-Range means ranges work
+        try:
+            resp = self.ydl.urlopen(Request(url, headers={**headers, "Range": "bytes=0-0"}))
+        except Exception:
+            return None
+        try:
+            if resp.status != 206:
+                return None
+            m = _CONTENT_RANGE_RE.match(resp.headers.get("Content-Range") or "")
+            return int(m.group(3)) if m else None
+        finally:
+            resp.close()
+
+    def _load_state(self, tmp: str, total: int) -> Optional[List[_Range]]:
+        try:
+            data = json.loads(open(state_path(tmp), encoding="utf-8").read())
+            if data.get("total") != total or os.path.getsize(tmp) != total:
+                return None
+            ranges = [_Range(int(p), int(e)) for p, e in data["ranges"]]
+        except Exception:
+            return None
+        self.report_resuming_byte(total - sum(r.left for r in ranges))
+        return [r for r in ranges if r.left > 0] or [_Range(total, total)]
+
+
+def _leading_bytes(tmp: str, total: int) -> int:
+    # Size of a sequentially written .part; a full-size file without state
+    # may be a preallocated one, so it does not count
+    try:
+        size = os.path.getsize(tmp)
+    except OSError:
+        return 0
+    return size if size < total else 0
+
+
+def _preallocate(path: str, size: int, keep: int = 0) -> None:
+    # Keeps the first ``keep`` bytes of an existing file
+    with open(path, "r+b" if keep else "wb") as f:
+        f.truncate(size)
+        if hasattr(os, "posix_fallocate"):
+            try:
+                os.posix_fallocate(f.fileno(), 0, size)
+            except OSError:
+                pass  # e.g. unsupported by the filesystem; the sparse file still works
+
+
+class _Job:
+    """Connections, their ranges and the shared output file of one download."""
+
+    def __init__(self, fd: SegmentedHttpFD, url: str, headers: HTTPHeaderDict,
+                 tmp: str, ranges: List[_Range], chunk: int):
+        self.fd = fd
+        self.url = url
+        self.headers = headers
+        self.tmp = tmp
+        self.chunk = chunk
+        self.ranges = ranges  # every range, including finished ones
+        self._pending = list(ranges)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+        self._file = open(tmp, "r+b")
+        self.error: Optional[BaseException] = None
+        self.resumed = 0  # bytes already on disk when the job started
+        self.written = 0
+
+    def start(self, conns: int) -> None:
+        for i in range(conns):
+            t = threading.Thread(target=self._worker, name=f"segment-{i}", daemon=True)
+            t.start()
+            self._threads.append(t)
+
+    def wait(self, timeout: float) -> bool:
+        """True once every connection has finished (or failed)."""
+        deadline = time.monotonic() + timeout
+        for t in self._threads:
+            t.join(max(0.0, deadline - time.monotonic()))
+        if any(t.is_alive() for t in self._threads):
+            return False
+        self._file.close()
+        return True
+
+    def stop(self) -> None:
+        self._stop.set()
+        for t in self._threads:
+            t.join()
+        self._file.close()
+
+    def downloaded(self) -> int:
+        with self._lock:
+            return self.resumed + self.written
+
+    def contiguous(self, total: int) -> int:
+        with self._lock:
+            return min((r.pos for r in self.ranges if r.left > 0), default=total)
+
+    def save_state(self, total: int) -> None:
+        with self._lock:
+            data = {"total": total, "ranges": [[r.pos, r.end] for r in self.ranges if r.left > 0]}
+        try:
+            path = state_path(self.tmp)
+            with open(path + ".tmp", "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(path + ".tmp", path)
+        except OSError:
+            pass
+
+    def _next(self) -> Optional[_Range]:
+        with self._lock:
+            if self._pending:
+                return self._pending.pop(0)
+            # Steal the tail of the range with the most bytes left
+            busy = max(self.ranges, key=lambda r: r.left, default=None)
+            if busy is None or busy.left < 2 * MIN_SEGMENT:
+                return None
+            mid = busy.pos + busy.left // 2
+            tail = _Range(mid, busy.end)
+            busy.end = mid
+            self.ranges.append(tail)
+            return tail
+
+    def _worker(self) -> None:
+        while not self._stop.is_set():
+            r = self._next()
+            if r is None:
+                return
+            try:
+                self._fetch(r)
+            except BaseException as e:
+                with self._lock:
+                    if self.error is None:
+                        self.error = e
+                self._stop.set()
+                return
+
+    def _fetch(self, r: _Range) -> None:
+        attempt = 0
+        while r.left > 0 and not self._stop.is_set():
+            before = r.pos
+            end = r.end if not self.chunk else min(r.end, r.pos + self.chunk)
+            hdrs = {**self.headers, "Range": f"bytes={r.pos}-{end - 1}"}
+            try:
+                resp = self.fd.ydl.urlopen(Request(self.url, headers=hdrs))
+                try:
+                    if resp.status != 206:
+                        raise DownloadError(f"range request answered with HTTP {resp.status}")
+                    while not self._stop.is_set():
+                        data = resp.read(READ_SIZE)
+                        if not data:
+                            break
+                        with self._lock:
+                            # The tail may have been handed to another connection meanwhile
+                            n = min(len(data), r.end - r.pos)
+                            self._file.seek(r.pos)
+                            self._file.write(data[:n])
+                            r.pos += n
+                            self.written += n
+                        if r.left <= 0 or r.pos >= end:
+                            break
+                finally:
+                    resp.close()
+                if r.pos > before or r.left <= 0:
+                    attempt = 0
+                    continue
+                err: Exception = DownloadError("connection closed before any data")
+            except DownloadError:
+                raise
+            except Exception as e:
+                err = e
+            if self._stop.is_set():
+                return
+            attempt += 1
+            retries = self.fd.params.get("retries", RANGE_RETRIES)
+            if attempt > retries:
+                raise err
+            # Sleeps with the configured backoff (retry_sleep_functions["http"])
+            self.fd.report_retry(err, attempt, retries)
+            if not (self.fd.params.get("retry_sleep_functions") or {}).get("http"):
+                time.sleep(min(4.0, 0.5 * attempt))
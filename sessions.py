@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import atexit
+import threading
+import time
+from functools import lru_cache
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+
+from yt_dlp import YoutubeDL
+
+
+# Warm sessions are closed after this many seconds without a job
+IDLE_TTL = 300.0
+# Idle sessions kept per (extractor, profile) key
+MAX_IDLE_PER_KEY = 2
+
+
+@lru_cache(maxsize=1024)
+def extractor_key(url: str) -> str:
+    """yt-dlp extractor that will handle ``url`` (``Generic`` if none)."""
+    from yt_dlp.extractor import gen_extractor_classes
+
+    for ie in gen_extractor_classes():
+        try:
+            if ie.suitable(url) and ie.working():
+                return ie.ie_key()
+        except Exception:
+            continue
+    return "Generic"
+
+
+class SessionPool:
+    """Keeps warm ``YoutubeDL`` instances per (extractor, option profile).
+
+    A session keeps its extractor instances, cookie jar and HTTP handlers
+    between jobs. Sessions are handed out exclusively, so per-job state
+    (hooks, output template, filters) is swapped in by the caller on
+    checkout and never shared with a concurrent job.
+    """
+
+    def __init__(self, idle_ttl: float = IDLE_TTL, max_idle: int = MAX_IDLE_PER_KEY):
+        self.idle_ttl = idle_ttl
+        self.max_idle = max_idle
+        self._lock = threading.Lock()
+        self._idle: Dict[Hashable, List[Tuple[float, YoutubeDL]]] = {}
+        self._keys: Dict[int, Hashable] = {}  # id(session) -> key, for checked-out sessions
+
+    def acquire(self, key: Hashable, factory: Callable[[], YoutubeDL]) -> YoutubeDL:
+        stale: List[YoutubeDL] = []
+        ydl: Optional[YoutubeDL] = None
+        with self._lock:
+            stale = self._sweep_locked()
+            idle = self._idle.get(key)
+            if idle:
+                _, ydl = idle.pop()
+        self._close(stale)
+        if ydl is None:
+            ydl = factory()
+        with self._lock:
+            self._keys[id(ydl)] = key
+        return ydl
+
+    def release(self, ydl: YoutubeDL, reusable: bool = True) -> None:
+        with self._lock:
+            key = self._keys.pop(id(ydl), None)
+            if key is None or not reusable:
+                evict = [ydl]
+            else:
+                idle = self._idle.setdefault(key, [])
+                idle.append((time.monotonic(), ydl))
+                evict = [s for _, s in idle[:-self.max_idle]] if len(idle) > self.max_idle else []
+                del idle[:len(evict)]
+            evict += self._sweep_locked()
+        self._close(evict)
+
+    def close_all(self) -> None:
+        with self._lock:
+            sessions = [s for idle in self._idle.values() for _, s in idle]
+            self._idle.clear()
+        self._close(sessions)
+
+    def _sweep_locked(self) -> List[YoutubeDL]:
+        now = time.monotonic()
+        out: List[YoutubeDL] = []
+        for key in list(self._idle):
+            keep = []
+            for ts, s in self._idle[key]:
+                if now - ts > self.idle_ttl:
+                    out.append(s)
+                else:
+                    keep.append((ts, s))
+            if keep:
+                self._idle[key] = keep
+            else:
+                del self._idle[key]
+        return out
+
+    @staticmethod
+    def _close(sessions: List[YoutubeDL]) -> None:
+        for s in sessions:
+            try:
+                s.close()
+            except Exception:
+                pass
+
+
+_pool: Optional[SessionPool] = None
+_pool_lock = threading.Lock()
+
+
+def pool() -> SessionPool:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = SessionPool()
+            # Flush cookie files and close connections on interpreter exit
+            atexit.register(_pool.close_all)
+        return _pool
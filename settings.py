@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, fields
 from pathlib import Path
 
 
@@ -11,6 +11,37 @@ SETTINGS_FILE = Path(__file__).resolve().parent / "settings.json"
 @dataclass
 class AppSettings:
     download_dir: str
+    # Skip URLs whose video id is already in the download folder
+    skip_held: bool = True
+    # Parallel network downloads / ffmpeg post-processing jobs (0 = CPU cores / 2)
+    max_downloads: int = 2
+    max_postprocess: int = 0
+    # Connections per single-file (progressive) download; 1 = one connection
+    download_connections: int = 4
+    # Run downloads in worker processes instead of threads of the GUI process
+    process_workers: bool = False
+    # Network-phase downloads at once per site, and seconds between their starts
+    per_host_downloads: int = 2
+    host_interval: float = 1.0
+    # Local fast-disk folder for parts, merges and post-processing; empty = off
+    staging_dir: str = ""
+    # Whisper worker processes for long media (0 = CPU cores / 4)
+    stt_workers: int = 0
+    # Whisper accuracy tier and latency target (processing time / audio time);
+    # the model is picked from the benchmark results in whisper_bench.json
+    stt_tier: str = "dengeli"
+    stt_max_rtf: float = 0.5
+    # Transcript language, e.g. "tr"; empty = the video's own language
+    transcript_lang: str = ""
+    # Memory budget for decoded list thumbnails
+    thumb_cache_mb: int = 32
+    # Local HTTP/JSON control API on 127.0.0.1 (0 = off); optional bearer token
+    api_port: int = 0
+    api_token: str = ""
+    # GUI event-loop stalls longer than this are logged with their stack (0 = off)
+    stall_threshold_ms: int = 250
+    # Subscriptions (channels/playlists) are synced this often; 0 = only on demand
+    sync_interval_hours: int = 24
 
     @staticmethod
     def default() -> "AppSettings":
@@ -21,7 +52,8 @@ def load_settings() -> AppSettings:
     try:
         if SETTINGS_FILE.exists():
             data = json.loads(SETTINGS_FILE.read_text(encoding="utf-8"))
-            return AppSettings(**data)
+            known = {f.name for f in fields(AppSettings)}
+            return AppSettings(**{k: v for k, v in data.items() if k in known})
     except Exception:
         pass
     return AppSettings.default()
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+
+# Sidecar kinds of a media file "<stem>.<ext>", by exact file name
+THUMB_EXTS = (".jpg", ".jpeg", ".png", ".webp")
+THUMB = "thumb"
+AUDIO = "audio"  # <stem>.mp3 next to a video
+TRANSCRIPT = "transcript"  # <stem>.transcript.txt
+SUBTITLE = "subtitle"  # <stem>.srt / <stem>.vtt / <stem>.<lang>.vtt
+SIDECAR_KINDS = (THUMB, AUDIO, TRANSCRIPT, SUBTITLE)
+# Media files, so "<stem>.<lang>.vtt" is not taken for a sidecar of <stem>
+# when it belongs to a media file "<stem>.<lang>.*" (e.g. Talk.new.mp4)
+MEDIA_EXTS = (".mp4", ".mkv", ".webm", ".mov", ".avi", ".flv", ".m4v", ".mp3", ".m4a", ".opus", ".ogg", ".wav", ".flac")
+
+# yt-dlp names subtitle files "<stem>.<lang>.<ext>" (en, pt-BR, en-orig, ...)
+_LANG_RE = re.compile(r"^[a-z]{2,3}(?:[-_][A-Za-z0-9]+)*$")
+
+_Key = Tuple[str, str]
+
+
+def classify(name: str) -> List[Tuple[str, str]]:
+    """(stem, kind) pairs ``name`` is a sidecar for; empty for other files."""
+    low = name.lower()
+    if low.endswith(".transcript.txt"):
+        return [(name[: -len(".transcript.txt")], TRANSCRIPT)]
+    base, ext = os.path.splitext(name)
+    ext = ext.lower()
+    if ext == ".mp3":
+        return [(base, AUDIO)]
+    if ext in THUMB_EXTS:
+        if low.endswith(".thumb.jpg"):
+            return [(name[: -len(".thumb.jpg")], THUMB)]
+        return [(base, THUMB)]
+    if ext in (".srt", ".vtt"):
+        out = [(base, SUBTITLE)]
+        stem, lang = os.path.splitext(base)
+        if stem and _LANG_RE.match(lang[1:]):
+            out.append((stem, SUBTITLE))
+        return out
+    return []
+
+
+class SidecarIndex:
+    """In-memory map from (folder, media stem) to the exact sidecar files.
+
+    Built with one directory listing and kept current with ``add`` /
+    ``discard`` as the app writes and deletes files, so lookups never scan
+    the folder. Media file stems are indexed too: a language-tagged
+    subtitle whose full stem is itself a media file belongs to that file
+    only. Thumbnail lookups run on loader threads, hence the lock.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._groups: Dict[_Key, Dict[str, Set[Path]]] = {}
+        self._media: Set[_Key] = set()
+
+    @staticmethod
+    def _key(parent: Path, stem: str) -> _Key:
+        return os.path.normcase(str(parent)), os.path.normcase(stem)
+
+    def scan(self, root: Path) -> List[os.DirEntry]:
+        """Index ``root`` from a single listing; returns its file entries."""
+        try:
+            entries = [e for e in os.scandir(root) if e.is_file()]
+        except OSError:
+            return []
+        root_s = os.path.normcase(str(Path(root)))
+        with self._lock:
+            self._groups = {k: v for k, v in self._groups.items() if k[0] != root_s}
+            self._media = {k for k in self._media if k[0] != root_s}
+            for e in entries:
+                self._add(Path(e.path))
+        return entries
+
+    def _add(self, path: Path) -> None:
+        if path.suffix.lower() in MEDIA_EXTS:
+            self._media.add(self._key(path.parent, path.stem))
+        for stem, kind in classify(path.name):
+            group = self._groups.setdefault(self._key(path.parent, stem), {})
+            group.setdefault(kind, set()).add(path)
+
+    def add(self, path: Path) -> None:
+        with self._lock:
+            self._add(Path(path))
+
+    def discard(self, path: Path) -> None:
+        path = Path(path)
+        with self._lock:
+            if path.suffix.lower() in MEDIA_EXTS:
+                self._media.discard(self._key(path.parent, path.stem))
+            for stem, kind in classify(path.name):
+                group = self._groups.get(self._key(path.parent, stem))
+                if group and kind in group:
+                    group[kind].discard(path)
+
+    def refresh(self, media: Path) -> None:
+        """Pick up sidecars written for ``media`` outside the app's own writes.
+
+        Probes the plain sidecar names only (no listing); language-tagged
+        subtitles are found by the next ``scan``.
+        """
+        media = Path(media)
+        stem, parent = media.stem, media.parent
+        names = [stem + e for e in THUMB_EXTS] + [
+            stem + ".thumb.jpg", stem + ".mp3", stem + ".transcript.txt", stem + ".srt", stem + ".vtt",
+        ]
+        found = [parent / n for n in names if (parent / n).is_file()]
+        with self._lock:
+            if media.suffix.lower() in MEDIA_EXTS:
+                self._media.add(self._key(parent, stem))
+            for p in found:
+                self._add(p)
+
+    def _files(self, media: Path, kind: str) -> List[Path]:
+        media = Path(media)
+        with self._lock:
+            group = self._groups.get(self._key(media.parent, media.stem)) or {}
+            files = [p for p in group.get(kind, ()) if p != media]
+            if kind == SUBTITLE:
+                # "<stem>.<tag>.vtt" with a media file "<stem>.<tag>.*" is that file's
+                files = [p for p in files if os.path.normcase(p.stem) == os.path.normcase(media.stem)
+                         or self._key(p.parent, p.stem) not in self._media]
+            return sorted(files)
+
+    def sidecars(self, media: Path, kinds: Iterable[str] = SIDECAR_KINDS) -> List[Path]:
+        out: List[Path] = []
+        for kind in kinds:
+            out += self._files(media, kind)
+        return out
+
+    def thumbnail(self, media: Path) -> Optional[Path]:
+        # Downloaded thumbnails first, then a frame grabbed by the app
+        thumbs = self._files(media, THUMB)
+        thumbs.sort(key=lambda p: p.name.lower().endswith(".thumb.jpg"))
+        return thumbs[0] if thumbs else None
+
+    def has_transcript(self, media: Path) -> bool:
+        return bool(self._files(media, TRANSCRIPT))
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import os
+import shutil
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from yt_dlp.postprocessor.movefilesafterdownload import MoveFilesAfterDownloadPP
+from yt_dlp.utils import PostProcessingError, make_parent_dirs
+
+
+# Read/write block size for downloads into the staging folder
+STAGING_BUFFER = 1024 * 1024
+PUBLISH_SUFFIX = ".tmp"
+
+
+def staging_paths(download_dir: Path, staging_dir: Optional[Path]) -> Optional[dict]:
+    """yt-dlp ``paths`` for staging in ``staging_dir``; None when staging is off."""
+    if not staging_dir:
+        return None
+    staging_dir = Path(staging_dir)
+    try:
+        if staging_dir.resolve() == Path(download_dir).resolve():
+            return None
+        staging_dir.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        return None
+    return {"home": str(download_dir), "temp": str(staging_dir)}
+
+
+def publish(src: str, dst: str) -> None:
+    """Move a finished file from staging to its final place.
+
+    Same volume: a rename. Otherwise one sequential copy to ``<dst>.tmp``
+    (sendfile where available) and a rename, so the destination share
+    never shows a half-written file under its final name.
+    """
+    try:
+        same_volume = os.stat(src).st_dev == os.stat(os.path.dirname(dst) or ".").st_dev
+    except OSError:
+        same_volume = False
+    if same_volume:
+        os.replace(src, dst)
+        return
+    tmp = dst + PUBLISH_SUFFIX
+    try:
+        shutil.copyfile(src, tmp)
+        shutil.copystat(src, tmp)
+        os.replace(tmp, dst)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+    os.remove(src)
+
+
+class PublishFilesPP(MoveFilesAfterDownloadPP):
+    """MoveFilesAfterDownloadPP that moves with :func:`publish`.
+
+    The moves are recorded in ``moved`` (old, new) so hashes taken while
+    downloading can follow the files.
+    """
+
+    def __init__(self, downloader=None, downloaded=True):
+        super().__init__(downloader, downloaded)
+        self.moved: List[Tuple[str, str]] = []
+
+    def run(self, info):
+        dl_path, dl_name = os.path.split(info["filepath"])
+        finaldir = info.get("__finaldir", dl_path)
+        finalpath = os.path.join(finaldir, dl_name)
+        if self._downloaded:
+            info["__files_to_move"][info["filepath"]] = finalpath
+
+        for oldfile, newfile in info["__files_to_move"].items():
+            if not newfile:
+                newfile = os.path.join(finaldir, os.path.basename(oldfile))
+            if os.path.abspath(oldfile) == os.path.abspath(newfile):
+                continue
+            if not os.path.exists(oldfile):
+                self.report_warning(f'File "{oldfile}" cannot be found')
+                continue
+            if os.path.exists(newfile) and not self.get_param("overwrites", True):
+                self.report_warning(f'Cannot move "{oldfile}" out of the staging folder since "{newfile}" already exists')
+                continue
+            try:
+                make_parent_dirs(newfile)
+            except OSError as e:
+                raise PostProcessingError(f"Unable to create directory: {e}") from e
+            self.to_screen(f'Publishing "{oldfile}" to "{newfile}"')
+            publish(oldfile, newfile)
+            self.moved.append((oldfile, newfile))
+
+        info["filepath"] = finalpath
+        return [], info
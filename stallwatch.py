@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Optional
+
+from PySide6.QtCore import QObject, Qt, QTimer
+
+try:
+    from settings import SETTINGS_FILE
+except Exception:
+    from .settings import SETTINGS_FILE
+
+
+# Stalls (with the GUI thread's stack) go here; profiles to PROFILE_DIR
+STALL_LOG = SETTINGS_FILE.parent / "stalls.log"
+PROFILE_DIR = SETTINGS_FILE.parent / "profiles"
+MAX_LOG_BYTES = 1024 * 1024  # then the log moves to stalls.log.1
+
+HEARTBEAT_MS = 50
+STALL_THRESHOLD = 0.25
+# 200 samples/s; a sample costs a few microseconds per thread
+SAMPLE_INTERVAL = 0.005
+
+
+class StallWatchdog(QObject):
+    """Measures GUI event-loop latency and logs every stall.
+
+    A timer on the GUI thread records a heartbeat every ``HEARTBEAT_MS``. A
+    watcher thread notices when the heartbeat is more than ``threshold``
+    seconds late, takes the GUI thread's Python stack right then (the
+    blocking call is on it) and writes it to ``log_path``; once the loop
+    runs again the stall's total length follows. Create it on the GUI thread.
+    """
+
+    def __init__(self, threshold: float = STALL_THRESHOLD, log_path: Path = STALL_LOG,
+                 parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self.threshold = threshold
+        self.log_path = Path(log_path)
+        self.max_latency = 0.0  # worst heartbeat delay seen, seconds
+        self.stalls = 0
+        self._gui = threading.get_ident()
+        self._last = time.monotonic()
+        self._last_late = 0.0
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.setInterval(HEARTBEAT_MS)
+        self._timer.timeout.connect(self._beat)
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._last = time.monotonic()
+        self._stop = threading.Event()  # the previous watcher may still be waking up
+        self._timer.start()
+        self._thread = threading.Thread(target=self._watch, args=(self._stop,), name="stall-watchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._timer.stop()
+        self._stop.set()
+        self._thread = None
+
+    def _beat(self) -> None:
+        now = time.monotonic()
+        late = max(0.0, now - self._last - HEARTBEAT_MS / 1000)
+        self._last_late = late
+        self._last = now
+        if late > self.max_latency:
+            self.max_latency = late
+
+    def _watch(self, stop: threading.Event) -> None:
+        reported: Optional[float] = None  # heartbeat the current stall started after
+        while not stop.wait(min(0.05, self.threshold / 4)):
+            last = self._last
+            if reported is not None and last != reported:
+                # The loop is back; its first heartbeat measured the whole stall
+                self._write(f"{_stamp()} stall ended after {self._last_late * 1000:.0f} ms\n\n")
+                reported = None
+            blocked = time.monotonic() - last - HEARTBEAT_MS / 1000
+            if reported is None and blocked >= self.threshold:
+                reported = last
+                self.stalls += 1
+                frame = sys._current_frames().get(self._gui)
+                stack = "".join(traceback.format_stack(frame)) if frame is not None else "  (no stack)\n"
+                self._write(f"{_stamp()} GUI thread blocked for {blocked * 1000:.0f} ms so far:\n{stack}")
+
+    def _write(self, text: str) -> None:
+        try:
+            self.log_path.parent.mkdir(parents=True, exist_ok=True)
+            if self.log_path.exists() and self.log_path.stat().st_size > MAX_LOG_BYTES:
+                os.replace(self.log_path, self.log_path.with_name(self.log_path.name + ".1"))
+            with open(self.log_path, "a", encoding="utf-8") as f:
+                f.write(text)
+        except OSError:
+            pass
+
+
+def _stamp() -> str:
+    return time.strftime("%Y-%m-%d %H:%M:%S")
+
+
+class SamplingProfiler:
+    """Wall-clock sampling profiler for every thread of the process.
+
+    A background thread reads all Python stacks every ``interval`` seconds
+    and counts identical ones. :meth:`stop` writes them in the collapsed
+    ("folded") format, one ``thread;outer;...;inner count`` line per stack,
+    which flamegraph.pl, inferno and speedscope read directly. Threads that
+    wait (locks, sockets, the Qt event loop) are sampled too, so the
+    graph shows where each thread spends its time, not only CPU use.
+    """
+
+    def __init__(self, interval: float = SAMPLE_INTERVAL, out_dir: Path = PROFILE_DIR):
+        self.interval = interval
+        self.out_dir = Path(out_dir)
+        self._counts: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._started = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._counts = Counter()
+        self._stop.clear()
+        self._started = time.time()
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> Optional[Path]:
+        """Stop sampling and write the profile; returns its path (None if empty)."""
+        if self._thread is None:
+            return None
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        if not self._counts:
+            return None
+        path = self.out_dir / time.strftime("profile-%Y%m%d-%H%M%S.folded", time.localtime(self._started))
+        lines = []
+        for (thread, codes), n in self._counts.items():
+            frames = [thread] + [_frame_name(c) for c in reversed(codes)]
+            lines.append(f"{';'.join(frames)} {n}\n")
+        try:
+            self.out_dir.mkdir(parents=True, exist_ok=True)
+            path.write_text("".join(sorted(lines)), encoding="utf-8")
+        except OSError:
+            return None
+        return path
+
+    def _run(self) -> None:
+        me = threading.get_ident()
+        counts = self._counts
+        names: Dict[int, str] = {}
+        names_at = 0.0
+        while not self._stop.wait(self.interval):
+            now = time.monotonic()
+            if now - names_at > 1.0:
+                names = {t.ident: t.name for t in threading.enumerate() if t.ident is not None}
+                names_at = now
+            for ident, frame in sys._current_frames().items():
+                if ident == me:
+                    continue
+                # Code objects only; formatted once, at stop()
+                codes = []
+                while frame is not None:
+                    codes.append(frame.f_code)
+                    frame = frame.f_back
+                counts[(names.get(ident, str(ident)), tuple(codes))] += 1
+
+
+def _frame_name(code) -> str:
+    # Function and its first line, so samples anywhere in it share one frame
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})".replace(";", ":")
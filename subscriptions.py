@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass, field, fields
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    from settings import SETTINGS_FILE
+    import downloader
+except Exception:
+    from .settings import SETTINGS_FILE
+    from . import downloader
+
+
+SUBSCRIPTIONS_FILE = SETTINGS_FILE.parent / "subscriptions.json"
+# Entry ids remembered per subscription, newest first (all of them with full_scan)
+MAX_SEEN = 5000
+# A scan ends after this many known entries in a row (pinned or reordered
+# items make the first known entry an unreliable stop)
+STOP_AFTER_KNOWN = 5
+# Entries older than the newest one seen, by more than this, count as known
+CURSOR_SLACK = 2 * 24 * 3600
+# A queued entry whose download fails this often is given up (marked seen)
+MAX_ATTEMPTS = 3
+
+
+@dataclass
+class Subscription:
+    """A channel or playlist mirrored into the download folder.
+
+    ``seen`` holds the entry ids already downloaded (or given up on);
+    ``pending`` maps the ids queued but not finished yet to their URLs,
+    oldest first, so they are queued again after a restart. ``etag`` and
+    ``last_modified`` come from the page's last response and ``cursor``
+    is the newest entry timestamp seen; both let a sync stop early.
+    Listings are assumed to be newest first (channels, upload tabs);
+    ``full_scan`` lists every entry instead, for playlists that grow at
+    the end.
+    """
+    url: str
+    quality: str = "best"
+    seen: List[str] = field(default_factory=list)
+    pending: Dict[str, str] = field(default_factory=dict)
+    failures: Dict[str, int] = field(default_factory=dict)  # pending id -> failed attempts
+    etag: str = ""
+    last_modified: str = ""
+    cursor: float = 0.0
+    full_scan: bool = False
+    last_sync: float = 0.0
+    error: str = ""
+
+
+@dataclass
+class SyncResult:
+    url: str
+    new: List[Tuple[str, str]] = field(default_factory=list)  # (entry URL, entry id), newest first
+    first: bool = False  # the subscription's first sync: a backfill
+    unchanged: bool = False  # 304 from the server, nothing listed
+    etag: str = ""
+    last_modified: str = ""
+    cursor: float = 0.0
+    error: str = ""
+
+
+def _entry_url(entry: Dict[str, Any]) -> Optional[str]:
+    url = entry.get("webpage_url") or entry.get("url")
+    return url if isinstance(url, str) and url.startswith(("http://", "https://")) else None
+
+
+def sync(sub: Subscription) -> SyncResult:
+    """List ``sub``'s entries up to the ones it already knows (network only).
+
+    Does not change ``sub``; :meth:`SubscriptionStore.apply` records the result.
+    """
+    res = SyncResult(sub.url, first=not sub.last_sync, cursor=sub.cursor)
+    try:
+        if sub.last_sync and (sub.etag or sub.last_modified):
+            validators = downloader.changed_since(sub.url, sub.etag, sub.last_modified)
+            if validators is None:
+                res.unchanged = True
+                res.etag, res.last_modified = sub.etag, sub.last_modified
+                return res
+        else:
+            validators = downloader.changed_since(sub.url)
+        res.etag = (validators or {}).get("etag", "")
+        res.last_modified = (validators or {}).get("last_modified", "")
+
+        known = set(sub.seen) | set(sub.pending)
+        run = 0
+        entries = downloader.flat_entries(sub.url)
+        try:
+            for entry in entries:
+                eid = str(entry.get("id") or entry.get("url") or "")
+                url = _entry_url(entry)
+                ts = entry.get("timestamp")
+                if ts:
+                    res.cursor = max(res.cursor, float(ts))
+                old = eid in known or (sub.cursor and ts and float(ts) < sub.cursor - CURSOR_SLACK)
+                if old or not eid or not url:
+                    run += 1 if old else 0
+                    if run >= STOP_AFTER_KNOWN and not sub.full_scan and not res.first:
+                        break
+                    continue
+                run = 0
+                known.add(eid)
+                res.new.append((url, eid))
+        finally:
+            entries.close()
+    except Exception as e:
+        res.error = str(e) or type(e).__name__
+    return res
+
+
+class SubscriptionStore:
+    """Subscriptions in ``subscriptions.json``; safe to use from sync threads."""
+
+    def __init__(self, path: Path = SUBSCRIPTIONS_FILE):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._subs: Dict[str, Subscription] = {}
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        names = {f.name for f in fields(Subscription)}
+        for d in data if isinstance(data, list) else []:
+            if isinstance(d, dict) and d.get("url"):
+                sub = Subscription(**{k: v for k, v in d.items() if k in names})
+                self._subs[sub.url] = sub
+
+    def _save(self) -> None:
+        # Call with the lock held; write-then-rename so a crash keeps the old file
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        try:
+            tmp.write_text(json.dumps([asdict(s) for s in self._subs.values()], ensure_ascii=False, indent=1),
+                           encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError:
+            pass
+
+    def all(self) -> List[Subscription]:
+        with self._lock:
+            return [Subscription(**asdict(s)) for s in self._subs.values()]
+
+    def add(self, url: str, quality: str = "best", full_scan: bool = False) -> bool:
+        with self._lock:
+            if url in self._subs:
+                return False
+            self._subs[url] = Subscription(url, quality=quality, full_scan=full_scan)
+            self._save()
+            return True
+
+    def remove(self, url: str) -> None:
+        with self._lock:
+            if self._subs.pop(url, None) is not None:
+                self._save()
+
+    def due(self, interval: float) -> List[Subscription]:
+        now = time.time()
+        return [s for s in self.all() if now - s.last_sync >= interval]
+
+    def apply(self, res: SyncResult) -> None:
+        """Record a sync: new entries become pending, cursors move forward."""
+        with self._lock:
+            sub = self._subs.get(res.url)
+            if sub is None:
+                return  # removed while syncing
+            sub.error = res.error
+            if res.error:
+                self._save()
+                return
+            for url, eid in reversed(res.new):
+                sub.pending.setdefault(eid, url)
+            sub.etag, sub.last_modified = res.etag, res.last_modified
+            sub.cursor = max(sub.cursor, res.cursor)
+            sub.last_sync = time.time()
+            self._save()
+
+    def pending(self) -> List[Tuple[Subscription, str, str]]:
+        """(subscription, entry URL, entry id) of every entry still to download."""
+        return [(sub, url, eid) for sub in self.all() for eid, url in sub.pending.items()]
+
+    def finish(self, url: str, eid: str) -> None:
+        """The entry's job is done (or skipped as held, or canceled): it becomes seen."""
+        with self._lock:
+            sub = self._subs.get(url)
+            if sub is None or sub.pending.pop(eid, None) is None:
+                return
+            sub.failures.pop(eid, None)
+            seen = [eid] + [e for e in sub.seen if e != eid]
+            sub.seen = seen if sub.full_scan else seen[:MAX_SEEN]
+            self._save()
+
+    def fail(self, url: str, eid: str) -> None:
+        """The entry's job failed; it stays pending until ``MAX_ATTEMPTS``."""
+        with self._lock:
+            sub = self._subs.get(url)
+            if sub is None or eid not in sub.pending:
+                return
+            sub.failures[eid] = sub.failures.get(eid, 0) + 1
+            if sub.failures[eid] < MAX_ATTEMPTS:
+                self._save()
+                return
+        self.finish(url, eid)
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import html
+import re
+from pathlib import Path
+from typing import List, Tuple
+
+try:
+    from transcribe import Segment
+except Exception:
+    from .transcribe import Segment
+
+
+_TIME = r"(?:(\d+):)?(\d{1,2}):(\d{2})[.,](\d{3})"
+_CUE_RE = re.compile(_TIME + r"\s*-->\s*" + _TIME)
+_TAG_RE = re.compile(r"<[^>]+>")
+
+
+def _seconds(h, m, s, ms) -> float:
+    return int(h or 0) * 3600 + int(m) * 60 + int(s) + int(ms) / 1000.0
+
+
+def parse(text: str, rollup: bool = False) -> List[Segment]:
+    """Cues of a WebVTT or SRT document.
+
+    Inline styling/karaoke tags are dropped. Auto-generated captions repeat
+    the previous line at the top of every cue (roll-up); with ``rollup``
+    those repeated lines are kept only once.
+    """
+    segments: List[Segment] = []
+    recent: List[str] = []
+    for block in re.split(r"\r?\n\s*\r?\n", text):
+        lines = block.strip().splitlines()
+        for i, line in enumerate(lines):
+            m = _CUE_RE.search(line)
+            if m:
+                break
+        else:
+            continue  # header, NOTE/STYLE block or stray text
+        start, end = _seconds(*m.groups()[:4]), _seconds(*m.groups()[4:])
+        new = []
+        for raw in lines[i + 1:]:
+            t = html.unescape(_TAG_RE.sub("", raw)).strip()
+            if t and not (rollup and t in recent):
+                new.append(t)
+        if not new:
+            continue
+        recent = (recent + new)[-2:]
+        segments.append(Segment(start, end, " ".join(new)))
+    return segments
+
+
+def _stamp(t: float, sep: str) -> str:
+    ms = int(round(t * 1000))
+    h, ms = divmod(ms, 3600_000)
+    m, ms = divmod(ms, 60_000)
+    s, ms = divmod(ms, 1000)
+    return f"{h:02d}:{m:02d}:{s:02d}{sep}{ms:03d}"
+
+
+def to_srt(segments: List[Segment]) -> str:
+    out = []
+    for n, s in enumerate(segments, 1):
+        out.append(f"{n}\n{_stamp(s.start, ',')} --> {_stamp(s.end, ',')}\n{s.text}\n")
+    return "\n".join(out)
+
+
+def to_vtt(segments: List[Segment]) -> str:
+    out = ["WEBVTT\n"]
+    for s in segments:
+        out.append(f"{_stamp(s.start, '.')} --> {_stamp(s.end, '.')}\n{s.text}\n")
+    return "\n".join(out)
+
+
+def to_text(segments: List[Segment]) -> str:
+    return "\n".join(s.text for s in segments if s.text)
+
+
+def sidecar_paths(base: Path) -> Tuple[Path, Path, Path]:
+    """(<base>.transcript.txt, <base>.srt, <base>.vtt); ``base`` has no extension."""
+    return (
+        base.with_name(base.name + ".transcript.txt"),
+        base.with_name(base.name + ".srt"),
+        base.with_name(base.name + ".vtt"),
+    )
+
+
+def write_sidecars(media_path: Path, segments: List[Segment]) -> Path:
+    """Write the transcript next to ``media_path``; returns the .transcript.txt path."""
+    return write_transcript(media_path.with_suffix(""), segments)
+
+
+def write_transcript(base: Path, segments: List[Segment]) -> Path:
+    """Write the transcript in all three formats; returns the .transcript.txt path."""
+    txt, srt, vtt = sidecar_paths(base)
+    txt.write_text(to_text(segments), encoding="utf-8")
+    srt.write_text(to_srt(segments), encoding="utf-8")
+    vtt.write_text(to_vtt(segments), encoding="utf-8")
+    return txt
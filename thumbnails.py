@@ -0,0 +1,273 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import shutil
+import subprocess
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Iterable, Optional
+
+from PySide6.QtCore import Qt, QObject, QSize, Signal
+from PySide6.QtGui import QImage, QImageReader, QPixmap
+from yt_dlp.postprocessor.common import PostProcessor
+
+try:
+    from settings import SETTINGS_FILE
+except Exception:
+    from .settings import SETTINGS_FILE
+
+
+# Row thumbnail box (logical px) and the stored resolution (2x for HiDPI screens)
+DISPLAY_SIZE = QSize(160, 90)
+STORE_SIZE = QSize(320, 180)
+JPEG_QUALITY = 82
+
+# Hover preview strips: SPRITE_FRAMES keyframes side by side, one tile per frame
+SPRITE_FRAMES = 12
+SPRITE_TILE = DISPLAY_SIZE
+SPRITE_DIR = SETTINGS_FILE.parent / "previews"
+
+
+def _fit(src: QSize, box: QSize) -> QSize:
+    if src.width() <= box.width() and src.height() <= box.height():
+        return src
+    return src.scaled(box, Qt.KeepAspectRatio)
+
+
+def load_scaled(path: Path, box: QSize = STORE_SIZE) -> QImage:
+    """Decode ``path`` directly at (at most) ``box``.
+
+    The scaled size is handed to the image plugin, so JPEGs are decoded at
+    reduced DCT scale and no full-resolution buffer is kept. QImage is safe
+    to use off the GUI thread.
+    """
+    reader = QImageReader(str(path))
+    reader.setAutoTransform(True)
+    size = reader.size()
+    if size.isValid():
+        reader.setScaledSize(_fit(size, box))
+    return reader.read()
+
+
+def write_thumbnail(src: Path, dst: Path, box: QSize = STORE_SIZE) -> bool:
+    img = load_scaled(src, box)
+    if img.isNull():
+        return False
+    tmp = dst.with_name(dst.name + ".tmp")
+    if not img.save(str(tmp), "JPG", JPEG_QUALITY):
+        return False
+    os.replace(tmp, dst)
+    return True
+
+
+class QtThumbnailsConvertorPP(PostProcessor):
+    """In-process replacement for yt-dlp's FFmpegThumbnailsConvertor.
+
+    Each written thumbnail is decoded at ``STORE_SIZE`` and saved once as a
+    compact JPEG, instead of spawning ffmpeg for a full-size conversion.
+    """
+
+    def run(self, info):
+        files_to_delete = []
+        moves = info.setdefault("__files_to_move", {})
+        for thumb in info.get("thumbnails") or []:
+            src = thumb.get("filepath")
+            if not src or not os.path.isfile(src):
+                continue
+            dst = os.path.splitext(src)[0] + ".jpg"
+            try:
+                ok = write_thumbnail(Path(src), Path(dst))
+            except Exception:
+                ok = False
+            if not ok:
+                self.report_warning(f"Thumbnail could not be converted: {src}")
+                continue
+            thumb["filepath"] = dst
+            if dst != src:
+                files_to_delete.append(src)
+                if moves.get(src):
+                    moves[dst] = os.path.splitext(moves[src])[0] + ".jpg"
+        return files_to_delete, info
+
+
+_DURATION_RE = re.compile(r"Duration:\s*(\d+):(\d{2}):(\d{2}(?:\.\d+)?)")
+
+
+def media_duration(path: Path) -> Optional[float]:
+    # ffmpeg prints the container duration while probing (ffprobe is not shipped everywhere)
+    try:
+        r = subprocess.run(
+            ["ffmpeg", "-hide_banner", "-i", str(path)],
+            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, timeout=30,
+        )
+    except Exception:
+        return None
+    m = _DURATION_RE.search(r.stderr.decode("utf-8", "replace"))
+    if not m:
+        return None
+    return int(m.group(1)) * 3600 + int(m.group(2)) * 60 + float(m.group(3))
+
+
+def sprite_path(media: Path) -> Path:
+    # Keyed by path, size and mtime so a replaced file gets a new strip
+    st = media.stat()
+    key = f"{media.resolve()}|{st.st_size}|{st.st_mtime_ns}|{SPRITE_FRAMES}"
+    return SPRITE_DIR / (hashlib.sha1(key.encode("utf-8")).hexdigest()[:20] + ".jpg")
+
+
+def build_sprite(media: Path, dst: Path, frames: int = SPRITE_FRAMES) -> bool:
+    """Write a strip of ``frames`` evenly spaced keyframes of ``media`` to ``dst``.
+
+    Every position is a separate input seeked without accurate seek and with
+    ``-skip_frame nokey``, so ffmpeg jumps to the nearest keyframe and decodes
+    only that frame instead of the GOP up to the exact timestamp.
+    """
+    if shutil.which("ffmpeg") is None:
+        return False
+    duration = media_duration(media)
+    if not duration:
+        return False
+    tw, th = SPRITE_TILE.width(), SPRITE_TILE.height()
+    cmd = ["ffmpeg", "-hide_banner", "-loglevel", "error", "-y"]
+    chains = []
+    for i in range(frames):
+        t = duration * (i + 0.5) / frames
+        cmd += ["-skip_frame", "nokey", "-noaccurate_seek", "-ss", f"{t:.3f}", "-i", str(media)]
+        chains.append(
+            f"[{i}:v:0]scale={tw}:{th}:force_original_aspect_ratio=decrease,"
+            f"pad={tw}:{th}:(ow-iw)/2:(oh-ih)/2,setsar=1[v{i}]"
+        )
+    stack = "".join(f"[v{i}]" for i in range(frames)) + f"hstack=inputs={frames}"
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    tmp = dst.with_name(dst.stem + ".tmp.jpg")
+    cmd += ["-filter_complex", ";".join(chains + [stack]), "-frames:v", "1", "-q:v", "5", str(tmp)]
+    try:
+        subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=120)
+        os.replace(tmp, dst)
+        return True
+    except Exception:
+        try:
+            tmp.unlink()
+        except Exception:
+            pass
+        return False
+
+
+def ensure_sprite(media: Path) -> Optional[Path]:
+    """The cached preview strip of ``media``, built on first use."""
+    try:
+        dst = sprite_path(media)
+    except OSError:
+        return None
+    if dst.is_file() or build_sprite(media, dst):
+        return dst
+    return None
+
+
+def sprite_frame(sprite: QPixmap, fraction: float) -> QPixmap:
+    # Tile under the cursor; ``fraction`` is the x position across the label
+    tiles = max(1, sprite.width() // SPRITE_TILE.width())
+    i = min(tiles - 1, max(0, int(fraction * tiles)))
+    return sprite.copy(i * SPRITE_TILE.width(), 0, SPRITE_TILE.width(), SPRITE_TILE.height())
+
+
+def pixmap_bytes(pm: QPixmap) -> int:
+    return pm.width() * pm.height() * max(1, pm.depth()) // 8
+
+
+class PixmapCache:
+    """LRU of decoded thumbnails, bounded by their total pixel bytes.
+
+    Widgets only hold a cached pixmap while their row is near the viewport,
+    so evicting an entry here actually frees its memory.
+    """
+
+    def __init__(self, budget_bytes: int):
+        self.budget = budget_bytes
+        self.used = 0
+        self._items: "OrderedDict[str, QPixmap]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[QPixmap]:
+        pm = self._items.get(key)
+        if pm is not None:
+            self._items.move_to_end(key)
+        return pm
+
+    def put(self, key: str, pm: QPixmap) -> None:
+        old = self._items.pop(key, None)
+        if old is not None:
+            self.used -= pixmap_bytes(old)
+        self._items[key] = pm
+        self.used += pixmap_bytes(pm)
+        self._evict()
+
+    def set_budget(self, budget_bytes: int) -> None:
+        self.budget = budget_bytes
+        self._evict()
+
+    def _evict(self) -> None:
+        # Keep at least the newest entry even if it alone exceeds the budget
+        while self.used > self.budget and len(self._items) > 1:
+            _, pm = self._items.popitem(last=False)
+            self.used -= pixmap_bytes(pm)
+
+
+class ThumbnailLoader(QObject):
+    """Finds and decodes row thumbnails on background threads.
+
+    ``resolve`` maps a media path to its thumbnail file (it may run ffmpeg
+    to grab a frame). Images are decoded at (at most) ``box`` and delivered
+    through ``loaded`` in the loader's (GUI) thread. Requests for rows that
+    scrolled away before a thread picked them up are skipped unless they
+    were made with ``always``.
+    """
+    loaded = Signal(str, QImage)  # media path, image (null if none)
+
+    def __init__(
+        self,
+        resolve: Callable[[Path], Optional[Path]],
+        workers: int = 2,
+        box: Optional[QSize] = STORE_SIZE,
+        parent=None,
+    ):
+        super().__init__(parent)
+        self._resolve = resolve
+        self._box = box
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="thumbs")
+        self._lock = threading.Lock()
+        self._wanted: set = set()
+        self._pending: set = set()
+
+    def set_wanted(self, keys: Iterable[str]) -> None:
+        with self._lock:
+            self._wanted = set(keys)
+
+    def request(self, key: str, always: bool = False) -> None:
+        with self._lock:
+            if key in self._pending:
+                return
+            self._pending.add(key)
+        self._pool.submit(self._load, key, always)
+
+    def _load(self, key: str, always: bool) -> None:
+        with self._lock:
+            if not always and key not in self._wanted:
+                self._pending.discard(key)
+                return
+        img = QImage()
+        try:
+            src = self._resolve(Path(key))
+            if src is not None:
+                img = load_scaled(src, self._box) if self._box is not None else QImage(str(src))
+        except Exception:
+            pass
+        with self._lock:
+            self._pending.discard(key)
+        self.loaded.emit(key, img)
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
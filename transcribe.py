@@ -0,0 +1,387 @@
+from __future__ import annotations
+
+import multiprocessing
+import os
+import shutil
+import subprocess
+import tempfile
+import wave
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import closing
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+
+SAMPLE_RATE = 16000
+# Target chunk length; cuts move to the nearest silence around each boundary
+CHUNK_SECONDS = 600.0
+# Search window (each side of a boundary) for a silence to cut at
+BOUNDARY_WINDOW = 30.0
+# Shorter inputs are transcribed in-process; worker start-up would dominate
+MIN_PARALLEL_SECONDS = 2 * CHUNK_SECONDS
+
+
+@dataclass
+class Segment:
+    start: float
+    end: float
+    text: str
+
+
+def extract_wav(media_path: Path, wav_path: Path, max_seconds: Optional[float] = None) -> None:
+    # Mono 16 kHz PCM, the input Whisper expects
+    if shutil.which("ffmpeg") is None:
+        raise RuntimeError("FFmpeg bulunamadı (PATH'te olmalı)")
+    cmd = ["ffmpeg", "-y", "-i", str(media_path)]
+    if max_seconds:
+        cmd += ["-t", str(max_seconds)]
+    cmd += ["-vn", "-ac", "1", "-ar", str(SAMPLE_RATE), "-f", "wav", str(wav_path)]
+    subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+def wav_duration(wav_path: Path) -> float:
+    with wave.open(str(wav_path), "rb") as w:
+        return w.getnframes() / float(w.getframerate())
+
+
+def read_wav(wav_path: Path, start: float = 0.0, end: Optional[float] = None):
+    """float32 samples of ``[start, end)`` seconds, read without loading the rest."""
+    with wave.open(str(wav_path), "rb") as w:
+        rate = w.getframerate()
+        total = w.getnframes()
+        a = max(0, min(total, int(start * rate)))
+        b = total if end is None else max(a, min(total, int(end * rate)))
+        w.setpos(a)
+        raw = w.readframes(b - a)
+    return _pcm_to_float(raw)
+
+
+def _pcm_to_float(pcm: bytes):
+    import numpy as np
+
+    return np.frombuffer(pcm, dtype=np.int16).astype(np.float32) / 32768.0
+
+
+def _find_cut(wav_path: Path, target: float, duration: float) -> float:
+    lo = max(0.0, target - BOUNDARY_WINDOW)
+    hi = min(duration, target + BOUNDARY_WINDOW)
+    return _best_cut(read_wav(wav_path, lo, hi), lo, target)
+
+
+def _best_cut(audio, lo: float, target: float) -> float:
+    # Middle of the longest non-speech gap near ``target`` in ``audio``
+    # (which starts at ``lo`` seconds), per Silero VAD
+    from faster_whisper.vad import VadOptions, get_speech_timestamps
+
+    speech = get_speech_timestamps(audio, VadOptions(min_silence_duration_ms=300))
+    edges = [0] + [x for s in speech for x in (s["start"], s["end"])] + [len(audio)]
+    best: Optional[Tuple[int, float]] = None
+    for i in range(0, len(edges) - 1, 2):
+        gap_a, gap_b = edges[i], edges[i + 1]
+        if gap_b <= gap_a:
+            continue
+        # Prefer long gaps, then ones close to the target
+        mid = lo + (gap_a + gap_b) / 2 / SAMPLE_RATE
+        score = (gap_b - gap_a) / SAMPLE_RATE - abs(mid - target) / BOUNDARY_WINDOW
+        if best is None or score > best[1]:
+            best = (gap_a + gap_b) // 2, score
+    if best is None:
+        return target
+    return lo + best[0] / SAMPLE_RATE
+
+
+def plan_chunks(wav_path: Path, chunk_seconds: float = CHUNK_SECONDS) -> List[Tuple[float, float]]:
+    """(start, end) seconds of each chunk, cut at VAD-detected silences."""
+    duration = wav_duration(wav_path)
+    cuts = [0.0]
+    target = chunk_seconds
+    while target < duration - chunk_seconds / 4:
+        try:
+            cut = _find_cut(wav_path, target, duration)
+        except Exception:
+            cut = target
+        if cut <= cuts[-1]:
+            cut = target
+        cuts.append(cut)
+        target = cut + chunk_seconds
+    cuts.append(duration)
+    return list(zip(cuts[:-1], cuts[1:]))
+
+
+# ------------------------
+# Worker process side
+# ------------------------
+_model = None
+
+
+def _init_worker(model_size: str, device: str, compute_type: str, cpu_threads: int) -> None:
+    # Pool workers only: one model per process, limited to its share of the cores
+    global _model
+    os.environ["OMP_NUM_THREADS"] = str(cpu_threads)
+    from faster_whisper import WhisperModel
+
+    _model = WhisperModel(model_size, device=device, compute_type=compute_type, cpu_threads=cpu_threads)
+
+
+def _ready() -> bool:
+    # No-op task: makes the pool start its workers (and load models) early
+    return True
+
+
+def _detect_language(wav_path: str) -> Optional[str]:
+    _, info = _model.transcribe(read_wav(Path(wav_path), 0.0, 30.0), language=None)
+    return info.language
+
+
+def _detect_language_pcm(pcm: bytes) -> Optional[str]:
+    _, info = _model.transcribe(_pcm_to_float(pcm), language=None)
+    return info.language
+
+
+def _transcribe_pcm(pcm: bytes, offset: float, lang: Optional[str]) -> List[Tuple[float, float, str]]:
+    segments, _ = _model.transcribe(_pcm_to_float(pcm), language=lang, vad_filter=True)
+    return [(offset + s.start, offset + s.end, s.text.strip()) for s in segments]
+
+
+def _transcribe_chunk(wav_path: str, start: float, end: float, lang: Optional[str],
+                      model=None) -> List[Tuple[float, float, str]]:
+    # ``model``: the caller's own, when run outside a pool worker
+    audio = read_wav(Path(wav_path), start, end)
+    segments, _ = (model or _model).transcribe(audio, language=lang, vad_filter=True)
+    # Shift chunk-relative timestamps back onto the full recording
+    return [(start + s.start, start + s.end, s.text.strip()) for s in segments]
+
+
+def _auto_workers(n_chunks: int) -> int:
+    cores = os.cpu_count() or 1
+    # ~4 threads per worker scales well for CTranslate2 on CPU
+    return max(1, min(n_chunks, cores // 4))
+
+
+def transcribe_wav(
+    wav_path: Path,
+    lang: Optional[str] = None,
+    model_size: str = "small",
+    device: str = "cpu",
+    compute_type: str = "int8",
+    workers: int = 0,
+    cpu_threads: int = 0,
+) -> List[Segment]:
+    """Transcribe a 16 kHz mono wav, in parallel chunks when it is long.
+
+    ``workers``/``cpu_threads`` of 0 pick a split of the machine's cores.
+    """
+    duration = wav_duration(wav_path)
+    cores = os.cpu_count() or 1
+    chunks = plan_chunks(wav_path) if duration >= MIN_PARALLEL_SECONDS else [(0.0, duration)]
+    n = workers or _auto_workers(len(chunks))
+    n = max(1, min(n, len(chunks)))
+    if device != "cpu":
+        n = 1  # one model per GPU; chunks run back to back
+    threads = cpu_threads or max(1, cores // n)
+
+    if n == 1:
+        # In this process: a local model, freed on return (no process-wide state)
+        from faster_whisper import WhisperModel
+
+        model = WhisperModel(model_size, device=device, compute_type=compute_type, cpu_threads=threads)
+        try:
+            parts = [_transcribe_chunk(str(wav_path), a, b, lang, model) for a, b in chunks]
+        finally:
+            del model
+    else:
+        # spawn: never fork a process that runs Qt threads
+        ctx = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(
+            max_workers=n, mp_context=ctx,
+            initializer=_init_worker, initargs=(model_size, device, compute_type, threads),
+        ) as pool:
+            if lang is None:
+                # Chunks transcribed independently must agree on the language
+                lang = pool.submit(_detect_language, str(wav_path)).result()
+            futures = [pool.submit(_transcribe_chunk, str(wav_path), a, b, lang) for a, b in chunks]
+            parts = [f.result() for f in futures]
+
+    return [Segment(a, b, t) for part in parts for a, b, t in part]
+
+
+def transcribe_file(
+    media_path: Path,
+    lang: Optional[str] = None,
+    model_size: str = "small",
+    device: str = "cpu",
+    compute_type: str = "int8",
+    workers: int = 0,
+    cpu_threads: int = 0,
+) -> List[Segment]:
+    with tempfile.TemporaryDirectory() as td:
+        wav_path = Path(td) / "audio.wav"
+        extract_wav(media_path, wav_path)
+        return transcribe_wav(wav_path, lang, model_size, device, compute_type, workers, cpu_threads)
+
+
+# ------------------------
+# Streaming input (remote audio, transcribed while it downloads)
+# ------------------------
+# Shorter chunks than for files so inference starts early in the download
+STREAM_CHUNK_SECONDS = 120.0
+_READ_BLOCK = 64 * 1024
+
+
+class TranscriptionCancelled(Exception):
+    pass
+
+
+def stream_pcm(media_url: str, headers: Optional[Dict[str, str]] = None) -> Iterator[bytes]:
+    """16 kHz mono s16le PCM decoded by ffmpeg straight from ``media_url``.
+
+    Nothing is written to disk. Closing the generator stops ffmpeg.
+    """
+    if shutil.which("ffmpeg") is None:
+        raise RuntimeError("FFmpeg bulunamadı (PATH'te olmalı)")
+    cmd = ["ffmpeg", "-nostdin", "-loglevel", "error"]
+    if headers:
+        cmd += ["-headers", "".join(f"{k}: {v}\r\n" for k, v in headers.items())]
+    cmd += ["-i", media_url, "-vn", "-ac", "1", "-ar", str(SAMPLE_RATE), "-f", "s16le", "pipe:1"]
+    with tempfile.TemporaryFile() as err:
+        proc = subprocess.Popen(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=err)
+        try:
+            while True:
+                block = proc.stdout.read(_READ_BLOCK)
+                if not block:
+                    break
+                yield block
+            if proc.wait() != 0:
+                err.seek(0)
+                msg = err.read().decode("utf-8", "replace").strip().splitlines()
+                raise RuntimeError("FFmpeg: " + (msg[-1] if msg else f"çıkış kodu {proc.returncode}"))
+        finally:
+            if proc.poll() is None:
+                proc.kill()
+            proc.wait()
+            proc.stdout.close()
+
+
+class StreamTranscriber:
+    """Transcribes 16 kHz mono s16le PCM while it is still arriving.
+
+    Audio is buffered until a chunk plus the cut search window is available,
+    cut at a silence and handed to the worker pool, so inference runs
+    alongside the download. Workers start (and load the model) as soon as
+    the transcriber is created.
+    """
+
+    def __init__(
+        self,
+        lang: Optional[str] = None,
+        model_size: str = "small",
+        device: str = "cpu",
+        compute_type: str = "int8",
+        workers: int = 1,
+        cpu_threads: int = 0,
+        chunk_seconds: float = STREAM_CHUNK_SECONDS,
+    ):
+        n = 1 if device != "cpu" else max(1, workers)
+        threads = cpu_threads or max(1, (os.cpu_count() or 1) // n)
+        self.lang = lang
+        self.chunk_seconds = chunk_seconds
+        self._pool = ProcessPoolExecutor(
+            max_workers=n, mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker, initargs=(model_size, device, compute_type, threads),
+        )
+        for _ in range(n):
+            self._pool.submit(_ready)
+        self._buf = bytearray()
+        self._buf_start = 0.0
+        self._futures: List[Future] = []
+
+    @property
+    def received_seconds(self) -> float:
+        return self._buf_start + len(self._buf) / 2 / SAMPLE_RATE
+
+    def feed(self, pcm: bytes) -> None:
+        self._buf += pcm
+        need = _samples(self.chunk_seconds + BOUNDARY_WINDOW) * 2
+        while len(self._buf) >= need:
+            lo = self.chunk_seconds - BOUNDARY_WINDOW
+            window = _pcm_to_float(bytes(self._buf[_samples(lo) * 2:need]))
+            try:
+                cut = _best_cut(window, lo, self.chunk_seconds)
+            except Exception:
+                cut = self.chunk_seconds
+            self._dispatch(_samples(cut) * 2)
+
+    def _dispatch(self, nbytes: int) -> None:
+        if self.lang is None:
+            # Detected once on the opening audio; every chunk then uses it
+            head = bytes(self._buf[:_samples(30.0) * 2])
+            self.lang = self._pool.submit(_detect_language_pcm, head).result()
+        pcm = bytes(self._buf[:nbytes])
+        del self._buf[:nbytes]
+        self._futures.append(self._pool.submit(_transcribe_pcm, pcm, self._buf_start, self.lang))
+        self._buf_start += nbytes / 2 / SAMPLE_RATE
+
+    def finish(self) -> List[Segment]:
+        if self._buf:
+            self._dispatch(len(self._buf))
+        try:
+            parts = [f.result() for f in self._futures]
+        finally:
+            self.close()
+        return [Segment(a, b, t) for part in parts for a, b, t in part]
+
+    def close(self, cancel: bool = False) -> None:
+        if cancel:
+            # Python 3.14+: stop chunks that are mid-inference too
+            terminate = getattr(self._pool, "terminate_workers", None)
+            if terminate is not None:
+                terminate()
+                return
+        self._pool.shutdown(wait=not cancel, cancel_futures=cancel)
+
+
+def _samples(seconds: float) -> int:
+    return int(seconds * SAMPLE_RATE)
+
+
+def transcribe_stream(
+    media_url: str,
+    headers: Optional[Dict[str, str]] = None,
+    duration: Optional[float] = None,
+    lang: Optional[str] = None,
+    model_size: str = "small",
+    device: str = "cpu",
+    compute_type: str = "int8",
+    workers: int = 0,
+    cpu_threads: int = 0,
+    on_progress: Optional[Callable[[float], None]] = None,
+    cancel_check: Optional[Callable[[], bool]] = None,
+    on_received: Optional[Callable[[], None]] = None,
+) -> List[Segment]:
+    """Transcribe remote audio while ffmpeg is still receiving it.
+
+    ``on_progress`` gets the fraction of ``duration`` received so far and
+    ``on_received`` is called once the whole stream is in (the last chunks
+    may still be transcribing). Raises :class:`TranscriptionCancelled` when
+    ``cancel_check`` returns True.
+    """
+    expected = int((duration or 0) // STREAM_CHUNK_SECONDS) + 1
+    st = StreamTranscriber(
+        lang, model_size, device, compute_type,
+        workers or _auto_workers(expected), cpu_threads,
+    )
+    try:
+        with closing(stream_pcm(media_url, headers)) as blocks:
+            for block in blocks:
+                if cancel_check is not None and cancel_check():
+                    raise TranscriptionCancelled()
+                st.feed(block)
+                if on_progress is not None and duration:
+                    on_progress(min(1.0, st.received_seconds / duration))
+    except BaseException:
+        st.close(cancel=True)
+        raise
+    if on_received is not None:
+        on_received()
+    return st.finish()
@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+import json
+import multiprocessing
+import os
+import platform
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, fields
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Iterable, List, Optional, Tuple
+
+try:
+    import transcribe
+    from settings import SETTINGS_FILE
+    from library import Library
+except Exception:
+    from . import transcribe
+    from .settings import SETTINGS_FILE
+    from .library import Library
+
+
+# Saved results, next to settings.json
+BENCH_FILE = SETTINGS_FILE.parent / "whisper_bench.json"
+# Clip cut from a downloaded file when no fixture is bundled
+CLIP_FILE = SETTINGS_FILE.parent / "whisper_bench.wav"
+FIXTURE_SECONDS = 30.0
+
+MODEL_SIZES = ("tiny", "base", "small", "medium", "large-v3")
+COMPUTE_TYPES = {"cpu": ("int8", "float32"), "cuda": ("int8_float16", "float16")}
+
+# Accuracy tiers as shown in the UI; a model meets its own tier and below
+TIERS = ("hızlı", "dengeli", "doğru")
+MODEL_TIER = {"tiny": 0, "base": 0, "small": 1, "medium": 2, "large-v3": 2}
+
+# Used until a benchmark has run on this machine
+DEFAULT_CONFIG = ("small", "cpu", "int8")
+
+
+@dataclass
+class BenchResult:
+    model: str
+    device: str
+    compute_type: str
+    threads: int
+    load_s: float = 0.0
+    # Processing time / audio time; below 1.0 is faster than real time
+    rtf: Optional[float] = None
+    peak_mb: Optional[float] = None
+    error: str = ""
+
+    def describe(self) -> str:
+        if self.error:
+            return f"{self.model} {self.device}/{self.compute_type}: hata"
+        mem = f" · {self.peak_mb:.0f} MB" if self.peak_mb else ""
+        return f"{self.model} {self.device}/{self.compute_type} · RTF {self.rtf:.2f}{mem}"
+
+
+@lru_cache(maxsize=None)
+def machine_id() -> str:
+    # Results from another machine (or a changed GPU setup) are not reused.
+    # Cached: finding the GPUs imports ctranslate2, and this runs on the GUI thread
+    return "|".join([
+        platform.node(), platform.machine(), platform.processor(),
+        str(os.cpu_count()), str(_cuda_devices()),
+    ])
+
+
+@lru_cache(maxsize=None)
+def _cuda_devices() -> int:
+    try:
+        import ctranslate2
+
+        return int(ctranslate2.get_cuda_device_count())
+    except Exception:
+        return 0
+
+
+def _peak_rss_mb() -> Optional[float]:
+    try:
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # kilobytes on Linux, bytes on macOS
+        return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+    except Exception:
+        pass
+    try:
+        import psutil  # Windows: peak working set
+
+        return psutil.Process().memory_info().peak_wset / (1024 * 1024)
+    except Exception:
+        return None
+
+
+# ------------------------
+# Fixture
+# ------------------------
+def bundled_fixture() -> Optional[Path]:
+    pkg_dir = Path(__file__).resolve().parent
+    frozen_root = Path(getattr(sys, "_MEIPASS", pkg_dir.parent))
+    for root in (frozen_root, pkg_dir.parent, pkg_dir):
+        p = root / "assets" / "bench" / "fixture.wav"
+        if p.is_file():
+            return p
+    return None
+
+
+def ensure_fixture(download_dir: Path) -> Path:
+    """Audio to benchmark on: the bundled fixture, else a clip of the newest download."""
+    p = bundled_fixture()
+    if p is not None:
+        return p
+    if CLIP_FILE.is_file():
+        return CLIP_FILE
+    media = Library(download_dir).media_files()
+    if not media:
+        raise RuntimeError("Benchmark için ses bulunamadı (assets/bench/fixture.wav ya da indirilmiş bir dosya gerekli)")
+    newest = max(media, key=lambda m: m.stat().st_mtime)
+    transcribe.extract_wav(newest, CLIP_FILE, max_seconds=FIXTURE_SECONDS)
+    return CLIP_FILE
+
+
+# ------------------------
+# Measurement (runs in a fresh process per configuration)
+# ------------------------
+def _measure(wav_path: str, model: str, device: str, compute_type: str, threads: int) -> dict:
+    from faster_whisper import WhisperModel
+
+    t0 = time.perf_counter()
+    m = WhisperModel(model, device=device, compute_type=compute_type, cpu_threads=threads)
+    load_s = time.perf_counter() - t0
+    t1 = time.perf_counter()
+    segments, info = m.transcribe(wav_path, vad_filter=True)
+    for _ in segments:  # decoding is lazy
+        pass
+    elapsed = time.perf_counter() - t1
+    return {
+        "load_s": load_s,
+        "rtf": elapsed / max(info.duration, 1e-6),
+        "peak_mb": _peak_rss_mb(),
+    }
+
+
+def configurations(models: Iterable[str] = MODEL_SIZES) -> List[Tuple[str, str, str]]:
+    devices = ["cpu"] + (["cuda"] if _cuda_devices() else [])
+    return [(m, d, c) for m in models for d in devices for c in COMPUTE_TYPES[d]]
+
+
+def run_benchmark(
+    wav_path: Path,
+    models: Iterable[str] = MODEL_SIZES,
+    on_result: Optional[Callable[[BenchResult], None]] = None,
+    cancel_check: Optional[Callable[[], bool]] = None,
+) -> List[BenchResult]:
+    """Measure every model/device/compute type on ``wav_path`` and save the results.
+
+    Each configuration runs in its own process so peak memory is per model
+    and a crash (e.g. an unsupported compute type) does not take down the app.
+    A canceled run keeps the previously saved results.
+    """
+    threads = os.cpu_count() or 1
+    ctx = multiprocessing.get_context("spawn")
+    results: List[BenchResult] = []
+    canceled = False
+    for model, device, compute_type in configurations(models):
+        if cancel_check is not None and cancel_check():
+            canceled = True
+            break
+        r = BenchResult(model, device, compute_type, threads)
+        try:
+            with ProcessPoolExecutor(max_workers=1, mp_context=ctx) as pool:
+                data = pool.submit(_measure, str(wav_path), model, device, compute_type, threads).result()
+            r.load_s, r.rtf, r.peak_mb = data["load_s"], data["rtf"], data["peak_mb"]
+        except Exception as e:
+            r.error = str(e) or type(e).__name__
+        results.append(r)
+        if on_result is not None:
+            on_result(r)
+    if results and not canceled:
+        save_results(results)
+    return results
+
+
+# ------------------------
+# Persistence and selection
+# ------------------------
+def save_results(results: List[BenchResult]) -> None:
+    data = {"machine": machine_id(), "time": time.time(), "results": [asdict(r) for r in results]}
+    try:
+        tmp = BENCH_FILE.with_name(BENCH_FILE.name + ".tmp")
+        tmp.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+        os.replace(tmp, BENCH_FILE)
+    except Exception:
+        pass
+
+
+def load_results() -> List[BenchResult]:
+    try:
+        data = json.loads(BENCH_FILE.read_text(encoding="utf-8"))
+        if data.get("machine") != machine_id():
+            return []
+        known = {f.name for f in fields(BenchResult)}
+        return [BenchResult(**{k: v for k, v in r.items() if k in known}) for r in data.get("results", [])]
+    except Exception:
+        return []
+
+
+def pick(results: List[BenchResult], tier: str, max_rtf: float) -> Optional[BenchResult]:
+    """Fastest configuration meeting ``tier`` and the ``max_rtf`` latency target.
+
+    Accuracy wins over latency: if nothing in the tier is fast enough, the
+    fastest configuration of the tier is used. If no benchmarked model reaches
+    the tier, the most accurate ones measured are considered instead.
+    """
+    ok = [r for r in results if not r.error and r.rtf is not None]
+    if not ok:
+        return None
+    want = TIERS.index(tier) if tier in TIERS else 1
+    cands = [r for r in ok if MODEL_TIER.get(r.model, 0) >= want]
+    if not cands:
+        top = max(MODEL_TIER.get(r.model, 0) for r in ok)
+        cands = [r for r in ok if MODEL_TIER.get(r.model, 0) == top]
+    fast = [r for r in cands if r.rtf <= max_rtf]
+    return min(fast or cands, key=lambda r: r.rtf)
+
+
+def choose_config(tier: str, max_rtf: float) -> Tuple[str, str, str]:
+    """(model size, device, compute type) for transcription on this machine."""
+    best = pick(load_results(), tier, max_rtf)
+    if best is None:
+        return DEFAULT_CONFIG
+    return best.model, best.device, best.compute_type